@@ -0,0 +1,12 @@
+"""Shared test fixtures for pm-os-base tests."""
+
+import sys
+from pathlib import Path
+
+# Ensure plugin tools are importable
+PLUGIN_ROOT = Path(__file__).resolve().parent.parent
+TOOLS_ROOT = PLUGIN_ROOT / "tools"
+
+for p in [str(TOOLS_ROOT), str(TOOLS_ROOT / "core")]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
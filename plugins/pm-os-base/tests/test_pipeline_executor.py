@@ -0,0 +1,125 @@
+"""Tests for dependency scheduling in the pipeline executor."""
+
+import threading
+import time
+from pathlib import Path
+
+from pipeline.action_registry import ActionRegistry
+from pipeline.pipeline_executor import PipelineExecutor
+from pipeline.pipeline_schema import ErrorStrategy, PipelineDefinition, PipelineStep
+
+BOOT_YAML = Path(__file__).resolve().parent.parent / "pipelines" / "boot.yaml"
+
+
+def _recording_executor(tmp_path, delays=None):
+    """Executor whose "record" action logs start/end events per step."""
+    events = []
+    lock = threading.Lock()
+
+    def record(args, context):
+        with lock:
+            events.append(("start", args["name"]))
+        time.sleep((delays or {}).get(args["name"], 0.01))
+        with lock:
+            events.append(("end", args["name"]))
+        return {"success": True, "message": "", "data": {"name": args["name"]}}
+
+    registry = ActionRegistry()
+    registry.register("record", record)
+    return PipelineExecutor(registry, trace_dir=tmp_path / "traces"), events
+
+
+def _step(name, **kwargs):
+    return PipelineStep(name=name, action="record", args={"name": name}, **kwargs)
+
+
+def _pipeline(*steps):
+    return PipelineDefinition(
+        name="test", steps=list(steps), error_strategy=ErrorStrategy.CONTINUE
+    )
+
+
+class TestDependencies:
+
+    def test_depends_on_wait_for_and_result_refs(self, tmp_path):
+        executor, _ = _recording_executor(tmp_path)
+        pipeline = _pipeline(
+            _step("a"),
+            _step("b", depends_on=["a"]),
+            _step("c", wait_for=["not-installed", "b"]),
+            PipelineStep(name="d", action="record", args={"name": "${_result_a}"}),
+        )
+        assert executor.dependencies(pipeline) == [set(), {0}, {1}, {0}]
+        assert executor.validate(pipeline) == []
+
+    def test_cycle_is_reported_and_still_runs(self, tmp_path):
+        executor, events = _recording_executor(tmp_path)
+        pipeline = _pipeline(
+            _step("x", depends_on=["y"]),
+            _step("y", depends_on=["x"]),
+        )
+        assert executor.validate(pipeline) == ["Dependency cycle: x -> y -> x"]
+
+        result = executor.execute(pipeline, max_workers=2)
+        assert [r.step_name for r in result.step_results] == ["x", "y"]
+        assert [name for kind, name in events if kind == "start"] == ["x", "y"]
+
+
+class TestParallelExecution:
+
+    def test_steps_wait_for_dependencies(self, tmp_path):
+        executor, events = _recording_executor(tmp_path, delays={"a": 0.2})
+        pipeline = _pipeline(
+            _step("a"),
+            _step("b", depends_on=["a"]),
+            _step("c"),
+            _step("d", wait_for=["c", "missing"]),
+        )
+        result = executor.execute(pipeline, max_workers=4)
+
+        assert result.success
+        assert [r.step_name for r in result.step_results] == ["a", "b", "c", "d"]
+        order = {event: i for i, event in enumerate(events)}
+        assert order[("end", "a")] < order[("start", "b")]
+        assert order[("end", "c")] < order[("start", "d")]
+        # Independent steps overlap with the slow one
+        assert order[("start", "c")] < order[("end", "a")]
+
+    def test_serial_when_one_worker(self, tmp_path):
+        executor, events = _recording_executor(tmp_path)
+        pipeline = _pipeline(_step("a"), _step("b"), _step("c"))
+        executor.execute(pipeline, max_workers=1)
+        assert events == [
+            (kind, name) for name in "abc" for kind in ("start", "end")
+        ]
+
+
+class TestBootPipeline:
+
+    def test_boot_orders_steps_that_share_files(self, tmp_path):
+        executor, _ = _recording_executor(tmp_path)
+        pipeline = executor.load(BOOT_YAML)
+        names = [step.name for step in pipeline.steps]
+        deps = executor.dependencies(pipeline)
+
+        def needs(step, other):
+            """True if `step` transitively runs after `other`."""
+            target, seen = names.index(other), set()
+            pending = list(deps[names.index(step)])
+            while pending:
+                i = pending.pop()
+                if i == target:
+                    return True
+                if i not in seen:
+                    seen.add(i)
+                    pending.extend(deps[i])
+            return False
+
+        assert needs("session-ensure", "preflight")
+        if "brain-load" in names and "context-update" in names:
+            for writer in ("slack-channel-sync", "google-oauth", "context-update", "master-sheet"):
+                assert needs("brain-load", writer)
+            assert needs("brain-enrich", "context-update")
+        if "master-sheet" in names:
+            assert needs("master-sheet", "meeting-prep")
+        assert not any("cycle" in issue for issue in executor.validate(pipeline))
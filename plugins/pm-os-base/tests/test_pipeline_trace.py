@@ -0,0 +1,93 @@
+"""Tests for pipeline trace files and the --profile report."""
+
+import json
+from pathlib import Path
+
+from pipeline import pipeline_trace
+from pipeline.action_registry import ActionRegistry
+from pipeline.pipeline_executor import PipelineExecutor
+from pipeline.pipeline_schema import PipelineDefinition, PipelineStep
+from pipeline.pipeline_trace import (
+    PipelineTrace,
+    load_spans,
+    profile_report,
+    trace_span,
+)
+
+
+def _write_run(trace_dir, run_id, steps):
+    """Trace file of an earlier run with the given {step: duration_ms}."""
+    path = trace_dir / f"boot-{run_id}.jsonl"
+    lines = [{"type": "run", "pipeline": "boot", "run_id": run_id}]
+    for i, (name, ms) in enumerate(steps.items(), start=1):
+        lines.append({
+            "type": "span", "span_id": i, "parent_id": None, "name": name,
+            "kind": "step", "start": f"2026-01-01T00:00:0{i}", "duration_ms": ms,
+        })
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+    return path
+
+
+class TestPipelineTrace:
+
+    def test_spans_nest_and_stream_to_jsonl(self, tmp_path):
+        trace = PipelineTrace("boot", tmp_path)
+        with trace_span("outside") as span:
+            assert span is None
+
+        with trace.activate(), trace.span("boot", kind="pipeline"):
+            with trace.span("load", kind="step"):
+                with trace_span("tool", tool="x.py") as span:
+                    span.attrs["returncode"] = 0
+        trace.finish(success=True)
+
+        records = [json.loads(line) for line in trace.path.read_text().splitlines()]
+        assert [r["type"] for r in records] == ["run", "span", "span", "span", "summary"]
+        spans = {s["name"]: s for s in load_spans(trace.path)}
+        assert spans["tool"]["parent_id"] == spans["load"]["span_id"]
+        assert spans["load"]["parent_id"] == spans["boot"]["span_id"]
+        assert spans["tool"]["kind"] == "subprocess"
+        assert spans["tool"]["returncode"] == 0
+        assert set(spans["load"]["phases_ms"]) == {"tool"}
+        if pipeline_trace.HAS_RESOURCE:
+            load = spans["load"]
+            assert 0 <= load["rss_growth_kb"] <= load["process_rss_peak_kb"]
+            assert "rss_peak_kb" not in load
+
+    def test_old_traces_are_pruned(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pipeline_trace, "MAX_TRACES_PER_PIPELINE", 2)
+        for i in range(3):
+            _write_run(tmp_path, f"20260101-0000000000{i:02d}-1", {"a": 1})
+        PipelineTrace("boot", tmp_path)
+        assert len(pipeline_trace.run_files(tmp_path, "boot")) == 2
+
+
+class TestProfileReport:
+
+    def test_flags_steps_slower_than_their_median(self, tmp_path):
+        for i, ms in enumerate([100, 120, 110]):
+            _write_run(tmp_path, f"20260101-0000000000{i:02d}-1", {"slow": ms, "steady": 500})
+        current = _write_run(
+            tmp_path, "20260102-000000000000-1", {"slow": 400, "steady": 510, "new": 50}
+        )
+
+        report = profile_report(current, runs=10)
+        assert "median of last 3 runs" in report
+        assert "slow" in report and "+264%" in report
+        assert "(no history)" in report
+        assert "Regressions: slow (+264%)" in report
+        assert "Flame (wall time):" in report
+
+    def test_executor_run_can_be_profiled(self, tmp_path):
+        registry = ActionRegistry()
+        registry.register("noop", lambda args, context: {"success": True, "message": "", "data": {}})
+        executor = PipelineExecutor(registry, trace_dir=tmp_path)
+        pipeline = PipelineDefinition(
+            name="boot", steps=[PipelineStep(name="only", action="noop", args={})]
+        )
+
+        result = executor.execute(pipeline)
+        assert result.trace_path
+        assert "only" in profile_report(Path(result.trace_path))
+        if pipeline_trace.HAS_RESOURCE:
+            assert result.step_results[0].rss_growth_kb >= 0
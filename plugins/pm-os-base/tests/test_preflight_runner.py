@@ -0,0 +1,110 @@
+"""Tests for the preflight import pass cache and its parallel fallback."""
+
+import os
+import uuid
+
+import preflight.preflight_runner as preflight_runner_module
+from preflight.preflight_runner import PreflightRunner
+
+
+def _tool(tmp_path):
+    """A plugin tool whose module imports a sibling helper module."""
+    helper = f"helper_{uuid.uuid4().hex[:8]}"
+    tools = tmp_path / "tools"
+    tools.mkdir()
+    (tools / f"{helper}.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (tools / "tool.py").write_text(
+        f"import {helper}\n\n\nclass Tool:\n    pass\n", encoding="utf-8"
+    )
+    meta = {"module": "tools.tool", "_plugin_dir": str(tmp_path), "classes": ["Tool"]}
+    return meta, tools / f"{helper}.py"
+
+
+def _bump(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestImportCache:
+
+    def test_pass_is_cached_until_an_imported_file_changes(self, tmp_path):
+        meta, helper = _tool(tmp_path)
+        runner = PreflightRunner(categories=["test"], parallel=False)
+        assert runner._check_tool("test", "tool", meta).success
+        entry = next(iter(runner._new_passes.values()))
+        assert str(helper.resolve()) in entry["deps"]
+
+        cached = PreflightRunner(categories=["test"], parallel=False)
+        cached._cache = dict(runner._new_passes)
+        assert cached._cached_pass(meta) is not None
+
+        _bump(helper)
+        assert cached._cached_pass(meta) is None
+
+    def test_shared_dependency_invalidates_every_tool_importing_it(self, tmp_path):
+        meta, helper = _tool(tmp_path)
+        shared = tmp_path / "tools" / "shared.py"
+        shared.write_text(f"from {helper.stem} import VALUE\n", encoding="utf-8")
+        for name in ("first", "second"):
+            (tmp_path / "tools" / f"{name}.py").write_text(
+                "from shared import VALUE\n", encoding="utf-8"
+            )
+        tools = {
+            name: {"module": f"tools.{name}", "_plugin_dir": str(tmp_path)}
+            for name in ("first", "second")
+        }
+
+        runner = PreflightRunner(categories=["test"], parallel=False)
+        for name, tool_meta in tools.items():
+            assert runner._check_tool("test", name, tool_meta).success
+        for entry in runner._new_passes.values():
+            assert {str(shared.resolve()), str(helper.resolve())} <= set(entry["deps"])
+
+        cached = PreflightRunner(categories=["test"], parallel=False)
+        cached._cache = dict(runner._new_passes)
+        assert all(cached._cached_pass(m) is not None for m in tools.values())
+        _bump(helper)
+        assert all(cached._cached_pass(m) is None for m in tools.values())
+
+    def test_write_cache_prunes_changed_and_deleted_modules(self, tmp_path):
+        meta, _ = _tool(tmp_path)
+        runner = PreflightRunner(categories=["test"], parallel=False)
+        runner._check_tool("test", "tool", meta)
+        tool_file = str((tmp_path / "tools" / "tool.py").resolve())
+        runner._cache = {
+            str(tmp_path / "gone.py"): {"mtime_ns": 1, "size": 1, "deps": {}},
+            tool_file: {"mtime_ns": 1, "size": 1, "deps": {}},
+        }
+        runner._new_passes.clear()
+        cache_path = tmp_path / "cache.json"
+        runner._write_cache(cache_path)
+        assert PreflightRunner._read_cache(cache_path) == {}
+
+        runner._check_tool("test", "tool", meta)
+        runner._write_cache(cache_path)
+        assert list(PreflightRunner._read_cache(cache_path)) == [tool_file]
+
+
+class TestParallelFallback:
+
+    def test_worker_failure_falls_back_to_serial(self, tmp_path, monkeypatch):
+        class FailingPool:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def submit(self, *args, **kwargs):
+                raise RuntimeError("worker crashed")
+
+        monkeypatch.setattr(preflight_runner_module, "ProcessPoolExecutor", FailingPool)
+        meta, _ = _tool(tmp_path)
+        runner = PreflightRunner(categories=["a", "b"])
+        runner._new_passes["stale"] = {}
+        work = {"a": {"tool": meta}, "b": {"tool": meta}}
+        assert runner._check_in_pool(["a", "b"], work) == {}
+        assert runner._new_passes == {}
@@ -0,0 +1,88 @@
+"""Tests for running re-entrant tools in-process."""
+
+import subprocess
+import sys
+import textwrap
+import threading
+from pathlib import Path
+
+import pytest
+
+from pipeline import builtin_actions, tool_runner
+from pipeline.tool_runner import ToolStillRunning, run_inprocess, runs_inprocess
+
+PLUGINS_DIR = Path(__file__).resolve().parents[2]
+
+
+def _tool(tmp_path, name, body, reentrant=True):
+    script = tmp_path / name
+    header = "REENTRANT = True\n" if reentrant else ""
+    script.write_text(header + textwrap.dedent(body))
+    return [sys.executable, str(script)]
+
+
+class TestRunInprocess:
+
+    def test_output_captured_and_process_state_restored(self, tmp_path):
+        cmd = _tool(tmp_path, "echo_tool.py", """
+            import sys
+
+            def main(argv=None):
+                print("out", *argv)
+                sys.stderr.write("err\\n")
+                return 3
+        """)
+        stdout, stderr, path = sys.stdout, sys.stderr, list(sys.path)
+
+        result = run_inprocess(cmd + ["a", "b"], timeout=5)
+        assert (result.returncode, result.stdout, result.stderr) == (3, "out a b\n", "err\n")
+        assert sys.stdout is stdout and sys.stderr is stderr
+        assert sys.path == path
+
+    def test_tool_without_marker_runs_as_subprocess(self, tmp_path):
+        cmd = _tool(tmp_path, "plain_tool.py", """
+            def main(argv=None):
+                return 0
+        """, reentrant=False)
+        assert not runs_inprocess(cmd)
+        assert run_inprocess(cmd, timeout=5) is None
+
+    def test_timed_out_tool_is_not_started_again(self, tmp_path):
+        release = threading.Event()
+        cmd = _tool(tmp_path, "slow_tool.py", """
+            def main(argv=None):
+                RELEASE.wait(10)
+        """)
+        script = tool_runner._script_of(cmd)
+        tool_runner._load(script).RELEASE = release
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_inprocess(cmd, timeout=0.05)
+        assert runs_inprocess(cmd)
+        with pytest.raises(ToolStillRunning):
+            run_inprocess(cmd, timeout=5)
+        result = builtin_actions._run_tool(cmd, timeout=5)
+        assert not result["success"]
+        assert "still running" in result["message"]
+
+        # Once the orphaned call returns the tool runs as a subprocess
+        release.set()
+        tool_runner._orphans[str(script)].join(5)
+        assert not runs_inprocess(cmd)
+        assert run_inprocess(cmd, timeout=5) is None
+
+    def test_brain_index_generator_runs_twice_in_process(self, tmp_path):
+        pytest.importorskip("yaml")
+        script = PLUGINS_DIR / "pm-os-brain" / "tools" / "index" / "brain_index_generator.py"
+        if not script.exists():
+            pytest.skip("pm-os-brain not available")
+        brain = tmp_path / "brain"
+        brain.mkdir()
+        cmd = [sys.executable, str(script), "--brain-path", str(brain)]
+        assert runs_inprocess(cmd)
+
+        for output in ("first.md", "second.md"):
+            result = run_inprocess(cmd + ["--output", str(tmp_path / output)], timeout=60)
+            assert result.returncode == 0, result.stderr
+            assert f"Generated {tmp_path / output}" in result.stdout
+        assert (tmp_path / "first.md").read_text() == (tmp_path / "second.md").read_text()
@@ -0,0 +1,143 @@
+"""Tests for the background worker daemon and its socket protocol."""
+
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from pipeline.worker_daemon import ACTIVE_STATES, WorkerClient, WorkerDaemon
+
+PLUGINS_DIR = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def worker(tmp_path):
+    """A daemon serving one job at a time on a socket under tmp_path."""
+    daemon = WorkerDaemon(tmp_path / "worker.sock", jobs=1)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    client = WorkerClient(daemon.socket_path, timeout=5.0)
+    for _ in range(50):
+        if client.available():
+            break
+        time.sleep(0.05)
+    yield daemon, client
+    for job_id in list(daemon.jobs):
+        client.cancel(job_id)
+    daemon.shutdown()
+    thread.join(5)
+
+
+def _script(tmp_path, name, source):
+    path = tmp_path / name
+    path.write_text(source, encoding="utf-8")
+    return [sys.executable, str(path)]
+
+
+def _wait(client, job_id, states=ACTIVE_STATES, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.status(job_id)["job"]
+        if job["status"] not in states or time.monotonic() > deadline:
+            return job
+        time.sleep(0.05)
+
+
+class TestWorkerDaemon:
+
+    def test_submit_round_trip_uses_env_and_cwd(self, worker, tmp_path):
+        _, client = worker
+        cmd = _script(tmp_path, "show.py", (
+            "import os\n"
+            "print(os.getcwd())\n"
+            "print(os.environ['PMOS_WORKER_TEST'])\n"
+        ))
+        status_file = tmp_path / "show.json"
+        workdir = tmp_path / "work"
+        workdir.mkdir()
+
+        response = client.submit(
+            cmd, "show", str(status_file),
+            env={**os.environ, "PMOS_WORKER_TEST": "from-client"}, cwd=str(workdir),
+        )
+        assert response["ok"]
+        job_id = response["job"]["job_id"]
+        assert _wait(client, job_id)["status"] == "completed"
+
+        result = client.result(job_id)["job"]
+        assert result["mode"] == "subprocess"
+        assert result["stdout"].splitlines() == [str(workdir.resolve()), "from-client"]
+
+        status = json.loads(status_file.read_text())
+        assert status["job_id"] == job_id
+        assert status["status"] == "completed"
+        assert status["success"] is True
+        assert status["returncode"] == 0
+
+    def test_inprocess_only_when_context_matches(self, worker, tmp_path):
+        _, client = worker
+        cmd = _script(tmp_path, "reentrant.py", (
+            "import os\n"
+            "REENTRANT = True\n"
+            "def main(argv=None):\n"
+            "    print(os.getpid())\n"
+        ))
+
+        same = client.submit(cmd, "same")["job"]["job_id"]
+        assert _wait(client, same)["status"] == "completed"
+        result = client.result(same)["job"]
+        assert result["mode"] == "inprocess"
+        assert result["stdout"].strip() == str(os.getpid())
+
+        moved = client.submit(cmd, "moved", cwd=str(tmp_path))["job"]["job_id"]
+        assert _wait(client, moved)["status"] == "completed"
+        assert client.result(moved)["job"]["mode"] == "subprocess"
+
+        changed = client.submit(cmd, "changed", env={**os.environ, "PMOS_X": "1"})["job"]["job_id"]
+        assert _wait(client, changed)["status"] == "completed"
+        assert client.result(changed)["job"]["mode"] == "subprocess"
+
+    def test_index_job_runs_in_worker_process(self, worker, tmp_path):
+        _, client = worker
+        script = PLUGINS_DIR / "pm-os-cce" / "tools" / "feature" / "feature_index_generator.py"
+        if not script.exists():
+            pytest.skip("pm-os-cce not available")
+        products = tmp_path / "products"
+        products.mkdir()
+        output = tmp_path / "FEATURES.md"
+        cmd = [
+            sys.executable, str(script),
+            "--products-path", str(products), "--output", str(output),
+        ]
+
+        for name in ("first", "second"):
+            job_id = client.submit(cmd, name)["job"]["job_id"]
+            assert _wait(client, job_id)["status"] == "completed"
+            result = client.result(job_id)["job"]
+            assert result["mode"] == "inprocess"
+            assert "Feature index generated" in result["stdout"]
+        assert output.exists()
+
+    def test_cancel_running_and_queued_jobs(self, worker, tmp_path):
+        daemon, client = worker
+        cmd = _script(tmp_path, "sleep.py", "import time\ntime.sleep(30)\n")
+        status_file = tmp_path / "sleep.json"
+
+        running = client.submit(cmd, "sleep", str(status_file))["job"]["job_id"]
+        queued = client.submit(cmd, "queued")["job"]["job_id"]
+        _wait(client, running, states=("queued",))
+
+        assert client.cancel(queued)["job"]["status"] == "cancelled"
+        client.cancel(running)
+        assert _wait(client, running)["status"] == "cancelled"
+
+        status = json.loads(status_file.read_text())
+        assert status["status"] == "cancelled"
+        assert status["success"] is False
+        assert daemon._cancelled == set()
+        assert client.status()["ok"]
+        assert client.request("status", job_id="missing")["ok"] is False
@@ -28,6 +28,8 @@ _TOOLS_DIR = _PLUGIN_ROOT / "tools"
 if str(_TOOLS_DIR) not in sys.path:
     sys.path.insert(0, str(_TOOLS_DIR))
 
+from pipeline.tool_runner import ToolStillRunning, run_inprocess
+
 
 def _resolve_env():
     """Resolve PM-OS environment variables."""
@@ -79,7 +81,10 @@ def run_step(
 
     print(f"  [RUN] {name}...")
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        # Re-entrant tools run in this process; the rest are spawned
+        result = run_inprocess(cmd, timeout=300) or subprocess.run(
+            cmd, capture_output=True, text=True, timeout=300
+        )
         if result.returncode == 0:
             print(f"  [OK] {name}")
             if capture_stdout:
@@ -95,6 +100,9 @@ def run_step(
     except subprocess.TimeoutExpired:
         print(f"  [TIMEOUT] {name}")
         return "" if capture_stdout else not required
+    except ToolStillRunning as e:
+        print(f"  [TIMEOUT] {name}: {e}")
+        return "" if capture_stdout else not required
     except Exception as e:
         print(f"  [ERROR] {name}: {e}")
         return "" if capture_stdout else not required
@@ -115,7 +123,7 @@ def _check_background_tasks(user_dir: str):
             if state == "completed":
                 print(f"  [BG-DONE] {name}: completed at {bg.get('completed_at', '?')}")
                 sf.unlink()
-            elif state == "failed":
+            elif state in ("failed", "cancelled"):
                 print(f"  [BG-FAIL] {name}: {str(bg.get('message', 'unknown'))[:100]}")
                 sf.unlink()
             elif state == "running":
@@ -124,7 +132,8 @@ def _check_background_tasks(user_dir: str):
                     try:
                         os.kill(pid, 0)
                         started = bg.get("started_at", "")
-                        if started:
+                        # Worker jobs report the daemon PID; it enforces its own timeout
+                        if started and not bg.get("job_id"):
                             age = (datetime.now() - datetime.fromisoformat(started)).total_seconds()
                             if age > 3600:
                                 try:
@@ -17,30 +17,62 @@ import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 try:
     from pipeline.action_registry import ActionRegistry
+    from pipeline.pipeline_trace import trace_span
+    from pipeline.tool_runner import ToolStillRunning, run_inprocess, runs_inprocess
+    from pipeline.worker_daemon import worker_client
 except ImportError:
     from action_registry import ActionRegistry
+    from pipeline_trace import trace_span
+    from tool_runner import ToolStillRunning, run_inprocess, runs_inprocess
+    from worker_daemon import worker_client
 
 logger = logging.getLogger(__name__)
 
 
 def _run_tool(cmd: list, timeout: int = 120) -> Dict[str, Any]:
-    """Run a tool subprocess and return standardized result."""
+    """Run a tool subprocess and return standardized result.
+
+    Re-entrant Python tools run in-process (see tool_runner.py); others
+    are spawned. Either way the run is recorded as spans of the running
+    pipeline step.
+    """
+    tool = Path(str(cmd[1] if len(cmd) > 1 else cmd[0])).name
     try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=timeout,
-            env={**os.environ},
-        )
-        success = result.returncode == 0
-        output = result.stdout.strip()
-        error = result.stderr.strip()
+        completed = None
+        if runs_inprocess(cmd):
+            with trace_span("inprocess", kind="inprocess", tool=tool):
+                completed = run_inprocess(cmd, timeout)
+        if completed is not None:
+            returncode, stdout, stderr = completed.returncode, completed.stdout, completed.stderr
+        else:
+            with trace_span("spawn", kind="spawn", tool=tool):
+                proc = subprocess.Popen(
+                    cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                    env={**os.environ},
+                )
+            with trace_span("subprocess", tool=tool, pid=proc.pid) as span:
+                try:
+                    stdout, stderr = proc.communicate(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.communicate()
+                    raise
+                if span is not None:
+                    span.attrs["returncode"] = proc.returncode
+            returncode = proc.returncode
+        success = returncode == 0
+        output = stdout.strip()
+        error = stderr.strip()
         message = output[:200] if output else (error[:200] if error else "completed")
         return {"success": success, "message": message, "data": {"stdout": output, "stderr": error}}
     except subprocess.TimeoutExpired:
         return {"success": False, "message": f"Timeout after {timeout}s", "data": {}}
+    except ToolStillRunning as e:
+        return {"success": False, "message": str(e), "data": {}}
     except FileNotFoundError as e:
         return {"success": False, "message": f"Tool not found: {e}", "data": {}}
 
@@ -129,7 +161,11 @@ def _background_status_dir() -> Path:
 
 
 def _run_tool_background(cmd: list, step_name: str) -> Dict[str, Any]:
-    """Launch a tool subprocess in the background with status tracking."""
+    """Launch a tool in the background with status tracking.
+
+    Submits a job to the worker daemon when one is running (see
+    worker_daemon.py); otherwise spawns background_wrapper.py.
+    """
     status_dir = _background_status_dir()
     status_file = status_dir / f"{step_name}.json"
 
@@ -153,6 +189,21 @@ def _run_tool_background(cmd: list, step_name: str) -> Dict[str, Any]:
         except (json.JSONDecodeError, IOError):
             pass
 
+    client = worker_client()
+    if client is not None:
+        try:
+            response = client.submit(cmd, step_name, str(status_file))
+            if response.get("ok"):
+                job = response["job"]
+                return {
+                    "success": True,
+                    "message": f"Submitted to worker (job {job['job_id']})",
+                    "data": {"job_id": job["job_id"], "status_file": str(status_file)},
+                }
+            logger.warning("Worker rejected %s: %s", step_name, response.get("error"))
+        except OSError as e:
+            logger.warning("Worker unavailable for %s: %s", step_name, e)
+
     try:
         wrapper_script = str(Path(__file__).parent / "background_wrapper.py")
         wrapped_cmd = [
@@ -215,6 +266,18 @@ def action_preflight_check(args: Dict[str, Any], context: Dict[str, Any]) -> Dic
 # Background task management (Base-owned)
 # ---------------------------------------------------------------------------
 
+def _worker_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """Job state from the worker daemon, or None if it no longer knows it."""
+    client = worker_client()
+    if client is None:
+        return None
+    try:
+        response = client.status(job_id)
+    except OSError:
+        return None
+    return response.get("job") if response.get("ok") else None
+
+
 def action_check_background(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     """Check and report results of background pipeline steps."""
     status_dir = _background_status_dir()
@@ -232,9 +295,18 @@ def action_check_background(args: Dict[str, Any], context: Dict[str, Any]) -> Di
 
         state = status.get("status", "unknown")
 
-        if state in ("completed", "failed"):
+        if state in ("completed", "failed", "cancelled"):
             results.append(status)
             status_file.unlink(missing_ok=True)
+        elif state == "running" and status.get("job_id"):
+            # Worker job: the daemon rewrites the file when the job ends
+            job = _worker_job(status["job_id"])
+            if job is not None and job.get("status") in ("queued", "running", "cancelling"):
+                status["status"] = "still_running"
+            else:
+                status["status"] = "crashed"
+                status_file.unlink(missing_ok=True)
+            results.append(status)
         elif state == "running":
             pid = status.get("pid")
             if pid:
@@ -267,7 +339,9 @@ def action_check_background(args: Dict[str, Any], context: Dict[str, Any]) -> Di
             status_file.unlink(missing_ok=True)
 
     completed = [r for r in results if r.get("status") == "completed"]
-    failed = [r for r in results if r.get("status") in ("failed", "crashed", "killed_stale")]
+    failed = [
+        r for r in results if r.get("status") in ("failed", "crashed", "killed_stale", "cancelled")
+    ]
     running = [r for r in results if r.get("status") == "still_running"]
 
     parts = []
@@ -5,8 +5,21 @@ Pipeline Executor — loads YAML pipeline definitions and executes them.
 Supports plugin-contributed pipeline extensions: plugins can add steps
 to boot.yaml and logout.yaml via extension files.
 
+With max_workers > 1 (pipeline YAML or --workers), steps run concurrently
+in a bounded thread pool as soon as their dependencies finish. A step
+depends on the steps named in its depends_on, on the step an extension
+inserted it after, on those named in its wait_for that are present in
+the pipeline, and on any step whose ${_result_<name>} it references in
+args or condition. Steps that touch the same files must declare one of
+these. Results are reported in pipeline order.
+
+Each run writes a timing trace (see pipeline_trace.py); --profile prints
+the slowest steps against the median of recent runs plus a flame view.
+
 Usage:
     python3 pipeline_executor.py --run boot.yaml --var quick=true
+    python3 pipeline_executor.py --run boot.yaml --workers 4
+    python3 pipeline_executor.py --run boot.yaml --profile
     python3 pipeline_executor.py --list boot.yaml
     python3 pipeline_executor.py --validate boot.yaml
 """
@@ -17,8 +30,9 @@ import os
 import re
 import sys
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import yaml
 
@@ -32,6 +46,13 @@ try:
         StepResult,
     )
     from pipeline.action_registry import ActionRegistry
+    from pipeline.pipeline_trace import (
+        DEFAULT_HISTORY_RUNS,
+        PipelineTrace,
+        default_trace_dir,
+        flame_report,
+        profile_report,
+    )
 except ImportError:
     from pipeline_schema import (
         ErrorStrategy,
@@ -42,15 +63,41 @@ except ImportError:
         StepResult,
     )
     from action_registry import ActionRegistry
+    from pipeline_trace import (
+        DEFAULT_HISTORY_RUNS,
+        PipelineTrace,
+        default_trace_dir,
+        flame_report,
+        profile_report,
+    )
 
 logger = logging.getLogger(__name__)
 
+RESULT_REF_PATTERN = re.compile(r"\b(_result_\w+)")
+
+
+def result_key(step_name: str) -> str:
+    """Context key under which a step's result data is stored."""
+    return f"_result_{step_name.replace('-', '_').replace(' ', '_')}"
+
+
+def _as_list(value: Any) -> List[str]:
+    """Normalize a YAML scalar-or-list field to a list of strings."""
+    if not value:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(v) for v in value]
+    return [str(value)]
+
 
 class PipelineExecutor:
     """Loads and executes YAML pipeline definitions with plugin extension support."""
 
-    def __init__(self, registry: ActionRegistry):
+    def __init__(self, registry: ActionRegistry, trace_dir: Optional[Path] = None):
         self.registry = registry
+        self.trace_dir = trace_dir
+        # In-memory until execute() starts a traced run
+        self._trace = PipelineTrace("")
 
     def load(self, yaml_path: Path) -> PipelineDefinition:
         """Load a pipeline definition from a YAML file."""
@@ -101,6 +148,8 @@ class PipelineExecutor:
                 timeout_seconds=step_raw.get("timeout_seconds", 0),
                 description=step_raw.get("description", ""),
                 background=step_raw.get("background", False),
+                depends_on=_as_list(step_raw.get("depends_on")),
+                wait_for=_as_list(step_raw.get("wait_for")),
             ))
 
         error_strategy_str = raw.get("error_strategy", "fail_fast")
@@ -118,6 +167,7 @@ class PipelineExecutor:
             variables=raw.get("variables", {}),
             error_strategy=error_strategy,
             version=raw.get("version", "1.0"),
+            max_workers=max(1, int(raw.get("max_workers", 1))),
         )
 
     def _discover_extensions(self, base_path: Path, pipeline_name: str) -> List[Dict[str, Any]]:
@@ -181,6 +231,8 @@ class PipelineExecutor:
                     timeout_seconds=step_raw.get("timeout_seconds", 0),
                     description=step_raw.get("description", ""),
                     background=step_raw.get("background", False),
+                    depends_on=_as_list(step_raw.get("depends_on")) or _as_list(after),
+                    wait_for=_as_list(step_raw.get("wait_for")),
                 )
 
                 # Insert after the named step
@@ -202,18 +254,93 @@ class PipelineExecutor:
     def validate(self, pipeline: PipelineDefinition) -> List[str]:
         """Validate a pipeline definition against the registry."""
         issues = []
+        names = {step.name for step in pipeline.steps}
         for step in pipeline.steps:
             if not self.registry.has(step.action):
                 issues.append(f"Step '{step.name}': unknown action '{step.action}'")
+            for dep in step.depends_on:
+                if dep not in names:
+                    issues.append(f"Step '{step.name}': depends on unknown step '{dep}'")
+
+        cycle = self._find_cycle(self.dependencies(pipeline))
+        if cycle:
+            path = " -> ".join(pipeline.steps[i].name for i in cycle)
+            issues.append(f"Dependency cycle: {path}")
         return issues
 
+    def dependencies(self, pipeline: PipelineDefinition) -> List[Set[int]]:
+        """
+        Step indices each step depends on.
+
+        Combines declared depends_on and wait_for with steps whose
+        _result_ keys the step references in its args or condition.
+        Unknown names are ignored (validate() reports those in
+        depends_on).
+        """
+        by_name: Dict[str, List[int]] = {}
+        by_result: Dict[str, List[int]] = {}
+        for i, step in enumerate(pipeline.steps):
+            by_name.setdefault(step.name, []).append(i)
+            by_result.setdefault(result_key(step.name), []).append(i)
+
+        deps: List[Set[int]] = []
+        for i, step in enumerate(pipeline.steps):
+            found: Set[int] = set()
+            for dep in step.depends_on + step.wait_for:
+                found.update(by_name.get(dep, []))
+            texts = [v for v in step.args.values() if isinstance(v, str)]
+            if step.condition:
+                texts.append(step.condition)
+            for text in texts:
+                for ref in RESULT_REF_PATTERN.findall(text):
+                    found.update(by_result.get(ref, []))
+            found.discard(i)
+            deps.append(found)
+        return deps
+
+    @staticmethod
+    def _find_cycle(deps: List[Set[int]]) -> List[int]:
+        """Return one dependency cycle as a list of step indices, or []."""
+        state = [0] * len(deps)  # 0 = new, 1 = on stack, 2 = done
+        for root in range(len(deps)):
+            if state[root]:
+                continue
+            stack = [(root, iter(sorted(deps[root])))]
+            path = [root]
+            state[root] = 1
+            while stack:
+                node, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    stack.pop()
+                    path.pop()
+                    state[node] = 2
+                elif state[child] == 1:
+                    return path[path.index(child):] + [child]
+                elif state[child] == 0:
+                    state[child] = 1
+                    path.append(child)
+                    stack.append((child, iter(sorted(deps[child]))))
+        return []
+
     def execute(
         self,
         pipeline: PipelineDefinition,
         var_overrides: Optional[Dict[str, Any]] = None,
         dry_run: bool = False,
+        max_workers: Optional[int] = None,
+        trace: Optional[PipelineTrace] = None,
     ) -> PipelineResult:
-        """Execute a pipeline definition."""
+        """Execute a pipeline definition.
+
+        Args:
+            pipeline: Pipeline to run
+            var_overrides: Context variables overriding pipeline defaults
+            dry_run: Print steps without running actions
+            max_workers: Concurrent steps (default: pipeline.max_workers)
+            trace: Span collector (default: a trace file per run under
+                the executor's trace_dir or $PM_OS_USER/.cache)
+        """
         context: Dict[str, Any] = dict(pipeline.variables)
         if var_overrides:
             context.update(var_overrides)
@@ -225,51 +352,155 @@ class PipelineExecutor:
         result = PipelineResult(pipeline_name=pipeline.name, success=True)
         start_time = time.time()
 
+        if trace is None:
+            trace_dir = None if dry_run else self.trace_dir or default_trace_dir()
+            trace = PipelineTrace(pipeline.name, trace_dir)
+        self._trace = trace
+        result.trace_path = str(trace.path) if trace.path else None
+
         print(f"=== Pipeline: {pipeline.name} ===")
         if pipeline.description:
             print(f"    {pipeline.description}")
         print()
 
-        for step in pipeline.steps:
-            step_result = self._execute_step(step, context, dry_run)
-            result.step_results.append(step_result)
-
-            if step_result.skipped:
-                result.steps_skipped += 1
-            elif step_result.backgrounded:
-                result.steps_executed += 1
-            elif step_result.success:
-                result.steps_executed += 1
-                if step_result.data:
-                    context[f"_result_{step.name.replace('-', '_').replace(' ', '_')}"] = step_result.data
+        workers = max_workers if max_workers is not None else pipeline.max_workers
+        with trace.activate(), trace.span(pipeline.name, kind="pipeline", workers=workers):
+            if workers > 1 and len(pipeline.steps) > 1:
+                self._execute_parallel(pipeline, context, dry_run, result, workers)
             else:
-                result.steps_failed += 1
-                result.steps_executed += 1
-
-                if pipeline.error_strategy == ErrorStrategy.FAIL_FAST:
-                    result.success = False
-                    print(f"\n  [ABORT] Fail-fast: stopping pipeline after '{step.name}'")
-                    break
-                elif pipeline.error_strategy == ErrorStrategy.CONTINUE:
-                    print(f"  [CONTINUE] Ignoring failure in '{step.name}'")
+                for step in pipeline.steps:
+                    step_result = self._execute_step(step, context, dry_run)
+                    result.step_results.append(step_result)
+                    if self._record(pipeline, step, step_result, context, result):
+                        break
 
         if result.steps_failed > 0:
             result.success = False
 
         result.total_duration_ms = int((time.time() - start_time) * 1000)
+        trace.finish(
+            success=result.success,
+            total_ms=result.total_duration_ms,
+            steps_executed=result.steps_executed,
+            steps_failed=result.steps_failed,
+            steps_skipped=result.steps_skipped,
+        )
         print(f"\n{result.summary}")
         return result
 
+    def _record(
+        self,
+        pipeline: PipelineDefinition,
+        step: PipelineStep,
+        step_result: StepResult,
+        context: Dict[str, Any],
+        result: PipelineResult,
+    ) -> bool:
+        """Count a finished step and publish its data; True means abort."""
+        if step_result.skipped:
+            result.steps_skipped += 1
+        elif step_result.backgrounded:
+            result.steps_executed += 1
+        elif step_result.success:
+            result.steps_executed += 1
+            if step_result.data:
+                context[result_key(step.name)] = step_result.data
+        else:
+            result.steps_failed += 1
+            result.steps_executed += 1
+
+            if pipeline.error_strategy == ErrorStrategy.FAIL_FAST:
+                result.success = False
+                print(f"\n  [ABORT] Fail-fast: stopping pipeline after '{step.name}'")
+                return True
+            elif pipeline.error_strategy == ErrorStrategy.CONTINUE:
+                print(f"  [CONTINUE] Ignoring failure in '{step.name}'")
+        return False
+
+    def _execute_parallel(
+        self,
+        pipeline: PipelineDefinition,
+        context: Dict[str, Any],
+        dry_run: bool,
+        result: PipelineResult,
+        workers: int,
+    ) -> None:
+        """Run steps in a bounded pool, each once its dependencies finish.
+
+        Ready steps start in pipeline order. Step results are published to
+        the context by this thread before dependents are submitted, and are
+        reported in pipeline order. On fail-fast abort, running steps are
+        allowed to finish but nothing new starts.
+        """
+        steps = pipeline.steps
+        deps = self.dependencies(pipeline)
+        pending = list(range(len(steps)))
+        done: Set[int] = set()
+        results: List[Optional[StepResult]] = [None] * len(steps)
+        running: Dict[Any, int] = {}
+        aborted = False
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pipeline") as pool:
+            while running or (pending and not aborted):
+                if not aborted:
+                    ready = [i for i in pending if deps[i] <= done]
+                    if not ready and not running:
+                        # Dependency cycle: fall back to pipeline order
+                        ready = pending[:1]
+                    for i in ready[: workers - len(running)]:
+                        pending.remove(i)
+                        future = pool.submit(
+                            self._execute_step, steps[i], context, dry_run, True
+                        )
+                        running[future] = i
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in sorted(finished, key=running.get):
+                    i = running.pop(future)
+                    results[i] = future.result()
+                    done.add(i)
+                    if self._record(pipeline, steps[i], results[i], context, result):
+                        aborted = True
+
+        result.step_results.extend(r for r in results if r is not None)
+
     def _execute_step(
-        self, step: PipelineStep, context: Dict[str, Any], dry_run: bool,
+        self,
+        step: PipelineStep,
+        context: Dict[str, Any],
+        dry_run: bool,
+        concurrent: bool = False,
     ) -> StepResult:
-        """Execute a single pipeline step."""
-        if step.condition and not self._evaluate_condition(step.condition, context):
-            print(f"  [SKIP] {step.name} (condition: {step.condition})")
-            return StepResult(
-                step_name=step.name, action=step.action, success=True,
-                skipped=True, message=f"Skipped: condition '{step.condition}' not met",
-            )
+        """Execute a single pipeline step inside a trace span.
+
+        With concurrent=True each step prints one complete line when it
+        finishes, so output from parallel steps does not interleave.
+        """
+        with self._trace.span(step.name, kind="step", action=step.action) as span:
+            step_result = self._run_step(step, context, dry_run, concurrent)
+            span.attrs.update(success=step_result.success, skipped=step_result.skipped)
+        step_result.phases = {name: int(ms) for name, ms in span.phases.items()}
+        step_result.rss_growth_kb = span.attrs.get("rss_growth_kb", 0)
+        return step_result
+
+    def _run_step(
+        self,
+        step: PipelineStep,
+        context: Dict[str, Any],
+        dry_run: bool,
+        concurrent: bool,
+    ) -> StepResult:
+        """Evaluate, interpolate and run one step, timing each phase."""
+        trace = self._trace
+        if step.condition:
+            with trace.span("condition"):
+                met = self._evaluate_condition(step.condition, context)
+            if not met:
+                print(f"  [SKIP] {step.name} (condition: {step.condition})")
+                return StepResult(
+                    step_name=step.name, action=step.action, success=True,
+                    skipped=True, message=f"Skipped: condition '{step.condition}' not met",
+                )
 
         action_fn = self.registry.resolve(step.action)
         if action_fn is None:
@@ -277,7 +508,8 @@ class PipelineExecutor:
             print(f"  [ERROR] {step.name}: {msg}")
             return StepResult(step_name=step.name, action=step.action, success=False, error=msg)
 
-        resolved_args = self._resolve_args(step.args, context)
+        with trace.span("interpolate"):
+            resolved_args = self._resolve_args(step.args, context)
 
         if dry_run:
             print(f"  [DRY-RUN] {step.name}: {step.action}({resolved_args})")
@@ -290,11 +522,15 @@ class PipelineExecutor:
             resolved_args["background"] = True
 
         tag = "BACKGROUND" if step.background else "RUN"
-        print(f"  [{tag}] {step.name}: {step.action} ...", end="", flush=True)
+        label = f"  [{tag}] {step.name}: {step.action} ..."
+        prefix = label if concurrent else ""
+        if not concurrent:
+            print(label, end="", flush=True)
         start = time.time()
 
         try:
-            action_result = action_fn(resolved_args, context)
+            with trace.span("action"):
+                action_result = action_fn(resolved_args, context)
             duration_ms = int((time.time() - start) * 1000)
 
             success = action_result.get("success", True)
@@ -302,7 +538,7 @@ class PipelineExecutor:
             data = action_result.get("data", {})
 
             status = "OK" if success else "FAIL"
-            print(f" [{status}] {message} ({duration_ms}ms)")
+            print(f"{prefix} [{status}] {message} ({duration_ms}ms)")
 
             return StepResult(
                 step_name=step.name, action=step.action, success=success,
@@ -312,7 +548,7 @@ class PipelineExecutor:
         except Exception as e:
             duration_ms = int((time.time() - start) * 1000)
             error_msg = f"{type(e).__name__}: {e}"
-            print(f" [ERROR] {error_msg} ({duration_ms}ms)")
+            print(f"{prefix} [ERROR] {error_msg} ({duration_ms}ms)")
 
             if step.on_error == StepErrorAction.SKIP:
                 return StepResult(
@@ -391,6 +627,16 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Show steps without executing")
     parser.add_argument("--fallback", type=str, help="Fallback command if pipeline fails")
     parser.add_argument("--list-actions", action="store_true", help="List registered actions")
+    parser.add_argument(
+        "--workers", type=int, help="Run independent steps concurrently (default: pipeline max_workers)"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="Print slowest steps vs. recent runs and a flame view"
+    )
+    parser.add_argument(
+        "--profile-runs", type=int, default=DEFAULT_HISTORY_RUNS,
+        help=f"Earlier runs for the --profile median (default: {DEFAULT_HISTORY_RUNS})",
+    )
 
     args = parser.parse_args()
 
@@ -448,12 +694,26 @@ def main():
     if args.list:
         print(f"Pipeline: {pipeline.name}")
         print(f"Steps ({len(pipeline.steps)}):")
+        deps = executor.dependencies(pipeline)
         for i, step in enumerate(pipeline.steps, 1):
             cond = f" [if {step.condition}]" if step.condition else ""
-            print(f"  {i}. {step.name}: {step.action}{cond}")
+            after = sorted({pipeline.steps[d].name for d in deps[i - 1]})
+            needs = f" (after {', '.join(after)})" if after else ""
+            print(f"  {i}. {step.name}: {step.action}{cond}{needs}")
         return 0
 
-    result = executor.execute(pipeline, var_overrides=var_overrides, dry_run=args.dry_run)
+    result = executor.execute(
+        pipeline, var_overrides=var_overrides, dry_run=args.dry_run, max_workers=args.workers
+    )
+
+    if args.profile:
+        print()
+        if result.trace_path:
+            print(profile_report(Path(result.trace_path), runs=args.profile_runs))
+        else:
+            # Tracing disabled or no PM_OS_USER: report this run from memory
+            spans = [span.to_dict() for span in executor._trace.spans]
+            print(flame_report(spans))
 
     if not result.success and args.fallback:
         print(f"\n[FALLBACK] Pipeline failed, running: {args.fallback}")
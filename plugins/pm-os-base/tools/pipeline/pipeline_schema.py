@@ -3,7 +3,8 @@
 Pipeline Schema — dataclass definitions for YAML pipeline composition.
 
 A pipeline is a sequence of steps that execute actions from the action registry.
-Steps can have conditions, error strategies, and timeouts.
+Steps can have conditions, error strategies, timeouts, and dependencies on
+other steps (used when the pipeline runs with more than one worker).
 """
 
 from dataclasses import dataclass, field
@@ -36,6 +37,10 @@ class PipelineStep:
     timeout_seconds: int = 0
     description: str = ""
     background: bool = False
+    depends_on: List[str] = field(default_factory=list)
+    # Like depends_on, but for steps that may not be in the pipeline
+    # (e.g. contributed by a plugin that is not installed)
+    wait_for: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -47,6 +52,7 @@ class PipelineDefinition:
     variables: Dict[str, Any] = field(default_factory=dict)
     error_strategy: ErrorStrategy = ErrorStrategy.FAIL_FAST
     version: str = "1.0"
+    max_workers: int = 1
 
 
 @dataclass
@@ -61,6 +67,8 @@ class StepResult:
     backgrounded: bool = False
     duration_ms: int = 0
     error: Optional[str] = None
+    phases: Dict[str, int] = field(default_factory=dict)
+    rss_growth_kb: int = 0  # Rise of the process peak RSS during the step
 
 
 @dataclass
@@ -73,6 +81,7 @@ class PipelineResult:
     steps_executed: int = 0
     steps_skipped: int = 0
     steps_failed: int = 0
+    trace_path: Optional[str] = None
 
     @property
     def summary(self) -> str:
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Pipeline Trace — per-run timing spans for pipeline executions.
+
+Every pipeline run records nested spans (pipeline -> step -> phase ->
+sub-tool) with wall-clock start/end times, durations and memory: how far
+the process peak RSS rose during the span (rss_growth_kb) next to the
+process-lifetime peak (process_rss_peak_kb). Spans are appended to one JSONL file per run under
+$PM_OS_USER/.cache/pipeline-traces/, so partial traces survive crashes.
+
+Actions that spawn sub-tools open their own spans with trace_span(); it
+nests under the step running on the current thread and is a no-op when
+no pipeline is being traced.
+
+Usage:
+    python3 pipeline_trace.py report <trace.jsonl>
+    python3 pipeline_trace.py profile <trace.jsonl> [--runs 10]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+
+    HAS_RESOURCE = True
+except ImportError:  # Windows
+    HAS_RESOURCE = False
+
+TRACE_DIRNAME = "pipeline-traces"
+# Traces kept per pipeline; older files are pruned when a run starts
+MAX_TRACES_PER_PIPELINE = 50
+DEFAULT_HISTORY_RUNS = 10
+# A step is flagged when it is this much slower than its median...
+REGRESSION_RATIO = 1.25
+# ...and at least this many milliseconds slower
+REGRESSION_MIN_MS = 100
+
+_active: Optional["PipelineTrace"] = None
+
+
+def default_trace_dir() -> Optional[Path]:
+    """Trace directory under PM_OS_USER, or None when tracing is off."""
+    if os.environ.get("PM_OS_PIPELINE_TRACE", "1") == "0":
+        return None
+    user = os.environ.get("PM_OS_USER", "")
+    if not user:
+        return None
+    return Path(user) / ".cache" / TRACE_DIRNAME
+
+
+def run_files(trace_dir: Path, pipeline_name: str) -> List[Path]:
+    """Trace files of one pipeline, oldest first."""
+    pattern = re.compile(rf"^{re.escape(pipeline_name)}-\d{{8}}-\d{{12}}-\d+\.jsonl$")
+    return sorted(p for p in trace_dir.glob("*.jsonl") if pattern.match(p.name))
+
+
+def _rss_kb(who: int) -> int:
+    """Lifetime peak resident set size in KB (ru_maxrss is bytes on macOS)."""
+    if not HAS_RESOURCE:
+        return 0
+    peak = resource.getrusage(who).ru_maxrss
+    return int(peak / 1024) if sys.platform == "darwin" else int(peak)
+
+
+class Span:
+    """One timed region of a pipeline run."""
+
+    def __init__(self, span_id: int, parent_id: Optional[int], name: str, kind: str, attrs):
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attrs: Dict[str, Any] = dict(attrs)
+        self.start = time.time()
+        self._t0 = time.perf_counter()
+        self._rss0 = _rss_kb(resource.RUSAGE_SELF) if HAS_RESOURCE else 0
+        self.duration_ms = 0.0
+        self.end = self.start
+        # Nearest enclosing step span; descendants add their time to its phases
+        self.step: Optional["Span"] = None
+        self.phases: Dict[str, float] = {}
+
+    def finish(self) -> None:
+        self.duration_ms = (time.perf_counter() - self._t0) * 1000
+        self.end = self.start + self.duration_ms / 1000
+        if HAS_RESOURCE:
+            # ru_maxrss never falls, so only its rise belongs to this span
+            peak = _rss_kb(resource.RUSAGE_SELF)
+            self.attrs["rss_growth_kb"] = peak - self._rss0
+            self.attrs["process_rss_peak_kb"] = peak
+            self.attrs["child_rss_peak_kb"] = _rss_kb(resource.RUSAGE_CHILDREN)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": "span",
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start": datetime.fromtimestamp(self.start).isoformat(),
+            "end": datetime.fromtimestamp(self.end).isoformat(),
+            "duration_ms": round(self.duration_ms, 2),
+            **self.attrs,
+        }
+
+
+class PipelineTrace:
+    """Collects spans for one pipeline run and streams them to JSONL."""
+
+    def __init__(self, pipeline_name: str, trace_dir: Optional[Path] = None):
+        self.pipeline_name = pipeline_name
+        self.run_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S%f')}-{os.getpid()}"
+        self.spans: List[Span] = []
+        self.path: Optional[Path] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._next_id = 0
+        self._root: Optional[Span] = None
+
+        if trace_dir is not None:
+            try:
+                trace_dir.mkdir(parents=True, exist_ok=True)
+                self._prune(trace_dir)
+                self.path = trace_dir / f"{pipeline_name}-{self.run_id}.jsonl"
+                self._write({
+                    "type": "run",
+                    "pipeline": pipeline_name,
+                    "run_id": self.run_id,
+                    "started_at": datetime.now().isoformat(),
+                    "pid": os.getpid(),
+                })
+            except OSError:
+                self.path = None
+
+    def _prune(self, trace_dir: Path) -> None:
+        old = run_files(trace_dir, self.pipeline_name)
+        for stale in old[: max(0, len(old) - MAX_TRACES_PER_PIPELINE + 1)]:
+            stale.unlink(missing_ok=True)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        if self.path is None:
+            return
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, kind: str = "phase", **attrs: Any) -> Iterator[Span]:
+        """Time a region; nests under the current thread's open span."""
+        stack = self._stack()
+        parent = stack[-1] if stack else self._root
+        with self._lock:
+            self._next_id += 1
+            span = Span(self._next_id, parent.span_id if parent else None, name, kind, attrs)
+        span.step = span if kind == "step" else (parent.step if parent else None)
+        if self._root is None and kind == "pipeline":
+            self._root = span
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            stack.pop()
+            span.finish()
+            if span.step is not None and span.step is not span:
+                span.step.phases[name] = span.step.phases.get(name, 0.0) + span.duration_ms
+            if span.phases:
+                span.attrs["phases_ms"] = {k: round(v, 2) for k, v in span.phases.items()}
+            with self._lock:
+                self.spans.append(span)
+            self._write(span.to_dict())
+
+    @contextmanager
+    def activate(self) -> Iterator["PipelineTrace"]:
+        """Make this the trace that trace_span() reports to."""
+        global _active
+        previous, _active = _active, self
+        try:
+            yield self
+        finally:
+            _active = previous
+
+    def finish(self, **summary: Any) -> None:
+        """Write the run summary line."""
+        self._write({"type": "summary", "run_id": self.run_id, **summary})
+
+
+@contextmanager
+def trace_span(name: str, kind: str = "subprocess", **attrs: Any) -> Iterator[Optional[Span]]:
+    """Span in the active pipeline trace, or a no-op outside pipeline runs."""
+    trace = _active
+    if trace is None:
+        yield None
+        return
+    with trace.span(name, kind, **attrs) as span:
+        yield span
+
+
+# ---------------------------------------------------------------------------
+# Reports
+# ---------------------------------------------------------------------------
+
+def load_spans(path: Path) -> List[Dict[str, Any]]:
+    """Span records from a trace file (unreadable lines are skipped)."""
+    spans = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("type") == "span":
+                    spans.append(record)
+    except OSError:
+        pass
+    return spans
+
+
+def flame_report(spans: List[Dict[str, Any]], width: int = 40, min_ms: float = 1.0) -> str:
+    """Indented span tree with bars proportional to wall time."""
+    children: Dict[Optional[int], List[Dict[str, Any]]] = {}
+    for span in spans:
+        children.setdefault(span.get("parent_id"), []).append(span)
+    for group in children.values():
+        group.sort(key=lambda s: s["start"])
+
+    roots = children.get(None, [])
+    total = max((s["duration_ms"] for s in roots), default=0.0) or 1.0
+    lines: List[str] = []
+
+    def walk(span: Dict[str, Any], depth: int) -> None:
+        ms = span["duration_ms"]
+        if depth and ms < min_ms:
+            return
+        label = f"{'  ' * depth}{span['name']}"
+        bar = "#" * max(1 if ms else 0, int(round(width * ms / total)))
+        growth = span.get("rss_growth_kb") or 0
+        mem = f"  peak +{growth // 1024}MB" if growth >= 1024 else ""
+        lines.append(f"  {label:<36} {ms:>9.0f}ms {bar}{mem}")
+        for child in children.get(span["span_id"], []):
+            walk(child, depth + 1)
+
+    for root in roots:
+        walk(root, 0)
+    return "\n".join(lines)
+
+
+def step_durations(spans: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Step name -> duration of its step span (skipped steps excluded)."""
+    return {
+        s["name"]: s["duration_ms"]
+        for s in spans
+        if s.get("kind") == "step" and not s.get("skipped")
+    }
+
+
+def profile_report(
+    trace_path: Path,
+    runs: int = DEFAULT_HISTORY_RUNS,
+    top: int = 10,
+) -> str:
+    """
+    Slowest steps of a run against the median of the previous runs.
+
+    Args:
+        trace_path: Trace file of the run to report
+        runs: Number of earlier runs of the same pipeline to compare with
+        top: Number of steps to list
+
+    Returns:
+        Printable report including the flame view
+    """
+    spans = load_spans(trace_path)
+    current = step_durations(spans)
+
+    pipeline = trace_path.name.rsplit("-", 3)[0]
+    earlier = [
+        p for p in run_files(trace_path.parent, pipeline) if p.name < trace_path.name
+    ][-runs:]
+    history: Dict[str, List[float]] = {}
+    for path in earlier:
+        for name, ms in step_durations(load_spans(path)).items():
+            history.setdefault(name, []).append(ms)
+
+    lines = [f"=== Profile: {trace_path.stem} ===", ""]
+    lines.append(f"Top {min(top, len(current))} slowest steps (median of last {len(earlier)} runs):")
+    regressions = []
+    for name, ms in sorted(current.items(), key=lambda kv: -kv[1])[:top]:
+        past = history.get(name)
+        if past:
+            median = statistics.median(past)
+            change = f"{(ms - median) / median * 100:+.0f}%" if median >= 1 else "n/a"
+            lines.append(f"  {name:<28} {ms:>9.0f}ms   median {median:>8.0f}ms   {change}")
+            if ms > median * REGRESSION_RATIO and ms - median >= REGRESSION_MIN_MS:
+                regressions.append(f"{name} ({change})")
+        else:
+            lines.append(f"  {name:<28} {ms:>9.0f}ms   (no history)")
+    lines.append("")
+    lines.append("Regressions: " + (", ".join(regressions) if regressions else "none"))
+    lines.append("")
+    lines.append("Flame (wall time):")
+    lines.append(flame_report(spans))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PM-OS pipeline trace reports")
+    parser.add_argument("command", choices=["report", "profile"])
+    parser.add_argument("trace", type=Path, help="Trace JSONL file")
+    parser.add_argument("--runs", type=int, default=DEFAULT_HISTORY_RUNS, help="History runs for median")
+    args = parser.parse_args()
+
+    if args.command == "report":
+        print(flame_report(load_spans(args.trace)))
+    else:
+        print(profile_report(args.trace, runs=args.runs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Tool Runner — runs Python tool scripts inside the calling process.
+
+Pipeline actions and the boot orchestrator invoke tools as
+[python3, tool.py, *argv]. A fresh interpreter per step re-pays startup,
+re-imports yaml/dotenv and re-reads config. For tools that declare
+
+    REENTRANT = True  # main(argv) is safe to call repeatedly in-process
+
+at module level, run_inprocess() imports the script once and calls
+main(argv) with stdout/stderr captured for the calling thread only, so
+concurrent pipeline steps keep separate output. sys.stdout/sys.stderr and
+the script directory on sys.path are only swapped while calls are running.
+Anything else — other commands, tools without the marker, tools that timed
+out before — returns None and the caller falls back to a subprocess. While
+a timed-out call is still running, run_inprocess raises ToolStillRunning
+rather than starting a second copy of the tool.
+
+Set PM_OS_INPROCESS_TOOLS=0 to always use subprocesses.
+
+Usage:
+    from pipeline.tool_runner import run_inprocess
+
+    result = run_inprocess(cmd, timeout=30) or subprocess.run(cmd, ...)
+"""
+
+import hashlib
+import importlib.util
+import inspect
+import io
+import os
+import re
+import subprocess
+import sys
+import threading
+import traceback
+from contextlib import contextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterator, List, Optional, Set
+
+INPROCESS_ENV = "PM_OS_INPROCESS_TOOLS"
+# Checked in the source first so non-opted-in tools are never imported here
+REENTRANT_MARKER = re.compile(r"^REENTRANT\s*=\s*True\b", re.MULTILINE)
+
+_import_lock = threading.Lock()
+_modules: Dict[str, ModuleType] = {}
+# Scripts that must run as subprocesses (no marker, failed import, timed out)
+_subprocess_only: Set[str] = set()
+# One call at a time per tool; different tools may run concurrently
+_call_locks: Dict[str, threading.Lock] = {}
+# Timed-out calls whose thread may still be running
+_orphans: Dict[str, threading.Thread] = {}
+
+# Stream proxies and sys.path entries are held by the running calls
+_scope_lock = threading.Lock()
+_active_calls = 0
+_path_refs: Dict[str, int] = {}
+
+
+class ToolStillRunning(subprocess.SubprocessError):
+    """An earlier in-process call of the tool timed out and has not returned."""
+
+    def __init__(self, cmd: List[str]):
+        self.cmd = cmd
+        super().__init__(f"{Path(str(cmd[1])).name} is still running after an earlier timeout")
+
+
+class _ThreadStream:
+    """Stream proxy sending writes to a per-thread buffer when one is set."""
+
+    def __init__(self, target, local: threading.local):
+        self._target = target
+        self._local = local
+
+    def _current(self):
+        return getattr(self._local, "buffer", None) or self._target
+
+    def write(self, text):
+        return self._current().write(text)
+
+    def flush(self):
+        return self._current().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+_stdout_local = threading.local()
+_stderr_local = threading.local()
+
+
+def _acquire_streams() -> None:
+    """Route sys.stdout/sys.stderr through per-thread proxies while calls run."""
+    global _active_calls
+    with _scope_lock:
+        _active_calls += 1
+        if not isinstance(sys.stdout, _ThreadStream):
+            sys.stdout = _ThreadStream(sys.stdout, _stdout_local)
+        if not isinstance(sys.stderr, _ThreadStream):
+            sys.stderr = _ThreadStream(sys.stderr, _stderr_local)
+
+
+def _release_streams() -> None:
+    """Put the original streams back once the last running call returns."""
+    global _active_calls
+    with _scope_lock:
+        _active_calls -= 1
+        if _active_calls:
+            return
+        # Leave streams alone if something else replaced them meanwhile
+        if isinstance(sys.stdout, _ThreadStream) and sys.stdout._local is _stdout_local:
+            sys.stdout = sys.stdout._target
+        if isinstance(sys.stderr, _ThreadStream) and sys.stderr._local is _stderr_local:
+            sys.stderr = sys.stderr._target
+
+
+@contextmanager
+def _script_path(directory: Path) -> Iterator[None]:
+    """Put a script's directory on sys.path, as under `python3 tool.py`."""
+    entry = str(directory)
+    with _scope_lock:
+        refs = _path_refs.get(entry)
+        if refs is None and entry not in sys.path:
+            sys.path.insert(0, entry)
+            refs = 0
+        if refs is not None:
+            _path_refs[entry] = refs + 1
+    try:
+        yield
+    finally:
+        with _scope_lock:
+            refs = _path_refs.get(entry)
+            if refs is not None:
+                if refs > 1:
+                    _path_refs[entry] = refs - 1
+                else:
+                    del _path_refs[entry]
+                    if entry in sys.path:
+                        sys.path.remove(entry)
+
+
+def _script_of(cmd: List[str]) -> Optional[Path]:
+    """Tool script for a plain `python tool.py args...` command."""
+    if len(cmd) < 2 or not str(cmd[1]).endswith(".py"):
+        return None
+    interpreter = str(cmd[0])
+    if interpreter != sys.executable and not Path(interpreter).name.startswith("python"):
+        return None
+    script = Path(cmd[1]).resolve()
+    return script if script.is_file() else None
+
+
+def _load(script: Path) -> Optional[ModuleType]:
+    """Import a tool script once; None if it must run as a subprocess."""
+    key = str(script)
+    with _import_lock:
+        if key in _subprocess_only:
+            return None
+        if key in _modules:
+            return _modules[key]
+
+        try:
+            opted_in = bool(REENTRANT_MARKER.search(script.read_text(encoding="utf-8")))
+        except (OSError, UnicodeDecodeError):
+            opted_in = False
+        if not opted_in:
+            _subprocess_only.add(key)
+            return None
+
+        digest = hashlib.sha1(key.encode()).hexdigest()[:8]
+        try:
+            spec = importlib.util.spec_from_file_location(f"_pmos_tool_{script.stem}_{digest}", script)
+            module = importlib.util.module_from_spec(spec)
+            with _script_path(script.parent):
+                spec.loader.exec_module(module)
+        except BaseException:
+            _subprocess_only.add(key)
+            return None
+
+        main = getattr(module, "main", None)
+        if not getattr(module, "REENTRANT", False) or not callable(main):
+            _subprocess_only.add(key)
+            return None
+        try:
+            inspect.signature(main).bind(["--help"])
+        except (TypeError, ValueError):
+            _subprocess_only.add(key)
+            return None
+
+        _modules[key] = module
+        _call_locks[key] = threading.Lock()
+        return module
+
+
+def _exit_code(code) -> int:
+    """Map a main() return value or SystemExit code to a process exit code."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    return 1
+
+
+def _inprocess_script(cmd: List[str]) -> Optional[Path]:
+    """Tool script of cmd unless in-process runs are switched off."""
+    if os.environ.get(INPROCESS_ENV, "1") == "0":
+        return None
+    return _script_of(cmd)
+
+
+def _orphaned(script: Path) -> bool:
+    """True while a timed-out call of the script is still running."""
+    key = str(script)
+    with _import_lock:
+        orphan = _orphans.get(key)
+        if orphan is not None and not orphan.is_alive():
+            del _orphans[key]
+            orphan = None
+    return orphan is not None
+
+
+def runs_inprocess(cmd: List[str]) -> bool:
+    """Whether run_inprocess(cmd) would handle cmd instead of returning None."""
+    script = _inprocess_script(cmd)
+    if script is None:
+        return False
+    return _orphaned(script) or _load(script) is not None
+
+
+def run_inprocess(cmd: List[str], timeout: Optional[float] = None) -> Optional[subprocess.CompletedProcess]:
+    """
+    Run a re-entrant Python tool in this process.
+
+    Args:
+        cmd: Command as it would be passed to subprocess.run
+        timeout: Seconds to wait for main() to return
+
+    Returns:
+        CompletedProcess with captured stdout/stderr, or None when the
+        command must run as a subprocess instead
+
+    Raises:
+        subprocess.TimeoutExpired: main() did not return in time. The call
+            keeps running in a daemon thread and the tool is demoted to
+            subprocess execution for later calls.
+        ToolStillRunning: a timed-out call of this tool has not returned
+            yet; the caller should fail the step instead of respawning it.
+    """
+    script = _inprocess_script(cmd)
+    if script is None:
+        return None
+    if _orphaned(script):
+        raise ToolStillRunning(cmd)
+    module = _load(script)
+    if module is None:
+        return None
+
+    key = str(script)
+    argv = [str(arg) for arg in cmd[2:]]
+    outcome: Dict[str, object] = {}
+    stdout, stderr = io.StringIO(), io.StringIO()
+
+    def target():
+        _stdout_local.buffer, _stderr_local.buffer = stdout, stderr
+        try:
+            with _call_locks[key], _script_path(script.parent):
+                outcome["code"] = _exit_code(module.main(argv))
+        except SystemExit as e:
+            if e.code is not None and not isinstance(e.code, int):
+                stderr.write(f"{e.code}\n")
+            outcome["code"] = _exit_code(e.code)
+        except BaseException:
+            stderr.write(traceback.format_exc())
+            outcome["code"] = 1
+        finally:
+            _stdout_local.buffer = _stderr_local.buffer = None
+            _release_streams()
+
+    worker = threading.Thread(target=target, name=f"tool-{script.stem}", daemon=True)
+    _acquire_streams()
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        with _import_lock:
+            _subprocess_only.add(key)
+            _modules.pop(key, None)
+            _orphans[key] = worker
+        raise subprocess.TimeoutExpired(cmd, timeout, output=stdout.getvalue(), stderr=stderr.getvalue())
+
+    return subprocess.CompletedProcess(cmd, outcome["code"], stdout.getvalue(), stderr.getvalue())
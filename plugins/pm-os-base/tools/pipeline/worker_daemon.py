@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+"""
+Worker Daemon — optional long-lived runner for background pipeline steps.
+
+Without the daemon every background step is a cold interpreter started
+through background_wrapper.py. When a worker is listening on
+$PM_OS_USER/.cache/worker.sock, _run_tool_background submits the step as
+a job instead. Re-entrant tools (see tool_runner.py) then run inside the
+worker, so imported modules, the config singleton and Brain entity caches
+stay warm between jobs; other tools are spawned and can be killed.
+
+Jobs write the same status files under .cache/background/ as the wrapper
+(plus job_id), so pipeline.check_background and boot report them as
+before. A job carries the submitter's environment and working directory;
+it runs in-process only when both match the worker's, otherwise it is
+spawned with them. Requests are one JSON line per connection:
+
+    {"op": "submit", "cmd": [...], "step_name": "...", "status_file": "...",
+     "env": {...}, "cwd": "..."}
+    {"op": "status" | "result" | "cancel", "job_id": "..."}
+    {"op": "ping" | "shutdown"}
+
+Set PM_OS_WORKER=0 to ignore a running worker.
+
+Usage:
+    python3 worker_daemon.py start [--jobs 2]   # Detach and serve
+    python3 worker_daemon.py serve              # Serve in the foreground
+    python3 worker_daemon.py status [JOB_ID]
+    python3 worker_daemon.py result JOB_ID
+    python3 worker_daemon.py cancel JOB_ID
+    python3 worker_daemon.py stop
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    from pipeline.tool_runner import run_inprocess
+except ImportError:
+    from tool_runner import run_inprocess
+
+logger = logging.getLogger(__name__)
+
+SOCKET_NAME = "worker.sock"
+WORKER_ENV = "PM_OS_WORKER"
+DEFAULT_JOBS = 2
+# Background steps older than this are treated as stale by the status checks
+JOB_TIMEOUT = 3600
+OUTPUT_LIMIT = 64 * 1024
+FINISHED_JOBS_KEPT = 200
+ACTIVE_STATES = ("queued", "running", "cancelling")
+# Warm Brain caches are rescanned when the brain changed, or after this long
+CACHE_MAX_AGE = 60.0
+# Shell bookkeeping variables that do not change how a tool runs
+_VOLATILE_ENV = ("_", "PWD", "OLDPWD", "SHLVL")
+
+_TOOLS_DIR = Path(__file__).resolve().parent.parent
+
+
+def default_socket_path() -> Optional[Path]:
+    """Worker socket under PM_OS_USER, or None when PM_OS_USER is unset."""
+    user = os.environ.get("PM_OS_USER", "")
+    return Path(user) / ".cache" / SOCKET_NAME if user else None
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+class WorkerClient:
+    """Talks to a worker daemon over its Unix socket."""
+
+    def __init__(self, socket_path: Optional[Path] = None, timeout: float = 5.0):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+
+    def request(self, op: str, **fields: Any) -> Dict[str, Any]:
+        """Send one request; raises OSError when no worker is listening."""
+        if self.socket_path is None or not hasattr(socket, "AF_UNIX"):
+            raise ConnectionError("No worker socket")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(str(self.socket_path))
+            sock.sendall((json.dumps({"op": op, **fields}) + "\n").encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        try:
+            return json.loads(b"".join(chunks).decode("utf-8"))
+        except ValueError as e:
+            raise ConnectionError(f"Bad worker response: {e}")
+
+    def available(self) -> bool:
+        """True when a worker answers on the socket."""
+        try:
+            return bool(self.request("ping").get("ok"))
+        except OSError:
+            return False
+
+    def submit(self, cmd: List[str], step_name: str, status_file: Optional[str] = None,
+               timeout: int = JOB_TIMEOUT, env: Optional[Dict[str, str]] = None,
+               cwd: Optional[str] = None) -> Dict[str, Any]:
+        """Submit a job; env and cwd default to this process's."""
+        return self.request("submit", cmd=cmd, step_name=step_name,
+                            status_file=status_file, timeout=timeout,
+                            env=dict(os.environ) if env is None else env,
+                            cwd=cwd or os.getcwd())
+
+    def status(self, job_id: Optional[str] = None) -> Dict[str, Any]:
+        return self.request("status", job_id=job_id)
+
+    def result(self, job_id: str) -> Dict[str, Any]:
+        return self.request("result", job_id=job_id)
+
+    def cancel(self, job_id: str) -> Dict[str, Any]:
+        return self.request("cancel", job_id=job_id)
+
+    def shutdown(self) -> Dict[str, Any]:
+        return self.request("shutdown")
+
+
+def worker_client() -> Optional[WorkerClient]:
+    """Client for the running worker, or None (no worker or PM_OS_WORKER=0)."""
+    if os.environ.get(WORKER_ENV, "1") == "0":
+        return None
+    client = WorkerClient(timeout=2.0)
+    return client if client.available() else None
+
+
+# ---------------------------------------------------------------------------
+# Daemon
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Job:
+    """One submitted background step."""
+    job_id: str
+    step_name: str
+    cmd: List[str]
+    status_file: Optional[str] = None
+    timeout: int = JOB_TIMEOUT
+    env: Optional[Dict[str, str]] = None
+    cwd: Optional[str] = None
+    status: str = "queued"
+    mode: str = ""
+    submitted_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    returncode: Optional[int] = None
+    stdout: str = ""
+    stderr: str = ""
+    message: str = ""
+
+    def to_dict(self, output: bool = False) -> Dict[str, Any]:
+        data = {
+            "job_id": self.job_id, "step_name": self.step_name, "cmd": self.cmd,
+            "cwd": self.cwd, "status": self.status, "mode": self.mode,
+            "submitted_at": self.submitted_at, "started_at": self.started_at,
+            "completed_at": self.completed_at, "returncode": self.returncode,
+            "message": self.message,
+        }
+        if output:
+            data.update(stdout=self.stdout, stderr=self.stderr)
+        return data
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8"))
+            response = self.server.worker.handle(request)
+        except Exception as e:
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        self.wfile.write((json.dumps(response, default=str) + "\n").encode("utf-8"))
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class WorkerDaemon:
+    """Runs submitted jobs in a bounded pool with warm in-process state."""
+
+    def __init__(self, socket_path: Path, jobs: int = DEFAULT_JOBS):
+        self.socket_path = socket_path
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._pool = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="worker-job")
+        self._lock = threading.RLock()
+        self._futures: Dict[str, Any] = {}
+        self._procs: Dict[str, subprocess.Popen] = {}
+        self._cancelled: set = set()
+        self._server: Optional[_Server] = None
+        self._config_mtime: Optional[float] = None
+        self._started = time.time()
+
+    # -- lifecycle -----------------------------------------------------
+
+    def serve_forever(self) -> None:
+        """Bind the socket and serve until shutdown or SIGTERM."""
+        if WorkerClient(self.socket_path, timeout=1.0).available():
+            raise RuntimeError(f"A worker is already listening on {self.socket_path}")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+
+        self._warm()
+        self._server = _Server(str(self.socket_path), _Handler)
+        self._server.worker = self
+        os.chmod(self.socket_path, 0o600)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *_: self.shutdown())
+        logger.info("Worker %d listening on %s", os.getpid(), self.socket_path)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            for job_id in list(self._procs):
+                self._kill(job_id)
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def _warm(self) -> None:
+        """Import the config singleton once, before the first job."""
+        if str(_TOOLS_DIR) not in sys.path:
+            sys.path.insert(0, str(_TOOLS_DIR))
+        try:
+            from core.config_loader import get_config
+
+            config = get_config()
+            self._config_mtime = self._config_stat(config)
+        except Exception as e:
+            logger.debug("Config preload skipped: %s", e)
+
+    @staticmethod
+    def _config_stat(config) -> Optional[float]:
+        try:
+            return (Path(config.user_path) / "config.yaml").stat().st_mtime
+        except (OSError, TypeError, AttributeError):
+            return None
+
+    def _refresh(self) -> None:
+        """Pick up edits made outside the worker before an in-process job."""
+        config_loader = sys.modules.get("core.config_loader")
+        if config_loader is not None:
+            config = config_loader.get_config()
+            mtime = self._config_stat(config)
+            if mtime != self._config_mtime:
+                config_loader.get_config(force_reload=True)
+                self._config_mtime = mtime
+        for name in ("pm_os_brain.tools.brain_core.entity_cache", "brain_core.entity_cache"):
+            module = sys.modules.get(name)
+            if module is not None and hasattr(module, "refresh_shared_caches"):
+                module.refresh_shared_caches(max_age=CACHE_MAX_AGE)
+
+    @staticmethod
+    def _shares_context(job: Job) -> bool:
+        """True when the job's env and cwd match the worker's own."""
+        if job.cwd and os.path.realpath(job.cwd) != os.path.realpath(os.getcwd()):
+            return False
+        if job.env is None:
+            return True
+
+        def relevant(env):
+            return {k: v for k, v in env.items() if k not in _VOLATILE_ENV}
+
+        return relevant(job.env) == relevant(os.environ)
+
+    # -- requests ------------------------------------------------------
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "uptime_s": int(time.time() - self._started)}
+        if op == "submit":
+            return {"ok": True, "job": self.submit(request).to_dict()}
+        if op == "shutdown":
+            self.shutdown()
+            return {"ok": True}
+
+        job_id = request.get("job_id")
+        if op == "status" and not job_id:
+            with self._lock:
+                return {"ok": True, "jobs": [job.to_dict() for job in self.jobs.values()]}
+        job = self.jobs.get(job_id or "")
+        if job is None:
+            return {"ok": False, "error": f"Unknown job: {job_id}"}
+        if op == "status":
+            return {"ok": True, "job": job.to_dict()}
+        if op == "result":
+            return {"ok": True, "job": job.to_dict(output=True)}
+        if op == "cancel":
+            return {"ok": True, "job": self.cancel(job).to_dict()}
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+    def submit(self, request: Dict[str, Any]) -> Job:
+        cmd = [str(part) for part in request.get("cmd") or []]
+        if not cmd:
+            raise ValueError("submit needs a cmd")
+        job = Job(
+            job_id=uuid.uuid4().hex[:12],
+            step_name=request.get("step_name") or Path(cmd[-1]).stem,
+            cmd=cmd,
+            status_file=request.get("status_file"),
+            timeout=int(request.get("timeout") or JOB_TIMEOUT),
+            env=request.get("env"),
+            cwd=request.get("cwd"),
+        )
+        with self._lock:
+            self.jobs[job.job_id] = job
+            self._prune()
+        self._write_status(job)
+        with self._lock:
+            self._futures[job.job_id] = self._pool.submit(self._run, job)
+        return job
+
+    def cancel(self, job: Job) -> Job:
+        with self._lock:
+            if job.status not in ACTIVE_STATES:
+                return job
+            self._cancelled.add(job.job_id)
+            future = self._futures.get(job.job_id)
+            if job.status == "queued" and future is not None and future.cancel():
+                self._finish(job, None, "Cancelled before start")
+                return job
+            job.status = "cancelling"
+        # Spawned tools are killed; in-process ones finish and are discarded
+        self._kill(job.job_id)
+        return job
+
+    def _prune(self) -> None:
+        finished = [j for j in self.jobs.values() if j.status not in ACTIVE_STATES]
+        for job in finished[: max(0, len(finished) - FINISHED_JOBS_KEPT)]:
+            del self.jobs[job.job_id]
+            self._futures.pop(job.job_id, None)
+            self._cancelled.discard(job.job_id)
+
+    def _kill(self, job_id: str) -> None:
+        proc = self._procs.get(job_id)
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+
+    # -- execution -----------------------------------------------------
+
+    def _run(self, job: Job) -> None:
+        with self._lock:
+            cancelled = job.job_id in self._cancelled
+            if not cancelled:
+                job.status = "running"
+                job.started_at = datetime.now().isoformat()
+        if cancelled:
+            self._finish(job, None, "Cancelled before start")
+            return
+        self._write_status(job)
+
+        try:
+            completed = None
+            if self._shares_context(job):
+                self._refresh()
+                completed = run_inprocess(job.cmd, job.timeout)
+            if completed is not None:
+                job.mode = "inprocess"
+                returncode, stdout, stderr = completed.returncode, completed.stdout, completed.stderr
+            else:
+                job.mode = "subprocess"
+                proc = subprocess.Popen(
+                    job.cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                    env={**os.environ} if job.env is None else job.env,
+                    cwd=job.cwd or None, start_new_session=True,
+                )
+                self._procs[job.job_id] = proc
+                try:
+                    stdout, stderr = proc.communicate(timeout=job.timeout)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.communicate()
+                    raise
+                finally:
+                    self._procs.pop(job.job_id, None)
+                returncode = proc.returncode
+        except subprocess.TimeoutExpired:
+            self._finish(job, None, f"Timeout after {job.timeout}s")
+            return
+        except Exception as e:
+            self._finish(job, None, f"Exception: {e}")
+            return
+
+        job.stdout, job.stderr = stdout[-OUTPUT_LIMIT:], stderr[-OUTPUT_LIMIT:]
+        self._finish(job, returncode, stderr.strip()[:500] or stdout.strip()[:500] or "completed")
+
+    def _finish(self, job: Job, returncode: Optional[int], message: str) -> None:
+        with self._lock:
+            cancelled = job.job_id in self._cancelled
+            self._cancelled.discard(job.job_id)
+            self._futures.pop(job.job_id, None)
+        if cancelled:
+            job.status, message = "cancelled", "Cancelled"
+        else:
+            job.status = "completed" if returncode == 0 else "failed"
+        job.returncode = returncode
+        job.message = message
+        job.completed_at = datetime.now().isoformat()
+        self._write_status(job)
+
+    def _write_status(self, job: Job) -> None:
+        """Mirror the job into its background status file."""
+        if not job.status_file:
+            return
+        status = {
+            "step_name": job.step_name,
+            "status": "running" if job.status in ACTIVE_STATES else job.status,
+            "pid": os.getpid(),
+            "job_id": job.job_id,
+            "started_at": job.started_at or job.submitted_at,
+        }
+        if job.completed_at:
+            status.update({
+                "completed_at": job.completed_at,
+                "success": job.status == "completed",
+                "message": job.message,
+                "returncode": job.returncode,
+            })
+        try:
+            tmp = Path(f"{job.status_file}.tmp")
+            tmp.write_text(json.dumps(status, indent=2), encoding="utf-8")
+            os.replace(tmp, job.status_file)
+        except OSError as e:
+            logger.warning("Cannot write status for job %s: %s", job.job_id, e)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _start_detached(socket_path: Path, jobs: int) -> int:
+    """Launch `serve` in a new session and wait for it to answer."""
+    log_path = socket_path.parent / "worker.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "a") as log:
+        proc = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "serve", "--jobs", str(jobs),
+             "--socket", str(socket_path)],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+            start_new_session=True, env={**os.environ},
+        )
+    client = WorkerClient(socket_path, timeout=1.0)
+    for _ in range(50):
+        if client.available():
+            print(f"Worker started (PID {proc.pid}) on {socket_path}")
+            return 0
+        if proc.poll() is not None:
+            break
+        time.sleep(0.1)
+    print(f"Worker did not start; see {log_path}", file=sys.stderr)
+    return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PM-OS background worker daemon")
+    parser.add_argument("command", choices=["start", "serve", "status", "result", "cancel", "stop"])
+    parser.add_argument("job_id", nargs="?", help="Job ID for status/result/cancel")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="Concurrent jobs")
+    parser.add_argument("--socket", type=Path, help="Socket path (default: $PM_OS_USER/.cache/worker.sock)")
+    args = parser.parse_args()
+
+    socket_path = args.socket or default_socket_path()
+    if socket_path is None:
+        print("PM_OS_USER is not set and no --socket given", file=sys.stderr)
+        return 1
+
+    if args.command == "serve":
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s: %(message)s")
+        try:
+            WorkerDaemon(socket_path, jobs=args.jobs).serve_forever()
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            return 1
+        return 0
+
+    client = WorkerClient(socket_path)
+    if args.command == "start":
+        if client.available():
+            print(f"Worker already running on {socket_path}")
+            return 0
+        return _start_detached(socket_path, args.jobs)
+
+    if args.command in ("result", "cancel") and not args.job_id:
+        parser.error(f"{args.command} needs a JOB_ID")
+    try:
+        if args.command == "stop":
+            response = client.shutdown()
+        elif args.command == "status":
+            response = client.status(args.job_id)
+        elif args.command == "result":
+            response = client.result(args.job_id)
+        else:
+            response = client.cancel(args.job_id)
+    except OSError:
+        print(f"No worker running on {socket_path}")
+        return 1
+
+    print(json.dumps(response, indent=2))
+    return 0 if response.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
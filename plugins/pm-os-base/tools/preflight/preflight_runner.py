@@ -11,25 +11,39 @@ Usage:
     python3 preflight_runner.py --json             # JSON output
     python3 preflight_runner.py --quick            # Import tests only
     python3 preflight_runner.py --list             # Print tool inventory
+    python3 preflight_runner.py --no-cache         # Re-import every module
+
+Tools whose module file (mtime/size), interpreter, and every non-stdlib
+module they import, directly or transitively, are unchanged since their
+last passing import are not imported again; the cache lives in
+$PM_OS_USER/.cache/preflight-imports.json. Categories with modules left to
+import are checked in parallel, one worker process per category.
 
 Version: 5.0.0
 """
 
 import argparse
+import ast
 import importlib
+import importlib.util
 import json
 import os
 import sys
+import sysconfig
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-# Add plugin tools directory to path
+# Add plugin tools directory to path. Plugin tools fall back to a bare
+# `from config_loader import ...`, so core/ goes on the path as well rather
+# than relying on an earlier core check having added it.
 PLUGIN_ROOT = Path(__file__).resolve().parent.parent.parent
 TOOLS_DIR = PLUGIN_ROOT / "tools"
-if str(TOOLS_DIR) not in sys.path:
-    sys.path.insert(0, str(TOOLS_DIR))
+for _path in (TOOLS_DIR / "core", TOOLS_DIR):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
 
 
 def _bootstrap_environment():
@@ -70,6 +84,137 @@ _bootstrap_environment()
 from preflight.registry import get_categories, get_registry, get_tool_count, get_tools_by_category
 from preflight.result import CategoryResult, PreflightResult, ToolResult
 
+IMPORT_CACHE_FILENAME = "preflight-imports.json"
+# Interpreter version is part of the cache, so stdlib files need no stat
+_STDLIB_DIRS = tuple(
+    str(Path(sysconfig.get_paths()[name]).resolve()) + os.sep
+    for name in ("stdlib", "platstdlib")
+)
+# Installed distributions change as a whole, so their files are stamped
+# but their own imports are not followed
+_SITE_DIRS = tuple(
+    str(Path(sysconfig.get_paths()[name]).resolve()) + os.sep
+    for name in ("purelib", "platlib")
+)
+
+
+def _import_cache_path() -> Optional[Path]:
+    """Import pass cache under PM_OS_USER, or None when it is unset."""
+    user_dir = os.environ.get("PM_OS_USER", "")
+    return Path(user_dir) / ".cache" / IMPORT_CACHE_FILENAME if user_dir else None
+
+
+def _module_file(tool_meta: Dict[str, Any]) -> Optional[Path]:
+    """Source file a tool's checks import, if it is file-based."""
+    module_path = tool_meta.get("module", "")
+    if not module_path:
+        return None
+    file_rel = module_path.replace(".", "/")
+    if not file_rel.endswith(".py"):
+        file_rel += ".py"
+    plugin_dir = tool_meta.get("_plugin_dir", "")
+    file_path = Path(plugin_dir) / file_rel if plugin_dir else PLUGIN_ROOT / file_rel
+    return file_path if file_path.exists() else None
+
+
+def _file_stamp(path: str) -> Optional[List[int]]:
+    """[mtime_ns, size] of a file, or None if it cannot be stat'ed."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _imported_files(before: set) -> Dict[str, List[int]]:
+    """Stamps of the non-stdlib source files of modules imported since `before`."""
+    files: Dict[str, List[int]] = {}
+    for name in set(sys.modules) - before:
+        path = getattr(sys.modules.get(name), "__file__", None)
+        if not path:
+            continue
+        path = os.path.realpath(path)
+        if path.startswith(_STDLIB_DIRS):
+            continue
+        stamp = _file_stamp(path)
+        if stamp is not None:
+            files[path] = stamp
+    return files
+
+
+def _static_imports(path: str, package: str) -> Set[str]:
+    """Absolute names of every module a source file imports, at any depth."""
+    try:
+        tree = ast.parse(Path(path).read_bytes(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return set()
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            targets = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                try:
+                    base = importlib.util.resolve_name("." * node.level + base, package)
+                except (ImportError, ValueError):
+                    continue
+            targets = [base] + [f"{base}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        for name in targets:
+            parts = name.split(".")
+            names.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+    return names
+
+
+def _dependency_files(
+    file_path: Path, before: set, parsed: Dict[str, Set[str]]
+) -> Dict[str, List[int]]:
+    """Stamps of every non-stdlib file a tool module depends on.
+
+    Follows the import statements of the tool and of each local module it
+    reaches, resolving names against sys.modules, so modules an earlier
+    check already imported are included. Modules imported dynamically
+    (newly present in sys.modules since `before`) are added as well.
+
+    Args:
+        file_path: The tool's module file (imported under its bare stem)
+        before: sys.modules keys before the tool was imported
+        parsed: Per-run memo of file path -> imported module names
+    """
+    files = _imported_files(before)
+    seen: Set[str] = set()
+    queue = [(str(file_path), "")]
+    while queue:
+        path, package = queue.pop()
+        if path not in parsed:
+            parsed[path] = _static_imports(path, package)
+        for name in parsed[path] - seen:
+            seen.add(name)
+            module = sys.modules.get(name)
+            dep = getattr(module, "__file__", None)
+            if not dep:
+                continue
+            dep = os.path.realpath(dep)
+            if dep.startswith(_STDLIB_DIRS):
+                continue
+            stamp = _file_stamp(dep)
+            if stamp is not None:
+                files[dep] = stamp
+            if dep.endswith(".py") and not dep.startswith(_SITE_DIRS):
+                queue.append((dep, getattr(module, "__package__", None) or ""))
+    return files
+
+
+def _check_category_worker(
+    options: Dict[str, Any], category: str, tools: Dict[str, Any], cache: Dict[str, Any]
+) -> Tuple[CategoryResult, Dict[str, Any]]:
+    """Process-pool entry point: check one category in a fresh interpreter."""
+    runner = PreflightRunner(**options)
+    runner._cache = cache
+    return runner._check_category(category, tools), runner._new_passes
+
 
 class PreflightRunner:
     """Runs pre-flight verification checks for PM-OS tools."""
@@ -80,11 +225,21 @@ class PreflightRunner:
         quick: bool = False,
         skip_connectivity: bool = True,
         categories: Optional[List[str]] = None,
+        use_cache: bool = True,
+        parallel: bool = True,
     ):
         self.verbose = verbose
         self.quick = quick
         self.skip_connectivity = skip_connectivity
         self.categories = categories or get_categories()
+        self.use_cache = use_cache
+        self.parallel = parallel
+        # module file -> last passing check; filled by run()
+        self._cache: Dict[str, Any] = {}
+        self._new_passes: Dict[str, Any] = {}
+        # module file -> every file its import depends on
+        self._import_deps: Dict[str, Dict[str, List[int]]] = {}
+        self._parsed_imports: Dict[str, Set[str]] = {}
 
     def run(self) -> PreflightResult:
         """Run all pre-flight checks."""
@@ -94,21 +249,148 @@ class PreflightRunner:
         )
 
         registry = get_registry()
-
+        work = {}
         for category in self.categories:
             tools = registry.get_tools_by_category(category)
-            if not tools:
-                continue
-
-            cat_result = self._check_category(category, tools)
+            if tools:
+                work[category] = tools
+
+        cache_path = _import_cache_path()
+        if self.use_cache and cache_path is not None:
+            self._cache = self._read_cache(cache_path)
+
+        # Only categories with modules left to import are worth a process
+        pending = [
+            category for category, tools in work.items()
+            if any(
+                not meta.get("skip_import", False) and self._cached_pass(meta) is None
+                for meta in tools.values()
+            )
+        ]
+        use_pool = self.parallel and len(pending) > 1 and (os.cpu_count() or 1) > 1
+        checked = self._check_in_pool(pending, work) if use_pool else {}
+
+        for category, tools in work.items():
+            cat_result = checked.get(category) or self._check_category(category, tools)
             result.categories.append(cat_result)
+            if self.verbose:
+                for tool_result in cat_result.tools:
+                    status = "PASS" if tool_result.success else "FAIL"
+                    print(f"  [{status}] {tool_result.tool_name}")
 
             if not cat_result.success:
                 result.success = False
 
+        if self._new_passes and self.use_cache and cache_path is not None:
+            self._write_cache(cache_path)
+
         result.end_time = datetime.now()
         return result
 
+    def _check_in_pool(
+        self, categories: List[str], work: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, CategoryResult]:
+        """Check categories in parallel worker processes, one per category.
+
+        Returns an empty dict when worker processes are unavailable so the
+        caller checks everything in this process instead.
+        """
+        options = {
+            "verbose": False,
+            "quick": self.quick,
+            "skip_connectivity": self.skip_connectivity,
+            "categories": categories,
+        }
+        checked = {}
+        try:
+            with ProcessPoolExecutor(max_workers=len(categories)) as pool:
+                futures = {
+                    category: pool.submit(
+                        _check_category_worker, options, category, work[category], self._cache
+                    )
+                    for category in categories
+                }
+                for category, future in futures.items():
+                    checked[category], passes = future.result()
+                    self._new_passes.update(passes)
+        except Exception:
+            # Broken pool, unpicklable result, failure inside a worker:
+            # check everything serially in this process instead
+            self._new_passes.clear()
+            return {}
+        return checked
+
+    # -- import pass cache ---------------------------------------------
+
+    @staticmethod
+    def _read_cache(cache_path: Path) -> Dict[str, Any]:
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("python") != sys.version:
+            return {}
+        return data.get("modules", {})
+
+    def _write_cache(self, cache_path: Path) -> None:
+        """Save passes, dropping entries for deleted or since-changed modules."""
+        modules = {
+            path: entry
+            for path, entry in {**self._cache, **self._new_passes}.items()
+            if _file_stamp(path) == [entry.get("mtime_ns"), entry.get("size")]
+        }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"python": sys.version, "modules": modules}), encoding="utf-8")
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _pass_key(tool_meta: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Cache key and the fingerprint a cached pass must match."""
+        file_path = _module_file(tool_meta)
+        if file_path is None:
+            return None
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return str(file_path.resolve()), {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "classes": sorted(tool_meta.get("classes") or []),
+            "functions": sorted(tool_meta.get("functions") or []),
+        }
+
+    def _cached_pass(self, tool_meta: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Cached passing entry for an unchanged module, if any."""
+        key = self._pass_key(tool_meta)
+        if key is None:
+            return None
+        entry = self._cache.get(key[0])
+        if not entry or any(entry.get(k) != v for k, v in key[1].items()):
+            return None
+        if not self.quick and not entry.get("full"):
+            return None
+        deps = entry.get("deps")
+        if not isinstance(deps, dict):
+            return None
+        if any(_file_stamp(path) != stamp for path, stamp in deps.items()):
+            return None
+        return entry
+
+    def _record_pass(self, tool_meta: Dict[str, Any]) -> None:
+        key = self._pass_key(tool_meta)
+        if key is not None:
+            self._new_passes[key[0]] = {
+                **key[1],
+                "full": not self.quick,
+                "deps": self._import_deps.get(key[0], {}),
+            }
+
     def _check_category(self, category: str, tools: Dict[str, Any]) -> CategoryResult:
         """Check all tools in a category."""
         cat_result = CategoryResult(category=category)
@@ -120,10 +402,6 @@ class PreflightRunner:
             tool_result = self._check_tool(category, tool_name, tool_meta)
             cat_result.tools.append(tool_result)
 
-            if self.verbose:
-                status = "PASS" if tool_result.success else "FAIL"
-                print(f"  [{status}] {tool_name}")
-
         return cat_result
 
     def _check_tool(
@@ -137,6 +415,18 @@ class PreflightRunner:
             success=True,
         )
 
+        # Unchanged module that passed before: count checks 1-3 as passed
+        if self._cached_pass(tool_meta) is not None:
+            cached_checks = 1
+            if not self.quick:
+                cached_checks += bool(tool_meta.get("classes")) + bool(tool_meta.get("functions"))
+            result.checks_total += cached_checks
+            result.checks_passed += cached_checks
+            if self.quick:
+                result.duration_ms = (time.time() - start) * 1000
+                return result
+            return self._check_runtime(tool_meta, result, start)
+
         # Check 1: Import test
         passed, msg = self._check_import(tool_meta)
         result.checks_total += 1
@@ -155,6 +445,7 @@ class PreflightRunner:
 
         # Quick mode stops here
         if self.quick:
+            self._record_pass(tool_meta)
             result.duration_ms = (time.time() - start) * 1000
             return result
 
@@ -178,6 +469,12 @@ class PreflightRunner:
                 result.errors.append(msg)
                 result.success = False
 
+        if result.success:
+            self._record_pass(tool_meta)
+        return self._check_runtime(tool_meta, result, start)
+
+    def _check_runtime(self, tool_meta: Dict[str, Any], result: ToolResult, start: float) -> ToolResult:
+        """Checks 4-5, which depend on the environment and are never cached."""
         # Check 4: Environment variables (warning only)
         if tool_meta.get("env_keys"):
             passed, msg = self._check_env_vars(tool_meta)
@@ -200,7 +497,19 @@ class PreflightRunner:
         return result
 
     def _check_import(self, tool_meta: Dict[str, Any]) -> Tuple[bool, str]:
-        """Check if module can be imported.
+        """Check if module can be imported, noting the files it depends on."""
+        before = set(sys.modules)
+        try:
+            return self._try_import(tool_meta)
+        finally:
+            file_path = _module_file(tool_meta)
+            if file_path is not None:
+                self._import_deps[str(file_path.resolve())] = _dependency_files(
+                    file_path, before, self._parsed_imports
+                )
+
+    def _try_import(self, tool_meta: Dict[str, Any]) -> Tuple[bool, str]:
+        """Import a tool's module.
 
         Uses file-based import (spec_from_file_location) for plugin tools
         to avoid __init__.py cascading import failures from package-style imports.
@@ -430,6 +739,7 @@ def main():
     parser.add_argument("--skip-connectivity", action="store_true", default=True)
     parser.add_argument("--with-connectivity", action="store_true")
     parser.add_argument("--list", "-l", action="store_true", help="Print tool inventory")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached import passes")
 
     args = parser.parse_args()
 
@@ -451,6 +761,7 @@ def main():
         quick=args.quick,
         skip_connectivity=not args.with_connectivity,
         categories=categories,
+        use_cache=not args.no_cache,
     )
 
     result = runner.run()
@@ -28,6 +28,9 @@ from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# main(argv) can be called repeatedly in one process (pipeline/tool_runner.py)
+REENTRANT = True
+
 # Config-driven path resolution
 _CONFUCIUS_DIR: Optional[Path] = None
 
@@ -420,7 +423,7 @@ def print_status():
     print(f"  Research:     {len(notes.get('research', []))}")
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(description="Confucius Note-Taker")
     parser.add_argument("--start", type=str, metavar="TOPIC", help="Start a new session")
     parser.add_argument("--end", action="store_true", help="End current session")
@@ -444,7 +447,7 @@ def main():
     parser.add_argument("--ensure", type=str, nargs="?", const="Daily Work Session", metavar="TOPIC",
                         help="Ensure session is active")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.ensure:
         state = ensure_session_active(args.ensure)
@@ -27,6 +27,9 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# main(argv) can be called repeatedly in one process (pipeline/tool_runner.py)
+REENTRANT = True
+
 # Path resolution — config-driven, not hardcoded
 _SESSIONS_DIR: Optional[Path] = None
 
@@ -476,7 +479,7 @@ class SessionManager:
         return "\n".join(summary_parts)
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(description="Session Manager for Claude Code")
     parser.add_argument("--create", "-c", type=str, help="Create new session with title")
     parser.add_argument("--save", "-s", action="store_true", help="Save/update current session")
@@ -494,7 +497,7 @@ def main():
     parser.add_argument("--files-created", type=str, help="Files created (comma-separated)")
     parser.add_argument("--files-modified", type=str, help="Files modified (comma-separated)")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     manager = SessionManager()
 
     if args.create:
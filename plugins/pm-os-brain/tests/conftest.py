@@ -0,0 +1,70 @@
+"""Shared test fixtures for pm-os-brain tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure plugin tools are importable
+PLUGIN_ROOT = Path(__file__).resolve().parent.parent
+TOOLS_ROOT = PLUGIN_ROOT / "tools"
+BASE_PLUGIN = PLUGIN_ROOT.parent / "pm-os-base"
+
+for p in [str(TOOLS_ROOT), str(BASE_PLUGIN / "tools" / "core"), str(BASE_PLUGIN / "tools")]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+
+def write_entity(brain_dir: Path, rel_path: str, frontmatter: str, body: str = "") -> Path:
+    """Write a markdown entity with YAML frontmatter under brain_dir."""
+    path = brain_dir / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\n{frontmatter.strip()}\n---\n{body}", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def brain_dir(tmp_path):
+    """Provide a small brain with a few linked entities."""
+    brain = tmp_path / "brain"
+    write_entity(
+        brain,
+        "Entities/People/alice-smith.md",
+        """
+$id: entity/person/alice-smith
+$type: person
+$status: active
+name: Alice Smith
+$aliases: [alice, asmith]
+$relationships:
+  - type: member_of
+    target: entity/team/platform
+""",
+        "# Alice Smith\n\nAlice leads the payments migration.\n",
+    )
+    write_entity(
+        brain,
+        "Entities/Teams/platform.md",
+        """
+$id: entity/team/platform
+$type: team
+$status: active
+name: Platform
+$relationships:
+  - type: has_member
+    target: entity/person/alice-smith
+""",
+        "# Platform\n\nOwns the payments gateway and billing systems.\n",
+    )
+    write_entity(
+        brain,
+        "Entities/Systems/payments-gateway.md",
+        """
+$id: entity/system/payments-gateway
+$type: system
+$status: active
+name: Payments Gateway
+""",
+        "# Payments Gateway\n\nHandles card payments.\n",
+    )
+    return brain
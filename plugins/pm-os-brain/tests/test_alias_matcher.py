@@ -0,0 +1,117 @@
+"""Tests for the shared Aho-Corasick alias matcher."""
+
+import json
+import pickle
+import re
+
+import pytest
+
+from brain_core import alias_matcher
+from brain_core.alias_matcher import (
+    MATCHER_DIRNAME,
+    AliasMatcher,
+    get_alias_matcher,
+)
+
+ALIASES = ["otp", "otp launch", "c++", "a.b", "aa", "platform", "_x", "ü-team"]
+
+TEXTS = [
+    "the otp launch is blocked; otp again. otpx is not a match",
+    "we use c++ and c++11 and (c++) ",
+    "a.b a.bc xa.b a.b.",
+    "aaaa aa aa_aa",
+    "platform-platform platform_ Platform",
+    "_x __x _x_ x_x",
+    "über ü-team ü-teams",
+]
+
+
+def _regex_counts(aliases, text):
+    counts = {}
+    for alias in aliases:
+        found = re.findall(r"\b" + re.escape(alias) + r"\b", text)
+        if found:
+            counts[alias] = len(found)
+    return counts
+
+
+class TestAliasMatcher:
+
+    def test_word_counts_match_regex(self):
+        matcher = AliasMatcher(ALIASES)
+        for text in TEXTS:
+            assert matcher.count_words(text) == _regex_counts(ALIASES, text), text
+
+    def test_find_present_is_substring_in_pattern_order(self):
+        matcher = AliasMatcher(ALIASES)
+        text = "otpx aaa platforms"
+        assert matcher.find_present(text) == [a for a in ALIASES if a in text]
+
+    def test_empty_and_duplicate_aliases_ignored(self):
+        matcher = AliasMatcher(["", "otp", "otp"])
+        assert len(matcher) == 1
+        assert matcher.count_words("otp otp") == {"otp": 2}
+
+
+class TestMatcherCache:
+
+    def test_persisted_per_alias_set(self, tmp_path):
+        alias_matcher._memo.clear()
+        get_alias_matcher(ALIASES, cache_dir=tmp_path)
+        files = list((tmp_path / MATCHER_DIRNAME).glob("*.json"))
+        assert len(files) == 1
+
+        alias_matcher._memo.clear()
+        loaded = get_alias_matcher(ALIASES, cache_dir=tmp_path)
+        assert loaded.count_words(TEXTS[0]) == _regex_counts(ALIASES, TEXTS[0])
+
+        get_alias_matcher(ALIASES + ["new alias"], cache_dir=tmp_path)
+        assert len(list((tmp_path / MATCHER_DIRNAME).glob("*.json"))) == 2
+
+    def test_corrupt_cache_is_rebuilt(self, tmp_path):
+        alias_matcher._memo.clear()
+        get_alias_matcher(ALIASES, cache_dir=tmp_path)
+        path = next((tmp_path / MATCHER_DIRNAME).glob("*.json"))
+        path.write_text("not json")
+
+        alias_matcher._memo.clear()
+        matcher = get_alias_matcher(ALIASES, cache_dir=tmp_path)
+        assert matcher.count_words("otp") == {"otp": 1}
+
+    def test_cache_is_json_and_pickles_are_never_loaded(self, tmp_path):
+        marker = tmp_path / "executed"
+        legacy = tmp_path / MATCHER_DIRNAME / "legacy.pkl"
+        legacy.parent.mkdir()
+        legacy.write_bytes(pickle.dumps(_Touch(str(marker))))
+
+        alias_matcher._memo.clear()
+        get_alias_matcher(ALIASES, cache_dir=tmp_path)
+        path = next((tmp_path / MATCHER_DIRNAME).glob("*.json"))
+        assert json.loads(path.read_text())[0] == alias_matcher.MATCHER_FORMAT_VERSION
+        assert not legacy.exists()
+        assert not marker.exists()
+
+    def test_out_of_range_state_is_rejected(self):
+        version, patterns, goto, fail, out = json.loads(
+            json.dumps(AliasMatcher(ALIASES).to_state())
+        )
+        assert AliasMatcher.from_state(
+            (version, patterns, goto, fail, out)
+        ).count_words(TEXTS[0]) == _regex_counts(ALIASES, TEXTS[0])
+
+        with pytest.raises(ValueError):
+            AliasMatcher.from_state((version - 1, patterns, goto, fail, out))
+        with pytest.raises(ValueError):
+            AliasMatcher.from_state((version, patterns, goto, fail[:-1], out))
+        with pytest.raises(ValueError):
+            AliasMatcher.from_state((version, patterns, goto, fail, out[:-1] + [[len(patterns)]]))
+
+
+class _Touch:
+    """Pickle payload that creates a file when unpickled."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __reduce__(self):
+        return (open, (self.path, "w"))
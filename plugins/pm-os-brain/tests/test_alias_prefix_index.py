@@ -0,0 +1,97 @@
+"""Tests for the sorted alias prefix/fuzzy index used by BrainSearch."""
+
+import os
+
+import yaml
+
+from index.alias_prefix_index import INDEX_FILENAME, AliasPrefixIndex
+from index.brain_search import BrainSearch
+
+ALIASES = {
+    alias: ("entities", f"id-{i}", f"Entities/{alias}.md")
+    for i, alias in enumerate(
+        ["pay", "payments", "payment-gateway", "paypal", "platform", "plat", "plate", "zeta"]
+    )
+}
+
+
+def _levenshtein(a, b):
+    row = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        prev, row[0] = row[0], i
+        for j, cb in enumerate(b, 1):
+            prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (ca != cb))
+    return row[-1]
+
+
+class TestAliasPrefixIndex:
+
+    def test_prefix_matches_linear_scan(self):
+        index = AliasPrefixIndex(ALIASES)
+        for term in ["pa", "pay", "plat", "z", "q"]:
+            for extra in [None, 0, 3]:
+                expected = sorted(
+                    a for a in ALIASES
+                    if a.startswith(term) and (extra is None or len(a) <= len(term) + extra)
+                )
+                assert [a for a, _ in index.prefix(term, max_extra=extra)] == expected
+
+    def test_fuzzy_matches_brute_force(self):
+        index = AliasPrefixIndex(ALIASES)
+        for term in ["paymnets", "platfrom", "plat", "xeta", "paypl"]:
+            for dist in [1, 2]:
+                expected = sorted(
+                    (_levenshtein(term, a), a) for a in ALIASES if _levenshtein(term, a) <= dist
+                )
+                got = [(d, a) for a, d, _ in index.fuzzy(term, max_distance=dist)]
+                assert got == expected, (term, dist)
+
+    def test_save_and_load_invalidates_on_registry_change(self, tmp_path):
+        registry = tmp_path / "registry.yaml"
+        registry.write_text("entities: {}\n", encoding="utf-8")
+        path = tmp_path / INDEX_FILENAME
+
+        AliasPrefixIndex(ALIASES).save(path, registry)
+        loaded = AliasPrefixIndex.load(path, registry)
+        assert loaded is not None
+        assert loaded.get("paypal") == ALIASES["paypal"]
+        assert [a for a, _ in loaded.prefix("plat", max_extra=1)] == ["plat", "plate"]
+
+        st = registry.stat()
+        os.utime(registry, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert AliasPrefixIndex.load(path, registry) is None
+
+
+class TestBrainSearchAliases:
+
+    def _write_registry(self, brain_dir):
+        registry = {
+            "entities": {
+                "payments-gateway": {
+                    "file": "Entities/Systems/payments-gateway.md",
+                    "aliases": ["paygate"],
+                },
+                "platform": {"file": "Entities/Teams/platform.md", "aliases": []},
+            }
+        }
+        (brain_dir / "registry.yaml").write_text(yaml.safe_dump(registry), encoding="utf-8")
+
+    def test_prefix_and_fuzzy_search(self, brain_dir):
+        self._write_registry(brain_dir)
+        search = BrainSearch(brain_dir)
+
+        ids = {r.entity_id for r in search.search("payga")}
+        assert "payments-gateway" in ids
+
+        fuzzy = search.search("platfrom")
+        assert fuzzy[0].entity_id == "platform"
+        assert "alias fuzzy" in fuzzy[0].match_reasons[0]
+
+    def test_alias_index_persisted_and_reused(self, brain_dir):
+        self._write_registry(brain_dir)
+        BrainSearch(brain_dir)
+        assert (brain_dir / INDEX_FILENAME).exists()
+
+        search = BrainSearch(brain_dir)
+        assert search._registry is None  # registry.yaml not re-parsed
+        assert "paygate" in search.alias_index
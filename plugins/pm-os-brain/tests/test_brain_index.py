@@ -0,0 +1,260 @@
+"""Tests for the BM25 positional content index and its binary postings format."""
+
+import json
+import os
+
+import index.brain_index as brain_index_module
+from index.brain_index import BrainIndex, PorterStemmer
+from index.brain_search import BrainSearch
+from index.postings_format import (
+    INDEX_FILENAME,
+    PostingsReader,
+    concat_term_blocks,
+    decode_varints,
+    encode_postings,
+    encode_term,
+    encode_varints,
+)
+
+from .conftest import write_entity
+
+
+def _write_docs(brain_dir):
+    write_entity(
+        brain_dir,
+        "Entities/Systems/checkout-service.md",
+        "$id: entity/system/checkout-service\n$type: system",
+        "# Checkout Service\n\nHandles checkout. Checkout latency and checkout "
+        "errors are tracked by the payments team.\n",
+    )
+    write_entity(
+        brain_dir,
+        "Projects/loyalty-launch.md",
+        "$id: entity/project/loyalty-launch\n$type: project",
+        "# Loyalty Launch\n\nThe loyalty program launch depends on checkout.\n",
+    )
+
+
+class TestPostingsFormat:
+
+    def test_varint_roundtrip(self):
+        values = [0, 1, 127, 128, 300, 2**21, 2**35]
+        buf = bytearray()
+        encode_varints(values, buf)
+        assert decode_varints(bytes(buf), 0, len(buf)) == values
+
+    def test_reader_decodes_postings_and_positions(self):
+        reader = PostingsReader.from_postings(
+            {}, ["a", "b", "c"], [3, 1, 2], {"x": [(0, [1, 5, 9]), (2, [0, 200])]}
+        )
+        assert reader.postings("x") == [(0, 3), (2, 2)]
+        assert reader.positions("x") == {0: [1, 5, 9], 2: [0, 200]}
+        assert reader.doc_freq("x") == 2
+        assert reader.max_tf("x") == 3
+
+    def test_concatenated_shards_match_single_encoding(self):
+        postings = [(0, [1]), (3, [2, 4]), (200, [7]), (201, [0, 1, 2])]
+        shards = [encode_postings({"x": postings[:2]}), encode_postings({"x": postings[2:]})]
+        docs, positions, max_tf = encode_term(postings)
+        assert concat_term_blocks([s["x"] for s in shards]) == (docs, positions, 4, 3)
+
+
+class TestBrainIndex:
+
+    def test_build_save_load_roundtrip(self, brain_dir):
+        _write_docs(brain_dir)
+        built = BrainIndex(brain_dir)
+        built.build()
+        built.save()
+        assert (brain_dir / INDEX_FILENAME).exists()
+
+        loaded = BrainIndex(brain_dir)
+        assert loaded.load()
+        query = [["checkout"]]
+        assert loaded.search_bm25(query, top_k=None) == built.search_bm25(query, top_k=None)
+        assert loaded.search("checkout loyalty") == ["project/loyalty-launch"]
+
+    def test_bm25_ranks_by_term_frequency(self, brain_dir):
+        _write_docs(brain_dir)
+        index = BrainIndex(brain_dir)
+        index.build()
+        ranked = index.search_bm25([["checkout"]], top_k=10)
+        assert ranked[0][0] == "entity/system/checkout-service"
+        assert ranked[0][1] > ranked[1][1] > 0
+
+    def test_and_requires_every_token(self, brain_dir):
+        _write_docs(brain_dir)
+        index = BrainIndex(brain_dir)
+        index.build()
+        loyalty = PorterStemmer().stem("loyalty")
+        assert index.search_bm25([[loyalty]], top_k=None)
+        assert index.search_bm25([[loyalty], ["zzzunknown"]], top_k=None) == []
+        assert index.search_bm25([["zzzunknown"]], top_k=None) == []
+        assert index.search("loyalty zzzunknown") == []
+        assert index.search("loyalty zzzunknown", mode="or") == index.search("loyalty")
+
+    def test_or_top_k_matches_exhaustive(self, brain_dir):
+        _write_docs(brain_dir)
+        index = BrainIndex(brain_dir)
+        index.build()
+        groups = [["checkout"], ["loyalty"], ["payment"], ["team"]]
+        full = index.search_bm25(groups, top_k=None, require_all=False)
+        assert index.search_bm25(groups, top_k=1, require_all=False) == full[:1]
+
+    def test_phrase_docs(self, brain_dir):
+        _write_docs(brain_dir)
+        index = BrainIndex(brain_dir)
+        index.build()
+        assert index.phrase_docs("loyalty program launch") == {"project/loyalty-launch"}
+        assert index.phrase_docs("launch loyalty program") == set()
+        # Stopwords keep their width inside a phrase
+        assert index.phrase_docs("tracked by the payments") == {
+            "entity/system/checkout-service"
+        }
+
+    def test_legacy_json_index_is_readable(self, brain_dir):
+        legacy = {"meta": {}, "index": {"checkout": ["a/x", "b/y"], "loyalty": ["b/y"]}}
+        (brain_dir / "content_index.json").write_text(json.dumps(legacy))
+        index = BrainIndex(brain_dir)
+        assert index.load()
+        assert index.search("checkout") == ["a/x", "b/y"]
+        assert index.search("checkout loyalty") == ["b/y"]
+
+
+class TestPorterStemmer:
+
+    def test_stem_many_matches_stem(self):
+        words = ["services", "launching", "services", "configuration", "teams"]
+        batch = PorterStemmer().stem_many(words)
+        single = PorterStemmer()
+        assert batch == {w: single.stem(w) for w in words}
+
+    def test_cache_is_bounded_lru(self):
+        stemmer = PorterStemmer(max_cache=2)
+        stemmer.stem("alpha")
+        stemmer.stem("bravo")
+        stemmer.stem("alpha")  # Most recently used
+        stemmer.stem("charlie")
+        assert list(stemmer.cache) == ["alpha", "charlie"]
+
+    def test_cache_persists_with_index(self, brain_dir):
+        _write_docs(brain_dir)
+        index = BrainIndex(brain_dir)
+        index.build()
+        index.save()
+        assert index.stem_cache_file.exists()
+
+        warm = BrainIndex(brain_dir)
+        warm._load_stem_cache()
+        assert warm.stemmer.cache["checkout"] == "checkout"
+        warm._tokenize_positions("checkout latency")
+        assert warm.stemmer.misses == 0
+
+
+class TestParallelBuild:
+
+    def test_parallel_build_matches_serial(self, brain_dir, monkeypatch):
+        _write_docs(brain_dir)
+        for i in range(12):
+            write_entity(
+                brain_dir,
+                f"Entities/Systems/service-{i}.md",
+                f"$id: entity/system/service-{i}",
+                f"Service {i} handles checkout step {i} for loyalty members.\n",
+            )
+        monkeypatch.setattr(brain_index_module, "PARALLEL_MIN_FILES", 0)
+
+        serial = BrainIndex(brain_dir)
+        serial.build()
+        parallel = BrainIndex(brain_dir, workers=2)
+        parallel.build()
+
+        assert parallel.reader.docs == serial.reader.docs
+        assert parallel.reader.terms == serial.reader.terms
+        assert parallel._encoded[1] == serial._encoded[1]
+        assert parallel._files == serial._files
+
+
+class TestBrainSearchContent:
+
+    def test_content_results_ranked_by_bm25(self, brain_dir):
+        _write_docs(brain_dir)
+        index = BrainIndex(brain_dir)
+        index.build()
+        index.save()
+
+        search = BrainSearch(brain_dir)
+        results = search._search_content("checkout")
+        by_id = {r.entity_id: r.score for r in results}
+        assert by_id["entity/system/checkout-service"] > by_id["project/loyalty-launch"]
+
+        phrase = search._search_content('"program launch" checkout')
+        assert [r.entity_id for r in phrase] == ["project/loyalty-launch"]
+
+        unknown = search._search_content("loyalty zzzunknown")
+        assert [r.entity_id for r in unknown] == ["project/loyalty-launch"]
+
+
+class TestIncrementalUpdate:
+
+    QUERIES = [[["checkout"]], [["loyalty"], ["launch"]], [["payment"]], [["refund"]]]
+
+    def _assert_matches_full_build(self, brain_dir, index):
+        fresh = BrainIndex(brain_dir)
+        fresh.build()
+        for query in self.QUERIES:
+            got = index.search_bm25(query, top_k=None)
+            expected = fresh.search_bm25(query, top_k=None)
+            assert [e for e, _ in got] == [e for e, _ in expected]
+            assert [round(s, 9) for _, s in got] == [round(s, 9) for _, s in expected]
+
+    def test_update_modes(self, brain_dir):
+        _write_docs(brain_dir)
+        index = BrainIndex(brain_dir)
+        assert index.update()["mode"] == "full"
+        assert index.update()["mode"] == "unchanged"
+
+        write_entity(
+            brain_dir,
+            "Projects/loyalty-launch.md",
+            "$id: entity/project/loyalty-launch\n$type: project",
+            "# Loyalty Launch\n\nLaunch now covers refund flows and checkout.\n",
+        )
+        write_entity(
+            brain_dir,
+            "Projects/refund-revamp.md",
+            "$id: entity/project/refund-revamp\n$type: project",
+            "# Refund Revamp\n\nRefund payment handling.\n",
+        )
+        (brain_dir / "Entities/Systems/payments-gateway.md").unlink()
+
+        stats = index.update()
+        assert stats["mode"] == "incremental"
+        assert stats["files_added"] == 1
+        assert stats["files_removed"] == 1
+        assert stats["files_modified"] >= 1
+        assert "entity/system/payments-gateway" not in index.search("payment")
+        assert index.phrase_docs("refund payment") == {"project/refund-revamp"}
+        self._assert_matches_full_build(brain_dir, index)
+
+        reloaded = BrainIndex(brain_dir)
+        assert reloaded.load()
+        self._assert_matches_full_build(brain_dir, reloaded)
+
+    def test_touch_without_change_is_unchanged(self, brain_dir):
+        _write_docs(brain_dir)
+        index = BrainIndex(brain_dir)
+        index.update()
+        path = brain_dir / "Projects/loyalty-launch.md"
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        stats = index.update()
+        assert stats["mode"] == "unchanged"
+        assert stats["files_touched"] == 1
+
+    def test_stale_manifest_forces_full_rebuild(self, brain_dir):
+        _write_docs(brain_dir)
+        index = BrainIndex(brain_dir)
+        index.update()
+        (brain_dir / "content_index.db").unlink()
+        assert index.update()["mode"] == "full"
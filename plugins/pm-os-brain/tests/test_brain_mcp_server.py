@@ -0,0 +1,122 @@
+"""Tests for the Brain MCP server's warm engine context."""
+
+import os
+
+import yaml
+
+from brain_core.entity_cache import reset_shared_caches
+from index.graph_store import compile_graph
+from mcp import brain_mcp_server as server
+from .conftest import write_entity
+
+
+def _write_registry(brain_dir, aliases):
+    registry = {
+        "entities": {
+            "payments-gateway": {
+                "file": "Entities/Systems/payments-gateway.md",
+                "aliases": aliases,
+            },
+        }
+    }
+    path = brain_dir / "registry.yaml"
+    path.write_text(yaml.safe_dump(registry), encoding="utf-8")
+    return path
+
+
+class TestBrainEngines:
+
+    def test_keyword_engine_reused_until_registry_changes(self, brain_dir):
+        registry = _write_registry(brain_dir, ["paygate"])
+        engines = server.BrainEngines(brain_dir)
+
+        first = engines.keyword_search()
+        assert engines.keyword_search() is first
+        assert "paygate" in first.alias_index
+
+        _write_registry(brain_dir, ["cardgate"])
+        st = registry.stat()
+        os.utime(registry, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        reloaded = engines.keyword_search()
+        assert reloaded is not first
+        assert "cardgate" in reloaded.alias_index
+
+    def test_search_tool_uses_shared_engines(self, brain_dir, monkeypatch):
+        _write_registry(brain_dir, ["paygate"])
+        engines = server.BrainEngines(brain_dir)
+        engines.warm_up()
+        monkeypatch.setattr(server, "_ENGINES", engines)
+
+        response = server.search_entities("paygate")
+        assert "payments-gateway" in response
+        assert engines._keyword is not None
+
+
+class TestEntityIndex:
+
+    def _engines(self, brain_dir, monkeypatch):
+        reset_shared_caches()
+        engines = server.BrainEngines(brain_dir)
+        monkeypatch.setattr(server, "_ENGINES", engines)
+        return engines
+
+    def test_get_entity_and_relationships_by_id(self, brain_dir, monkeypatch):
+        self._engines(brain_dir, monkeypatch)
+        response = server.get_entity("entity/team/platform")
+        assert "name: Platform" in response
+        assert "Owns the payments gateway" in response
+
+        rels = server.get_relationships("entity/person/alice-smith")
+        assert "--[member_of]--> entity/team/platform" in rels
+        assert server.get_entity("entity/team/missing").startswith("Entity not found")
+
+    def test_moved_and_new_entities_found_before_ttl(self, brain_dir, monkeypatch):
+        engines = self._engines(brain_dir, monkeypatch)
+        engines.entities.refresh()
+        monkeypatch.setattr(server, "ENTITY_MISS_REFRESH", 0.0)
+
+        old = brain_dir / "Entities/Teams/platform.md"
+        old.rename(brain_dir / "Entities/platform.md")
+        write_entity(brain_dir, "Entities/Teams/billing.md", "$id: entity/team/billing\n$type: team")
+
+        assert "Entities/platform.md" in server.get_entity("entity/team/platform")
+        assert "Entity: entity/team/billing" in server.get_entity("entity/team/billing")
+
+    def test_list_entities_pages_with_cursor(self, brain_dir, monkeypatch):
+        for i in range(5):
+            write_entity(
+                brain_dir,
+                f"Entities/Projects/p{i}.md",
+                f"$id: entity/project/p{i}\n$type: project\n$status: active\n$updated: '2026-01-0{i + 1}'",
+            )
+        write_entity(brain_dir, "Inbox/draft.md", "$id: entity/project/draft\n$type: project")
+        engines = self._engines(brain_dir, monkeypatch)
+
+        seen, cursor = [], ""
+        while True:
+            page, total, cursor = engines.entities.page("project", "active", 2, cursor)
+            seen.extend(e["id"] for e in page)
+            if not cursor:
+                break
+        assert total == 5
+        assert seen == [f"entity/project/p{i}" for i in range(4, -1, -1)]
+
+        first = server.list_entities(entity_type="project", limit=2)
+        assert "(2 shown of 5)" in first
+        assert "Next cursor:" in first
+        assert "draft" not in server.list_entities(limit=50)
+
+    def test_relationships_served_from_graph_until_file_changes(self, brain_dir, monkeypatch):
+        engines = self._engines(brain_dir, monkeypatch)
+        compile_graph(brain_dir)
+        path = brain_dir / "Entities/People/alice-smith.md"
+        path.write_text(path.read_text().replace("member_of", "leads"), encoding="utf-8")
+
+        engines.graph()
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, engines.graph_mtime_ns - 1))
+        assert "--[member_of]-->" in server.get_relationships("entity/person/alice-smith")
+
+        os.utime(path, ns=(st.st_atime_ns, engines.graph_mtime_ns + 1_000_000))
+        assert "--[leads]-->" in server.get_relationships("entity/person/alice-smith")
@@ -0,0 +1,81 @@
+"""Tests for the shared Brain scan service used by quality/relationship tools."""
+
+from brain_core.entity_cache import (
+    EntityCache,
+    get_shared_cache,
+    parse_frontmatter,
+    reset_shared_caches,
+)
+from quality.graph_health import GraphHealthMonitor
+from quality.orphan_analyzer import OrphanAnalyzer
+from quality.orphan_cleaner import OrphanCleaner
+from quality.quality_scorer import QualityScorer
+from quality.stale_entity_detector import StaleEntityDetector
+from relationships.body_relationship_extractor import BodyRelationshipExtractor
+from relationships.canonical_resolver import CanonicalResolver
+from relationships.relationship_auditor import RelationshipAuditor
+from relationships.relationship_normalizer import RelationshipNormalizer
+from temporal.snapshot_manager import SnapshotManager
+
+from .conftest import write_entity
+
+
+class TestParseFrontmatter:
+
+    def test_parses_mapping_and_body(self):
+        fm, body = parse_frontmatter("---\n$id: x\nname: X\n---\n\nHello\n")
+        assert fm == {"$id": "x", "name": "X"}
+        assert body.strip() == "Hello"
+
+    def test_non_mapping_frontmatter_is_ignored(self):
+        content = "---\n- a\n- b\n---\nbody"
+        assert parse_frontmatter(content) == ({}, content)
+
+    def test_missing_frontmatter(self):
+        assert parse_frontmatter("just text") == ({}, "just text")
+
+
+class TestSharedScan:
+
+    def test_all_tools_share_one_scan(self, brain_dir):
+        cache = EntityCache(brain_dir, persistent=False)
+
+        GraphHealthMonitor(brain_dir, cache=cache).analyze()
+        OrphanAnalyzer(brain_dir, cache=cache).analyze()
+        OrphanCleaner(brain_dir, cache=cache).analyze_orphans()
+        QualityScorer(brain_dir, cache=cache).score_all_entities()
+        StaleEntityDetector(brain_dir, cache=cache).detect_stale()
+        RelationshipAuditor(brain_dir, cache=cache).audit()
+        RelationshipNormalizer(brain_dir, cache=cache).normalize_all(dry_run=True)
+        BodyRelationshipExtractor(brain_dir, cache=cache).scan()
+        CanonicalResolver(brain_dir, cache=cache).build_index(force=True)
+        entities = SnapshotManager(brain_dir, cache=cache)._snapshot_entities()
+
+        assert cache.stats()["scans"] == 1
+        assert set(entities) == {
+            "Entities/People/alice-smith.md",
+            "Entities/Teams/platform.md",
+            "Entities/Systems/payments-gateway.md",
+        }
+        assert not any(k.startswith("_") for e in entities.values() for k in e)
+
+    def test_files_sharing_an_id_are_all_scanned(self, brain_dir):
+        write_entity(
+            brain_dir, "Entities/Teams/platform-old.md", "$id: entity/team/platform\n$type: team"
+        )
+        cache = EntityCache(brain_dir, persistent=False)
+
+        entities = SnapshotManager(brain_dir, cache=cache)._snapshot_entities()
+        assert "Entities/Teams/platform-old.md" in entities
+        assert "Entities/Teams/platform.md" in entities
+        assert len(QualityScorer(brain_dir, cache=cache).score_all_entities()) == 4
+
+    def test_default_cache_is_process_wide(self, brain_dir):
+        reset_shared_caches()
+        try:
+            scorer = QualityScorer(brain_dir)
+            detector = StaleEntityDetector(brain_dir)
+            assert scorer._cache is detector._cache
+            assert scorer._cache is get_shared_cache(brain_dir)
+        finally:
+            reset_shared_caches()
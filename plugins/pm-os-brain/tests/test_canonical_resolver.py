@@ -0,0 +1,168 @@
+"""Tests for CanonicalResolver batch resolution and fuzzy matching."""
+
+import json
+import os
+
+from brain_core.entity_cache import EntityCache, reset_shared_caches
+from quality.orphan_cleaner import OrphanCleaner
+from quality.reference_validator import ReferenceValidator
+from relationships.canonical_resolver import CanonicalResolver
+
+from .conftest import write_entity
+
+QUERIES = [
+    "alice-smyth",
+    "alice",
+    "al",
+    "platfrom",
+    "platform-team",
+    "payments",
+    "gateway-payments",
+    "entity/team/platfor",
+    "ff",
+    "",
+    "zzz-unrelated",
+]
+
+
+def _resolver(brain_dir):
+    reset_shared_caches()
+    write_entity(
+        brain_dir,
+        "Projects/factor-form.md",
+        "$id: entity/project/factor-form\n$type: project\nname: Factor Form\n$aliases: [ff]",
+    )
+    resolver = CanonicalResolver(brain_dir)
+    resolver.build_index(force=True)
+    return resolver
+
+
+class TestFindSimilar:
+
+    def test_shortlist_matches_full_scan(self, brain_dir, monkeypatch):
+        resolver = _resolver(brain_dir)
+        fast = {q: resolver.find_similar(q) for q in QUERIES}
+
+        monkeypatch.setattr(resolver, "_candidates", lambda ref: list(resolver._index))
+        assert {q: resolver.find_similar(q) for q in QUERIES} == fast
+        assert fast["platfrom"][0][0] == "entity/team/platform"
+
+    def test_batch_apis(self, brain_dir):
+        resolver = _resolver(brain_dir)
+        resolved = resolver.resolve_many(["Alice Smith", "ff", "nobody", "ff"])
+        assert resolved == {
+            "Alice Smith": "entity/person/alice-smith",
+            "ff": "entity/project/factor-form",
+            "nobody": None,
+        }
+
+        similar = resolver.find_similar_many(["factor-fom", "platfrom"], max_results=1)
+        assert similar == {
+            "factor-fom": resolver.find_similar("factor-fom", max_results=1),
+            "platfrom": resolver.find_similar("platfrom", max_results=1),
+        }
+
+    def test_rebuild_refreshes_fuzzy_index(self, brain_dir):
+        resolver = _resolver(brain_dir)
+        assert resolver.find_similar("ledgerx") == []
+        write_entity(
+            brain_dir,
+            "Entities/Systems/ledger.md",
+            "$id: entity/system/ledger\n$type: system\nname: Ledger",
+        )
+        resolver._cache.reload()
+        resolver.build_index(force=True)
+        assert resolver.find_similar("ledgerx")[0][0] == "entity/system/ledger"
+
+
+class TestBatchConsumers:
+
+    def test_orphan_cleaner_and_validator(self, brain_dir):
+        _resolver(brain_dir)
+        write_entity(
+            brain_dir,
+            "Projects/checkout.md",
+            """
+$id: entity/project/checkout
+$type: project
+$relationships:
+  - type: owned_by
+    target: platfrom
+  - type: depends_on
+    target: entity/system/payments-gateway
+""",
+        )
+        reset_shared_caches()
+        orphans = OrphanCleaner(brain_dir).analyze_orphans()
+        assert [(o.target, o.category, o.suggestion) for o in orphans] == [
+            ("platfrom", "likely_typo", "entity/team/platform")
+        ]
+
+        validator = ReferenceValidator(brain_dir)
+        refs = ["platfrom", "entity/team/platform", "entity/team/gone", "Alice Smith"]
+        batch = validator.validate_references(refs)
+        assert batch == {ref: validator.validate_reference(ref) for ref in refs}
+
+
+class TestResolverCache:
+
+    def test_reload_reindexes_only_changed_files(self, brain_dir):
+        _resolver(brain_dir)
+        assert _resolver(brain_dir).cache_stats()["source"] == "rebuild"
+
+        reset_shared_caches()
+        resolver = CanonicalResolver(brain_dir)
+        assert resolver.resolve("ff") == "entity/project/factor-form"
+        assert resolver.cache_stats()["source"] == "cache"
+        assert resolver.cache_stats()["reindexed"] == 0
+
+        write_entity(
+            brain_dir,
+            "Projects/factor-form.md",
+            "$id: entity/project/factor-form\n$type: project\nname: Factor Form\n$aliases: [ffx]",
+        )
+        (brain_dir / "Entities/Systems/payments-gateway.md").unlink()
+        assert resolver.refresh() == 2
+        assert resolver.resolve("ffx") == "entity/project/factor-form"
+        assert resolver.resolve("ff") is None
+        assert resolver.resolve("payments-gateway") is None
+
+        reloaded = CanonicalResolver(brain_dir)
+        reloaded.build_index()
+        assert reloaded.cache_stats()["reindexed"] == 0
+        assert reloaded.resolve("ffx") == "entity/project/factor-form"
+        assert reloaded._index == resolver._index
+
+    def test_cache_is_json_and_replaces_pickle_file(self, brain_dir):
+        legacy = brain_dir / ".resolver-cache.pkl"
+        legacy.write_bytes(b"old pickle")
+        resolver = _resolver(brain_dir)
+
+        data = json.loads(resolver._cache_file.read_text(encoding="utf-8"))
+        assert data["files"]["Projects/factor-form.md"][2] == "entity/project/factor-form"
+        assert not legacy.exists()
+
+    def test_unreadable_cache_falls_back_to_rebuild(self, brain_dir):
+        resolver = _resolver(brain_dir)
+        resolver._cache_file.write_bytes(b"not a pickle")
+
+        reloaded = CanonicalResolver(brain_dir)
+        reloaded.build_index()
+        assert reloaded.cache_stats()["source"] == "rebuild"
+        assert reloaded._index == resolver._index
+
+    def test_full_build_skips_stale_entity_cache_entries(self, brain_dir):
+        cache = EntityCache(brain_dir, persistent=False).load()
+        path = write_entity(
+            brain_dir,
+            "Entities/Teams/platform.md",
+            "$id: entity/team/platform\n$type: team\nname: Platform\n$aliases: [core-infra]",
+        )
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert cache.get_if_current(path, path.stat()) is None
+
+        resolver = CanonicalResolver(brain_dir, cache=cache)
+        resolver.build_index(force=True)
+        assert resolver.resolve("core-infra") == "entity/team/platform"
+        assert resolver.refresh() == 0
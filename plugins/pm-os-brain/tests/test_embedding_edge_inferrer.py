@@ -0,0 +1,73 @@
+"""Tests for the vectorized similarity scan behind EmbeddingEdgeInferrer."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from relationships.embedding_edge_inferrer import (
+    EmbeddingEdgeInferrer,
+    _synthetic_embeddings,
+    topk_similar_pairs,
+)
+
+
+def _pairs(rows, cols, sims):
+    return [(int(i), int(j), round(float(s), 5)) for i, j, s in zip(rows, cols, sims)]
+
+
+class TestTopkSimilarPairs:
+
+    def test_blocked_scan_matches_full_matrix(self):
+        embeddings = _synthetic_embeddings(120, dim=16, seed=3)
+        excluded = {0: [5, 7], 10: [11]}
+        scores = embeddings @ embeddings.T
+        ranked = sorted(
+            (
+                (i, j)
+                for i in range(120)
+                for j in range(i + 1, 120)
+                if scores[i, j] >= 0.5 and j not in excluded.get(i, [])
+            ),
+            key=lambda p: (-scores[p], p),
+        )[:25]
+        expected = [(i, j, round(float(scores[i, j]), 5)) for i, j in ranked]
+
+        # A tiny budget forces one row per block
+        blocked = topk_similar_pairs(embeddings, 25, 0.5, excluded, memory_mb=0.001)
+        assert _pairs(*blocked) == expected
+        assert _pairs(*topk_similar_pairs(embeddings, 25, 0.5, excluded)) == expected
+
+    def test_small_inputs(self):
+        assert len(topk_similar_pairs(np.ones((1, 4), dtype=np.float32), 5)[0]) == 0
+        rows, cols, sims = topk_similar_pairs(np.eye(3, dtype=np.float32), 10, -1.0)
+        assert list(zip(rows.tolist(), cols.tolist())) == [(0, 1), (0, 2), (1, 2)]
+
+
+class TestEngines:
+
+    def test_numpy_engine_matches_pairwise_loop(self, tmp_path):
+        embeddings = _synthetic_embeddings(80, dim=16, seed=5)
+        entity_ids = [f"entity/synthetic/e{i}" for i in range(80)]
+        entities = {eid: {"$type": "synthetic"} for eid in entity_ids}
+        entities[entity_ids[0]]["$relationships"] = [{"target": entity_ids[1]}]
+
+        inferrer = EmbeddingEdgeInferrer(tmp_path, threshold=0.6)
+        fast = inferrer._numpy_scan(entities, entity_ids, embeddings, 30)
+        slow = inferrer._bruteforce_scan(entities, entity_ids, [], embeddings, 30)
+        assert {(e.source_id, e.target_id) for e in fast[0]} == {
+            (e.source_id, e.target_id) for e in slow[0]
+        }
+        assert fast[1] == slow[1]
+        assert (entity_ids[0], entity_ids[1]) not in {
+            (e.source_id, e.target_id) for e in fast[0]
+        }
+
+    def test_engine_selection(self, tmp_path, monkeypatch):
+        embeddings = _synthetic_embeddings(30, dim=8)
+        monkeypatch.delenv("PMOS_EDGE_SCAN_ENGINE", raising=False)
+        assert EmbeddingEdgeInferrer(tmp_path)._select_engine(30, embeddings) == "numpy"
+        assert EmbeddingEdgeInferrer(tmp_path)._select_engine(30, None) == "bruteforce"
+        monkeypatch.setenv("PMOS_EDGE_SCAN_ENGINE", "bruteforce")
+        assert EmbeddingEdgeInferrer(tmp_path)._select_engine(30, embeddings) == "bruteforce"
+        chroma = EmbeddingEdgeInferrer(tmp_path, engine="chroma")
+        assert chroma._select_engine(30, embeddings) in ("chroma", "numpy")
@@ -0,0 +1,108 @@
+"""Tests for the persistent (model, content hash) embedding store."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from brain_core.embedding_store import (
+    EmbeddingStore,
+    build_embedding_text,
+    content_hash,
+)
+
+
+class CountingEncoder:
+    """Deterministic fake model that records what it was asked to encode."""
+
+    def __init__(self, dim=8):
+        self.dim = dim
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            rng = np.random.default_rng(int(content_hash(text), 16) % (2**32))
+            out[i] = rng.standard_normal(self.dim)
+        return out
+
+
+class TestEmbeddingStore:
+
+    def test_encodes_each_text_once(self, tmp_path):
+        encoder = CountingEncoder()
+        store = EmbeddingStore(tmp_path, "model-a")
+        first = store.encode(["alpha", "beta", "alpha"], encoder)
+        second = store.encode(["beta", "gamma"], encoder)
+
+        assert encoder.calls == [["alpha", "beta"], ["gamma"]]
+        assert first.shape == (3, 8)
+        np.testing.assert_array_equal(first[0], first[2])
+        np.testing.assert_array_equal(first[1], second[0])
+
+    def test_persists_across_instances_and_models(self, tmp_path):
+        encoder = CountingEncoder()
+        expected = EmbeddingStore(tmp_path, "model-a").encode(["alpha", "beta"], encoder)
+
+        reloaded = EmbeddingStore(tmp_path, "model-a").encode(["beta", "alpha"], encoder)
+        assert len(encoder.calls) == 1
+        np.testing.assert_array_equal(reloaded, expected[::-1])
+
+        EmbeddingStore(tmp_path, "model-b").encode(["alpha"], encoder)
+        assert encoder.calls[-1] == ["alpha"]
+
+    def test_compact_keeps_live_vectors(self, tmp_path):
+        encoder = CountingEncoder()
+        store = EmbeddingStore(tmp_path, "model-a")
+        vectors = store.encode(["a", "b", "c", "d"], encoder)
+
+        removed = store.compact([content_hash("b"), content_hash("d")])
+        assert removed == 2
+        assert len(store) == 2
+
+        reloaded = EmbeddingStore(tmp_path, "model-a")
+        np.testing.assert_array_equal(reloaded.encode(["d", "b"], encoder), vectors[[3, 1]])
+        assert len(encoder.calls) == 1
+        reloaded.encode(["a"], encoder)
+        assert encoder.calls[-1] == ["a"]
+
+    def test_deferred_save_writes_table_once(self, tmp_path, monkeypatch):
+        encoder = CountingEncoder()
+        store = EmbeddingStore(tmp_path, "model-a")
+        saves = []
+        original = store._save_table
+        monkeypatch.setattr(store, "_save_table", lambda: (saves.append(1), original()))
+
+        with store.deferred_save():
+            store.encode(["a", "b"], encoder)
+            store.encode(["c"], encoder)
+            assert saves == []
+        assert saves == [1]
+
+        reloaded = EmbeddingStore(tmp_path, "model-a")
+        reloaded.encode(["a", "b", "c"], encoder)
+        assert len(encoder.calls) == 2
+
+    def test_truncated_data_file_is_ignored(self, tmp_path):
+        encoder = CountingEncoder()
+        store = EmbeddingStore(tmp_path, "model-a")
+        store.encode(["alpha", "beta"], encoder)
+        store.data_path.write_bytes(b"")
+
+        EmbeddingStore(tmp_path, "model-a").encode(["alpha"], encoder)
+        assert encoder.calls[-1] == ["alpha"]
+
+
+class TestBuildEmbeddingText:
+
+    def test_falls_back_to_filename_and_strips_body(self, tmp_path):
+        entity = {
+            "description": "Payments platform",
+            "_body": "\n\n  Body text  \n",
+            "$tags": ["fintech", "core"],
+            "_path": tmp_path / "Payment_Gateway.md",
+        }
+        assert build_embedding_text(entity) == (
+            "Payment Gateway Payments platform Body text fintech core"
+        )
+        assert build_embedding_text(dict(entity, name="PG")).startswith("PG ")
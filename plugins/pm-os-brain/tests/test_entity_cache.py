@@ -0,0 +1,201 @@
+"""Tests for the persistent, incremental EntityCache."""
+
+import os
+import pickle
+import sqlite3
+from datetime import date, datetime
+
+from brain_core.entity_cache import (
+    CACHE_FILENAME,
+    EntityCache,
+    get_shared_cache,
+    refresh_shared_caches,
+    reset_shared_caches,
+)
+
+from .conftest import write_entity
+
+
+class _Touch:
+    """Creates a file when unpickled."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __reduce__(self):
+        return (open, (self.path, "w"))
+
+
+class TestEntityCachePersistence:
+
+    def test_first_load_parses_everything(self, brain_dir):
+        cache = EntityCache(brain_dir).load()
+        stats = cache.stats()
+        assert stats["entity_count"] == 3
+        assert stats["misses"] == 3
+        assert stats["hits"] == 0
+        assert (brain_dir / CACHE_FILENAME).exists()
+
+    def test_second_load_is_all_hits(self, brain_dir):
+        EntityCache(brain_dir).load()
+        cache = EntityCache(brain_dir).load()
+        stats = cache.stats()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 0
+        person = cache.get_by_id("entity/person/alice-smith")
+        assert person["name"] == "Alice Smith"
+        assert "payments migration" in person["_body"]
+        assert person["_path"] == brain_dir / "Entities/People/alice-smith.md"
+
+    def test_only_changed_files_are_reparsed(self, brain_dir):
+        EntityCache(brain_dir).load()
+        path = write_entity(
+            brain_dir,
+            "Entities/Systems/payments-gateway.md",
+            "$id: entity/system/payments-gateway\n$type: system\nname: Payments GW v2",
+        )
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        cache = EntityCache(brain_dir).load()
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 2
+        assert cache.get_by_id("entity/system/payments-gateway")["name"] == "Payments GW v2"
+
+    def test_touched_but_unchanged_file_is_hash_hit(self, brain_dir):
+        EntityCache(brain_dir).load()
+        path = brain_dir / "Entities/Teams/platform.md"
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        cache = EntityCache(brain_dir).load()
+        assert cache.stats()["hits"] == 3
+        assert cache.stats()["misses"] == 0
+
+    def test_deleted_files_are_dropped(self, brain_dir):
+        EntityCache(brain_dir).load()
+        (brain_dir / "Entities/Teams/platform.md").unlink()
+
+        cache = EntityCache(brain_dir).load()
+        assert cache.stats()["removed"] == 1
+        assert cache.get_by_id("entity/team/platform") is None
+        assert EntityCache(brain_dir).load().stats()["removed"] == 0
+
+    def test_corrupt_store_is_rebuilt(self, brain_dir):
+        (brain_dir / CACHE_FILENAME).write_bytes(b"not a database")
+        cache = EntityCache(brain_dir).load()
+        assert cache.entity_count == 3
+        assert EntityCache(brain_dir).load().stats()["hits"] == 3
+
+    def test_undecodable_row_is_reparsed_and_replaced(self, brain_dir, tmp_path):
+        EntityCache(brain_dir).load()
+        marker = tmp_path / "unpickled"
+        # A row that would run code if it were ever unpickled
+        payload = pickle.dumps(_Touch(str(marker)))
+        conn = sqlite3.connect(str(brain_dir / CACHE_FILENAME))
+        with conn:
+            conn.execute(
+                "UPDATE entities SET data = ? WHERE path = ?",
+                (payload, "Entities/Teams/platform.md"),
+            )
+        conn.close()
+
+        cache = EntityCache(brain_dir).load()
+        assert not marker.exists()
+        assert cache.get_by_id("entity/team/platform") is not None
+        assert cache.stats()["misses"] == 1
+        assert EntityCache(brain_dir).load().stats()["hits"] == 3
+
+    def test_rows_keep_yaml_timestamps(self, brain_dir):
+        write_entity(
+            brain_dir,
+            "Entities/Teams/dated.md",
+            "$id: entity/team/dated\n$type: team\nstarted: 2026-01-02\n"
+            "$updated: 2026-01-02T03:04:05+00:00\n1: int key",
+        )
+        first = EntityCache(brain_dir).load().get_by_id("entity/team/dated")
+        warm = EntityCache(brain_dir).load()
+        assert warm.get_by_id("entity/team/dated") == first
+        assert isinstance(first["started"], date)
+        assert isinstance(first["$updated"], datetime)
+
+    def test_non_persistent_mode_writes_nothing(self, brain_dir):
+        cache = EntityCache(brain_dir, persistent=False).load()
+        assert cache.entity_count == 3
+        assert not (brain_dir / CACHE_FILENAME).exists()
+
+
+class TestSharedCaches:
+
+    def test_refresh_picks_up_external_edits(self, brain_dir):
+        reset_shared_caches()
+        assert refresh_shared_caches() == 0
+        cache = get_shared_cache(brain_dir)
+        assert cache.get_by_id("entity/team/platform") is not None
+
+        (brain_dir / "Entities/Teams/platform.md").unlink()
+        assert cache.get_by_id("entity/team/platform") is not None
+        assert refresh_shared_caches() == 1
+        assert cache.get_by_id("entity/team/platform") is None
+        assert cache.stats()["hits"] == 2
+        reset_shared_caches()
+
+    def test_refresh_skips_unchanged_brain(self, brain_dir):
+        reset_shared_caches()
+        cache = get_shared_cache(brain_dir)
+        cache.load()
+        assert refresh_shared_caches(max_age=3600) == 0
+
+        write_entity(brain_dir, "Entities/Teams/growth.md", "$id: entity/team/growth\n$type: team")
+        assert refresh_shared_caches(max_age=3600) == 1
+        assert cache.get_by_id("entity/team/growth") is not None
+        assert refresh_shared_caches(max_age=0) == 1
+        reset_shared_caches()
+
+    def test_stale_shared_cache_is_reloaded_when_handed_out(self, brain_dir):
+        reset_shared_caches()
+        cache = get_shared_cache(brain_dir).load()
+
+        write_entity(brain_dir, "Entities/Teams/growth.md", "$id: entity/team/growth\n$type: team")
+        assert get_shared_cache(brain_dir, max_age=None).get_by_id("entity/team/growth") is None
+        assert get_shared_cache(brain_dir) is cache
+        assert cache.get_by_id("entity/team/growth") is not None
+        reset_shared_caches()
+
+
+class TestPerFileLookups:
+
+    def test_files_sharing_an_id_are_all_kept(self, brain_dir):
+        first = write_entity(brain_dir, "Entities/Teams/a-dup.md", "$id: entity/team/dup\n$type: team")
+        second = write_entity(brain_dir, "Entities/Teams/b-dup.md", "$id: entity/team/dup\n$type: team")
+        cache = EntityCache(brain_dir, persistent=False).load()
+
+        paths = {fm["_path"] for fm in cache.get_files()}
+        assert {first, second} <= paths
+        assert len(paths) == 5
+        assert cache.get_by_path(first)["_path"] == first
+        assert cache.get_by_path(second)["_path"] == second
+        assert list(cache.get_by_type("team")).count("entity/team/dup") == 1
+
+        winner = cache.get_path("entity/team/dup")
+        winner.unlink()
+        cache.invalidate_path(winner)
+        assert cache.get_path("entity/team/dup") == ({first, second} - {winner}).pop()
+
+    def test_invalidate_follows_id_and_type_changes(self, brain_dir):
+        cache = EntityCache(brain_dir, persistent=False).load()
+        path = write_entity(
+            brain_dir, "Entities/Teams/platform.md", "$id: entity/squad/platform\n$type: squad"
+        )
+        cache.invalidate_path(path)
+
+        assert cache.get_by_id("entity/team/platform") is None
+        assert "team" not in cache.get_types()
+        assert list(cache.get_by_type("squad")) == ["entity/squad/platform"]
+        assert cache.get_by_path(path)["$id"] == "entity/squad/platform"
+
+        path.write_text("no frontmatter\n", encoding="utf-8")
+        cache.invalidate_path(path)
+        assert cache.get_by_id("entity/squad/platform") is None
+        assert path in cache.get_plain_paths()
+        assert cache.entity_count == 2
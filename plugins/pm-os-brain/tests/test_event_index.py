@@ -0,0 +1,117 @@
+"""Tests for the indexed event log behind EventStore queries."""
+
+from datetime import datetime, timezone
+
+import yaml
+
+from brain_core.entity_cache import reset_shared_caches
+from temporal.event_store import EventStore
+
+from .conftest import write_entity
+
+
+def _event(event_id, day, event_type="field_update", actor="system/a", correlation_id=None):
+    event = {
+        "event_id": event_id,
+        "timestamp": f"2026-03-{day:02d}T10:00:00+00:00",
+        "type": event_type,
+        "actor": actor,
+        "message": event_id,
+        "changes": [],
+    }
+    if correlation_id:
+        event["correlation_id"] = correlation_id
+    return event
+
+
+def _write_events(brain_dir, rel_path, entity_id, events):
+    frontmatter = {"$id": entity_id, "$type": "project", "$events": events}
+    return write_entity(brain_dir, rel_path, yaml.safe_dump(frontmatter, sort_keys=False))
+
+
+def _day(day):
+    return datetime(2026, 3, day, tzinfo=timezone.utc)
+
+
+class TestEventIndex:
+
+    def test_queries_served_from_index(self, brain_dir):
+        reset_shared_caches()
+        _write_events(brain_dir, "Projects/a.md", "entity/project/a", [
+            _event("evt-a1", 1, correlation_id="run-1"),
+            _event("evt-a2", 5, actor="system/b"),
+        ])
+        _write_events(brain_dir, "Projects/b.md", "entity/project/b", [
+            _event("evt-b1", 3, event_type="status_change", correlation_id="run-1"),
+        ])
+        store = EventStore(brain_dir)
+
+        recent = store.query_events(since=_day(2))
+        assert [e.event_id for e in recent] == ["evt-a2", "evt-b1"]
+        assert recent[1].entity_id == "Projects/b.md"
+
+        assert [e.event_id for e in store.query_events(actors=["system/b"])] == ["evt-a2"]
+        assert [e.event_id for e in store.query_events(entity_pattern="Projects/a.md")] == [
+            "evt-a2",
+            "evt-a1",
+        ]
+        assert [e.event_id for e in store.get_events_by_correlation("run-1")] == [
+            "evt-b1",
+            "evt-a1",
+        ]
+        assert store.count_events(group_by="type") == {"field_update": 2, "status_change": 1}
+        assert store.count_events(since=_day(2), group_by="actor") == {
+            "system/a": 1,
+            "system/b": 1,
+        }
+
+    def test_log_is_append_only_and_syncs_changed_files(self, brain_dir):
+        reset_shared_caches()
+        path = _write_events(brain_dir, "Projects/a.md", "entity/project/a", [
+            _event("evt-a1", 1),
+            _event("evt-a2", 2),
+        ])
+        store = EventStore(brain_dir)
+        assert store.index.sync()["events"] == 2
+        assert store.index.sync()["changed"] == 0
+
+        # Compaction drops evt-a1 from the file; the log keeps it
+        _write_events(brain_dir, "Projects/a.md", "entity/project/a", [
+            _event("evt-a2", 2),
+            _event("evt-a3", 3),
+        ])
+        store.sync_index(force=True)
+        assert [e.event_id for e in store.query_events()] == ["evt-a3", "evt-a2", "evt-a1"]
+
+        event = store.append_event(path, "field_update", "manual edit", correlation_id="run-9")
+        assert [e.event_id for e in store.get_events_by_correlation("run-9")] == [event.event_id]
+
+    def test_same_second_events_are_all_logged(self, brain_dir):
+        reset_shared_caches()
+        path = _write_events(brain_dir, "Projects/a.md", "entity/project/a", [])
+        store = EventStore(brain_dir)
+        first = store.append_event(path, "field_update", "one", correlation_id="run-2")
+        second = store.append_event(path, "field_update", "two", correlation_id="run-2")
+        assert first.event_id != second.event_id
+        assert len(store.get_events_by_correlation("run-2")) == 2
+
+        # Legacy second-resolution ids repeated within a file
+        _write_events(brain_dir, "Projects/b.md", "entity/project/b", [
+            _event("evt-20260301-100000", 1),
+            _event("evt-20260301-100000", 1, event_type="status_change"),
+        ])
+        store.sync_index(force=True)
+        assert store.count_events(group_by="type", since=_day(1), until=_day(2)) == {
+            "field_update": 1,
+            "status_change": 1,
+        }
+
+    def test_sync_drops_deleted_files(self, brain_dir):
+        reset_shared_caches()
+        path = _write_events(brain_dir, "Projects/a.md", "entity/project/a", [_event("evt-a1", 1)])
+        store = EventStore(brain_dir)
+        assert store.index.sync()["events"] == 1
+
+        path.unlink()
+        assert store.index.sync()["removed"] == 1
+        assert store.query_events() == []
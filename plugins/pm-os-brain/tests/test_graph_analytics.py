@@ -0,0 +1,86 @@
+"""Tests for array-form graph analytics and their health/ranking consumers."""
+
+import pytest
+
+from brain_core.entity_cache import reset_shared_caches
+from index.brain_query import BrainQuery
+from index.brain_search import SearchResult
+from index.graph_store import compile_graph
+from quality import graph_analytics
+from quality.graph_analytics import analyze_edges
+from quality.graph_health import GraphHealthMonitor
+
+from .conftest import write_entity
+
+# a -> b <-> c -> d, plus isolated e
+NODES = ["a", "b", "c", "d", "e"]
+SRC = [0, 1, 2, 2]
+DST = [1, 2, 1, 3]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(graph_analytics, "HAS_NUMPY", False)
+    return request.param
+
+
+class TestAnalyzeEdges:
+
+    def test_structure_metrics(self, backend):
+        result = analyze_edges(NODES, SRC, DST)
+        assert result.in_degree == [0, 2, 1, 1, 0]
+        assert result.out_degree == [1, 1, 2, 0, 0]
+        assert result.degree_distribution() == {0: 1, 1: 2, 3: 2}
+        assert result.component_count == 2
+        assert result.largest_component == 4
+        assert result.component_labels[0] == result.component_labels[3]
+        assert result.reciprocal_pairs == 1
+        assert result.bridge_entities() == ["b", "c"]
+
+    def test_pagerank_sums_to_one_and_matches_backends(self, backend, monkeypatch):
+        ranks = analyze_edges(NODES, SRC, DST).pagerank
+        assert sum(ranks) == pytest.approx(1.0)
+        top = [eid for eid, _ in analyze_edges(NODES, SRC, DST).top_pagerank(2)]
+        assert sorted(top) == ["b", "c"]
+
+        monkeypatch.setattr(graph_analytics, "HAS_NUMPY", False)
+        assert analyze_edges(NODES, SRC, DST).pagerank == pytest.approx(ranks)
+
+    def test_empty_graph(self, backend):
+        result = analyze_edges([], [], [])
+        assert result.component_count == 0
+        assert result.pagerank == []
+
+
+class TestConsumers:
+
+    def test_graph_health_report(self, brain_dir):
+        reset_shared_caches()
+        write_entity(brain_dir, "Entities/Misc/loner.md", "$id: entity/misc/loner\n$type: misc")
+        report = GraphHealthMonitor(brain_dir).analyze()
+
+        assert report.bidirectional_relationships == 1
+        assert report.entities_with_incoming == 2
+        assert report.orphans == ["entity/misc/loner", "entity/system/payments-gateway"]
+        assert report.connected_components == 3
+        assert report.largest_component == 2
+        assert report.degree_distribution == {0: 2, 2: 2}
+
+    def test_merge_and_rank_boosts_central_entities(self, brain_dir):
+        reset_shared_caches()
+        compile_graph(brain_dir)
+        seeds = [
+            SearchResult(entity_id="entity/system/payments-gateway", score=1.0, source="alias"),
+            SearchResult(entity_id="entity/team/platform", score=1.0, source="alias"),
+        ]
+
+        flat = BrainQuery(brain_dir, centrality_weight=0)._merge_and_rank(seeds, [])
+        assert [r.score for r in flat] == [1.0, 1.0]
+
+        ranked = BrainQuery(brain_dir)._merge_and_rank(seeds, [])
+        scores = {r.entity_id: r.score for r in ranked}
+        assert scores["entity/team/platform"] == pytest.approx(1.1)
+        assert 1.0 < scores["entity/system/payments-gateway"] < 1.1
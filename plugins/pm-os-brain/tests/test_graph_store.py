@@ -0,0 +1,120 @@
+"""Tests for the compiled relationship graph and BrainGraph traversal."""
+
+from brain_core.entity_cache import reset_shared_caches
+from index.brain_graph import BrainGraph
+from index.brain_search import SearchResult
+from index.graph_store import (
+    GRAPH_FILENAME,
+    CompiledGraph,
+    compile_graph,
+    load_or_compile,
+)
+
+from .conftest import write_entity
+
+
+def _seed(entity_id):
+    return SearchResult(entity_id=entity_id, score=1.0, source="test")
+
+
+def _add_project(brain_dir):
+    write_entity(
+        brain_dir,
+        "Projects/checkout.md",
+        """
+$id: entity/project/checkout
+$type: project
+name: Checkout
+$relationships:
+  - type: owned_by
+    target: Platform
+    strength: 0.8
+    confidence: 0.9
+    source: manual
+    last_verified: '2026-01-02'
+    inferred_by: soft-edge
+  - type: depends_on
+    target: entity/system/does-not-exist
+""",
+    )
+
+
+class TestCompiledGraph:
+
+    def test_compile_resolves_targets_and_round_trips_fields(self, brain_dir):
+        reset_shared_caches()
+        _add_project(brain_dir)
+        graph = CompiledGraph.open(compile_graph(brain_dir))
+
+        edges = list(graph.edges("entity/project/checkout"))
+        assert [e.target for e in edges] == ["entity/team/platform", None]
+        assert edges[0].as_relationship() == {
+            "type": "owned_by",
+            "target": "Platform",
+            "strength": 0.8,
+            "confidence": 0.9,
+            "source": "manual",
+            "last_verified": "2026-01-02",
+            "inferred_by": "soft-edge",
+        }
+        assert graph.stats()["unresolved_edges"] == 1
+        assert graph.node("checkout") == graph.node_ids["entity/project/checkout"]
+        graph.close()
+
+    def test_stale_graph_is_recompiled(self, brain_dir):
+        reset_shared_caches()
+        _add_project(brain_dir)
+        compile_graph(brain_dir)
+
+        # Removing an entity changes the file count
+        (brain_dir / "Entities/Teams/platform.md").unlink()
+        graph = load_or_compile(brain_dir)
+        assert "entity/team/platform" not in graph.node_ids
+        graph.close()
+
+        # Editing an entity changes the newest mtime
+        write_entity(
+            brain_dir,
+            "Entities/Systems/payments-gateway.md",
+            """
+$id: entity/system/payments-gateway
+$type: system
+$relationships:
+  - type: depends_on
+    target: entity/person/alice-smith
+""",
+        )
+        graph = load_or_compile(brain_dir)
+        assert [e.target for e in graph.edges("entity/system/payments-gateway")] == [
+            "entity/person/alice-smith"
+        ]
+        graph.close()
+
+
+class TestBrainGraphExpand:
+
+    def test_multi_hop_expand_from_compiled_graph(self, brain_dir):
+        reset_shared_caches()
+        _add_project(brain_dir)
+        compile_graph(brain_dir)
+        graph = BrainGraph(brain_dir)
+
+        one_hop = {r.entity_id: r for r in graph.expand([_seed("checkout")], depth=1)}
+        assert set(one_hop) == {"entity/team/platform"}
+        assert one_hop["entity/team/platform"].score == 0.8
+        assert one_hop["entity/team/platform"].relationship_type == "owned_by"
+        assert graph.warnings == [
+            "Unresolved: 'entity/system/does-not-exist' in checkout"
+        ]
+
+        two_hop = {r.entity_id: r for r in graph.expand([_seed("entity/project/checkout")], depth=2)}
+        alice = two_hop["entity/person/alice-smith"]
+        assert alice.score == 0.8 * 0.25
+        assert alice.via == "entity/project/checkout"
+
+    def test_compiles_on_first_use(self, brain_dir):
+        reset_shared_caches()
+        graph = BrainGraph(brain_dir)
+        rels = graph.get_relationships("entity/person/alice-smith")
+        assert rels == [{"type": "member_of", "target": "entity/team/platform"}]
+        assert (brain_dir / GRAPH_FILENAME).exists()
@@ -0,0 +1,160 @@
+"""Tests for content-addressed entity snapshots and point-in-time reads."""
+
+from datetime import datetime, timezone
+
+from brain_core.entity_cache import reset_shared_caches
+from enrichment.brain_enrich import BrainEnrichmentOrchestrator
+from temporal.snapshot_manager import SnapshotManager
+from temporal.temporal_query import TemporalQuery
+
+from .conftest import write_entity
+
+ALICE = "Entities/People/alice-smith.md"
+
+
+def _snapshot_at(manager, stamp):
+    """Create an entity snapshot and file it under the given date/time."""
+    path = manager.create_snapshot(include_entities=True)
+    date_dir = manager.snapshots_dir / stamp[:10]
+    date_dir.mkdir(exist_ok=True)
+    target = date_dir / f"snapshot-{stamp[11:].replace(':', '')}.json.gz"
+    path.rename(target)
+    return target
+
+
+def _objects(manager):
+    return sorted(manager.objects_dir.glob("*/*.json.gz"))
+
+
+class TestSnapshotManager:
+
+    def test_unchanged_entities_reuse_objects(self, brain_dir):
+        reset_shared_caches()
+        manager = SnapshotManager(brain_dir)
+        _snapshot_at(manager, "2026-01-01T10:00:00")
+        assert manager.last_stats == {"entities": 3, "reused": 0, "serialized": 3, "written": 3}
+
+        _snapshot_at(manager, "2026-01-02T10:00:00")
+        assert manager.last_stats["reused"] == 3
+        assert len(_objects(manager)) == 3
+
+        write_entity(brain_dir, ALICE, "$id: entity/person/alice-smith\n$type: person\nname: Alice S.")
+        manager._cache.reload()
+        _snapshot_at(manager, "2026-01-03T10:00:00")
+        assert manager.last_stats["serialized"] == 1
+        assert len(_objects(manager)) == 4
+
+        jan2 = manager.get_entity_at(ALICE, datetime(2026, 1, 2, 12, tzinfo=timezone.utc))
+        assert jan2["frontmatter"]["name"] == "Alice Smith"
+        assert "payments migration" in jan2["body"]
+        jan3 = manager.get_entity_at(ALICE, datetime(2026, 1, 3, 12))
+        assert jan3["frontmatter"]["name"] == "Alice S."
+        assert manager.get_entity_at(ALICE, datetime(2025, 12, 31)) is None
+
+    def test_cleanup_collects_unreferenced_objects(self, brain_dir):
+        reset_shared_caches()
+        manager = SnapshotManager(brain_dir)
+        _snapshot_at(manager, "2020-01-01T10:00:00")
+        write_entity(brain_dir, ALICE, "$id: entity/person/alice-smith\n$type: person")
+        manager._cache.reload()
+        _snapshot_at(manager, "2020-01-05T10:00:00")
+        assert len(_objects(manager)) == 4
+
+        manager.cleanup_old_snapshots(retention_days=30, keep_monthly=True)
+        assert len(_objects(manager)) == 3
+        assert manager.load_entities(manager.get_snapshot(date_str="2020-01-01"))[ALICE][
+            "name"
+        ] == "Alice Smith"
+
+
+class TestTemporalQuerySnapshots:
+
+    def test_get_entity_at_reads_snapshot_for_changed_and_deleted(self, brain_dir):
+        reset_shared_caches()
+        tq = TemporalQuery(brain_dir)
+        _snapshot_at(tq.snapshots, "2026-01-01T10:00:00")
+
+        path = write_entity(
+            brain_dir,
+            ALICE,
+            "$id: entity/person/alice-smith\n$type: person\nname: Alice S.\n"
+            "$updated: '2026-02-01T00:00:00+00:00'",
+        )
+        before = tq.get_entity_at(path, datetime(2026, 1, 15, tzinfo=timezone.utc))
+        assert before.frontmatter["name"] == "Alice Smith"
+
+        platform = brain_dir / "Entities/Teams/platform.md"
+        platform.unlink()
+        gone = tq.get_entity_at(platform, datetime(2026, 1, 15))
+        assert gone.frontmatter["$id"] == "entity/team/platform"
+
+    def test_bulk_reconstruction_from_checkpoints_and_events(self, brain_dir):
+        reset_shared_caches()
+        tq = TemporalQuery(brain_dir)
+        _snapshot_at(tq.snapshots, "2026-01-01T10:00:00")
+
+        write_entity(
+            brain_dir,
+            ALICE,
+            """
+$id: entity/person/alice-smith
+$type: person
+$status: inactive
+name: Alice Smith
+$updated: '2026-02-01T00:00:00+00:00'
+$events:
+  - event_id: evt-leave
+    timestamp: '2026-01-10T00:00:00+00:00'
+    type: status_change
+    actor: system/test
+    changes:
+      - {field: $status, operation: set, value: on_leave, old_value: active}
+  - event_id: evt-exit
+    timestamp: '2026-02-01T00:00:00+00:00'
+    type: status_change
+    actor: system/test
+    changes:
+      - {field: $status, operation: set, value: inactive, old_value: on_leave}
+""",
+        )
+        (brain_dir / "Entities/Teams/platform.md").unlink()
+        tq.snapshots._cache.reload()
+        _snapshot_at(tq.snapshots, "2026-02-10T10:00:00")
+        tq.sync_checkpoints(force=True)
+
+        jan15 = datetime(2026, 1, 15, tzinfo=timezone.utc)
+        states = {s.entity_id: s for s in tq.query_entities_at(jan15)}
+        assert sorted(states) == [
+            ALICE,
+            "Entities/Systems/payments-gateway.md",
+            "Entities/Teams/platform.md",
+        ]
+        # Nearest checkpoint (Jan 1) plus the Jan 10 status change
+        assert states[ALICE].frontmatter["$status"] == "on_leave"
+        single = tq.get_entity_at(brain_dir / ALICE, jan15)
+        assert single.frontmatter == states[ALICE].frontmatter
+        assert [s.entity_id for s in tq.query_entities_at(jan15, status="on_leave")] == [ALICE]
+        assert "Entities/Teams/platform.md" not in {
+            s.entity_id for s in tq.query_entities_at(datetime(2026, 2, 15))
+        }
+
+        changes = {c["entity_id"]: c for c in tq.iter_changes(jan15, datetime(2026, 2, 15))}
+        assert sorted(changes) == [ALICE, "Entities/Teams/platform.md"]
+        assert {"field": "$status", "old_value": "on_leave", "new_value": "inactive"} in changes[
+            ALICE
+        ]["field_changes"]
+        assert changes["Entities/Teams/platform.md"]["exists_at_end"] is False
+
+        summary = tq.get_changes_in_period(datetime(2026, 1, 1), datetime(2026, 2, 28), "person")
+        assert summary["total_events"] == 2
+        assert summary["by_entity"] == {ALICE: 2}
+        assert tq.get_changes_in_period(jan15, datetime(2026, 2, 28), "team")["total_events"] == 0
+
+    def test_enrichment_takes_daily_checkpoint(self, brain_dir):
+        reset_shared_caches()
+        BrainEnrichmentOrchestrator(brain_dir)._checkpoint()
+        tq = TemporalQuery(brain_dir)
+        tq.sync_checkpoints()
+        assert tq.checkpoints.latest_checkpoint() is not None
+        # A checkpoint younger than the interval is not repeated
+        assert tq.checkpoint() is None
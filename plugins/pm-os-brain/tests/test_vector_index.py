@@ -0,0 +1,96 @@
+"""Tests for incremental vector index sync (collection and model faked)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import index.vector_index as vector_index_module
+from index.vector_index import BrainVectorIndex
+
+from .conftest import write_entity
+
+
+class FakeCollection:
+    """In-memory stand-in for the ChromaDB collection API used by sync()."""
+
+    def __init__(self):
+        self.rows = {}
+        self.upserted = []
+        self.updated = []
+
+    def count(self):
+        return len(self.rows)
+
+    def get(self, include=None, limit=None, offset=0):
+        ids = sorted(self.rows)[offset : offset + limit]
+        return {"ids": ids, "metadatas": [self.rows[i] for i in ids]}
+
+    def upsert(self, ids, documents, embeddings, metadatas):
+        self.upserted.extend(ids)
+        self.rows.update(zip(ids, metadatas))
+
+    def update(self, ids, metadatas):
+        self.updated.extend(ids)
+        self.rows.update(zip(ids, metadatas))
+
+    def delete(self, ids):
+        for entity_id in ids:
+            self.rows.pop(entity_id, None)
+
+
+@pytest.fixture
+def vector_index(brain_dir, monkeypatch):
+    monkeypatch.setattr(vector_index_module, "VECTOR_AVAILABLE", True)
+    index = BrainVectorIndex(brain_dir, model_name="fake-model")
+    index._collection = FakeCollection()
+    index.embedding_store = None
+    monkeypatch.setattr(
+        index, "_encode", lambda documents, hashes: np.zeros((len(documents), 4))
+    )
+    return index
+
+
+class TestVectorSync:
+
+    def test_metadata_only_change_updates_without_embedding(self, brain_dir, vector_index):
+        collection = vector_index._collection
+        assert vector_index.sync()["added"] == 3
+        assert vector_index.sync()["unchanged"] == 3
+
+        # $status and $confidence are filter metadata, not embedded text
+        write_entity(
+            brain_dir,
+            "Entities/Systems/payments-gateway.md",
+            """
+$id: entity/system/payments-gateway
+$type: system
+$status: deprecated
+$confidence: 0.4
+name: Payments Gateway
+""",
+            "# Payments Gateway\n\nHandles card payments.\n",
+        )
+        collection.upserted.clear()
+        stats = vector_index.sync()
+        assert stats["metadata_updated"] == 1
+        assert stats["updated"] == 0
+        assert stats["unchanged"] == 2
+        assert collection.upserted == []
+        assert collection.updated == ["entity/system/payments-gateway"]
+        row = collection.rows["entity/system/payments-gateway"]
+        assert row["entity_status"] == "deprecated"
+        assert row["confidence"] == 0.4
+        assert row["embedding_model"] == "fake-model"
+
+        assert vector_index.sync()["metadata_updated"] == 0
+
+    def test_moved_file_updates_path_metadata(self, brain_dir, vector_index):
+        vector_index.sync()
+        old = brain_dir / "Entities/Teams/platform.md"
+        new = brain_dir / "Entities/Archive-Teams/platform.md"
+        new.parent.mkdir(parents=True)
+        old.rename(new)
+
+        stats = vector_index.sync()
+        assert stats["metadata_updated"] == 1
+        assert vector_index._collection.rows["entity/team/platform"]["file_path"] == str(new)
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Alias Matcher -- one-pass multi-alias scanning (Aho-Corasick).
+
+Compiles every registry alias into a single automaton so a context
+document is scanned once, instead of running one regex per alias.
+Word-boundary matching reproduces the semantics of
+re.findall(r"\\b" + re.escape(alias) + r"\\b", text) exactly, including
+non-overlapping counts per alias.
+
+Automata are memoised in-process and saved as JSON under the brain
+directory (.alias-matchers/<fingerprint>.json), keyed by a fingerprint of
+the ordered alias list -- i.e. one compiled matcher per registry version.
+The brain directory may be synced or shared, so saved automata are plain
+data that is validated on load, never pickles.
+
+Shared by brain_loader.scan_for_entities, brain_updater.scan_for_entities,
+BaseEnricher.find_entity_by_mention and the meeting participant resolver.
+
+Usage:
+    from pm_os_brain.tools.brain_core.alias_matcher import get_alias_matcher
+
+    matcher = get_alias_matcher(alias_index.keys(), cache_dir=brain_path)
+    counts = matcher.count_words(text.lower())   # {alias: count}
+    present = matcher.find_present(text.lower())  # [alias, ...]
+
+CLI:
+    python3 alias_matcher.py --synthetic 5000     # Benchmark vs per-alias regex
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MATCHER_DIRNAME = ".alias-matchers"
+MATCHER_FORMAT_VERSION = 2
+MAX_CACHED_MATCHERS = 8
+
+_memo: Dict[str, "AliasMatcher"] = {}
+_memo_lock = threading.Lock()
+
+
+def _is_word_char(ch: str) -> bool:
+    """Match the definition of \\w used by the re module for str patterns."""
+    return ch.isalnum() or ch == "_"
+
+
+class AliasMatcher:
+    """
+    Aho-Corasick automaton over a fixed, ordered list of aliases.
+
+    Patterns are matched case-sensitively; callers lowercase both the
+    aliases and the text, as the alias indexes already do.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Compile the automaton.
+
+        Args:
+            patterns: Aliases to match. Order is preserved in results;
+                      empty strings and duplicates are ignored.
+        """
+        seen = set()
+        self.patterns: List[str] = []
+        for p in patterns:
+            if p and p not in seen:
+                seen.add(p)
+                self.patterns.append(p)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        self._build()
+
+    def _build(self) -> None:
+        """Build the trie, then failure links and merged outputs (BFS)."""
+        goto, out = self._goto, self._out
+        for pid, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] = out[state] + (pid,)
+
+        fail = self._fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                if out[fail[nxt]]:
+                    out[nxt] = out[nxt] + out[fail[nxt]]
+
+    def to_state(self) -> Tuple:
+        """Plain-data state for persistence (JSON-serialisable)."""
+        return (MATCHER_FORMAT_VERSION, self.patterns, self._goto, self._fail, self._out)
+
+    @classmethod
+    def from_state(cls, state: Iterable) -> "AliasMatcher":
+        """
+        Rebuild a matcher from to_state() output without recompiling.
+
+        Accepts the state after a JSON round trip (lists for tuples) and
+        checks that every transition, failure link and output is in range.
+
+        Raises:
+            ValueError: Unsupported version or inconsistent state
+        """
+        version, patterns, goto, fail, out = state
+        if version != MATCHER_FORMAT_VERSION:
+            raise ValueError(f"Unsupported alias matcher format: {version}")
+        states = len(goto)
+        if not states or len(fail) != states or len(out) != states:
+            raise ValueError("Alias matcher state tables differ in length")
+        if not all(isinstance(p, str) for p in patterns):
+            raise ValueError("Alias matcher patterns must be strings")
+        for table in goto:
+            if not isinstance(table, dict) or not all(
+                isinstance(ch, str) and len(ch) == 1
+                and isinstance(nxt, int) and 0 < nxt < states
+                for ch, nxt in table.items()
+            ):
+                raise ValueError("Alias matcher transition out of range")
+        if not all(isinstance(f, int) and 0 <= f < states for f in fail):
+            raise ValueError("Alias matcher failure link out of range")
+        out = [tuple(pids) for pids in out]
+        if not all(
+            isinstance(pid, int) and 0 <= pid < len(patterns) for pids in out for pid in pids
+        ):
+            raise ValueError("Alias matcher output out of range")
+
+        matcher = cls.__new__(cls)
+        matcher.patterns = list(patterns)
+        matcher._goto, matcher._fail, matcher._out = list(goto), list(fail), out
+        return matcher
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yield every (start, end, pattern_id) occurrence, overlaps included.
+
+        Occurrences are yielded in order of end position.
+        """
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                end = i + 1
+                for pid in out[state]:
+                    yield end - len(patterns[pid]), end, pid
+
+    def count_words(self, text: str) -> Dict[str, int]:
+        """
+        Count word-boundary occurrences of each alias.
+
+        Equivalent to len(re.findall(r"\\b" + re.escape(alias) + r"\\b", text))
+        for every alias, computed in a single pass.
+
+        Args:
+            text: Text to scan (already lowercased)
+
+        Returns:
+            {alias: count} for aliases found, in pattern order
+        """
+        n = len(text)
+        last_end: Dict[int, int] = {}
+        counts: Dict[int, int] = {}
+        for start, end, pid in self.iter_matches(text):
+            if start < last_end.get(pid, 0):
+                continue
+            before = start > 0 and _is_word_char(text[start - 1])
+            if before == _is_word_char(text[start]):
+                continue
+            after = end < n and _is_word_char(text[end])
+            if after == _is_word_char(text[end - 1]):
+                continue
+            last_end[pid] = end
+            counts[pid] = counts.get(pid, 0) + 1
+        return {self.patterns[pid]: counts[pid] for pid in sorted(counts)}
+
+    def find_present(self, text: str) -> List[str]:
+        """
+        Return aliases occurring anywhere in text as substrings.
+
+        Equivalent to [a for a in patterns if a in text], in pattern order.
+        """
+        found = {pid for _, _, pid in self.iter_matches(text)}
+        return [self.patterns[pid] for pid in sorted(found)]
+
+
+def fingerprint(patterns: Iterable[str]) -> str:
+    """Stable fingerprint of an ordered alias list (the registry version)."""
+    h = hashlib.sha256(f"v{MATCHER_FORMAT_VERSION}".encode("utf-8"))
+    for p in patterns:
+        h.update(b"\x00")
+        h.update(p.encode("utf-8"))
+    return h.hexdigest()[:20]
+
+
+def get_alias_matcher(
+    patterns: Iterable[str], cache_dir: Optional[Path] = None
+) -> AliasMatcher:
+    """
+    Return a compiled matcher for patterns, built at most once per alias set.
+
+    Args:
+        patterns: Ordered aliases (typically alias_index.keys())
+        cache_dir: Brain directory to persist the automaton under. If None,
+                   the matcher is only memoised in-process.
+
+    Returns:
+        AliasMatcher
+    """
+    patterns = list(patterns)
+    key = fingerprint(patterns)
+
+    with _memo_lock:
+        matcher = _memo.get(key)
+    if matcher is not None:
+        return matcher
+
+    path = Path(cache_dir) / MATCHER_DIRNAME / f"{key}.json" if cache_dir else None
+    if path is not None and path.exists():
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                matcher = AliasMatcher.from_state(json.load(f))
+        except Exception as e:
+            logger.warning("Alias matcher cache unreadable, rebuilding: %s", e)
+            matcher = None
+
+    if matcher is None:
+        matcher = AliasMatcher(patterns)
+        if path is not None:
+            _save(matcher, path)
+
+    with _memo_lock:
+        if len(_memo) >= MAX_CACHED_MATCHERS:
+            _memo.pop(next(iter(_memo)))
+        _memo[key] = matcher
+    return matcher
+
+
+def _save(matcher: AliasMatcher, path: Path) -> None:
+    """Atomically write the automaton and prune stale registry versions."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(matcher.to_state(), f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+        cached = sorted(
+            path.parent.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True
+        )
+        # Pickled automata from format 1 are never loaded again
+        for stale in cached[MAX_CACHED_MATCHERS:] + list(path.parent.glob("*.pkl")):
+            stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("Failed to persist alias matcher: %s", e)
+
+
+def _benchmark(count: int, text_kb: int) -> Dict[str, float]:
+    """Compare per-alias regex scanning with the compiled automaton."""
+    rng = random.Random(42)
+    aliases = [f"alias{i} {rng.choice(['squad', 'team', 'svc'])}" for i in range(count)]
+    words = ["the", "launch", "review", "blocked", "on"] + aliases[:: max(1, count // 50)]
+    text = []
+    size = 0
+    while size < text_kb * 1024:
+        w = rng.choice(words)
+        text.append(w)
+        size += len(w) + 1
+    text = " ".join(text)
+
+    t0 = time.perf_counter()
+    expected = {}
+    for alias in aliases:
+        found = re.findall(r"\b" + re.escape(alias) + r"\b", text)
+        if found:
+            expected[alias] = len(found)
+    regex_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    matcher = AliasMatcher(aliases)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    counts = matcher.count_words(text)
+    scan_ms = (time.perf_counter() - t0) * 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        get_alias_matcher(aliases, cache_dir=Path(tmp))
+        _memo.clear()
+        t0 = time.perf_counter()
+        get_alias_matcher(aliases, cache_dir=Path(tmp))
+        load_ms = (time.perf_counter() - t0) * 1000
+
+    return {
+        "aliases": count,
+        "text_kb": text_kb,
+        "regex_scan_ms": round(regex_ms, 1),
+        "automaton_build_ms": round(build_ms, 1),
+        "automaton_load_ms": round(load_ms, 1),
+        "automaton_scan_ms": round(scan_ms, 1),
+        "results_identical": counts == expected,
+    }
+
+
+def main() -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Brain alias matcher")
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        metavar="N",
+        default=5000,
+        help="Benchmark with N synthetic aliases",
+    )
+    parser.add_argument("--text-kb", type=int, default=64, help="Size of scanned text")
+    args = parser.parse_args()
+
+    print(json.dumps(_benchmark(args.synthetic, args.text_kb), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
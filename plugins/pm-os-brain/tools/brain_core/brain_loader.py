@@ -46,6 +46,12 @@ try:
 except ImportError:
     from path_resolver import get_paths
 
+try:
+    from pm_os_brain.tools.brain_core.alias_matcher import get_alias_matcher
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.alias_matcher import get_alias_matcher
+
 # Try to import yaml, fall back to basic parsing if not available
 try:
     import yaml
@@ -462,6 +468,9 @@ def scan_for_entities(
         partial_match: If True, matches if alias is IN text (good for short search queries).
                        If False, uses word boundaries (good for scanning long docs).
 
+    Word-boundary scanning runs a single pass of the shared alias
+    automaton (compiled once per registry version) over the text.
+
     Returns dict of matched entities with their details and match count.
     """
     matches = defaultdict(
@@ -471,25 +480,23 @@ def scan_for_entities(
     # Normalize text for matching
     text_lower = text.lower()
 
-    for alias, (category, entity_id, file_path) in alias_index.items():
-        if partial_match:
-            # For search queries: simple substring check
+    if partial_match:
+        # For search queries: simple substring check
+        for alias, (category, entity_id, file_path) in alias_index.items():
             if text_lower in alias or alias in text_lower:
                 matches[entity_id]["count"] += 1
                 matches[entity_id]["category"] = category
                 matches[entity_id]["file"] = file_path
                 matches[entity_id]["matched_aliases"].add(alias)
-        else:
-            # For context scanning: Word boundary matching for precision
-            escaped_alias = re.escape(alias)
-            pattern = r"\b" + escaped_alias + r"\b"
-
-            found = re.findall(pattern, text_lower)
-            if found:
-                matches[entity_id]["count"] += len(found)
-                matches[entity_id]["category"] = category
-                matches[entity_id]["file"] = file_path
-                matches[entity_id]["matched_aliases"].add(alias)
+    else:
+        # For context scanning: Word boundary matching for precision
+        matcher = get_alias_matcher(alias_index.keys(), cache_dir=BRAIN_DIR)
+        for alias, found in matcher.count_words(text_lower).items():
+            category, entity_id, file_path = alias_index[alias]
+            matches[entity_id]["count"] += found
+            matches[entity_id]["category"] = category
+            matches[entity_id]["file"] = file_path
+            matches[entity_id]["matched_aliases"].add(alias)
 
     # Convert sets to lists for output
     for entity_id in matches:
@@ -15,7 +15,6 @@ Usage:
 import argparse
 import logging
 import os
-import re
 import sys
 from datetime import datetime
 from glob import glob
@@ -38,6 +37,12 @@ try:
 except ImportError:
     from core.path_resolver import get_paths
 
+try:
+    from pm_os_brain.tools.brain_core.alias_matcher import get_alias_matcher
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.alias_matcher import get_alias_matcher
+
 try:
     import yaml
 
@@ -93,14 +98,12 @@ def scan_for_entities(text: str, alias_index: Dict) -> Dict[str, Dict]:
     matches = defaultdict(lambda: {"count": 0, "category": "", "file": ""})
     text_lower = text.lower()
 
-    for alias, (category, entity_id, file_path) in alias_index.items():
-        escaped_alias = re.escape(alias)
-        pattern = r"\b" + escaped_alias + r"\b"
-        found = re.findall(pattern, text_lower)
-        if found:
-            matches[entity_id]["count"] += len(found)
-            matches[entity_id]["category"] = category
-            matches[entity_id]["file"] = file_path
+    matcher = get_alias_matcher(alias_index.keys(), cache_dir=BRAIN_DIR)
+    for alias, found in matcher.count_words(text_lower).items():
+        category, entity_id, file_path = alias_index[alias]
+        matches[entity_id]["count"] += found
+        matches[entity_id]["category"] = category
+        matches[entity_id]["file"] = file_path
 
     return dict(matches)
 
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Persistent embedding store -- encode each entity text once per content change.
+
+Embeddings are keyed by (model name, content hash), where the hash is
+taken over the exact text passed to the model. Each model gets its own
+pair of files under the brain directory (.embeddings/):
+
+    <model>.f32    raw float32 rows, read through a numpy memmap
+    <model>.json   {"dim", "rows", "hashes": {content_hash: row}}
+
+New vectors are appended to the data file before the table is atomically
+replaced, so an interrupted write leaves at most unreferenced rows.
+Inside deferred_save() (used by multi-batch index builds) the table is
+written once on exit rather than after every batch. compact() drops rows
+whose hash is no longer live.
+
+BrainVectorIndex and EmbeddingEdgeInferrer both embed through the store
+and build their text with build_embedding_text(), so an entity encoded by
+one is a cache hit for the other.
+
+Usage:
+    from pm_os_brain.tools.brain_core.embedding_store import EmbeddingStore
+
+    store = EmbeddingStore(brain_path, model_name)
+    vectors = store.encode(texts, model.encode)  # (len(texts), dim) float32
+    with store.deferred_save():  # One table write for many batches
+        for batch in batches:
+            store.encode(batch, model.encode)
+    store.compact(live_hashes)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+STORE_DIRNAME = ".embeddings"
+# Bump when the file layout or build_embedding_text() output changes
+STORE_VERSION = 1
+# Characters of entity body included in the embedded text
+BODY_CHARS = 500
+
+
+def content_hash(text: str) -> str:
+    """Hash of the exact text that gets embedded."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def build_embedding_text(entity: Dict[str, Any]) -> str:
+    """Build the text embedded for an entity (name, description, body, tags).
+
+    Accepts parsed frontmatter with the `_body` key (and optionally `_name`
+    or `_path` for a filename-derived name fallback).
+    """
+    parts = []
+
+    name = entity.get("name") or entity.get("_name")
+    if not name and entity.get("_path"):
+        name = Path(entity["_path"]).stem.replace("_", " ")
+    if name:
+        parts.append(str(name))
+
+    description = entity.get("description")
+    if description:
+        parts.append(str(description))
+
+    body = str(entity.get("_body") or "").strip()
+    if body:
+        parts.append(body[:BODY_CHARS].strip())
+
+    tags = entity.get("$tags")
+    if tags and isinstance(tags, list):
+        parts.append(" ".join(str(t) for t in tags))
+
+    return " ".join(parts)
+
+
+def _model_slug(model_name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", model_name).strip("_") or "model"
+
+
+class EmbeddingStore:
+    """
+    On-disk (model, content hash) -> vector cache.
+
+    Thread-safe within a process. Writers in separate processes should
+    not share one store concurrently; the last table written wins and the
+    other's new rows become unreferenced (and are re-encoded on demand).
+    """
+
+    def __init__(self, brain_path: Path, model_name: str):
+        """
+        Initialize the store.
+
+        Args:
+            brain_path: Path to brain directory (store lives in .embeddings/)
+            model_name: Embedding model name; each model has its own files
+        """
+        if not HAS_NUMPY:
+            raise ImportError("numpy required. Install with: pip install numpy")
+        self.model_name = model_name
+        self.store_dir = Path(brain_path) / STORE_DIRNAME
+        slug = _model_slug(model_name)
+        self.data_path = self.store_dir / f"{slug}.f32"
+        self.table_path = self.store_dir / f"{slug}.json"
+        self._lock = threading.Lock()
+        self._dim: Optional[int] = None
+        self._rows = 0
+        self._hashes: Dict[str, int] = {}
+        self._matrix = None
+        self._loaded = False
+        self._deferred = 0  # Open deferred_save() blocks
+        self._dirty = False  # Rows appended since the table was written
+        self.hits = 0
+        self.misses = 0
+
+    # -----------------------------------------------------------------------
+    # Public API
+    # -----------------------------------------------------------------------
+
+    def encode(
+        self,
+        texts: List[str],
+        encoder: Callable[[List[str]], Any],
+        hashes: Optional[List[str]] = None,
+    ) -> "np.ndarray":
+        """
+        Return embeddings for texts, encoding only those not yet stored.
+
+        Args:
+            texts: Texts to embed
+            encoder: Called with the list of missing texts; returns an
+                array-like of shape (n, dim)
+            hashes: Precomputed content_hash() of each text (optional)
+
+        Returns:
+            float32 array of shape (len(texts), dim)
+        """
+        if hashes is None:
+            hashes = [content_hash(t) for t in texts]
+        found = self.get_many(hashes)
+
+        missing: Dict[str, str] = {}
+        for text, h in zip(texts, hashes):
+            if h not in found and h not in missing:
+                missing[h] = text
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            new_vectors = np.asarray(encoder(list(missing.values())), dtype=np.float32)
+            new_hashes = list(missing.keys())
+            self.put_many(new_hashes, new_vectors)
+            found.update(zip(new_hashes, new_vectors))
+
+        if not texts:
+            return np.zeros((0, self._dim or 0), dtype=np.float32)
+        return np.stack([found[h] for h in hashes]).astype(np.float32, copy=False)
+
+    def get_many(self, hashes: Iterable[str]) -> Dict[str, "np.ndarray"]:
+        """Return {hash: vector} for the hashes present in the store."""
+        with self._lock:
+            self._ensure_loaded()
+            if self._matrix is None:
+                return {}
+            out = {}
+            for h in hashes:
+                row = self._hashes.get(h)
+                if row is not None:
+                    out[h] = np.array(self._matrix[row])
+            return out
+
+    def put_many(self, hashes: List[str], vectors: Any) -> None:
+        """Append vectors for hashes not yet stored and persist the table.
+
+        Inside deferred_save() the table is written when the block exits.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or len(hashes) != vectors.shape[0]:
+            raise ValueError("vectors must be a (len(hashes), dim) array")
+        with self._lock:
+            self._ensure_loaded()
+            if self._dim is None:
+                self._dim = int(vectors.shape[1])
+            elif vectors.shape[1] != self._dim:
+                logger.warning(
+                    "Embedding dimension changed for %s (%d -> %d), resetting store",
+                    self.model_name, self._dim, vectors.shape[1],
+                )
+                self._reset(int(vectors.shape[1]))
+
+            keep: List[int] = []
+            seen = set(self._hashes)
+            for i, h in enumerate(hashes):
+                if h not in seen:
+                    seen.add(h)
+                    keep.append(i)
+            if not keep:
+                return
+            try:
+                self.store_dir.mkdir(parents=True, exist_ok=True)
+                with open(self.data_path, "r+b" if self.data_path.exists() else "wb") as f:
+                    f.seek(self._rows * self._dim * 4)
+                    f.write(np.ascontiguousarray(vectors[keep]).tobytes())
+                    f.truncate()
+            except OSError as e:
+                logger.warning("Failed to write embedding store: %s", e)
+                return
+            for offset, i in enumerate(keep):
+                self._hashes[hashes[i]] = self._rows + offset
+            self._rows += len(keep)
+            self._open_matrix()
+            self._dirty = True
+            if not self._deferred:
+                self._save_table()
+
+    @contextmanager
+    def deferred_save(self) -> Iterator["EmbeddingStore"]:
+        """Write the table once when the block exits instead of per put_many()."""
+        with self._lock:
+            self._deferred += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._deferred -= 1
+                if not self._deferred and self._dirty:
+                    self._save_table()
+
+    def compact(self, live_hashes: Iterable[str]) -> int:
+        """
+        Drop rows whose hash is not in live_hashes.
+
+        Returns:
+            Number of rows removed
+        """
+        live = set(live_hashes)
+        with self._lock:
+            self._ensure_loaded()
+            dead = [h for h in self._hashes if h not in live]
+            if not dead or self._matrix is None:
+                return 0
+            kept = [(h, r) for h, r in self._hashes.items() if h in live]
+            kept.sort(key=lambda item: item[1])
+            data = np.array(self._matrix[[r for _, r in kept]]) if kept else None
+            self._matrix = None
+            try:
+                fd, tmp = tempfile.mkstemp(dir=str(self.store_dir), suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    if data is not None:
+                        f.write(np.ascontiguousarray(data).tobytes())
+                os.replace(tmp, self.data_path)
+            except OSError as e:
+                logger.warning("Failed to compact embedding store: %s", e)
+                self._open_matrix()
+                return 0
+            self._hashes = {h: i for i, (h, _) in enumerate(kept)}
+            self._rows = len(kept)
+            self._open_matrix()
+            self._save_table()
+            return len(dead)
+
+    def __contains__(self, text_hash: str) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            return text_hash in self._hashes
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._hashes)
+
+    def stats(self) -> Dict[str, Any]:
+        """Row count, dimension, on-disk size and hit/miss counters."""
+        with self._lock:
+            self._ensure_loaded()
+            size = self.data_path.stat().st_size if self.data_path.exists() else 0
+            return {
+                "model": self.model_name,
+                "vectors": len(self._hashes),
+                "dim": self._dim,
+                "bytes": size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    # -----------------------------------------------------------------------
+    # Internal helpers
+    # -----------------------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.table_path, "r", encoding="utf-8") as f:
+                table = json.load(f)
+        except (OSError, ValueError):
+            return
+        if table.get("version") != STORE_VERSION or table.get("model") != self.model_name:
+            return
+        dim, rows = table.get("dim"), table.get("rows", 0)
+        try:
+            size = self.data_path.stat().st_size
+        except OSError:
+            return
+        if not dim or size < rows * dim * 4:
+            logger.warning("Embedding store %s is truncated, ignoring it", self.data_path)
+            return
+        self._dim = int(dim)
+        self._rows = int(rows)
+        self._hashes = {h: int(r) for h, r in table.get("hashes", {}).items() if r < rows}
+        self._open_matrix()
+
+    def _open_matrix(self) -> None:
+        if self._rows and self._dim:
+            self._matrix = np.memmap(
+                self.data_path, dtype=np.float32, mode="r", shape=(self._rows, self._dim)
+            )
+        else:
+            self._matrix = None
+
+    def _reset(self, dim: int) -> None:
+        self._dim = dim
+        self._rows = 0
+        self._hashes = {}
+        self._matrix = None
+
+    def _save_table(self) -> None:
+        self._dirty = False
+        table = {
+            "version": STORE_VERSION,
+            "model": self.model_name,
+            "dim": self._dim,
+            "rows": self._rows,
+            "hashes": self._hashes,
+        }
+        try:
+            fd, tmp = tempfile.mkstemp(dir=str(self.store_dir), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(table, f, separators=(",", ":"))
+            os.replace(tmp, self.table_path)
+        except OSError as e:
+            logger.warning("Failed to save embedding store table: %s", e)
+
+
+_shared_stores: Dict[tuple, EmbeddingStore] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_store(brain_path: Path, model_name: str) -> Optional[EmbeddingStore]:
+    """Return the process-wide EmbeddingStore for (brain, model), or None without numpy."""
+    if not HAS_NUMPY:
+        return None
+    key = (Path(brain_path).resolve(), model_name)
+    with _shared_lock:
+        store = _shared_stores.get(key)
+        if store is None:
+            store = EmbeddingStore(Path(brain_path), model_name)
+            _shared_stores[key] = store
+        return store
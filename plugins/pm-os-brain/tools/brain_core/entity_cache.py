@@ -6,6 +6,23 @@ Loads and parses all Brain entity .md files once. Provides typed
 access (get_all, get_by_type, get_by_id) and content hashing
 for incremental enrichment.
 
+Parsed frontmatter is persisted to a SQLite store under the brain
+directory (.entity-cache.db), keyed by relative path plus mtime, size
+and content hash. On load, unchanged files are bulk-loaded from the
+store and only added or modified files are re-read and YAML-parsed.
+Rows are JSON (dates and datetimes tagged), never pickle: the brain
+directory is user content that may be synced or shared, so loading the
+store must not be able to execute code. Frontmatter that does not survive
+a JSON round trip is stored without data and re-parsed on each load.
+
+This module is also the single Brain scan service: get_shared_cache()
+returns one process-wide EntityCache per brain directory, and
+parse_frontmatter() is the one frontmatter parser that the quality,
+relationship and temporal tools share. Lookups by id keep the last file
+scanned for each $id; get_files() keeps every file, so per-file tools see
+files that share an id. A shared cache older than SHARED_CACHE_MAX_AGE is
+rescanned (incrementally) when it is next handed out.
+
 Usage:
     from pm_os_brain.tools.brain_core.entity_cache import EntityCache
 
@@ -13,10 +30,28 @@ Usage:
     cache.load()
     persons = cache.get_by_type("person")
     entity = cache.get_by_id("entity/person/person-01")
+    for frontmatter in cache.get_files():  # One per file, duplicate ids included
+        ...
+
+    # Process-wide instance shared by every tool in this run
+    cache = get_shared_cache(brain_path)
+
+CLI:
+    python3 entity_cache.py --brain-path PATH          # Load and print stats
+    python3 entity_cache.py --synthetic 20000          # Benchmark on a synthetic brain
 """
 
+import argparse
 import hashlib
+import json
 import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -28,84 +63,282 @@ except ImportError:
     logger.error("PyYAML required. Install with: pip install pyyaml")
     raise
 
+# libyaml-backed loader when available (same safe semantics, much faster)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 PLUGIN_ROOT = Path(__file__).resolve().parent.parent.parent
 
+CACHE_FILENAME = ".entity-cache.db"
+# Bump when the stored row layout or parse semantics change
+CACHE_SCHEMA_VERSION = 2
+
+EXCLUDED_FILENAMES = ("readme.md", "index.md", "_index.md")
+EXCLUDED_DIR_MARKERS = (".snapshots", ".schema", ".events")
+
+# Keys attached to cached frontmatter that are not part of the entity
+META_KEYS = ("_body", "_path", "_content_hash")
+
+# Seconds before get_shared_cache() checks a loaded cache for changes
+SHARED_CACHE_MAX_AGE = 60.0
+
+
+def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
+    """Parse YAML frontmatter from markdown content.
+
+    Returns:
+        Tuple of (frontmatter dict, body). Content without a valid
+        frontmatter block yields ({}, content).
+    """
+    if not content.startswith("---"):
+        return {}, content
+
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        return {}, content
+
+    try:
+        frontmatter = yaml.load(parts[1], Loader=_YAML_LOADER) or {}
+    except yaml.YAMLError:
+        return {}, content
+    if not isinstance(frontmatter, dict):
+        return {}, content
+    return frontmatter, parts[2]
+
+
+def _json_default(value: Any) -> Any:
+    """Tag YAML timestamps so rows decode to the same types."""
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"not JSON serializable: {type(value).__name__}")
+
+
+def _json_object_hook(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if "$datetime" in obj:
+            return datetime.fromisoformat(obj["$datetime"])
+        if "$date" in obj:
+            return date.fromisoformat(obj["$date"])
+    return obj
+
+
+def encode_row(frontmatter: Dict[str, Any], body: str) -> Optional[str]:
+    """JSON for a parsed (frontmatter, body), or None if it would not round-trip."""
+    try:
+        data = json.dumps([frontmatter, body], default=_json_default, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return data if decode_row(data) == (frontmatter, body) else None
+
+
+def decode_row(data: Optional[str]) -> Optional[Tuple[Dict[str, Any], str]]:
+    """Parsed (frontmatter, body) from encode_row() output, or None if unusable."""
+    if not isinstance(data, str):
+        return None
+    try:
+        frontmatter, body = json.loads(data, object_hook=_json_object_hook)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(frontmatter, dict) or not isinstance(body, str):
+        return None
+    return frontmatter, body
+
+
+def strip_meta(frontmatter: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of cached frontmatter without cache metadata keys."""
+    return {k: v for k, v in frontmatter.items() if k not in META_KEYS}
+
+
+_shared_caches: Dict[Path, "EntityCache"] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_cache(
+    brain_path: Path, max_age: Optional[float] = SHARED_CACHE_MAX_AGE
+) -> "EntityCache":
+    """Return the process-wide EntityCache for a brain directory.
+
+    The cache is created on first use and loaded lazily on first access,
+    so every tool constructed in the same process shares one scan. In
+    long-lived processes a loaded cache that is_stale(max_age) is reloaded
+    before it is returned, re-parsing only changed files.
+
+    Args:
+        brain_path: Path to brain directory
+        max_age: Staleness check for an already loaded cache; None
+                 returns it as is
+    """
+    key = Path(brain_path).resolve()
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = EntityCache(Path(brain_path))
+            _shared_caches[key] = cache
+    if max_age is not None and cache._loaded and cache.is_stale(max_age):
+        cache.reload()
+    return cache
+
+
+def reset_shared_caches() -> None:
+    """Drop all process-wide caches (next access rescans)."""
+    with _shared_lock:
+        _shared_caches.clear()
+
+
+def refresh_shared_caches(max_age: Optional[float] = None) -> int:
+    """Rescan loaded process-wide caches, re-parsing only changed files.
+
+    Long-lived processes call this between jobs so that warm caches pick
+    up edits made by other processes.
+
+    Args:
+        max_age: If set, skip caches whose change_token() is unchanged
+                 and whose last scan is younger than max_age seconds
+
+    Returns:
+        Number of caches refreshed
+    """
+    with _shared_lock:
+        caches = [cache for cache in _shared_caches.values() if cache._loaded]
+    refreshed = 0
+    for cache in caches:
+        if max_age is not None and not cache.is_stale(max_age):
+            continue
+        cache.reload()
+        refreshed += 1
+    return refreshed
+
 
 class EntityCache:
     """In-memory cache for all Brain entities.
 
-    Not a singleton -- each enrichment run creates its own instance.
-    Provides O(1) access by ID and O(1) access by type after the
-    initial O(n) scan.
+    Not a singleton -- use get_shared_cache() for the process-wide
+    instance. Provides O(1) access by ID and O(1) access by type after
+    the initial O(n) scan.
     """
 
-    def __init__(self, brain_path: Path):
+    def __init__(self, brain_path: Path, persistent: bool = True):
+        """Initialize the cache.
+
+        Args:
+            brain_path: Path to brain directory
+            persistent: Use the on-disk parsed-frontmatter store so that
+                        load() only re-parses files changed since the last run
+        """
         self.brain_path = brain_path
+        self.persistent = persistent
+        self.cache_path = brain_path / CACHE_FILENAME
         self._entities: Dict[str, Dict[str, Any]] = {}  # id -> frontmatter+meta
         self._by_type: Dict[str, List[str]] = {}  # type -> [ids]
+        self._by_path: Dict[Path, Dict[str, Any]] = {}  # path -> frontmatter+meta
+        self._id_by_path: Dict[Path, str] = {}  # path -> id
+        self._paths_by_id: Dict[str, List[Path]] = {}  # id -> [paths], last wins
+        self._plain_paths: List[Path] = []  # .md files without frontmatter
+        self._stats: Dict[Path, Tuple[int, int]] = {}  # path -> (mtime_ns, size) parsed
+        self._lock = threading.RLock()
         self._loaded = False
         self._entity_count = 0
         self._scan_ms = 0.0
+        self._hits = 0
+        self._misses = 0
+        self._removed = 0
+        self._scans = 0
+        self._token: Optional[Tuple[int, int]] = None
+        self._loaded_at = 0.0
 
     def load(self) -> "EntityCache":
         """Scan brain directory and load all entities into memory.
 
+        Files whose mtime and size match the persistent store are loaded
+        without being read. Files whose stat changed but whose content hash
+        still matches are counted as hits and not re-parsed.
+
         Returns self for chaining: cache = EntityCache(path).load()
         """
-        import time
+        with self._lock:
+            return self._load()
 
+    def _load(self) -> "EntityCache":
         t0 = time.perf_counter()
+        self._loaded_at = time.monotonic()
 
         self._entities.clear()
         self._by_type.clear()
-
-        entity_files = list(self.brain_path.rglob("*.md"))
-        entity_files = [
-            f
-            for f in entity_files
-            if f.name.lower() not in ("readme.md", "index.md", "_index.md")
-            and ".snapshots" not in str(f)
-            and ".schema" not in str(f)
-        ]
-
-        by_type: Dict[str, List[str]] = {}
-
-        for entity_path in entity_files:
+        self._by_path.clear()
+        self._id_by_path.clear()
+        self._paths_by_id.clear()
+        self._plain_paths = []
+        self._stats.clear()
+        self._hits = 0
+        self._misses = 0
+        self._removed = 0
+
+        stored = self._read_store() if self.persistent else {}
+        upserts: List[Tuple[Any, ...]] = []
+        seen: set = set()
+
+        for entity_path, stat in self.iter_entity_files():
+            rel_path = entity_path.relative_to(self.brain_path).as_posix()
+            seen.add(rel_path)
+            row = stored.get(rel_path)
+
+            # A row that does not decode is re-parsed and overwritten
+            parsed = decode_row(row[3]) if row is not None else None
             try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter, body = self._parse_content(content)
-
-                if not frontmatter:
-                    continue
-
-                entity_id = frontmatter.get(
-                    "$id", str(entity_path.relative_to(self.brain_path))
-                )
-                entity_type = frontmatter.get("$type", "unknown")
-
-                # Attach metadata for consumers
-                frontmatter["_body"] = body
-                frontmatter["_path"] = entity_path
-                frontmatter["_content_hash"] = self._content_hash(content)
-
-                self._entities[entity_id] = frontmatter
-
-                if entity_type not in by_type:
-                    by_type[entity_type] = []
-                by_type[entity_type].append(entity_id)
-
+                if (
+                    parsed is not None
+                    and row[0] == stat.st_mtime_ns
+                    and row[1] == stat.st_size
+                ):
+                    frontmatter, body = parsed
+                    content_hash = row[2]
+                    self._hits += 1
+                else:
+                    content = entity_path.read_text(encoding="utf-8")
+                    content_hash = self._content_hash(content)
+                    if parsed is not None and row[2] == content_hash:
+                        data = row[3]
+                        frontmatter, body = parsed
+                        self._hits += 1
+                    else:
+                        frontmatter, body = self._parse_content(content)
+                        data = encode_row(frontmatter, body)
+                        self._misses += 1
+                    upserts.append((
+                        rel_path,
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                        content_hash,
+                        data,
+                    ))
             except Exception:
                 continue
 
-        self._by_type = by_type
+            self._stats[entity_path] = (stat.st_mtime_ns, stat.st_size)
+            if not frontmatter:
+                self._plain_paths.append(entity_path)
+                continue
+            self._add(entity_path, frontmatter, body, content_hash)
+
+        removed = [p for p in stored if p not in seen]
+        self._removed = len(removed)
+        if self.persistent and (upserts or removed):
+            self._write_store(upserts, removed)
+
         self._entity_count = len(self._entities)
         self._loaded = True
+        self._scans += 1
+        # After the store write, which touches the brain directory itself
+        self._token = self.change_token()
         self._scan_ms = (time.perf_counter() - t0) * 1000
 
         logger.debug(
-            "EntityCache loaded %d entities in %.1fms",
+            "EntityCache loaded %d entities in %.1fms (%d hits, %d misses)",
             self._entity_count,
             self._scan_ms,
+            self._hits,
+            self._misses,
         )
 
         return self
@@ -126,37 +359,126 @@ class EntityCache:
         self._ensure_loaded()
         return self._entities.get(entity_id)
 
+    def get_files(self) -> List[Dict[str, Any]]:
+        """Return the frontmatter of every entity file, in scan order.
+
+        Unlike get_all(), files that share an $id are all included.
+        """
+        self._ensure_loaded()
+        return list(self._by_path.values())
+
+    def get_by_path(self, entity_path: Path) -> Optional[Dict[str, Any]]:
+        """Return the entity parsed from a file path, or None."""
+        self._ensure_loaded()
+        return self._by_path.get(Path(entity_path))
+
+    def get_path(self, entity_id: str) -> Optional[Path]:
+        """Return the file path for an entity ID, or None."""
+        entity = self.get_by_id(entity_id)
+        return entity.get("_path") if entity is not None else None
+
+    def get_plain_paths(self) -> List[Path]:
+        """Return .md files under the brain that have no frontmatter."""
+        self._ensure_loaded()
+        return list(self._plain_paths)
+
+    def get_if_current(
+        self, entity_path: Path, stat: os.stat_result
+    ) -> Optional[Dict[str, Any]]:
+        """Return cached frontmatter if it was parsed from a file with this stat.
+
+        Returns {} for a plain file, and None when the path is not cached
+        or its mtime/size changed since it was parsed.
+        """
+        self._ensure_loaded()
+        entity_path = Path(entity_path)
+        if self._stats.get(entity_path) != (stat.st_mtime_ns, stat.st_size):
+            return None
+        return self._by_path.get(entity_path, {})
+
     def get_types(self) -> List[str]:
         """Return list of all entity types present."""
         self._ensure_loaded()
         return list(self._by_type.keys())
 
     def invalidate(self, entity_id: str) -> None:
-        """Reload a single entity from disk (after modification)."""
+        """Reload every file carrying entity_id from disk (after modification)."""
         self._ensure_loaded()
-        entity = self._entities.get(entity_id)
-        if entity is None:
-            return
+        for entity_path in list(self._paths_by_id.get(entity_id, [])):
+            self.invalidate_path(entity_path)
+
+    def invalidate_path(self, entity_path: Path) -> None:
+        """Reload the entity stored at entity_path (after modification).
 
-        entity_path = entity.get("_path")
-        if entity_path is None or not entity_path.exists():
+        Id, type and plain-file lookups follow the new content; a file
+        that no longer exists is dropped.
+        """
+        self._ensure_loaded()
+        entity_path = Path(entity_path)
+        try:
+            entity_path.relative_to(self.brain_path)
+        except ValueError:
             return
 
         try:
+            stat = entity_path.stat()
             content = entity_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            content = None
+        except (OSError, UnicodeDecodeError):
+            return
+        if content is not None:
             frontmatter, body = self._parse_content(content)
-            if frontmatter:
-                frontmatter["_body"] = body
-                frontmatter["_path"] = entity_path
-                frontmatter["_content_hash"] = self._content_hash(content)
-                self._entities[entity_id] = frontmatter
-        except Exception:
-            pass
+
+        with self._lock:
+            self._discard(entity_path)
+            if entity_path in self._plain_paths:
+                self._plain_paths.remove(entity_path)
+            self._stats.pop(entity_path, None)
+            if content is not None:
+                self._stats[entity_path] = (stat.st_mtime_ns, stat.st_size)
+                if frontmatter:
+                    self._add(entity_path, frontmatter, body, self._content_hash(content))
+                else:
+                    self._plain_paths.append(entity_path)
+            self._entity_count = len(self._entities)
 
     def reload(self) -> "EntityCache":
         """Full reload from disk."""
         return self.load()
 
+    def change_token(self) -> Tuple[int, int]:
+        """Newest directory mtime and entry count under the brain.
+
+        Needs no per-file stat. Adding, deleting or atomically replacing
+        a file changes its directory. In-place edits do not, so
+        is_stale() also expires the cache by age.
+        """
+        newest = count = 0
+        pending = [str(self.brain_path)]
+        while pending:
+            directory = pending.pop()
+            try:
+                newest = max(newest, os.stat(directory).st_mtime_ns)
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        count += 1
+                        if entry.is_dir(follow_symlinks=False) and not any(
+                            m in entry.name for m in EXCLUDED_DIR_MARKERS
+                        ):
+                            pending.append(entry.path)
+            except OSError:
+                continue
+        return newest, count
+
+    def is_stale(self, max_age: float) -> bool:
+        """True if the brain may have changed since the last scan."""
+        if not self._loaded:
+            return True
+        if time.monotonic() - self._loaded_at >= max_age:
+            return True
+        return self.change_token() != self._token
+
     def stats(self) -> Dict[str, Any]:
         """Return cache statistics."""
         self._ensure_loaded()
@@ -165,6 +487,11 @@ class EntityCache:
             "type_count": len(self._by_type),
             "types": {t: len(ids) for t, ids in self._by_type.items()},
             "scan_ms": round(self._scan_ms, 2),
+            "persistent": self.persistent,
+            "hits": self._hits,
+            "misses": self._misses,
+            "removed": self._removed,
+            "scans": self._scans,
         }
 
     @property
@@ -178,10 +505,154 @@ class EntityCache:
         """Time taken for the last scan in milliseconds."""
         return self._scan_ms
 
+    def clear_store(self) -> None:
+        """Delete the persistent store, forcing a full re-parse on next load."""
+        try:
+            self.cache_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def iter_entity_files(self):
+        """Yield (path, stat) for every entity .md file under the brain."""
+        for dirpath, dirnames, filenames in os.walk(self.brain_path):
+            dirnames[:] = [
+                d
+                for d in dirnames
+                if not any(m in d for m in EXCLUDED_DIR_MARKERS)
+            ]
+            for name in filenames:
+                if not name.endswith(".md") or name.lower() in EXCLUDED_FILENAMES:
+                    continue
+                path = Path(dirpath) / name
+                try:
+                    yield path, path.stat()
+                except OSError:
+                    continue
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the store, (re)creating the table if the schema changed."""
+        conn = sqlite3.connect(str(self.cache_path))
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != CACHE_SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS entities")
+            conn.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entities ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, "
+            "content_hash TEXT, data TEXT)"
+        )
+        return conn
+
+    def _read_store(self) -> Dict[str, Tuple[int, int, str, Optional[str]]]:
+        """Bulk-load all rows as {rel_path: (mtime_ns, size, hash, data)}."""
+        if not self.cache_path.exists():
+            return {}
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT path, mtime_ns, size, content_hash, data FROM entities"
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("Entity cache store unreadable, rebuilding: %s", e)
+            self.clear_store()
+            return {}
+        return {r[0]: (r[1], r[2], r[3], r[4]) for r in rows}
+
+    def _write_store(
+        self,
+        upserts: List[Tuple[Any, ...]],
+        removed: List[str],
+    ) -> None:
+        """Persist changed rows and drop rows for deleted files."""
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO entities "
+                        "(path, mtime_ns, size, content_hash, data) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        upserts,
+                    )
+                    conn.executemany(
+                        "DELETE FROM entities WHERE path = ?",
+                        [(p,) for p in removed],
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("Failed to update entity cache store: %s", e)
+
+    def _add(
+        self,
+        entity_path: Path,
+        frontmatter: Dict[str, Any],
+        body: str,
+        content_hash: str,
+    ) -> None:
+        """Index a parsed file; a later file with the same $id wins lookups."""
+        rel_path = entity_path.relative_to(self.brain_path).as_posix()
+        entity_id = frontmatter.get("$id", rel_path)
+
+        # Attach metadata for consumers
+        frontmatter["_body"] = body
+        frontmatter["_path"] = entity_path
+        frontmatter["_content_hash"] = content_hash
+
+        previous = self._entities.get(entity_id)
+        self._by_path[entity_path] = frontmatter
+        self._id_by_path[entity_path] = entity_id
+        self._paths_by_id.setdefault(entity_id, []).append(entity_path)
+        self._entities[entity_id] = frontmatter
+        self._retype(entity_id, previous, frontmatter)
+
+    def _discard(self, entity_path: Path) -> None:
+        """Remove a file from the lookups, falling back to another file with its $id."""
+        frontmatter = self._by_path.pop(entity_path, None)
+        if frontmatter is None:
+            return
+        entity_id = self._id_by_path.pop(entity_path)
+        paths = self._paths_by_id[entity_id]
+        paths.remove(entity_path)
+        if self._entities.get(entity_id) is not frontmatter:
+            return
+        if paths:
+            replacement = self._by_path[paths[-1]]
+            self._entities[entity_id] = replacement
+        else:
+            del self._paths_by_id[entity_id]
+            del self._entities[entity_id]
+            replacement = None
+        self._retype(entity_id, frontmatter, replacement)
+
+    def _retype(
+        self,
+        entity_id: str,
+        old: Optional[Dict[str, Any]],
+        new: Optional[Dict[str, Any]],
+    ) -> None:
+        """Move entity_id between _by_type lists when its winning file changes type."""
+        old_type = old.get("$type", "unknown") if old is not None else None
+        new_type = new.get("$type", "unknown") if new is not None else None
+        if old_type == new_type:
+            return
+        if old_type is not None:
+            ids = self._by_type[old_type]
+            ids.remove(entity_id)
+            if not ids:
+                del self._by_type[old_type]
+        if new_type is not None:
+            self._by_type.setdefault(new_type, []).append(entity_id)
+
     def _ensure_loaded(self) -> None:
         """Auto-load on first access if not yet loaded."""
         if not self._loaded:
-            self.load()
+            with self._lock:
+                if not self._loaded:
+                    self._load()
 
     @staticmethod
     def _content_hash(content: str) -> str:
@@ -191,15 +662,101 @@ class EntityCache:
     @staticmethod
     def _parse_content(content: str) -> Tuple[Dict[str, Any], str]:
         """Parse YAML frontmatter from content."""
-        if not content.startswith("---"):
-            return {}, content
+        return parse_frontmatter(content)
+
+
+def _write_synthetic_brain(brain_path: Path, count: int) -> None:
+    """Write a synthetic brain of `count` linked entities for benchmarking."""
+    types = ["person", "team", "project", "system", "squad"]
+    for i in range(count):
+        etype = types[i % len(types)]
+        target_type = types[(i + 1) % len(types)]
+        entity_dir = brain_path / "Entities" / etype.title()
+        entity_dir.mkdir(parents=True, exist_ok=True)
+        (entity_dir / f"{etype}-{i:06d}.md").write_text(
+            "---\n"
+            f"$id: entity/{etype}/{etype}-{i:06d}\n"
+            f"$type: {etype}\n"
+            "$status: active\n"
+            f"name: {etype.title()} {i}\n"
+            f"$aliases: [{etype}{i}]\n"
+            "$relationships:\n"
+            "  - type: related_to\n"
+            f"    target: entity/{target_type}/{target_type}-{(i + 1) % count:06d}\n"
+            "---\n"
+            f"# {etype.title()} {i}\n\nSynthetic entity body for benchmarking.\n",
+            encoding="utf-8",
+        )
+
+
+def _benchmark(count: int, consumers: int) -> Dict[str, Any]:
+    """Compare per-tool scans against one shared, persistent scan."""
+    with tempfile.TemporaryDirectory() as tmp:
+        brain_path = Path(tmp) / "brain"
+        _write_synthetic_brain(brain_path, count)
+
+        t0 = time.perf_counter()
+        for _ in range(consumers):
+            EntityCache(brain_path, persistent=False).load()
+        per_tool_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        cold = EntityCache(brain_path).load()
+        cold_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        warm = EntityCache(brain_path).load()
+        warm_ms = (time.perf_counter() - t0) * 1000
+
+        return {
+            "entities": count,
+            "consumers": consumers,
+            "per_tool_scans_ms": round(per_tool_ms, 1),
+            "shared_cold_scan_ms": round(cold_ms, 1),
+            "shared_warm_scan_ms": round(warm_ms, 1),
+            "cold_misses": cold.stats()["misses"],
+            "warm_hits": warm.stats()["hits"],
+        }
 
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}, content
 
+def main() -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Brain entity cache")
+    parser.add_argument("--brain-path", type=Path, help="Path to brain directory")
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        metavar="N",
+        help="Benchmark on a synthetic brain of N entities",
+    )
+    parser.add_argument(
+        "--consumers",
+        type=int,
+        default=10,
+        help="Tools that would each rescan without the shared cache",
+    )
+    parser.add_argument("--clear", action="store_true", help="Delete the persistent store")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        print(json.dumps(_benchmark(args.synthetic, args.consumers), indent=2))
+        return 0
+
+    brain_path = args.brain_path
+    if brain_path is None:
         try:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            return frontmatter, parts[2]
-        except yaml.YAMLError:
-            return {}, content
+            from pm_os_base.tools.core.path_resolver import get_paths
+        except ImportError:
+            sys.path.insert(0, str(PLUGIN_ROOT.parent / "pm-os-base" / "tools" / "core"))
+            from path_resolver import get_paths
+        brain_path = get_paths().brain
+
+    cache = EntityCache(brain_path)
+    if args.clear:
+        cache.clear_store()
+    print(json.dumps(cache.load().stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
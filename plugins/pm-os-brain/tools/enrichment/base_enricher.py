@@ -29,6 +29,14 @@ except ImportError:
     except ImportError:
         CanonicalResolver = None
 
+try:
+    from ..brain_core.alias_matcher import get_alias_matcher
+except ImportError:
+    try:
+        from brain_core.alias_matcher import get_alias_matcher
+    except ImportError:
+        get_alias_matcher = None
+
 try:
     from ..core.event_helpers import EventHelper
 except ImportError:
@@ -147,10 +155,16 @@ class BaseEnricher(ABC):
 
         # Fall back to alias index for partial matches
         alias_index = self.get_alias_index()
-        for alias, slug in alias_index.items():
-            if alias in text_lower:
-                canonical = resolver.resolve(slug)
-                return canonical if canonical else slug
+        if get_alias_matcher is not None:
+            matcher = get_alias_matcher(alias_index.keys(), cache_dir=self.brain_path)
+            present = matcher.find_present(text_lower)
+            hits = present[:1]
+        else:
+            hits = (alias for alias in alias_index if alias in text_lower)
+        for alias in hits:
+            slug = alias_index[alias]
+            canonical = resolver.resolve(slug)
+            return canonical if canonical else slug
 
         return None
 
@@ -46,29 +46,33 @@ try:
 except ImportError:
     get_config = None
 
+# Shared scan service -- one entity scan for every tool in this run
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import get_shared_cache
+
 # Sibling imports with try/except pattern
 try:
     from ..relationships.body_relationship_extractor import BodyRelationshipExtractor
     from ..relationships.embedding_edge_inferrer import EdgeInferenceReport, EmbeddingEdgeInferrer
-    from ..core.entity_cache import EntityCache
-    from ..quality.extraction_hints import ExtractionHintsGenerator, ExtractionHintsReport
+    from ..relationships.extraction_hints import ExtractionHintsGenerator, ExtractionHintsReport
     from ..quality.graph_health import GraphHealthMonitor, GraphHealthReport
     from ..quality.orphan_analyzer import OrphanAnalyzer
-    from ..quality.relationship_decay import RelationshipDecayMonitor, RelationshipDecayReport
+    from ..relationships.relationship_decay import RelationshipDecayMonitor, RelationshipDecayReport
 except ImportError:
     try:
-        from body_relationship_extractor import BodyRelationshipExtractor
-        from embedding_edge_inferrer import EdgeInferenceReport, EmbeddingEdgeInferrer
-        from brain_core.entity_cache import EntityCache
-        from extraction_hints import ExtractionHintsGenerator, ExtractionHintsReport
-        from graph_health import GraphHealthMonitor, GraphHealthReport
-        from orphan_analyzer import OrphanAnalyzer
-        from relationship_decay import RelationshipDecayMonitor, RelationshipDecayReport
+        from relationships.body_relationship_extractor import BodyRelationshipExtractor
+        from relationships.embedding_edge_inferrer import EdgeInferenceReport, EmbeddingEdgeInferrer
+        from relationships.extraction_hints import ExtractionHintsGenerator, ExtractionHintsReport
+        from quality.graph_health import GraphHealthMonitor, GraphHealthReport
+        from quality.orphan_analyzer import OrphanAnalyzer
+        from relationships.relationship_decay import RelationshipDecayMonitor, RelationshipDecayReport
     except ImportError:
         BodyRelationshipExtractor = None
         EmbeddingEdgeInferrer = None
         EdgeInferenceReport = None
-        EntityCache = None
         ExtractionHintsGenerator = None
         ExtractionHintsReport = None
         GraphHealthMonitor = None
@@ -182,6 +186,17 @@ class BrainEnrichmentOrchestrator:
         ".enrichment-pid",
         ".enrichment-progress.json",
         ".enrichment-log",
+        ".entity-cache.db",
+        ".alias-matchers/",
+        ".embeddings/",
+        ".events/",
+        ".resolver-cache.json",
+        ".snapshots/checkpoints.db",
+        "alias_prefix_index.json",
+        "content_index.bin",
+        "content_index.db",
+        "content_index.stems.json",
+        "graph_index.bin",
     ]
 
     def __init__(self, brain_path: Path, verbose: bool = False):
@@ -193,10 +208,7 @@ class BrainEnrichmentOrchestrator:
         self._soft_edge_config = self._load_soft_edge_config()
 
         # Shared entity cache -- single scan for all modules
-        if EntityCache is not None:
-            self._cache = EntityCache(brain_path)
-        else:
-            self._cache = None
+        self._cache = get_shared_cache(brain_path)
 
         # Initialize tools with shared cache
         if GraphHealthMonitor is not None:
@@ -286,7 +298,11 @@ class BrainEnrichmentOrchestrator:
 
         # Orphan mode: run specialized cleanup
         if mode == "orphan":
-            return self._run_orphan_cleanup(result, dry_run)
+            result = self._run_orphan_cleanup(result, dry_run)
+            if not dry_run:
+                self._refresh_graph()
+                self._checkpoint()
+            return result
 
         if mode == "report":
             self._run_analysis(result)
@@ -349,7 +365,10 @@ class BrainEnrichmentOrchestrator:
             if hasattr(report, 'used_ann') and report.used_ann:
                 result.ann_enabled = True
                 result.ann_queries += 1
-            elif hasattr(report, 'entities_processed') and report.entities_processed >= 20:
+            elif (
+                getattr(report, 'engine', 'bruteforce') == 'bruteforce'
+                and getattr(report, 'entities_processed', 0) >= 20
+            ):
                 result.ann_fallback_to_bruteforce += 1
 
         # Sequential apply phase: writes to files (not thread-safe)
@@ -403,6 +422,8 @@ class BrainEnrichmentOrchestrator:
         # Save incremental state for next run
         if not dry_run:
             self._save_enrichment_state()
+            self._refresh_graph()
+            self._checkpoint()
 
         return result
 
@@ -585,6 +606,34 @@ class BrainEnrichmentOrchestrator:
         with open(gitignore_path, "a", encoding="utf-8") as f:
             f.write(addition)
 
+    def _refresh_graph(self) -> None:
+        """Recompile graph_index.bin if enrichment changed any entity."""
+        try:
+            try:
+                from ..index.graph_store import load_or_compile
+            except ImportError:
+                from index.graph_store import load_or_compile
+            graph = load_or_compile(self.brain_path)
+            if graph is not None:
+                graph.close()
+        except (ImportError, OSError) as e:
+            if self.verbose:
+                logger.warning("  Warning: graph index not refreshed: %s", e)
+
+    def _checkpoint(self) -> None:
+        """Take a temporal checkpoint if the newest one is older than a day."""
+        try:
+            try:
+                from ..temporal.temporal_query import TemporalQuery
+            except ImportError:
+                from temporal.temporal_query import TemporalQuery
+            path = TemporalQuery(self.brain_path).checkpoint()
+            if path is not None and self.verbose:
+                logger.info("  Checkpoint created: %s", path.name)
+        except Exception as e:
+            if self.verbose:
+                logger.warning("  Warning: temporal checkpoint not taken: %s", e)
+
     def _create_snapshot(self) -> None:
         """Create pre-enrichment snapshot via git stash create."""
         try:
@@ -779,7 +828,9 @@ class BrainEnrichmentOrchestrator:
 
         if BodyRelationshipExtractor is not None:
             try:
-                body_extractor = BodyRelationshipExtractor(self.brain_path)
+                body_extractor = BodyRelationshipExtractor(
+                    self.brain_path, cache=self._cache
+                )
                 body_report = body_extractor.scan(orphans_only=True, limit=1000)
 
                 if body_report.relationships and not dry_run:
@@ -840,7 +891,7 @@ class BrainEnrichmentOrchestrator:
 
         if OrphanAnalyzer is not None:
             try:
-                orphan_analyzer = OrphanAnalyzer(self.brain_path)
+                orphan_analyzer = OrphanAnalyzer(self.brain_path, cache=self._cache)
                 standalone_count = orphan_analyzer.mark_standalone(dry_run=dry_run)
                 result.orphans_marked_standalone = standalone_count
                 orphan_analyzer.clear_reason_for_connected(dry_run=dry_run)
@@ -886,7 +937,7 @@ def main():
     parser.add_argument("--brain-path", type=Path, help="Path to brain directory")
     parser.add_argument("--dry-run", action="store_true", help="Preview changes without applying")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
-    parser.add_argument("--embed", action="store_true", help="Rebuild vector index after enrichment")
+    parser.add_argument("--embed", action="store_true", help="Sync vector index (embed new/changed entities) after enrichment")
     parser.add_argument("--timeout", type=int, default=0, help="Self-imposed timeout in seconds")
     parser.add_argument("--rollback", action="store_true", help="Rollback to pre-enrichment state")
     parser.add_argument("--output", choices=["text", "json"], default="text", help="Output format")
@@ -955,23 +1006,28 @@ def main():
     if args.timeout > 0 and hasattr(signal, "SIGALRM"):
         signal.alarm(0)
 
-    # Rebuild vector index if requested
+    # Sync vector index if requested
     if args.embed and mode != "boot" and not args.dry_run:
         try:
             from ..index.vector_index import BrainVectorIndex, VECTOR_AVAILABLE
             if VECTOR_AVAILABLE:
                 if args.verbose or args.output == "text":
-                    print("Step 5: Rebuilding vector index...")
+                    print("Step 5: Syncing vector index...")
                 vi = BrainVectorIndex(args.brain_path)
-                vi_stats = vi.build_index()
+                vi_stats = vi.sync()
                 if args.verbose or args.output == "text":
-                    print(f"  Indexed {vi_stats['entities_indexed']} entities")
+                    print(
+                        f"  Embedded {vi_stats['added'] + vi_stats['updated']}, "
+                        f"removed {vi_stats['removed']}, "
+                        f"unchanged {vi_stats['unchanged']} "
+                        f"({vi_stats['entities_indexed']} indexed)"
+                    )
             else:
                 if args.verbose or args.output == "text":
                     print("Step 5: Skipped vector index (dependencies not installed)")
         except Exception as e:
             if args.verbose or args.output == "text":
-                print(f"Step 5: Vector index rebuild failed: {e}")
+                print(f"Step 5: Vector index sync failed: {e}")
 
     # Output
     if args.output == "json":
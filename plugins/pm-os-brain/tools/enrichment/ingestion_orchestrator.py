@@ -41,6 +41,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# main(argv) can be called repeatedly in one process (pipeline/tool_runner.py)
+REENTRANT = True
+
 
 def _resolve_paths() -> Dict[str, Path]:
     """Resolve all needed paths via path_resolver and config_loader."""
@@ -403,7 +406,7 @@ def show_status():
     print("=" * 60)
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(description="Brain Ingestion Orchestrator")
     parser.add_argument(
         "--mode", choices=["full", "quick"], default="full",
@@ -419,7 +422,7 @@ def main():
     parser.add_argument("--verbose", "-v", action="store_true", default=True)
     parser.add_argument("--quiet", "-q", action="store_true")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.status:
         show_status()
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Alias Prefix Index - Sorted alias arrays for prefix and fuzzy lookup
+
+Replaces linear scans over the registry alias index with binary search:
+- Exact lookup: dict, O(1)
+- Prefix lookup: bisect over a sorted array, O(log n + k). Aliases are
+  also bucketed by length so "prefix with at most N extra characters"
+  touches only the matching aliases.
+- Fuzzy lookup: bounded Levenshtein distance, computed as a depth-first
+  walk of the sorted array treated as an implicit trie -- DP rows are
+  shared across common prefixes and whole subtrees are skipped with
+  bisect once the distance bound is exceeded.
+
+Persisted as alias_prefix_index.json next to the content index and
+invalidated when registry.yaml changes (mtime/size).
+
+Usage:
+    python alias_prefix_index.py --prefix plat        # Prefix lookup
+    python alias_prefix_index.py --fuzzy paymnets     # Fuzzy lookup
+    python alias_prefix_index.py --benchmark 100000   # Synthetic benchmark
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "alias_prefix_index.json"
+INDEX_VERSION = 1
+
+# Sorts after every character that can appear in an alias
+_PREFIX_END = "\U0010ffff"
+
+AliasEntry = Tuple[str, str, str]  # (category, entity_id, file_path)
+
+
+class AliasPrefixIndex:
+    """Sorted alias index supporting exact, prefix and fuzzy lookup."""
+
+    def __init__(self, alias_index: Optional[Dict[str, AliasEntry]] = None):
+        """
+        Build the index.
+
+        Args:
+            alias_index: Mapping of lowercase alias -> (category, entity_id, file_path)
+        """
+        self.entries: Dict[str, AliasEntry] = {}
+        self.keys: List[str] = []
+        self._by_length: Dict[int, List[str]] = {}
+        self.meta: Dict[str, Any] = {}
+        if alias_index:
+            self._build(alias_index)
+
+    def _build(self, alias_index: Dict[str, AliasEntry]) -> None:
+        """Sort aliases globally and per length bucket."""
+        self.entries = {k: tuple(v) for k, v in alias_index.items() if k}
+        self.keys = sorted(self.entries)
+        by_length: Dict[int, List[str]] = {}
+        for key in self.keys:
+            by_length.setdefault(len(key), []).append(key)
+        self._by_length = by_length
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def as_dict(self) -> Dict[str, AliasEntry]:
+        """Return the alias -> (category, entity_id, file_path) mapping."""
+        return self.entries
+
+    def get(self, alias: str) -> Optional[AliasEntry]:
+        """Exact alias lookup."""
+        return self.entries.get(alias)
+
+    def prefix(
+        self, term: str, max_extra: Optional[int] = None
+    ) -> List[Tuple[str, AliasEntry]]:
+        """
+        Find aliases starting with term.
+
+        Args:
+            term: Lowercase prefix
+            max_extra: If set, only aliases at most this many characters
+                       longer than term are returned
+
+        Returns:
+            List of (alias, entry) in sorted alias order
+        """
+        if max_extra is None:
+            keys = self._range(self.keys, term)
+        else:
+            keys = []
+            for length in range(len(term), len(term) + max_extra + 1):
+                bucket = self._by_length.get(length)
+                if bucket:
+                    keys.extend(self._range(bucket, term))
+            keys.sort()
+        return [(k, self.entries[k]) for k in keys]
+
+    @staticmethod
+    def _range(keys: List[str], term: str) -> List[str]:
+        """Slice of sorted keys that start with term."""
+        lo = bisect_left(keys, term)
+        hi = bisect_left(keys, term + _PREFIX_END, lo)
+        return keys[lo:hi]
+
+    def fuzzy(
+        self, term: str, max_distance: int = 1, limit: int = 20
+    ) -> List[Tuple[str, int, AliasEntry]]:
+        """
+        Find aliases within a bounded Levenshtein distance of term.
+
+        Args:
+            term: Lowercase query term
+            max_distance: Maximum edit distance (insert/delete/substitute)
+            limit: Maximum matches to return
+
+        Returns:
+            List of (alias, distance, entry), closest first
+        """
+        keys = self.keys
+        n = len(keys)
+        m = len(term)
+        rows: List[List[int]] = [list(range(m + 1))]
+        prev = ""
+        matches: List[Tuple[str, int]] = []
+
+        i = 0
+        while i < n:
+            key = keys[i]
+            # Reuse DP rows for the prefix shared with the previous key
+            shared = 0
+            limit_shared = min(len(prev), len(key))
+            while shared < limit_shared and prev[shared] == key[shared]:
+                shared += 1
+            del rows[shared + 1 :]
+
+            pruned = False
+            for depth in range(shared, len(key)):
+                ch = key[depth]
+                above = rows[-1]
+                row = [above[0] + 1]
+                for j in range(1, m + 1):
+                    cost = 0 if term[j - 1] == ch else 1
+                    row.append(min(row[j - 1] + 1, above[j] + 1, above[j - 1] + cost))
+                rows.append(row)
+                if min(row) > max_distance:
+                    # No alias under this prefix can come back within bound
+                    prev = key[: depth + 1]
+                    i = bisect_left(keys, prev + _PREFIX_END, i + 1)
+                    pruned = True
+                    break
+            if pruned:
+                continue
+
+            prev = key
+            distance = rows[-1][m]
+            if distance <= max_distance:
+                matches.append((key, distance))
+            i += 1
+
+        matches.sort(key=lambda x: (x[1], x[0]))
+        return [(k, d, self.entries[k]) for k, d in matches[:limit]]
+
+    # --- Persistence ---
+
+    def save(self, path: Path, registry_file: Optional[Path] = None) -> None:
+        """
+        Atomically write the index as JSON.
+
+        Args:
+            path: Destination file
+            registry_file: registry.yaml the aliases came from; its
+                           mtime/size are recorded for invalidation
+        """
+        self.meta = {"version": INDEX_VERSION, "alias_count": len(self.keys)}
+        if registry_file is not None and registry_file.exists():
+            st = registry_file.stat()
+            self.meta["registry_mtime_ns"] = st.st_mtime_ns
+            self.meta["registry_size"] = st.st_size
+
+        data = {
+            "meta": self.meta,
+            "keys": self.keys,
+            "entries": [list(self.entries[k]) for k in self.keys],
+        }
+        try:
+            fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Failed to save alias prefix index: %s", e)
+
+    @classmethod
+    def load(
+        cls, path: Path, registry_file: Optional[Path] = None
+    ) -> Optional["AliasPrefixIndex"]:
+        """
+        Load a saved index if it is still current.
+
+        Args:
+            path: Saved index file
+            registry_file: If given, the index is rejected when the
+                           registry's mtime/size differ from those recorded
+
+        Returns:
+            AliasPrefixIndex, or None if missing, stale or unreadable
+        """
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Error loading alias prefix index: %s", e)
+            return None
+
+        meta = data.get("meta", {})
+        if meta.get("version") != INDEX_VERSION:
+            return None
+        if registry_file is not None:
+            try:
+                st = registry_file.stat()
+            except OSError:
+                return None
+            if (
+                meta.get("registry_mtime_ns") != st.st_mtime_ns
+                or meta.get("registry_size") != st.st_size
+            ):
+                return None
+
+        index = cls()
+        index.keys = data.get("keys", [])
+        index.entries = {
+            k: tuple(v) for k, v in zip(index.keys, data.get("entries", []))
+        }
+        by_length: Dict[int, List[str]] = {}
+        for key in index.keys:
+            by_length.setdefault(len(key), []).append(key)
+        index._by_length = by_length
+        index.meta = meta
+        return index
+
+
+def _synthetic_aliases(count: int) -> Dict[str, AliasEntry]:
+    """Generate count random aliases for benchmarking."""
+    rng = random.Random(7)
+    aliases = {}
+    while len(aliases) < count:
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 14)))
+        aliases[word] = ("entities", f"entity-{len(aliases)}", "")
+    return aliases
+
+
+def _benchmark(count: int, queries: int = 200) -> Dict[str, Any]:
+    """Compare a linear startswith scan against the prefix index."""
+    aliases = _synthetic_aliases(count)
+    rng = random.Random(11)
+    sample = rng.sample(list(aliases), min(queries, count))
+    terms = [a[: max(2, len(a) // 2)] for a in sample]
+
+    t0 = time.perf_counter()
+    index = AliasPrefixIndex(aliases)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    linear = [
+        sorted(a for a in aliases if a.startswith(t) and len(a) <= len(t) + 3)
+        for t in terms
+    ]
+    linear_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    indexed = [[a for a, _ in index.prefix(t, max_extra=3)] for t in terms]
+    prefix_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    for alias in sample[:50]:
+        typo = alias[:1] + alias[2:]
+        index.fuzzy(typo, max_distance=1)
+    fuzzy_ms = (time.perf_counter() - t0) * 1000
+
+    return {
+        "aliases": count,
+        "queries": len(terms),
+        "build_ms": round(build_ms, 1),
+        "linear_prefix_ms": round(linear_ms, 1),
+        "indexed_prefix_ms": round(prefix_ms, 2),
+        "fuzzy_ms_per_query": round(fuzzy_ms / min(50, len(sample)), 2),
+        "results_identical": linear == indexed,
+    }
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Brain alias prefix index")
+    parser.add_argument("--brain-path", type=str, help="Path to brain directory")
+    parser.add_argument("--prefix", type=str, help="Prefix lookup")
+    parser.add_argument("--fuzzy", type=str, help="Fuzzy lookup")
+    parser.add_argument("--max-distance", type=int, default=1, help="Fuzzy edit distance")
+    parser.add_argument("--benchmark", type=int, metavar="N", help="Benchmark with N aliases")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+    if args.benchmark:
+        print(json.dumps(_benchmark(args.benchmark), indent=2))
+        return
+
+    try:
+        from pm_os_brain.tools.index.brain_search import BrainSearch
+    except ImportError:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        from index.brain_search import BrainSearch
+
+    search = BrainSearch(Path(args.brain_path) if args.brain_path else None)
+    index = search.alias_prefix_index
+    if args.prefix:
+        for alias, (_, entity_id, _) in index.prefix(args.prefix.lower()):
+            print(f"{alias} -> {entity_id}")
+    elif args.fuzzy:
+        for alias, dist, (_, entity_id, _) in index.fuzzy(
+            args.fuzzy.lower(), max_distance=args.max_distance
+        ):
+            print(f"[{dist}] {alias} -> {entity_id}")
+    else:
+        print(json.dumps({"aliases": len(index), "meta": index.meta}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,10 @@ Expands seed entities via 1-hop relationship traversal.
 Part of BRAIN+GRAPH retrieval system based on TKS research.
 
 Key features:
-- Load $relationships from entity frontmatter
-- Resolve targets via canonical_resolver
+- Traverse the compiled CSR adjacency (graph_index.bin, see
+  graph_store.py); targets are resolved at compile time, so expansion
+  never reads markdown
+- Resolve non-canonical seed ids via canonical_resolver
 - Tunable decay factor (default 0.5)
 - Support relationship-specific strength field
 - Track visited to prevent cycles
@@ -15,8 +17,9 @@ Key features:
 """
 
 import logging
-import re
+import math
 import sys
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -52,13 +55,21 @@ except ImportError:
     except ImportError:
         SearchResult = None
 
-# Try to import yaml
 try:
-    import yaml
-
-    HAS_YAML = True
+    from pm_os_brain.tools.index.graph_store import (
+        NO_NODE,
+        CompiledGraph,
+        load_or_compile,
+        source_fingerprint,
+    )
 except ImportError:
-    HAS_YAML = False
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from index.graph_store import (
+        NO_NODE,
+        CompiledGraph,
+        load_or_compile,
+        source_fingerprint,
+    )
 
 
 def _resolve_brain_dir() -> Path:
@@ -84,6 +95,9 @@ def _resolve_brain_dir() -> Path:
 # Default decay factor for graph neighbors
 DEFAULT_DECAY = 0.5
 
+# How often a loaded graph is re-checked against the entity files
+FRESHNESS_CHECK_SECONDS = 30.0
+
 
 class BrainGraph:
     """
@@ -93,29 +107,37 @@ class BrainGraph:
     Implements TKS research findings: 1-hop traversal with decay.
     """
 
-    def __init__(self, brain_path: Optional[Path] = None, resolver=None):
+    def __init__(
+        self,
+        brain_path: Optional[Path] = None,
+        resolver=None,
+        graph: Optional[CompiledGraph] = None,
+    ):
         """
         Initialize graph component.
 
         Args:
             brain_path: Path to brain directory
             resolver: Optional CanonicalResolver instance (lazy-loaded if None)
+            graph: Optional CompiledGraph, used as given (otherwise
+                   graph_index.bin is opened, or compiled if missing or
+                   stale, on first use)
         """
         self.brain_path = (
             Path(brain_path) if brain_path else _resolve_brain_dir()
         )
         self._resolver = resolver
+        self._graph = graph
+        self._owns_graph = graph is None
+        self._checked_at = 0.0
         self.warnings: List[str] = []
 
-        # Cache for loaded entities
-        self._entity_cache: Dict[str, Dict] = {}
-
     @property
     def resolver(self):
         """Lazy-load canonical resolver."""
         if self._resolver is None:
             try:
-                from pm_os_brain.tools.brain_core.canonical_resolver import (
+                from pm_os_brain.tools.relationships.canonical_resolver import (
                     CanonicalResolver,
                 )
             except ImportError:
@@ -123,7 +145,7 @@ class BrainGraph:
                     from relationships.canonical_resolver import CanonicalResolver
                 except ImportError:
                     logger.warning(
-                        "canonical_resolver not available; graph expansion disabled"
+                        "canonical_resolver not available; seed resolution disabled"
                     )
                     return None
 
@@ -131,6 +153,24 @@ class BrainGraph:
             self._resolver.build_index()
         return self._resolver
 
+    @property
+    def compiled(self) -> Optional[CompiledGraph]:
+        """The compiled adjacency (loaded on first use, recompiled when stale)."""
+        now = time.monotonic()
+        if (
+            self._graph is not None
+            and self._owns_graph
+            and now - self._checked_at >= FRESHNESS_CHECK_SECONDS
+        ):
+            self._checked_at = now
+            if not self._graph.is_fresh(source_fingerprint(self.brain_path)):
+                self._graph.close()
+                self._graph = None
+        if self._graph is None:
+            self._graph = load_or_compile(self.brain_path, resolver=self._resolver)
+            self._checked_at = now
+        return self._graph
+
     def expand(
         self,
         seeds: List,
@@ -153,92 +193,74 @@ class BrainGraph:
         if not seeds:
             return []
 
-        if self.resolver is None:
-            self.warnings.append("Canonical resolver not available")
+        graph = self.compiled
+        if graph is None:
+            self.warnings.append("Graph index not available")
             return []
 
-        # Track visited entities (seeds + discovered)
-        visited: Set[str] = {s.entity_id for s in seeds}
-        neighbors: Dict[str, Any] = {}
+        nodes = graph.nodes
+        strings = graph.strings
+        offsets = graph.offsets
+        targets = graph.targets
+        strengths = graph.strengths
+
+        # Track visited entities (seeds + discovered) by node id
+        visited: Set[int] = set()
+        current_frontier: List[Tuple[int, str, float, Optional[str]]] = []
+        for s in seeds:
+            node = self._node_for(graph, s.entity_id)
+            if node is not None:
+                visited.add(node)
+                current_frontier.append((node, s.entity_id, s.score, None))
 
-        # Current frontier = seeds
-        current_frontier = [(s.entity_id, s.score, None) for s in seeds]
+        neighbors: Dict[str, Any] = {}
 
         for d in range(depth):
             next_frontier = []
             current_decay = decay ** (d + 1)  # Decay compounds with depth
 
-            for entity_id, parent_score, parent_id in current_frontier:
-                # Load entity and get relationships
-                entity_data = self._load_entity(entity_id)
-                if entity_data is None:
-                    continue
-
-                relationships = entity_data.get("$relationships", [])
-                if not relationships:
-                    continue
-
-                for rel in relationships:
-                    target = rel.get("target")
-                    if not target:
-                        continue
-
-                    # Resolve target to canonical ID
-                    canonical_target = self.resolver.resolve(target)
-                    if canonical_target is None:
+            for node, entity_id, parent_score, parent_id in current_frontier:
+                for e in range(offsets[node], offsets[node + 1]):
+                    target = targets[e]
+                    if target == NO_NODE:
                         self.warnings.append(
-                            f"Unresolved: '{target}' in {entity_id}"
+                            f"Unresolved: '{strings[graph.raw_targets[e]]}' in {entity_id}"
                         )
                         continue
 
                     # Skip if already visited
-                    if canonical_target in visited:
+                    if target in visited:
                         continue
+                    visited.add(target)
+                    canonical_target = nodes[target]
 
-                    # Calculate score with decay
                     # Use relationship-specific strength if defined
-                    rel_strength = rel.get("strength", current_decay)
-                    if isinstance(rel_strength, str):
-                        try:
-                            rel_strength = float(rel_strength)
-                        except ValueError:
-                            rel_strength = current_decay
+                    rel_strength = strengths[e]
+                    if math.isnan(rel_strength):
+                        rel_strength = current_decay
+                    else:
+                        rel_strength = round(rel_strength, 6)
 
                     score = parent_score * rel_strength
+                    rel_type = strings[graph.rel_types[e]]
 
                     # Track via which entity we found this neighbor
                     via_entity = parent_id if parent_id else entity_id
 
-                    # Create or update result (max score wins)
-                    if (
-                        canonical_target not in neighbors
-                        or score > neighbors[canonical_target].score
-                    ):
-                        if SearchResult is not None:
-                            neighbors[canonical_target] = SearchResult(
-                                entity_id=canonical_target,
-                                score=score,
-                                source="graph",
-                                match_reasons=[
-                                    f"via {via_entity} ({rel.get('type', 'related_to')})"
-                                ],
-                                via=via_entity,
-                                relationship_type=rel.get("type"),
-                            )
-                    else:
-                        # Already found with higher score, but track additional path
-                        if canonical_target in neighbors:
-                            neighbors[canonical_target].match_reasons.append(
-                                f"also via {via_entity} ({rel.get('type', 'related_to')})"
-                            )
-
-                    # Add to visited
-                    visited.add(canonical_target)
+                    if SearchResult is not None:
+                        neighbors[canonical_target] = SearchResult(
+                            entity_id=canonical_target,
+                            score=score,
+                            source="graph",
+                            match_reasons=[f"via {via_entity} ({rel_type or 'related_to'})"],
+                            via=via_entity,
+                            relationship_type=rel_type or None,
+                        )
 
                     # Add to next frontier for deeper traversal
                     if d < depth - 1:
                         next_frontier.append(
-                            (canonical_target, score, via_entity)
+                            (target, canonical_target, score, via_entity)
                         )
 
             current_frontier = next_frontier
@@ -253,138 +275,24 @@ class BrainGraph:
             entity_id: Entity ID to get relationships for
 
         Returns:
-            List of relationship dicts
+            List of relationship dicts with every field from $relationships
         """
-        entity_data = self._load_entity(entity_id)
-        if entity_data is None:
+        graph = self.compiled
+        if graph is None:
             return []
+        node = self._node_for(graph, entity_id)
+        if node is None:
+            return []
+        return [graph.edge(e).as_relationship() for e in graph.edge_range(node)]
 
-        return entity_data.get("$relationships", [])
-
-    def _load_entity(self, entity_id: str) -> Optional[Dict]:
-        """
-        Load entity data from file.
-
-        Args:
-            entity_id: Entity ID (canonical or resolvable)
-
-        Returns:
-            Dict with entity frontmatter, or None if not found
-        """
-        # Check cache
-        if entity_id in self._entity_cache:
-            return self._entity_cache[entity_id]
-
-        if self.resolver is None:
-            return None
-
-        # Resolve to canonical ID if needed
-        canonical_id = entity_id
-        if not entity_id.startswith("entity/") and not entity_id.startswith(
-            "project/"
-        ):
+    def _node_for(self, graph: CompiledGraph, entity_id: str) -> Optional[int]:
+        """Node id for an entity id, canonical or resolvable."""
+        node = graph.node(entity_id)
+        if node is None and self.resolver is not None:
             resolved = self.resolver.resolve(entity_id)
             if resolved:
-                canonical_id = resolved
-
-        # Get file path from resolver
-        file_path = (
-            self.resolver.get_entity_path(canonical_id)
-            if hasattr(self.resolver, "get_entity_path")
-            else None
-        )
-
-        if file_path is None:
-            # Try to find file by scanning common patterns
-            file_path = self._find_entity_file(canonical_id)
-
-        if file_path is None or not file_path.exists():
-            return None
-
-        # Load and parse file
-        try:
-            data = self._parse_entity_file(file_path)
-            self._entity_cache[entity_id] = data
-            return data
-        except Exception as e:
-            self.warnings.append(f"Error loading {entity_id}: {e}")
-            return None
-
-    def _find_entity_file(self, entity_id: str) -> Optional[Path]:
-        """Find entity file by ID pattern matching."""
-        parts = entity_id.split("/")
-        if len(parts) < 2:
-            return None
-
-        entity_type = parts[0]  # entity, project, etc.
-        subtype = parts[1] if len(parts) > 2 else None
-        name = parts[-1]
-
-        # Convert name: john-doe -> John_Doe
-        filename = (
-            "_".join(word.capitalize() for word in name.split("-")) + ".md"
-        )
-
-        # Try different paths
-        search_paths = []
-
-        if entity_type == "entity" and subtype:
-            subdir = (
-                subtype.capitalize() + "s"
-                if not subtype.endswith("s")
-                else subtype.capitalize()
-            )
-            search_paths.append(
-                self.brain_path / "Entities" / subdir / filename
-            )
-            search_paths.append(self.brain_path / "Entities" / filename)
-
-        elif entity_type == "project":
-            search_paths.append(self.brain_path / "Projects" / filename)
-
-        elif entity_type == "experiment":
-            search_paths.append(self.brain_path / "Experiments" / filename)
-
-        # Try each path
-        for path in search_paths:
-            if path.exists():
-                return path
-
-        # Fallback: search all directories
-        for pattern in [
-            f"**/{filename}",
-            f"**/{name}.md",
-            f"**/{name.replace('-', '_')}.md",
-        ]:
-            matches = list(self.brain_path.glob(pattern))
-            if matches:
-                return matches[0]
-
-        return None
-
-    def _parse_entity_file(self, file_path: Path) -> Dict:
-        """Parse entity file and extract frontmatter."""
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Check for YAML frontmatter
-        if not content.startswith("---"):
-            return {}
-
-        # Find end of frontmatter
-        end_match = re.search(r"\n---\s*\n", content[3:])
-        if not end_match:
-            return {}
-
-        frontmatter_str = content[4 : end_match.start() + 3]
-
-        if HAS_YAML:
-            try:
-                return yaml.safe_load(frontmatter_str) or {}
-            except yaml.YAMLError:
-                return {}
-        else:
-            return {}
+                node = graph.node_ids.get(resolved)
+        return node
 
 
 def main():
@@ -2,24 +2,43 @@
 """
 Brain Index - Inverted Index Builder for Content Search
 
-Builds an inverted index from all Brain entity files for O(1) content lookup.
-Includes Porter stemming for word normalization.
+Builds a positional inverted index from all Brain entity files, stored as
+compressed binary postings (content_index.bin, see postings_format.py).
+Documents are ranked with BM25; term positions support phrase queries.
+Includes Porter stemming for word normalization. Each CLI build/update
+also recompiles the relationship graph (graph_index.bin, see graph_store.py).
 
 Usage:
-    python brain_index.py                    # Build index
+    python brain_index.py                    # Build, or incrementally update, the index
+    python brain_index.py --rebuild          # Force a full rebuild
+    python brain_index.py --rebuild --workers 8   # Parallel full rebuild
     python brain_index.py --stats            # Show index statistics
     python brain_index.py --search "query"   # Test search (debug)
+    python brain_index.py --benchmark-stem 2000   # Stemming micro-benchmark
+    python brain_index.py --no-graph         # Skip recompiling graph_index.bin
 """
 
 import argparse
+import gc
+import hashlib
+import heapq
 import json
 import logging
+import math
+import os
+import random
 import re
+import sqlite3
 import sys
-from collections import defaultdict
+import tempfile
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +62,31 @@ except ImportError:
     except ImportError:
         get_paths = None
 
+# Sibling imports
+try:
+    from pm_os_brain.tools.index.postings_format import (
+        INDEX_FILENAME,
+        PostingsReader,
+        TermPostings,
+        assemble_header,
+        concat_term_blocks,
+        encode_postings,
+        write_encoded,
+        write_index,
+    )
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from index.postings_format import (
+        INDEX_FILENAME,
+        PostingsReader,
+        TermPostings,
+        assemble_header,
+        concat_term_blocks,
+        encode_postings,
+        write_encoded,
+        write_index,
+    )
+
 # Try to import yaml
 try:
     import yaml
@@ -52,6 +96,27 @@ except ImportError:
     HAS_YAML = False
 
 
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Incremental update manifest (content_index.db) and compaction threshold
+MANIFEST_SUFFIX = ".db"
+COMPACT_RATIO = 0.25
+
+# Stem cache: bounded LRU persisted next to the index. Bump STEMMER_VERSION
+# whenever PorterStemmer's rules change so stale caches are discarded.
+STEM_CACHE_FILENAME = "content_index.stems.json"
+STEM_CACHE_SIZE = 50000
+STEMMER_VERSION = 1
+
+# Parallel builds: below this many files, process start-up outweighs the gain
+PARALLEL_MIN_FILES = 200
+SHARDS_PER_WORKER = 4
+
+_WORD_RE = re.compile(r"\b[a-zA-Z][a-zA-Z0-9]*\b")
+
+
 def _resolve_brain_dir() -> Path:
     """Resolve brain directory from config/paths, no hardcoded values."""
     if get_paths is not None:
@@ -99,23 +164,110 @@ def _resolve_index_dirs() -> List[str]:
 
 
 class PorterStemmer:
-    """Simplified Porter stemmer for English word normalization."""
+    """
+    Simplified Porter stemmer for English word normalization.
 
-    def __init__(self):
-        self.cache = {}
+    Results are memoised in a bounded LRU cache that can be persisted with
+    the index (save_cache/load_cache), so rebuilds start warm.
+    """
+
+    def __init__(self, max_cache: int = STEM_CACHE_SIZE):
+        self.cache: "OrderedDict[str, str]" = OrderedDict()
+        self.max_cache = max_cache
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
 
     def stem(self, word: str) -> str:
         """Stem a word to its root form."""
-        if word in self.cache:
-            return self.cache[word]
-
         word = word.lower()
+        cache = self.cache
+        stemmed = cache.get(word)
+        if stemmed is not None:
+            cache.move_to_end(word)
+            self.hits += 1
+            return stemmed
+        self.misses += 1
+        stemmed = self._stem_uncached(word)
+        self._remember(word, stemmed)
+        return stemmed
+
+    def stem_many(self, words: Iterable[str]) -> Dict[str, str]:
+        """
+        Stem a batch of words, each distinct word once.
+
+        Args:
+            words: Words (lowercase); duplicates are collapsed first
+
+        Returns:
+            {word: stem} for every distinct word
+        """
+        cache = self.cache
+        get = cache.get
+        result = {}
+        for word in words:
+            if word in result:
+                continue
+            stemmed = get(word)
+            if stemmed is None:
+                self.misses += 1
+                stemmed = self._stem_uncached(word)
+                self._remember(word, stemmed)
+            else:
+                cache.move_to_end(word)
+                self.hits += 1
+            result[word] = stemmed
+        return result
+
+    def _remember(self, word: str, stemmed: str) -> None:
+        """Insert into the LRU cache, evicting the least recently used entry."""
+        self.cache[word] = stemmed
+        self.dirty = True
+        if len(self.cache) > self.max_cache:
+            self.cache.popitem(last=False)
+
+    def load_cache(self, path: Path) -> bool:
+        """
+        Load a persisted stem cache.
+
+        Returns:
+            True if loaded; False if missing, unreadable or from another
+            stemmer version
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("stemmer_version") != STEMMER_VERSION:
+            return False
+        for word, stemmed in data.get("entries", [])[-self.max_cache :]:
+            self.cache[word] = stemmed
+        while len(self.cache) > self.max_cache:
+            self.cache.popitem(last=False)
+        self.dirty = False
+        return True
+
+    def save_cache(self, path: Path) -> None:
+        """Atomically persist the cache (least recently used first)."""
+        data = {
+            "stemmer_version": STEMMER_VERSION,
+            "entries": list(self.cache.items()),
+        }
+        try:
+            fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, path)
+            self.dirty = False
+        except OSError as e:
+            logger.warning("Failed to save stem cache: %s", e)
+
+    def _stem_uncached(self, word: str) -> str:
+        """Apply the suffix rules to a lowercase word."""
         if len(word) <= 2:
             return word
 
-        # Basic suffix stripping
-        original = word
-
         # Step 1a: SSES -> SS, IES -> I, SS -> SS, S -> ''
         if word.endswith("sses"):
             word = word[:-2]
@@ -173,7 +325,6 @@ class PorterStemmer:
         elif word.endswith("ness") and len(word) > 6:
             word = word[:-4]
 
-        self.cache[original] = word
         return word
 
     def _has_vowel(self, word: str) -> bool:
@@ -189,16 +340,78 @@ class PorterStemmer:
         return word
 
 
+def _resolve_workers(workers: Optional[int]) -> int:
+    """Normalise a --workers value: None/1 serial, 0 = one per CPU."""
+    if workers is None:
+        return 1
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def _build_shard_worker(brain_path: str, groups: List[Tuple[int, List[str]]]) -> Dict[str, Any]:
+    """Worker process entry point for BrainIndex._build_shard."""
+    indexer = BrainIndex(Path(brain_path))
+    indexer._load_stem_cache()
+    known = set(indexer.stemmer.cache)
+    result = indexer._build_shard(groups)
+    # Hand newly learned stems back so the parent can persist them
+    result["stems"] = [
+        (w, s) for w, s in indexer.stemmer.cache.items() if w not in known
+    ]
+    return result
+
+
+def _analyze_shard(
+    brain_path: str, paths: List[str]
+) -> List[Tuple[str, Optional[Tuple[str, str, Dict[str, List[int]], int]], Optional[str]]]:
+    """
+    Analyze one shard of files in a worker process.
+
+    Args:
+        brain_path: Brain directory (entity ids are relative to it)
+        paths: Files to read, strip and tokenize
+
+    Returns:
+        [(path, analysis or None, error or None)] in input order
+    """
+    indexer = BrainIndex(Path(brain_path))
+    indexer._load_stem_cache()
+    results = []
+    for path in paths:
+        try:
+            results.append((path, indexer._analyze_file(Path(path)), None))
+        except Exception as e:
+            results.append((path, None, str(e)))
+    return results
+
+
 class BrainIndex:
     """Builds and manages inverted index for Brain content search."""
 
-    def __init__(self, brain_path: Optional[Path] = None):
+    def __init__(self, brain_path: Optional[Path] = None, workers: int = 1):
+        """
+        Args:
+            brain_path: Brain directory (resolved from config if None)
+            workers: Processes used to read and tokenize files during
+                     build()/update(); 1 is serial, 0 uses every CPU
+        """
         self.brain_path = Path(brain_path) if brain_path else _resolve_brain_dir()
-        self.index_file = self.brain_path / "content_index.json"
+        self.workers = _resolve_workers(workers)
+        self.index_file = self.brain_path / INDEX_FILENAME
+        self.legacy_index_file = self.brain_path / "content_index.json"
+        self.stem_cache_file = self.brain_path / STEM_CACHE_FILENAME
         self.stemmer = PorterStemmer()
-        self.index: Dict[str, List[str]] = {}
+        self._stem_cache_loaded = False
+        self.reader: Optional[PostingsReader] = None
         self.meta: Dict[str, Any] = {}
 
+        # Build output, kept for save()
+        self._encoded: Optional[Tuple[Dict[str, Any], bytes]] = None
+        self._forward: Dict[str, Tuple[int, str]] = {}
+        self._files: Dict[str, Tuple[int, int, str, str]] = {}
+        self._type_map: Optional[Dict[str, str]] = None
+
         # Stopwords to exclude
         self.stopwords = {
             "a",
@@ -296,86 +509,505 @@ class BrainIndex:
             "whose",
         }
 
-    def build(self) -> Dict[str, Any]:
-        """Build inverted index from all entity files."""
-        logger.info("Building index from %s...", self.brain_path)
-
-        index = defaultdict(set)
-        entity_count = 0
-        token_count = 0
-        errors = []
-
-        index_dirs = _resolve_index_dirs()
-
-        for dir_name in index_dirs:
-            dir_path = self.brain_path / dir_name
-            if not dir_path.exists():
-                continue
-
-            for md_file in dir_path.rglob("*.md"):
-                try:
-                    entity_id = self._file_to_entity_id(md_file)
-                    content = self._extract_text(md_file)
-                    tokens = self._tokenize_and_stem(content)
-
-                    for token in tokens:
-                        index[token].add(entity_id)
-                        token_count += 1
+    def build(self, workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Build the positional inverted index from all entity files.
 
-                    entity_count += 1
+        Entities are assigned doc ids in sorted order and split into shards
+        of contiguous doc ids. Each shard is read, tokenized and encoded
+        independently -- across a process pool when workers > 1 -- and the
+        encoded postings are concatenated per term. The result is
+        byte-identical to a serial build.
 
-                except Exception as e:
-                    errors.append(f"{md_file}: {e}")
+        Args:
+            workers: Override self.workers for this build
+        """
+        workers = self.workers if workers is None else _resolve_workers(workers)
+        logger.info("Building index from %s (workers=%d)...", self.brain_path, workers)
+        self._load_stem_cache()
+
+        scanned = self._scan_files()
+        files_by_entity: Dict[str, List[str]] = defaultdict(list)
+        for rel in sorted(scanned):
+            files_by_entity[self._file_to_entity_id(scanned[rel][0])].append(rel)
+        docs = sorted(files_by_entity)
+        groups = [
+            (doc_id, [str(scanned[rel][0]) for rel in files_by_entity[entity_id]])
+            for doc_id, entity_id in enumerate(docs)
+        ]
 
-        # Convert sets to sorted lists for JSON serialization
-        self.index = {k: sorted(v) for k, v in index.items()}
+        if workers > 1 and len(scanned) >= PARALLEL_MIN_FILES:
+            shard_size = max(1, -(-len(groups) // (workers * SHARDS_PER_WORKER)))
+            shards = [groups[i : i + shard_size] for i in range(0, len(groups), shard_size)]
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(
+                        pool.map(
+                            _build_shard_worker, [str(self.brain_path)] * len(shards), shards
+                        )
+                    )
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning("Parallel build failed, building serially: %s", e)
+                results = [self._build_shard(groups)]
+        else:
+            results = [self._build_shard(groups)]
+
+        # Merge shard outputs (shards are in ascending doc-id order)
+        doc_lengths = [0] * len(docs)
+        term_parts: Dict[str, list] = defaultdict(list)
+        forward: Dict[str, Tuple[int, str]] = {}
+        hashes: Dict[str, str] = {}
+        errors = []
+        for result in results:
+            for doc_id, length in result["doc_lengths"].items():
+                doc_lengths[doc_id] = length
+            for term, part in result["terms"].items():
+                term_parts[term].append(part)
+            for doc_id, terms_text in result["forward"].items():
+                forward[docs[doc_id]] = (doc_id, terms_text)
+            hashes.update(result["hashes"])
+            errors.extend(result["errors"])
+            for word, stemmed in result.get("stems", ()):
+                self.stemmer._remember(word, stemmed)
+        for doc_id, entity_id in enumerate(docs):
+            if entity_id not in forward:
+                docs[doc_id] = ""  # Every file of this entity failed to read
+
+        encoded = {term: concat_term_blocks(parts) for term, parts in term_parts.items()}
+        files: Dict[str, Tuple[int, int, str, str]] = {}
+        for entity_id, rels in files_by_entity.items():
+            for rel in rels:
+                md_file, st = scanned[rel]
+                if str(md_file) in hashes:
+                    files[rel] = (st.st_mtime_ns, st.st_size, hashes[str(md_file)], entity_id)
 
         self.meta = {
             "built": datetime.now().isoformat(),
             "brain_path": str(self.brain_path),
-            "entity_count": entity_count,
-            "token_count": len(self.index),
-            "total_postings": token_count,
+            "entity_count": sum(1 for d in docs if d),
+            "token_count": len(encoded),
+            "total_postings": sum(e[2] for e in encoded.values()),
             "errors": errors[:10] if errors else [],
         }
+        header, blob = assemble_header(self.meta, docs, doc_lengths, encoded)
+        self._encoded, self._forward, self._files = (header, blob), forward, files
+        self._set_reader(PostingsReader(header, blob, 0))
 
         logger.info(
-            "Indexed %d entities, %d unique tokens", entity_count, len(self.index)
+            "Indexed %d entities, %d unique tokens", self.meta["entity_count"], len(encoded)
         )
 
-        return {"meta": self.meta, "index": self.index}
+        return {"meta": self.meta}
+
+    def _build_shard(self, groups: List[Tuple[int, List[str]]]) -> Dict[str, Any]:
+        """
+        Read, tokenize and encode one shard of documents.
+
+        Args:
+            groups: [(doc_id, [file paths of the entity])], doc ids ascending
+
+        Returns:
+            Dict with doc_lengths {doc_id: n}, terms (encode_postings output),
+            forward {doc_id: newline-joined terms}, hashes {path: content
+            hash} and errors
+        """
+        postings: Dict[str, TermPostings] = defaultdict(list)
+        doc_lengths: Dict[int, int] = {}
+        forward: Dict[int, str] = {}
+        hashes: Dict[str, str] = {}
+        errors = []
+        for doc_id, paths in groups:
+            parts = []
+            for path in paths:
+                try:
+                    _, content_hash, terms, word_count = self._analyze_file(Path(path))
+                except Exception as e:
+                    errors.append(f"{path}: {e}")
+                    continue
+                hashes[path] = content_hash
+                parts.append((terms, word_count))
+            if not parts:
+                continue
+            terms = self._merge_analyses(parts)
+            doc_lengths[doc_id] = sum(len(p) for p in terms.values())
+            forward[doc_id] = "\n".join(terms)
+            for term, positions in terms.items():
+                postings[term].append((doc_id, positions))
+        return {
+            "doc_lengths": doc_lengths,
+            "terms": encode_postings(postings),
+            "forward": forward,
+            "hashes": hashes,
+            "errors": errors,
+        }
 
     def save(self, path: Optional[Path] = None):
-        """Save index to JSON file."""
+        """Save the index in the compressed binary postings format."""
         save_path = Path(path) if path else self.index_file
 
-        data = {"meta": self.meta, "index": self.index}
-
-        with open(save_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        if self._encoded is None:
+            logger.warning("Nothing to save: build() the index first")
+            return
+
+        header, blob = self._encoded
+        self.meta["generation"] = uuid.uuid4().hex
+        header["meta"] = self.meta
+        write_encoded(save_path, header, blob)
+
+        # Manifest for incremental updates (forward index + file records)
+        self._write_manifest(
+            save_path.with_suffix(MANIFEST_SUFFIX),
+            self.meta["generation"],
+            files=self._files,
+            removed_files=[],
+            forward=self._forward,
+            removed_docs=[],
+            replace=True,
+        )
+        self._save_stem_cache()
 
         size_kb = save_path.stat().st_size / 1024
         logger.info("Saved index to %s (%.1f KB)", save_path, size_kb)
 
-    def load(self, path: Optional[Path] = None) -> bool:
-        """Load index from JSON file."""
-        load_path = Path(path) if path else self.index_file
+    def update(self) -> Dict[str, Any]:
+        """
+        Bring the saved index up to date, touching only changed files.
 
-        if not load_path.exists():
-            return False
+        Files are compared against the manifest by mtime/size, then content
+        hash. Postings are removed and re-added only for the documents of
+        added, modified or deleted files; unchanged terms are copied
+        byte-for-byte. Doc ids stay stable (deleted documents become
+        tombstones) until they exceed COMPACT_RATIO, which triggers a full
+        rebuild. Falls back to build() + save() if there is no usable index.
+
+        Returns:
+            Dict with mode ("unchanged", "incremental" or "full"), file
+            counts and elapsed_ms
+        """
+        t0 = time.perf_counter()
+        manifest_path = self.index_file.with_suffix(MANIFEST_SUFFIX)
+
+        def full(reason: str) -> Dict[str, Any]:
+            logger.info("Full index rebuild (%s)", reason)
+            self.build()
+            self.save()
+            return {
+                "mode": "full",
+                "reason": reason,
+                "entity_count": self.meta["entity_count"],
+                "elapsed_ms": round((time.perf_counter() - t0) * 1000, 1),
+            }
+
+        self._load_stem_cache()
+        if not self.load(self.index_file):
+            return full("no index")
+        reader = self.reader
+        manifest = self._read_manifest(manifest_path)
+        if manifest is None or manifest["generation"] != reader.meta.get("generation"):
+            return full("manifest missing or out of date")
+        stored = manifest["files"]
+
+        current = self._scan_files()
+        removed_files = [rel for rel in stored if rel not in current]
+        touched: Dict[str, Tuple[int, int, str, str]] = {}
+        changed: Dict[str, Tuple[str, str, Dict[str, List[int]], int]] = {}
+        errors = []
+        candidates = [
+            rel
+            for rel, (_, st) in current.items()
+            if not (
+                rel in stored
+                and stored[rel][0] == st.st_mtime_ns
+                and stored[rel][1] == st.st_size
+            )
+        ]
+        results = self._analyze_files([current[rel][0] for rel in candidates])
+        for rel, (analysis, error) in zip(candidates, results):
+            md_file, st = current[rel]
+            record = stored.get(rel)
+            if error is not None:
+                errors.append(f"{md_file}: {error}")
+                continue
+            entity_id, content_hash, terms, word_count = analysis
+            touched[rel] = (st.st_mtime_ns, st.st_size, content_hash, entity_id)
+            if record and record[2] == content_hash and record[3] == entity_id:
+                continue  # Touched but identical
+            changed[rel] = (entity_id, content_hash, terms, word_count)
+
+        affected = {stored[rel][3] for rel in removed_files}
+        affected.update(stored[rel][3] for rel in changed if rel in stored)
+        affected.update(entity_id for entity_id, _, _, _ in changed.values())
+
+        if not affected:
+            if touched:
+                self._write_manifest(
+                    manifest_path, manifest["generation"], touched, [], {}, []
+                )
+            self._save_stem_cache()
+            return {
+                "mode": "unchanged",
+                "files_touched": len(touched),
+                "elapsed_ms": round((time.perf_counter() - t0) * 1000, 1),
+            }
+
+        # Re-analyze every file of each affected entity (usually just one)
+        files_by_entity: Dict[str, List[str]] = defaultdict(list)
+        for rel in current:
+            record = touched.get(rel) or stored.get(rel)
+            if record and record[3] in affected:
+                files_by_entity[record[3]].append(rel)
+        new_terms: Dict[str, Dict[str, List[int]]] = {}
+        for entity_id in affected:
+            parts = []
+            for rel in sorted(files_by_entity.get(entity_id, [])):
+                if rel in changed:
+                    parts.append(changed[rel][2:])
+                else:
+                    _, _, terms, word_count = self._analyze_file(current[rel][0])
+                    parts.append((terms, word_count))
+            if parts:
+                new_terms[entity_id] = self._merge_analyses(parts)
+
+        # Assign doc ids: reuse, tombstone or append
+        docs = list(reader.docs)
+        doc_lengths = list(reader.doc_lengths)
+        forward = self._read_forward(manifest_path, affected)
+        old_doc_ids = {forward[e][0] for e in affected if e in forward}
+        doc_ids: Dict[str, int] = {}
+        for entity_id in sorted(affected):
+            doc_id = forward[entity_id][0] if entity_id in forward else None
+            terms = new_terms.get(entity_id)
+            if terms is None:
+                if doc_id is not None:
+                    docs[doc_id], doc_lengths[doc_id] = "", 0
+                continue
+            if doc_id is None:
+                doc_id = len(docs)
+                docs.append(entity_id)
+                doc_lengths.append(0)
+            doc_lengths[doc_id] = sum(len(p) for p in terms.values())
+            doc_ids[entity_id] = doc_id
+
+        tombstones = sum(1 for d in docs if not d)
+        if docs and tombstones / len(docs) > COMPACT_RATIO:
+            return full("compacting deleted documents")
+
+        # Re-encode only the terms of affected documents
+        affected_terms = {t for e in affected if e in forward for t in forward[e][1]}
+        for terms in new_terms.values():
+            affected_terms.update(terms)
+        updated: Dict[str, TermPostings] = {}
+        for term in affected_terms:
+            entries = [
+                (d, p) for d, p in reader.positions(term).items() if d not in old_doc_ids
+            ]
+            for entity_id, terms in new_terms.items():
+                if term in terms:
+                    entries.append((doc_ids[entity_id], terms[term]))
+            entries.sort(key=lambda x: x[0])
+            updated[term] = entries
+
+        stats = {
+            "mode": "incremental",
+            "files_added": sum(1 for rel in changed if rel not in stored),
+            "files_modified": sum(1 for rel in changed if rel in stored),
+            "files_removed": len(removed_files),
+            "entities_updated": len(affected),
+            "terms_rewritten": len(updated),
+        }
+        doc_freqs = {t: reader.doc_freq(t) for t in reader.terms}
+        doc_freqs.update((t, len(e)) for t, e in updated.items())
+        meta = dict(
+            reader.meta,
+            built=datetime.now().isoformat(),
+            entity_count=sum(1 for d in docs if d),
+            token_count=sum(1 for df in doc_freqs.values() if df),
+            total_postings=sum(doc_freqs.values()),
+            generation=uuid.uuid4().hex,
+            last_update=stats,
+        )
+        if errors:
+            meta["errors"] = errors[:10]
+        write_index(self.index_file, meta, docs, doc_lengths, updated, base=reader)
+        self._write_manifest(
+            manifest_path,
+            meta["generation"],
+            files=touched,
+            removed_files=removed_files,
+            forward={e: (doc_ids[e], "\n".join(new_terms[e])) for e in doc_ids},
+            removed_docs=[e for e in affected if e not in doc_ids],
+        )
+        self.load(self.index_file)
+        self._save_stem_cache()
+
+        stats["elapsed_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+        logger.info(
+            "Index updated: %d added, %d modified, %d removed files (%.0fms)",
+            stats["files_added"], stats["files_modified"],
+            stats["files_removed"], stats["elapsed_ms"],
+        )
+        return stats
+
+    # --- Stem cache, persisted next to the index ---
 
+    def _load_stem_cache(self) -> None:
+        """Warm the stemmer from the persisted cache (once per instance)."""
+        if not self._stem_cache_loaded:
+            self._stem_cache_loaded = True
+            self.stemmer.load_cache(self.stem_cache_file)
+
+    def _save_stem_cache(self) -> None:
+        """Persist the stem cache if it learned new words."""
+        if self.stemmer.dirty:
+            self.stemmer.save_cache(self.stem_cache_file)
+
+    # --- Manifest (file records + forward index), stored in SQLite ---
+
+    def _read_manifest(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Load file records; forward entries are fetched on demand."""
+        if not path.exists():
+            return None
         try:
-            with open(load_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            conn = sqlite3.connect(str(path))
+            try:
+                row = conn.execute(
+                    "SELECT value FROM meta WHERE key = 'generation'"
+                ).fetchone()
+                files = {
+                    r[0]: (r[1], r[2], r[3], r[4])
+                    for r in conn.execute(
+                        "SELECT path, mtime_ns, size, hash, entity_id FROM files"
+                    )
+                }
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("Index manifest unreadable: %s", e)
+            return None
+        return {"generation": row[0] if row else None, "files": files}
+
+    @staticmethod
+    def _read_forward(path: Path, entity_ids) -> Dict[str, Tuple[int, List[str]]]:
+        """Fetch (doc_id, terms) from the forward index for the given entities."""
+        result = {}
+        conn = sqlite3.connect(str(path))
+        try:
+            for entity_id in entity_ids:
+                r = conn.execute(
+                    "SELECT doc_id, terms FROM forward WHERE entity_id = ?",
+                    (entity_id,),
+                ).fetchone()
+                if r:
+                    result[entity_id] = (r[0], r[1].split("\n") if r[1] else [])
+        finally:
+            conn.close()
+        return result
+
+    @staticmethod
+    def _write_manifest(
+        path: Path,
+        generation: str,
+        files: Dict[str, Tuple[int, int, str, str]],
+        removed_files: List[str],
+        forward: Dict[str, Tuple[int, str]],
+        removed_docs: List[str],
+        replace: bool = False,
+    ) -> None:
+        """Apply file-record and forward-index changes in one transaction."""
+        try:
+            if replace:
+                path.unlink(missing_ok=True)
+            conn = sqlite3.connect(str(path))
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, "
+                    "mtime_ns INTEGER, size INTEGER, hash TEXT, entity_id TEXT)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS forward (entity_id TEXT PRIMARY KEY, "
+                    "doc_id INTEGER, terms TEXT)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                    [(rel, *record) for rel, record in files.items()],
+                )
+                conn.executemany(
+                    "DELETE FROM files WHERE path = ?", [(r,) for r in removed_files]
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO forward VALUES (?, ?, ?)",
+                    [(e, d, t) for e, (d, t) in forward.items()],
+                )
+                conn.executemany(
+                    "DELETE FROM forward WHERE entity_id = ?",
+                    [(e,) for e in removed_docs],
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('generation', ?)", (generation,)
+                )
+            conn.close()
+        except sqlite3.Error as e:
+            logger.warning("Failed to write index manifest: %s", e)
+
+    def load(self, path: Optional[Path] = None) -> bool:
+        """
+        Load the index (memory-mapped).
 
-            self.meta = data.get("meta", {})
-            self.index = data.get("index", {})
+        Falls back to a legacy content_index.json (token -> entity ids),
+        which is converted in memory with unit term frequencies.
+        """
+        load_path = Path(path) if path else self.index_file
+
+        if load_path.exists():
+            reader = PostingsReader.open(load_path)
+            if reader is None:
+                return False
+            self._set_reader(reader)
+            self.meta = reader.meta
             return True
 
+        if path is None and self.legacy_index_file.exists():
+            return self._load_legacy(self.legacy_index_file)
+
+        return False
+
+    def _load_legacy(self, path: Path) -> bool:
+        """Load a v1 JSON index of token -> sorted entity ids."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
         except Exception as e:
             logger.error("Error loading index: %s", e)
             return False
 
+        index = data.get("index", {})
+        docs = sorted({e for ids in index.values() for e in ids})
+        doc_ids = {e: i for i, e in enumerate(docs)}
+        doc_lengths = [0] * len(docs)
+        postings: Dict[str, TermPostings] = {}
+        for token, ids in index.items():
+            postings[token] = sorted((doc_ids[e], [0]) for e in ids)
+            for e in ids:
+                doc_lengths[doc_ids[e]] += 1
+
+        self.meta = dict(data.get("meta", {}), legacy=True)
+        self._set_reader(
+            PostingsReader.from_postings(self.meta, docs, doc_lengths, postings)
+        )
+        return True
+
+    def _set_reader(self, reader: PostingsReader) -> None:
+        """Swap in a new postings reader, releasing the previous one."""
+        if self.reader is not None and self.reader is not reader:
+            self.reader.close()
+        self.reader = reader
+
+    def __contains__(self, term: str) -> bool:
+        return self.reader is not None and term in self.reader
+
     def search(self, query: str, mode: str = "and") -> List[str]:
         """
         Search index for query tokens.
@@ -385,36 +1017,223 @@ class BrainIndex:
             mode: "and" (all tokens must match) or "or" (any token matches)
 
         Returns:
-            List of matching entity IDs
+            List of matching entity IDs, sorted
         """
         tokens = self._tokenize_and_stem(query)
-
         if not tokens:
             return []
+        ranked = self.search_bm25(
+            [[t] for t in tokens], top_k=None, require_all=(mode == "and")
+        )
+        return sorted(entity_id for entity_id, _ in ranked)
+
+    def search_bm25(
+        self,
+        groups: List[List[str]],
+        top_k: Optional[int] = 20,
+        require_all: bool = True,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank documents with BM25.
 
-        # Get posting lists for each token
-        posting_lists = []
-        for token in tokens:
-            if token in self.index:
-                posting_lists.append(set(self.index[token]))
-            elif mode == "and":
-                # Token not found and we need all tokens - no results
-                return []
+        Args:
+            groups: Stemmed query term groups. A document matches a group if
+                    it contains any of the group's terms (e.g. a token plus
+                    its synonyms); matching terms all contribute to the score.
+            top_k: Number of results (None for all matches)
+            require_all: AND semantics across groups (a group with no indexed
+                         term matches nothing); otherwise OR
 
-        if not posting_lists:
+        Returns:
+            [(entity_id, score)] by descending score
+        """
+        reader = self.reader
+        if reader is None:
             return []
 
-        # Combine based on mode
-        if mode == "and":
-            result = posting_lists[0]
-            for pl in posting_lists[1:]:
-                result = result.intersection(pl)
-        else:  # or
-            result = set()
-            for pl in posting_lists:
-                result = result.union(pl)
+        groups = [[t for t in dict.fromkeys(g) if t in reader] for g in groups]
+        if require_all and not all(groups):
+            return []
+        groups = [g for g in groups if g]
+        terms = list(dict.fromkeys(t for g in groups for t in g))
+        if not terms:
+            return []
+
+        n_docs = reader.doc_count
+        avgdl = reader.avgdl
+        lengths = reader.doc_lengths
+        idf = {
+            t: math.log(1 + (n_docs - reader.doc_freq(t) + 0.5) / (reader.doc_freq(t) + 0.5))
+            for t in terms
+        }
+
+        def weight(term: str, tf: int, dl: int) -> float:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * dl / avgdl)
+            return idf[term] * tf * (BM25_K1 + 1) / (tf + norm)
+
+        scores: Dict[int, float] = {}
+        if require_all:
+            # Intersect group by group, rarest group first
+            groups.sort(key=lambda g: sum(reader.doc_freq(t) for t in g))
+            candidates: Optional[Set[int]] = None
+            group_postings = []
+            for group in groups:
+                plists = {t: reader.postings(t) for t in group}
+                docs_in_group = {d for pl in plists.values() for d, _ in pl}
+                candidates = (
+                    docs_in_group if candidates is None else candidates & docs_in_group
+                )
+                if not candidates:
+                    return []
+                group_postings.append(plists)
+            for plists in group_postings:
+                for term, plist in plists.items():
+                    for doc_id, tf in plist:
+                        if doc_id in candidates:
+                            scores[doc_id] = scores.get(doc_id, 0.0) + weight(
+                                term, tf, lengths[doc_id]
+                            )
+        else:
+            # MaxScore: visit terms by upper bound; once the k-th best score
+            # beats everything the remaining terms could add, stop admitting
+            # new documents and only refine existing candidates.
+            bounds = {t: weight(t, reader.max_tf(t), reader.min_dl) for t in terms}
+            terms.sort(key=lambda t: -bounds[t])
+            remaining = [0.0] * (len(terms) + 1)
+            for i in range(len(terms) - 1, -1, -1):
+                remaining[i] = remaining[i + 1] + bounds[terms[i]]
+            threshold = 0.0
+            for i, term in enumerate(terms):
+                admit = top_k is None or len(scores) < top_k or threshold < remaining[i]
+                for doc_id, tf in reader.postings(term):
+                    if not admit and doc_id not in scores:
+                        continue
+                    scores[doc_id] = scores.get(doc_id, 0.0) + weight(
+                        term, tf, lengths[doc_id]
+                    )
+                if top_k is not None and len(scores) >= top_k:
+                    threshold = heapq.nlargest(top_k, scores.values())[-1]
+
+        docs = reader.docs
+        ranked = [(docs[d], score) for d, score in scores.items() if docs[d]]
+        key = lambda x: (-x[1], x[0])  # noqa: E731
+        if top_k is None:
+            return sorted(ranked, key=key)
+        return heapq.nsmallest(top_k, ranked, key=key)
+
+    def phrase_docs(self, phrase: str) -> Set[str]:
+        """
+        Find entities containing phrase, using term positions.
+
+        Stopwords inside the phrase are treated as wildcards of the same
+        width (positions count every word).
+        """
+        reader = self.reader
+        if reader is None:
+            return set()
+        terms, _ = self._tokenize_positions(phrase)
+        pairs = sorted((p, t) for t, ps in terms.items() for p in ps)
+        if not pairs:
+            return set()
+        base = pairs[0][0]
+        offsets = [(t, p - base) for p, t in pairs]
+
+        position_maps = {t: reader.positions(t) for t in terms}
+        if any(not pm for pm in position_maps.values()):
+            return set()
+        candidates = set.intersection(*(set(pm) for pm in position_maps.values()))
+
+        first_term = offsets[0][0]
+        matches = set()
+        for doc_id in candidates:
+            doc_positions = {t: set(pm[doc_id]) for t, pm in position_maps.items()}
+            for start in position_maps[first_term][doc_id]:
+                if all(start + off in doc_positions[t] for t, off in offsets):
+                    matches.add(reader.docs[doc_id])
+                    break
+        matches.discard("")
+        return matches
+
+    def _scan_files(self) -> Dict[str, Tuple[Path, os.stat_result]]:
+        """Stat every markdown file under the configured index directories."""
+        files = {}
+        for dir_name in _resolve_index_dirs():
+            dir_path = self.brain_path / dir_name
+            if not dir_path.exists():
+                continue
+            for md_file in dir_path.rglob("*.md"):
+                try:
+                    files[md_file.relative_to(self.brain_path).as_posix()] = (
+                        md_file,
+                        md_file.stat(),
+                    )
+                except OSError:
+                    continue
+        return files
+
+    def _analyze_files(
+        self, paths: List[Path], workers: Optional[int] = None
+    ) -> List[Tuple[Optional[Tuple[str, str, Dict[str, List[int]], int]], Optional[str]]]:
+        """
+        Analyze files serially or across a process pool.
+
+        Args:
+            paths: Files to analyze
+            workers: Pool size (defaults to self.workers)
 
-        return sorted(result)
+        Returns:
+            [(analysis or None, error or None)] aligned with paths
+        """
+        workers = self.workers if workers is None else workers
+        if workers > 1 and len(paths) >= PARALLEL_MIN_FILES:
+            shard_size = max(1, -(-len(paths) // (workers * SHARDS_PER_WORKER)))
+            shards = [
+                [str(p) for p in paths[i : i + shard_size]]
+                for i in range(0, len(paths), shard_size)
+            ]
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = []
+                    for shard in pool.map(
+                        _analyze_shard, [str(self.brain_path)] * len(shards), shards
+                    ):
+                        results.extend((analysis, error) for _, analysis, error in shard)
+                    return results
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning("Parallel analysis failed, continuing serially: %s", e)
+
+        results = []
+        for md_file in paths:
+            try:
+                results.append((self._analyze_file(md_file), None))
+            except Exception as e:
+                results.append((None, str(e)))
+        return results
+
+    def _analyze_file(
+        self, md_file: Path
+    ) -> Tuple[str, str, Dict[str, List[int]], int]:
+        """Return (entity_id, content hash, term positions, word count) for one file."""
+        with open(md_file, "r", encoding="utf-8") as f:
+            content = f.read()
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+        terms, word_count = self._tokenize_positions(self._strip_markdown(content))
+        return self._file_to_entity_id(md_file), content_hash, terms, word_count
+
+    @staticmethod
+    def _merge_analyses(
+        parts: List[Tuple[Dict[str, List[int]], int]]
+    ) -> Dict[str, List[int]]:
+        """Merge several files of one entity into one document (positions offset)."""
+        if len(parts) == 1:
+            return parts[0][0]
+        merged: Dict[str, List[int]] = {}
+        offset = 0
+        for terms, word_count in parts:
+            for term, positions in terms.items():
+                merged.setdefault(term, []).extend(p + offset for p in positions)
+            offset += word_count
+        return merged
 
     def _file_to_entity_id(self, file_path: Path) -> str:
         """Convert file path to entity ID."""
@@ -439,7 +1258,9 @@ class BrainIndex:
         return f"{entity_type}/{name}"
 
     def _get_type_map(self) -> Dict[str, str]:
-        """Get directory-to-type mapping from config with defaults."""
+        """Get directory-to-type mapping from config with defaults (cached)."""
+        if self._type_map is not None:
+            return self._type_map
         default_map = {
             "Entities": "entity",
             "Projects": "project",
@@ -457,13 +1278,17 @@ class BrainIndex:
                     default_map.update(custom)
             except Exception:
                 pass
+        self._type_map = default_map
         return default_map
 
     def _extract_text(self, file_path: Path) -> str:
         """Extract searchable text from markdown file, stripping frontmatter."""
         with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+            return self._strip_markdown(f.read())
 
+    @staticmethod
+    def _strip_markdown(content: str) -> str:
+        """Strip frontmatter and markdown formatting from file content."""
         # Remove YAML frontmatter
         if content.startswith("---"):
             end = content.find("---", 3)
@@ -486,48 +1311,137 @@ class BrainIndex:
 
         return content
 
-    def _tokenize_and_stem(self, text: str) -> Set[str]:
-        """Tokenize text and stem each token."""
+    def _tokenize_positions(self, text: str) -> Tuple[Dict[str, List[int]], int]:
+        """
+        Tokenize and stem text, keeping word positions.
+
+        Returns:
+            ({stem: [word positions]}, total word count). Positions count
+            every word, including skipped stopwords, so phrases keep gaps.
+        """
         # Extract words (letters and numbers)
-        words = re.findall(r"\b[a-zA-Z][a-zA-Z0-9]*\b", text.lower())
+        words = _WORD_RE.findall(text.lower())
 
-        tokens = set()
-        for word in words:
-            # Skip stopwords and very short words
-            if word in self.stopwords or len(word) < 3:
-                continue
+        # Stem each distinct non-stopword once, then map positions through it
+        stopwords = self.stopwords
+        stems = self.stemmer.stem_many(
+            w for w in set(words) - stopwords if len(w) >= 3
+        )
+        get_stem = stems.get
 
-            # Stem the word
-            stemmed = self.stemmer.stem(word)
-            if len(stemmed) >= 2:
-                tokens.add(stemmed)
+        terms: Dict[str, List[int]] = defaultdict(list)
+        for pos, word in enumerate(words):
+            stemmed = get_stem(word)
+            if stemmed is not None and len(stemmed) >= 2:
+                terms[stemmed].append(pos)
 
-        return tokens
+        return dict(terms), len(words)
+
+    def _tokenize_and_stem(self, text: str) -> Set[str]:
+        """Tokenize text and stem each token."""
+        return set(self._tokenize_positions(text)[0])
 
     def stats(self) -> Dict[str, Any]:
         """Return index statistics."""
-        if not self.index:
+        if self.reader is None:
             self.load()
 
-        if not self.index:
+        reader = self.reader
+        if reader is None or not reader.terms:
             return {"error": "No index loaded"}
 
         # Top 20 most common tokens
-        token_counts = [
-            (token, len(entities)) for token, entities in self.index.items()
-        ]
+        token_counts = [(token, reader.doc_freq(token)) for token in reader.terms]
         token_counts.sort(key=lambda x: -x[1])
 
-        return {
+        stats = {
             "meta": self.meta,
             "top_tokens": token_counts[:20],
-            "total_tokens": len(self.index),
+            "total_tokens": len(reader.terms),
             "avg_postings_per_token": (
-                sum(len(v) for v in self.index.values()) / len(self.index)
-                if self.index
-                else 0
+                sum(c for _, c in token_counts) / len(token_counts)
             ),
+            "avg_doc_length": round(reader.avgdl, 1),
         }
+        if self.index_file.exists():
+            stats["index_size_kb"] = round(self.index_file.stat().st_size / 1024, 1)
+        return stats
+
+
+def _benchmark_stemming(doc_count: int, words_per_doc: int = 300) -> Dict[str, Any]:
+    """
+    Compare per-token stemming with vocabulary-deduplicated stem_many.
+
+    Documents draw from a Zipf-distributed vocabulary of inflected words,
+    approximating how entity notes reuse a small vocabulary.
+    """
+    rng = random.Random(5)
+    roots = [
+        "".join(rng.choice("bcdfghklmnprstvw") + rng.choice("aeiou") for _ in range(rng.randint(2, 4)))
+        for _ in range(3000)
+    ]
+    suffixes = ["", "s", "ing", "ed", "ation", "ness", "ful", "izer", "ies", "ational"]
+    vocab = [r + rng.choice(suffixes) for r in roots]
+    weights = [1.0 / (i + 1) for i in range(len(vocab))]
+    docs = [" ".join(rng.choices(vocab, weights, k=words_per_doc)) for _ in range(doc_count)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        indexer = BrainIndex(Path(tmp))
+
+        def per_token(text: str, stem) -> Dict[str, List[int]]:
+            """Tokenization as it was before stem_many: one stem call per token."""
+            terms: Dict[str, List[int]] = defaultdict(list)
+            for pos, word in enumerate(_WORD_RE.findall(text.lower())):
+                if word in indexer.stopwords or len(word) < 3:
+                    continue
+                stemmed = stem(word)
+                if len(stemmed) >= 2:
+                    terms[stemmed].append(pos)
+            return dict(terms)
+
+        def timed(tokenize) -> float:
+            """Run tokenize over every document with GC paused; return ms."""
+            gc.collect()
+            gc.disable()
+            try:
+                t0 = time.perf_counter()
+                for d in docs:
+                    tokenize(d)
+                return (time.perf_counter() - t0) * 1000
+            finally:
+                gc.enable()
+
+        timings = {}
+        uncached = PorterStemmer(max_cache=0)
+        timings["per_token_uncached_ms"] = timed(
+            lambda d: per_token(d, uncached._stem_uncached)
+        )
+        cached = PorterStemmer()
+        timings["per_token_cached_ms"] = timed(lambda d: per_token(d, cached.stem))
+        timings["stem_many_cold_ms"] = timed(indexer._tokenize_positions)
+        indexer.stemmer.save_cache(indexer.stem_cache_file)
+
+        warm_indexer = BrainIndex(Path(tmp))
+        t0 = time.perf_counter()
+        warm_indexer._load_stem_cache()
+        timings["cache_load_ms"] = (time.perf_counter() - t0) * 1000
+        timings["stem_many_warm_ms"] = timed(warm_indexer._tokenize_positions)
+
+        sample = docs[:200]
+        identical = all(
+            per_token(d, uncached._stem_uncached) == warm_indexer._tokenize_positions(d)[0]
+            for d in sample
+        )
+
+        result: Dict[str, Any] = {
+            "docs": doc_count,
+            "tokens": doc_count * words_per_doc,
+            "distinct_words": len(set(w for d in docs for w in d.split())),
+        }
+        result.update((k, round(v, 1)) for k, v in timings.items())
+        result["stem_cache_entries"] = len(warm_indexer.stemmer.cache)
+        result["results_identical"] = identical
+        return result
 
 
 def main():
@@ -538,6 +1452,23 @@ def main():
         "--rebuild", action="store_true", help="Force rebuild even if index exists"
     )
     parser.add_argument("--brain-path", type=str, help="Path to brain directory")
+    parser.add_argument(
+        "--benchmark-stem",
+        type=int,
+        metavar="N",
+        help="Benchmark tokenization/stemming over N synthetic documents",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes for reading/tokenizing files (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--no-graph",
+        action="store_true",
+        help="Do not recompile the relationship graph (graph_index.bin)",
+    )
 
     args = parser.parse_args()
 
@@ -546,8 +1477,12 @@ def main():
         level=logging.INFO, format="%(levelname)s: %(message)s"
     )
 
+    if args.benchmark_stem:
+        print(json.dumps(_benchmark_stemming(args.benchmark_stem), indent=2))
+        return
+
     brain_path = Path(args.brain_path) if args.brain_path else _resolve_brain_dir()
-    indexer = BrainIndex(brain_path)
+    indexer = BrainIndex(brain_path, workers=args.workers)
 
     if args.stats:
         stats = indexer.stats()
@@ -560,20 +1495,30 @@ def main():
             indexer.build()
             indexer.save()
 
-        results = indexer.search(args.search)
+        tokens = indexer._tokenize_and_stem(args.search)
+        results = indexer.search_bm25([[t] for t in tokens], top_k=20)
         print(f"Query: {args.search}")
         print(f"Results ({len(results)}):")
-        for entity_id in results[:20]:
-            print(f"  - {entity_id}")
+        for entity_id, score in results:
+            print(f"  - {entity_id} ({score:.2f})")
         return
 
-    # Build or rebuild index
-    if args.rebuild or not indexer.index_file.exists():
+    # Full rebuild on request; otherwise update only what changed
+    if args.rebuild:
         indexer.build()
         indexer.save()
     else:
-        print(f"Index already exists at {indexer.index_file}")
-        print("Use --rebuild to force rebuild")
+        print(json.dumps(indexer.update(), indent=2))
+
+    if not args.no_graph:
+        try:
+            from pm_os_brain.tools.index.graph_store import compile_graph
+        except ImportError:
+            from index.graph_store import compile_graph
+        try:
+            compile_graph(brain_path)
+        except (ImportError, OSError) as e:
+            logger.warning("Graph index not compiled: %s", e)
 
 
 if __name__ == "__main__":
@@ -25,6 +25,9 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# main(argv) can be called repeatedly in one process (pipeline/tool_runner.py)
+REENTRANT = True
+
 # Standalone support
 PLUGIN_ROOT = Path(__file__).resolve().parent.parent.parent
 
@@ -372,7 +375,7 @@ class BrainIndexGenerator:
         return self._format_index(tier1, tier2)
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """CLI entry point."""
     import argparse
 
@@ -384,7 +387,7 @@ def main():
     parser = argparse.ArgumentParser(description="Generate BRAIN.md compressed index")
     parser.add_argument("--brain-path", type=Path, help="Path to brain directory")
     parser.add_argument("--output", type=Path, help="Output file path")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     generator = BrainIndexGenerator(brain_path=args.brain_path)
     content = generator.generate()
@@ -398,6 +401,31 @@ def main():
     size_kb = len(content.encode("utf-8")) / 1024
     print(f"Generated {output_path} ({size_kb:.1f}KB)")
 
+    # Keep the compiled relationship graph in step with the entities
+    try:
+        try:
+            from pm_os_brain.tools.index.graph_store import load_or_compile
+        except ImportError:
+            tools_dir = str(Path(__file__).resolve().parent.parent)
+            if tools_dir not in sys.path:
+                sys.path.insert(0, tools_dir)
+            from index.graph_store import load_or_compile
+        graph = load_or_compile(generator.brain_path)
+        if graph is not None:
+            graph.close()
+    except (ImportError, OSError) as e:
+        logger.warning("Graph index not refreshed: %s", e)
+
+    # Daily entity checkpoint for point-in-time queries (no-op if recent)
+    try:
+        try:
+            from pm_os_brain.tools.temporal.temporal_query import TemporalQuery
+        except ImportError:
+            from temporal.temporal_query import TemporalQuery
+        TemporalQuery(generator.brain_path).checkpoint()
+    except Exception as e:
+        logger.warning("Temporal checkpoint not taken: %s", e)
+
 
 if __name__ == "__main__":
     main()
@@ -65,6 +65,17 @@ except ImportError:
         BrainSearch = None
         SearchResult = None
 
+try:
+    from pm_os_brain.tools.quality.graph_analytics import from_compiled
+except ImportError:
+    try:
+        from quality.graph_analytics import from_compiled
+    except ImportError:
+        from_compiled = None
+
+# Max relative score boost for the most central (highest PageRank) entity
+DEFAULT_CENTRALITY_WEIGHT = 0.1
+
 
 def _resolve_brain_dir() -> Path:
     """Resolve brain directory from config/paths, no hardcoded values."""
@@ -126,14 +137,22 @@ class BrainQuery:
     Orchestrates keyword search and graph expansion to find relevant entities.
     """
 
-    def __init__(self, brain_path: Optional[Path] = None):
+    def __init__(
+        self,
+        brain_path: Optional[Path] = None,
+        centrality_weight: float = DEFAULT_CENTRALITY_WEIGHT,
+    ):
         """
         Initialize the query system.
 
         Args:
             brain_path: Path to brain directory (defaults to user/brain)
+            centrality_weight: Max PageRank boost applied when merging
+                               graph results (0 disables it)
         """
         self.brain_path = Path(brain_path) if brain_path else _resolve_brain_dir()
+        self.centrality_weight = centrality_weight
+        self._centrality: Optional[Dict[str, float]] = None
 
         # Initialize components (lazy loading for speed)
         self._search: Optional[BrainSearch] = None
@@ -153,6 +172,19 @@ class BrainQuery:
             self._graph = BrainGraph(self.brain_path)
         return self._graph
 
+    @property
+    def centrality(self) -> Dict[str, float]:
+        """PageRank per entity, normalized to the top entity (lazy)."""
+        if self._centrality is None:
+            self._centrality = {}
+            compiled = self.graph.compiled if from_compiled is not None else None
+            if compiled is not None and compiled.nodes:
+                ranks = from_compiled(compiled, with_bridges=False).pagerank_by_id()
+                top = max(ranks.values())
+                if top > 0:
+                    self._centrality = {eid: pr / top for eid, pr in ranks.items()}
+        return self._centrality
+
     def query(
         self,
         query: str,
@@ -212,7 +244,8 @@ class BrainQuery:
 
     def _merge_and_rank(self, seeds, neighbors) -> List:
         """
-        Merge seeds and neighbors, max score wins on collision.
+        Merge seeds and neighbors, max score wins on collision, then
+        scale each score by up to (1 + centrality_weight) by PageRank.
 
         Args:
             seeds: Results from BRAIN search
@@ -242,6 +275,11 @@ class BrainQuery:
                     if reason not in existing.match_reasons:
                         existing.match_reasons.append(reason)
 
+        if self.centrality_weight:
+            centrality = self.centrality
+            for r in merged.values():
+                r.score *= 1 + self.centrality_weight * centrality.get(r.entity_id, 0.0)
+
         return list(merged.values())
 
     def get_entity_context(
@@ -4,7 +4,10 @@ Brain Search - BRAIN Keyword Search Component
 
 Implements keyword search across aliases and content using:
 - O(1) alias lookup via registry alias_index
-- O(1) content lookup via inverted index
+- O(log n + k) alias prefix and bounded-edit-distance fuzzy lookup
+  via AliasPrefixIndex (alias_prefix_index.json)
+- BM25-ranked content lookup via the positional inverted index
+  (quoted "phrases" are matched on term positions)
 - Query expansion for common synonyms
 - AND semantics for multi-word queries
 - Relevance scoring
@@ -53,6 +56,17 @@ except ImportError:
         BrainIndex = None
         PorterStemmer = None
 
+try:
+    from pm_os_brain.tools.index.alias_prefix_index import (
+        INDEX_FILENAME as ALIAS_INDEX_FILENAME,
+        AliasPrefixIndex,
+    )
+except ImportError:
+    from index.alias_prefix_index import (
+        INDEX_FILENAME as ALIAS_INDEX_FILENAME,
+        AliasPrefixIndex,
+    )
+
 # Try to import yaml
 try:
     import yaml
@@ -85,9 +99,13 @@ def _resolve_brain_dir() -> Path:
 # Scoring weights
 SCORE_ALIAS_EXACT = 1.0
 SCORE_ALIAS_PARTIAL = 0.5
+SCORE_ALIAS_FUZZY = 0.3
 SCORE_CONTENT_TITLE = 0.3
 SCORE_CONTENT_BODY = 0.1
 
+# Content candidates ranked by BM25 before merging with alias results
+CONTENT_TOP_K = 100
+
 
 @dataclass
 class SearchResult:
@@ -121,10 +139,12 @@ class BrainSearch:
     ):
         self.brain_path = Path(brain_path) if brain_path else _resolve_brain_dir()
         self.stemmer = PorterStemmer() if PorterStemmer else None
+        self._registry = registry if registry else None
 
-        # Load registry and build alias index
-        self.registry = registry if registry else self._load_registry()
-        self.alias_index = self._build_alias_index()
+        # Alias index: reuse the persisted prefix index while registry.yaml
+        # is unchanged, otherwise build from the registry and persist it
+        self.alias_prefix_index = self._load_alias_prefix_index()
+        self.alias_index = self.alias_prefix_index.as_dict()
 
         # Load content index
         self.content_index = self._load_content_index()
@@ -132,6 +152,13 @@ class BrainSearch:
         # Query expansion dictionary (synonyms) — loaded from config
         self.synonyms = self._build_synonym_dict()
 
+    @property
+    def registry(self) -> Dict:
+        """Registry (loaded on first use; not needed when the alias index is cached)."""
+        if self._registry is None:
+            self._registry = self._load_registry()
+        return self._registry
+
     def search(self, query: str, limit: int = 20) -> List[SearchResult]:
         """
         Search for entities matching query.
@@ -152,7 +179,7 @@ class BrainSearch:
         alias_results = self._search_aliases(query)
 
         # 2. Content matches via inverted index
-        content_results = self._search_content(query)
+        content_results = self._search_content(query, top_k=max(CONTENT_TOP_K, limit))
 
         # 3. Merge and rank (dedup, max score wins)
         merged = self._merge_results(alias_results, content_results)
@@ -201,23 +228,42 @@ class BrainSearch:
                     results[entity_id].score = min(1.0, results[entity_id].score + 0.1)
 
             # Prefix matching on aliases (for partial word matches)
-            for alias, (cat, entity_id, file_path) in self.alias_index.items():
-                if alias.startswith(term) and len(alias) <= len(term) + 3:
-                    if entity_id not in results:
-                        results[entity_id] = SearchResult(
-                            entity_id=entity_id,
-                            score=SCORE_ALIAS_PARTIAL
-                            * 0.8,  # Slightly lower for prefix
-                            source="alias",
-                            match_reasons=[f'alias prefix: "{term}" -> "{alias}"'],
-                            file_path=file_path,
-                        )
+            for alias, (cat, entity_id, file_path) in self.alias_prefix_index.prefix(
+                term, max_extra=3
+            ):
+                if entity_id not in results:
+                    results[entity_id] = SearchResult(
+                        entity_id=entity_id,
+                        score=SCORE_ALIAS_PARTIAL
+                        * 0.8,  # Slightly lower for prefix
+                        source="alias",
+                        match_reasons=[f'alias prefix: "{term}" -> "{alias}"'],
+                        file_path=file_path,
+                    )
+
+            # Fuzzy matching for typos (longer terms only, to limit noise)
+            if len(term) >= 4:
+                max_distance = 2 if len(term) >= 8 else 1
+                for alias, dist, (cat, entity_id, file_path) in (
+                    self.alias_prefix_index.fuzzy(term, max_distance=max_distance)
+                ):
+                    if dist == 0 or entity_id in results:
+                        continue
+                    results[entity_id] = SearchResult(
+                        entity_id=entity_id,
+                        score=SCORE_ALIAS_FUZZY / dist,
+                        source="alias",
+                        match_reasons=[f'alias fuzzy: "{term}" ~ "{alias}"'],
+                        file_path=file_path,
+                    )
 
         return list(results.values())
 
-    def _search_content(self, query: str) -> List[SearchResult]:
-        """Search content via inverted index with AND semantics."""
-        if not self.content_index:
+    def _search_content(
+        self, query: str, top_k: int = CONTENT_TOP_K
+    ) -> List[SearchResult]:
+        """Search content via the BM25 inverted index with AND semantics."""
+        if self.content_index is None:
             return []
 
         # Tokenize and stem query
@@ -225,44 +271,50 @@ class BrainSearch:
         if not tokens:
             return []
 
-        # Expand query with synonyms
-        expanded_tokens = self._expand_query(tokens)
-
-        # Get posting lists for each token
-        posting_lists = []
-        matched_tokens = []
+        # Each query token matches itself or any of its synonyms; tokens
+        # absent from every document are dropped rather than failing the AND
+        groups = [
+            [token] + self.synonyms.get(token, []) for token in dict.fromkeys(tokens)
+        ]
+        groups = [g for g in groups if any(t in self.content_index for t in g)]
+        if not groups:
+            return []
+        phrases = re.findall(r'"([^"]+)"', query)
+        ranked = self.content_index.search_bm25(
+            groups, top_k=None if phrases else top_k, require_all=True
+        )
 
-        for token in expanded_tokens:
-            if token in self.content_index:
-                posting_lists.append(set(self.content_index[token]))
-                matched_tokens.append(token)
+        # Quoted phrases must appear verbatim (by term position)
+        for phrase in phrases:
+            allowed = self.content_index.phrase_docs(phrase)
+            ranked = [(e, score) for e, score in ranked if e in allowed]
+        ranked = ranked[:top_k]
 
-        if not posting_lists:
+        if not ranked:
             return []
 
-        # AND semantics: intersection of all posting lists
-        result_set = posting_lists[0]
-        for pl in posting_lists[1:]:
-            result_set = result_set.intersection(pl)
+        matched_tokens = [t for g in groups for t in g if t in self.content_index]
+        best = ranked[0][1]
+        query_terms = query.lower().split()
 
-        # Score based on token coverage
         results = []
-        for entity_id in result_set:
-            # Calculate score based on how many tokens matched
-            coverage = len(matched_tokens) / len(tokens) if tokens else 0
-            score = SCORE_CONTENT_BODY * coverage
+        for entity_id, bm25 in ranked:
+            relevance = bm25 / best if best > 0 else 0.0
+            score = SCORE_CONTENT_BODY * relevance
 
             # Boost if entity name contains query terms
             entity_name = entity_id.split("/")[-1].replace("-", " ")
-            if any(term in entity_name for term in query.lower().split()):
-                score = max(score, SCORE_CONTENT_TITLE)
+            if any(term in entity_name for term in query_terms):
+                score = SCORE_CONTENT_TITLE + SCORE_CONTENT_BODY * relevance * 0.5
 
             results.append(
                 SearchResult(
                     entity_id=entity_id,
                     score=score,
                     source="content",
-                    match_reasons=[f'content: {", ".join(matched_tokens)}'],
+                    match_reasons=[
+                        f'content (bm25 {bm25:.2f}): {", ".join(matched_tokens)}'
+                    ],
                 )
             )
 
@@ -510,19 +562,29 @@ class BrainSearch:
 
         return index
 
-    def _load_content_index(self) -> Dict[str, List[str]]:
-        """Load content index from JSON file."""
-        index_file = self.brain_path / "content_index.json"
-        if not index_file.exists():
-            return {}
+    def _load_alias_prefix_index(self) -> AliasPrefixIndex:
+        """Load the persisted alias prefix index, rebuilding it if stale."""
+        index_file = self.brain_path / ALIAS_INDEX_FILENAME
+        registry_file = self.brain_path / "registry.yaml"
 
-        try:
-            with open(index_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return data.get("index", {})
-        except Exception as e:
-            logger.error("Error loading content index: %s", e)
-            return {}
+        # An explicitly supplied registry may not match the file on disk
+        from_disk = self._registry is None
+        if from_disk:
+            cached = AliasPrefixIndex.load(index_file, registry_file)
+            if cached is not None:
+                return cached
+
+        index = AliasPrefixIndex(self._build_alias_index())
+        if from_disk and registry_file.exists():
+            index.save(index_file, registry_file)
+        return index
+
+    def _load_content_index(self) -> Optional["BrainIndex"]:
+        """Open the content index (memory-mapped), or None if not built."""
+        if BrainIndex is None:
+            return None
+        index = BrainIndex(self.brain_path)
+        return index if index.load() else None
 
     def semantic_search(
         self,
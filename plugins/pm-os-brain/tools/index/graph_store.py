@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""
+Graph Store - Compiled CSR adjacency for Brain relationship traversal
+
+Compiles every entity's $relationships into integer adjacency arrays so
+graph expansion never reads or YAML-parses markdown. Targets are
+resolved to node ids once, at compile time, through CanonicalResolver.
+
+File layout (graph_index.bin):
+    magic "PMBG" | u32 format version | u64 header length | header JSON
+    | padding to 4 bytes | columns
+
+The JSON header holds the build meta, the node table (canonical ids,
+node id = position) and a string table (relationship types, raw targets,
+sources, verification dates, extra fields; index 0 is the empty string).
+The columns are little-endian 4-byte arrays read through mmap:
+    offsets     u32 x (nodes + 1)   edges of node i: offsets[i]:offsets[i+1]
+    targets     u32 x edges         target node id, NO_NODE if unresolved
+    raw_targets u32 x edges         string id of the target as written
+    rel_types   u32 x edges         string id of the relationship type
+    sources     u32 x edges         string id of rel "source"
+    verified    u32 x edges         string id of rel "last_verified"
+    extras      u32 x edges         string id of the other rel fields as a
+                                    JSON object, "" when there are none
+    strengths   f32 x edges         rel "strength", NaN if not set
+    confidences f32 x edges         rel "confidence", NaN if not set
+
+The build meta records the entity file count and newest mtime, and
+load_or_compile() recompiles when either no longer matches the brain.
+Compiled by brain_index.py after each build/update, by brain_enrich.py
+and brain_index_generator.py, or on demand by BrainGraph.
+
+Usage:
+    python graph_store.py                 # Compile graph_index.bin
+    python graph_store.py --stats         # Show node/edge counts
+    python graph_store.py --neighbors ID  # Print an entity's edges
+"""
+
+import argparse
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Standalone support
+PLUGIN_ROOT = Path(__file__).resolve().parent.parent.parent
+
+try:
+    from pm_os_base.tools.core.path_resolver import get_paths
+except ImportError:
+    try:
+        from core.path_resolver import get_paths
+    except ImportError:
+        get_paths = None
+
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import get_shared_cache
+
+MAGIC = b"PMBG"
+FORMAT_VERSION = 2
+GRAPH_FILENAME = "graph_index.bin"
+NO_NODE = 0xFFFFFFFF
+_PREAMBLE = struct.Struct("<4sIQ")
+_U32_COLUMNS = ("targets", "raw_targets", "rel_types", "sources", "verified", "extras")
+_F32_COLUMNS = ("strengths", "confidences")
+
+
+class Edge(NamedTuple):
+    """One compiled relationship."""
+
+    target: Optional[str]  # canonical target id, None if unresolved
+    raw_target: str
+    rel_type: str
+    strength: Optional[float]
+    confidence: Optional[float]
+    source: str
+    last_verified: str
+    extra: Dict[str, Any]  # any other relationship fields
+
+    def as_relationship(self) -> Dict[str, Any]:
+        """Rebuild the $relationships entry this edge was compiled from."""
+        rel: Dict[str, Any] = {"type": self.rel_type, "target": self.raw_target}
+        if self.strength is not None:
+            rel["strength"] = self.strength
+        if self.confidence is not None:
+            rel["confidence"] = self.confidence
+        if self.source:
+            rel["source"] = self.source
+        if self.last_verified:
+            rel["last_verified"] = self.last_verified
+        rel.update(self.extra)
+        return rel
+
+
+def _to_float(value: Any) -> float:
+    """Numeric relationship field as float, NaN when missing or invalid."""
+    if value is None or isinstance(value, bool):
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _column(buf: Union[bytes, mmap.mmap], start: int, count: int, code: str):
+    """Zero-copy view of a little-endian 4-byte column."""
+    view = memoryview(buf)[start : start + 4 * count]
+    if sys.byteorder == "little":
+        return view.cast(code)
+    column = array(code, view.tobytes())
+    column.byteswap()
+    return column
+
+
+class CompiledGraph:
+    """Read-only CSR adjacency over Brain entities."""
+
+    def __init__(
+        self,
+        header: Dict[str, Any],
+        buf: Union[bytes, mmap.mmap],
+        base: int,
+    ):
+        self.meta: Dict[str, Any] = header.get("meta", {})
+        self.nodes: List[str] = header.get("nodes", [])
+        self.strings: List[str] = header.get("strings", [""])
+        self.node_ids: Dict[str, int] = {n: i for i, n in enumerate(self.nodes)}
+        self.edge_count: int = self.meta.get("edge_count", 0)
+        self._buf = buf
+        self._slugs: Optional[Dict[str, int]] = None
+
+        n, m = len(self.nodes), self.edge_count
+        self.offsets = _column(buf, base, n + 1, "I")
+        pos = base + 4 * (n + 1)
+        for name in _U32_COLUMNS:
+            setattr(self, name, _column(buf, pos, m, "I"))
+            pos += 4 * m
+        for name in _F32_COLUMNS:
+            setattr(self, name, _column(buf, pos, m, "f"))
+            pos += 4 * m
+
+    @classmethod
+    def open(cls, path: Path) -> Optional["CompiledGraph"]:
+        """Memory-map a compiled graph. Returns None if missing or invalid."""
+        try:
+            with open(path, "rb") as f:
+                preamble = f.read(_PREAMBLE.size)
+                if len(preamble) < _PREAMBLE.size:
+                    return None
+                magic, version, header_len = _PREAMBLE.unpack(preamble)
+                if magic != MAGIC or version != FORMAT_VERSION:
+                    logger.warning("Unsupported graph index format in %s", path)
+                    return None
+                header = json.loads(f.read(header_len).decode("utf-8"))
+                base = _aligned(_PREAMBLE.size + header_len)
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, struct.error) as e:
+            logger.error("Error loading graph index: %s", e)
+            return None
+        return cls(header, buf, base)
+
+    def node(self, entity_id: str) -> Optional[int]:
+        """Node id for a canonical id, or for a bare slug (entity/x/<slug>)."""
+        node = self.node_ids.get(entity_id)
+        if node is not None:
+            return node
+        if self._slugs is None:
+            slugs: Dict[str, int] = {}
+            for i, canonical in enumerate(self.nodes):
+                slugs.setdefault(canonical.rsplit("/", 1)[-1].lower(), i)
+            self._slugs = slugs
+        return self._slugs.get(entity_id.lower())
+
+    def degree(self, node: int) -> int:
+        """Number of outgoing edges of a node."""
+        return self.offsets[node + 1] - self.offsets[node]
+
+    def edge_range(self, node: int) -> range:
+        """Edge ids of a node's outgoing relationships."""
+        return range(self.offsets[node], self.offsets[node + 1])
+
+    def edge(self, e: int) -> Edge:
+        """Decode one edge."""
+        target = self.targets[e]
+        strength = self.strengths[e]
+        confidence = self.confidences[e]
+        extra = self.strings[self.extras[e]]
+        return Edge(
+            target=None if target == NO_NODE else self.nodes[target],
+            raw_target=self.strings[self.raw_targets[e]],
+            rel_type=self.strings[self.rel_types[e]],
+            # float32 storage: round back to the precision that was written
+            strength=None if math.isnan(strength) else round(strength, 6),
+            confidence=None if math.isnan(confidence) else round(confidence, 6),
+            source=self.strings[self.sources[e]],
+            last_verified=self.strings[self.verified[e]],
+            extra=json.loads(extra) if extra else {},
+        )
+
+    def edges(self, entity_id: str) -> Iterator[Edge]:
+        """Outgoing edges of an entity (nothing if not in the graph)."""
+        node = self.node(entity_id)
+        if node is None:
+            return iter(())
+        return (self.edge(e) for e in self.edge_range(node))
+
+    def stats(self) -> Dict[str, Any]:
+        """Node/edge counts and build metadata."""
+        unresolved = sum(1 for t in self.targets if t == NO_NODE)
+        return {
+            "nodes": len(self.nodes),
+            "edges": self.edge_count,
+            "unresolved_edges": unresolved,
+            "built_at": self.meta.get("built_at"),
+        }
+
+    def is_fresh(self, fingerprint: Dict[str, int]) -> bool:
+        """Whether the graph was compiled from the files described."""
+        return self.meta.get("sources") == fingerprint
+
+    def close(self) -> None:
+        """Release the memory map."""
+        for name in ("offsets",) + _U32_COLUMNS + _F32_COLUMNS:
+            column = getattr(self, name, None)
+            if isinstance(column, memoryview):
+                column.release()
+        if isinstance(self._buf, mmap.mmap):
+            try:
+                self._buf.close()
+            except BufferError:
+                pass  # a caller still holds a column; freed with it
+        self._buf = b""
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 3) & ~3
+
+
+# Relationship fields with their own column; the rest go to "extras"
+_COLUMN_FIELDS = frozenset(
+    ("target", "type", "source", "last_verified", "strength", "confidence")
+)
+
+
+def source_fingerprint(brain_path: Path) -> Dict[str, int]:
+    """Entity file count and newest mtime (stat only, no reads)."""
+    files = newest = 0
+    for _, st in get_shared_cache(Path(brain_path)).iter_entity_files():
+        files += 1
+        newest = max(newest, st.st_mtime_ns)
+    return {"files": files, "max_mtime_ns": newest}
+
+
+class GraphBuilder:
+    """Accumulates nodes and edges, then writes the compiled file."""
+
+    def __init__(self):
+        self.nodes: List[str] = []
+        self.node_ids: Dict[str, int] = {}
+        self.strings: List[str] = [""]
+        self.string_ids: Dict[str, int] = {"": 0}
+        self.adjacency: List[List[tuple]] = []
+
+    def add_node(self, canonical_id: str) -> int:
+        node = self.node_ids.get(canonical_id)
+        if node is None:
+            node = len(self.nodes)
+            self.node_ids[canonical_id] = node
+            self.nodes.append(canonical_id)
+            self.adjacency.append([])
+        return node
+
+    def _string(self, value: Any) -> int:
+        text = "" if value is None else str(value)
+        sid = self.string_ids.get(text)
+        if sid is None:
+            sid = len(self.strings)
+            self.string_ids[text] = sid
+            self.strings.append(text)
+        return sid
+
+    def add_edge(
+        self, source: int, target: Optional[int], rel: Dict[str, Any]
+    ) -> None:
+        extra = {k: v for k, v in rel.items() if k not in _COLUMN_FIELDS}
+        self.adjacency[source].append((
+            NO_NODE if target is None else target,
+            self._string(rel.get("target")),
+            self._string(rel.get("type", "related_to")),
+            self._string(rel.get("source")),
+            self._string(rel.get("last_verified")),
+            self._string(
+                json.dumps(extra, default=str, separators=(",", ":")) if extra else ""
+            ),
+            _to_float(rel.get("strength")),
+            _to_float(rel.get("confidence")),
+        ))
+
+    def write(self, path: Path, meta: Optional[Dict[str, Any]] = None) -> None:
+        """Atomically write graph_index.bin."""
+        offsets = array("I", [0])
+        columns = [array("I") for _ in _U32_COLUMNS] + [array("f") for _ in _F32_COLUMNS]
+        for edges in self.adjacency:
+            for edge in edges:
+                for column, value in zip(columns, edge):
+                    column.append(value)
+            offsets.append(len(columns[0]))
+
+        header = {
+            "meta": dict(
+                meta or {},
+                node_count=len(self.nodes),
+                edge_count=len(columns[0]),
+                built_at=datetime.now().isoformat(),
+            ),
+            "nodes": self.nodes,
+            "strings": self.strings,
+        }
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        padding = _aligned(_PREAMBLE.size + len(header_bytes)) - (
+            _PREAMBLE.size + len(header_bytes)
+        )
+
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+                f.write(header_bytes)
+                f.write(b"\0" * padding)
+                for column in [offsets] + columns:
+                    if sys.byteorder != "little":
+                        column.byteswap()
+                    f.write(column.tobytes())
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+def compile_graph(
+    brain_path: Path,
+    resolver=None,
+    path: Optional[Path] = None,
+    fingerprint: Optional[Dict[str, int]] = None,
+) -> Path:
+    """
+    Compile every entity's $relationships into graph_index.bin.
+
+    Args:
+        brain_path: Path to brain directory
+        resolver: CanonicalResolver to resolve targets (rebuilt from the
+                  shared entity cache if None). Entities are read from the
+                  shared entity cache either way.
+        path: Output file (default: brain_path / GRAPH_FILENAME)
+        fingerprint: source_fingerprint() taken before reading entities
+                     (computed here if None)
+
+    Returns:
+        Path of the written file
+    """
+    brain_path = Path(brain_path)
+    t0 = time.perf_counter()
+    if fingerprint is None:
+        fingerprint = source_fingerprint(brain_path)
+    cache = get_shared_cache(brain_path)
+    if cache._loaded:
+        # A warm cache may predate edits made by other processes
+        cache.reload()
+    if resolver is None:
+        try:
+            from pm_os_brain.tools.relationships.canonical_resolver import (
+                CanonicalResolver,
+            )
+        except ImportError:
+            sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+            from relationships.canonical_resolver import CanonicalResolver
+        resolver = CanonicalResolver(brain_path)
+        resolver.build_index(force=True)
+
+    builder = GraphBuilder()
+    sources = []
+    for entity_id, frontmatter in cache.get_all().items():
+        rel_path = Path(frontmatter["_path"]).relative_to(brain_path).as_posix()
+        canonical = frontmatter.get("$id") or resolver.resolve(rel_path) or entity_id
+        sources.append((builder.add_node(canonical), frontmatter))
+
+    unresolved = 0
+    for node, frontmatter in sources:
+        relationships = frontmatter.get("$relationships") or []
+        if not isinstance(relationships, list):
+            continue
+        for rel in relationships:
+            if not isinstance(rel, dict) or not rel.get("target"):
+                continue
+            canonical_target = resolver.resolve(str(rel["target"]))
+            if canonical_target is None:
+                unresolved += 1
+                builder.add_edge(node, None, rel)
+            else:
+                builder.add_edge(node, builder.add_node(canonical_target), rel)
+
+    out = Path(path) if path else brain_path / GRAPH_FILENAME
+    builder.write(out, meta={"unresolved": unresolved, "sources": fingerprint})
+    logger.info(
+        "Compiled graph: %d nodes, %d edges (%d unresolved) in %.0fms",
+        len(builder.nodes),
+        sum(len(a) for a in builder.adjacency),
+        unresolved,
+        (time.perf_counter() - t0) * 1000,
+    )
+    return out
+
+
+def load_or_compile(brain_path: Path, resolver=None) -> Optional[CompiledGraph]:
+    """Open graph_index.bin, (re)compiling it if missing or stale."""
+    path = Path(brain_path) / GRAPH_FILENAME
+    fingerprint = source_fingerprint(brain_path)
+    graph = CompiledGraph.open(path) if path.exists() else None
+    if graph is not None and not graph.is_fresh(fingerprint):
+        logger.info("Graph index is stale, recompiling")
+        graph.close()
+        graph = None
+    if graph is None:
+        try:
+            compile_graph(brain_path, resolver=resolver, path=path, fingerprint=fingerprint)
+        except (ImportError, OSError) as e:
+            logger.warning("Could not compile graph index: %s", e)
+            return None
+        graph = CompiledGraph.open(path)
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the Brain relationship graph")
+    parser.add_argument("--brain-path", type=str, help="Path to brain directory")
+    parser.add_argument("--stats", action="store_true", help="Show graph statistics")
+    parser.add_argument("--neighbors", type=str, metavar="ID", help="Print an entity's edges")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+    if args.brain_path:
+        brain_path = Path(args.brain_path)
+    elif get_paths is not None:
+        brain_path = get_paths().brain
+    else:
+        brain_path = Path.cwd() / "user" / "brain"
+
+    if args.stats or args.neighbors:
+        graph = load_or_compile(brain_path)
+        if graph is None:
+            print("Error: graph index unavailable", file=sys.stderr)
+            return 1
+        if args.stats:
+            print(json.dumps(graph.stats(), indent=2))
+        if args.neighbors:
+            for edge in graph.edges(args.neighbors):
+                print(f"  --[{edge.rel_type}]--> {edge.target or edge.raw_target + ' (unresolved)'}")
+        return 0
+
+    print(compile_graph(brain_path))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
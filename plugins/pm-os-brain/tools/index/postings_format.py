@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Postings Format - Compressed binary storage for the Brain content index
+
+File layout (content_index.bin):
+    magic "PMBI" | u32 format version | u64 header length | header JSON | postings
+
+The JSON header holds the index meta, the document table (entity ids and
+lengths) and the term dictionary: term -> [offset, doc_bytes, pos_bytes,
+df, max_tf]. Each term's postings are two varint-encoded blocks:
+    docs block:      (doc_id gap, tf) per document, doc ids ascending
+    positions block: per document, tf position gaps
+so ranking only decodes the docs block and phrase queries decode positions
+on demand. The postings region is read through mmap, so opening the index
+costs only the header parse.
+
+Postings can be encoded in shards of contiguous doc ids (one per build
+worker) and joined with concat_term_blocks without decoding them.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PMBI"
+FORMAT_VERSION = 1
+INDEX_FILENAME = "content_index.bin"
+_PREAMBLE = struct.Struct("<4sIQ")
+
+# term -> [(doc_id, [positions...]), ...] with doc ids ascending
+TermPostings = List[Tuple[int, List[int]]]
+
+# (docs_block, positions_block, df, max_tf)
+EncodedTerm = Tuple[bytes, bytes, int, int]
+
+
+def encode_varints(values: Iterable[int], out: bytearray) -> None:
+    """Append unsigned LEB128 varints to out."""
+    append = out.append
+    for value in values:
+        while value >= 0x80:
+            append((value & 0x7F) | 0x80)
+            value >>= 7
+        append(value)
+
+
+def decode_varints(buf: Union[bytes, mmap.mmap], start: int, end: int) -> List[int]:
+    """Decode all unsigned LEB128 varints in buf[start:end]."""
+    data = buf[start:end]
+    values = []
+    value = shift = 0
+    for byte in data:
+        if byte & 0x80:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+        else:
+            values.append(value | (byte << shift))
+            value = shift = 0
+    return values
+
+
+def _read_varint(buf: bytes, start: int) -> Tuple[int, int]:
+    """Decode one varint at start. Returns (value, next offset)."""
+    value = shift = 0
+    pos = start
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def encode_term(postings: TermPostings) -> Tuple[bytes, bytes, int]:
+    """
+    Encode one term's postings.
+
+    Args:
+        postings: [(doc_id, positions)] sorted by doc_id
+
+    Returns:
+        (docs_block, positions_block, max_tf)
+    """
+    doc_values: List[int] = []
+    gaps: List[int] = []
+    last_doc = 0
+    max_tf = 0
+    for doc_id, pos_list in postings:
+        tf = len(pos_list)
+        if tf > max_tf:
+            max_tf = tf
+        doc_values.append(doc_id - last_doc)
+        doc_values.append(tf)
+        last_doc = doc_id
+        last_pos = 0
+        for p in pos_list:
+            gaps.append(p - last_pos)
+            last_pos = p
+    docs = bytearray()
+    positions = bytearray()
+    encode_varints(doc_values, docs)
+    encode_varints(gaps, positions)
+    return bytes(docs), bytes(positions), max_tf
+
+
+def encode_postings(
+    terms: Dict[str, TermPostings]
+) -> Dict[str, Tuple[bytes, bytes, int, int, int]]:
+    """
+    Encode a shard of postings for concat_term_blocks.
+
+    Returns:
+        term -> (docs_block, positions_block, df, max_tf, last_doc_id)
+    """
+    encoded = {}
+    for term, postings in terms.items():
+        if postings:
+            doc_block, pos_block, max_tf = encode_term(postings)
+            encoded[term] = (doc_block, pos_block, len(postings), max_tf, postings[-1][0])
+    return encoded
+
+
+def concat_term_blocks(parts: List[Tuple[bytes, bytes, int, int, int]]) -> EncodedTerm:
+    """
+    Join one term's encodings from several shards.
+
+    Parts must be in ascending doc-id order with non-overlapping doc ids.
+    Each shard encodes its first doc id as a gap from 0, so only that
+    leading varint is rebased against the previous shard's last doc id.
+
+    Args:
+        parts: [(docs_block, positions_block, df, max_tf, last_doc_id)]
+
+    Returns:
+        (docs_block, positions_block, df, max_tf)
+    """
+    if len(parts) == 1:
+        return parts[0][:4]
+    docs = bytearray()
+    positions = bytearray()
+    df = max_tf = 0
+    last_doc = 0
+    for doc_block, pos_block, part_df, part_max_tf, part_last in parts:
+        first_doc, rest = _read_varint(doc_block, 0)
+        encode_varints((first_doc - last_doc,), docs)
+        docs += doc_block[rest:]
+        positions += pos_block
+        df += part_df
+        max_tf = max(max_tf, part_max_tf)
+        last_doc = part_last
+    return bytes(docs), bytes(positions), df, max_tf
+
+
+def assemble_header(
+    meta: Dict[str, Any],
+    docs: List[str],
+    doc_lengths: List[int],
+    encoded: Dict[str, EncodedTerm],
+) -> Tuple[Dict[str, Any], bytes]:
+    """
+    Lay out already-encoded terms (sorted) and assemble the header.
+
+    Doc ids whose entity id is empty are tombstones (deleted documents)
+    and are excluded from the length statistics.
+
+    Returns:
+        (header, postings_blob)
+    """
+    blob = bytearray()
+    dictionary: Dict[str, List[int]] = {}
+    for term in sorted(encoded):
+        doc_block, pos_block, df, max_tf = encoded[term]
+        dictionary[term] = [len(blob), len(doc_block), len(pos_block), df, max_tf]
+        blob += doc_block
+        blob += pos_block
+
+    live = [n for d, n in zip(docs, doc_lengths) if d]
+    header = {
+        "meta": meta,
+        "docs": docs,
+        "doc_lengths": doc_lengths,
+        "avgdl": (sum(live) / len(live)) if live else 0.0,
+        "min_dl": min(live) if live else 0,
+        "terms": dictionary,
+    }
+    return header, bytes(blob)
+
+
+def build_header(
+    meta: Dict[str, Any],
+    docs: List[str],
+    doc_lengths: List[int],
+    terms: Dict[str, TermPostings],
+    base: Optional["PostingsReader"] = None,
+) -> Tuple[Dict[str, Any], bytes]:
+    """
+    Encode all postings and assemble the header.
+
+    Args:
+        meta, docs, doc_lengths: As for write_index
+        terms: Postings to encode. An empty list removes the term.
+        base: Existing index; its terms not present in `terms` are copied
+              byte-for-byte instead of being decoded and re-encoded.
+
+    Returns:
+        (header, postings_blob)
+    """
+    encoded: Dict[str, EncodedTerm] = {}
+    if base is not None:
+        for term in base.terms:
+            if term not in terms:
+                encoded[term] = base.raw_term(term)
+    for term, postings in terms.items():
+        if postings:
+            doc_block, pos_block, max_tf = encode_term(postings)
+            encoded[term] = (doc_block, pos_block, len(postings), max_tf)
+    return assemble_header(meta, docs, doc_lengths, encoded)
+
+
+def write_index(
+    path: Path,
+    meta: Dict[str, Any],
+    docs: List[str],
+    doc_lengths: List[int],
+    terms: Dict[str, TermPostings],
+    base: Optional["PostingsReader"] = None,
+) -> None:
+    """
+    Atomically write a content index file.
+
+    Args:
+        path: Destination (content_index.bin)
+        meta: Build metadata stored in the header
+        docs: Entity id per doc id ("" for deleted documents)
+        doc_lengths: Indexed token count per doc id
+        terms: Postings per term (all terms, or only changed ones with base)
+        base: Previous index to copy unchanged terms from
+    """
+    header, blob = build_header(meta, docs, doc_lengths, terms, base)
+    write_encoded(path, header, blob)
+
+
+def write_encoded(path: Path, header: Dict[str, Any], blob: bytes) -> None:
+    """Atomically write an assembled header and postings blob."""
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+            f.write(header_bytes)
+            f.write(blob)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class PostingsReader:
+    """Read-only access to a content index file (or an in-memory buffer)."""
+
+    def __init__(self, header: Dict[str, Any], buf: Union[bytes, mmap.mmap], base: int):
+        self.meta: Dict[str, Any] = header.get("meta", {})
+        self.docs: List[str] = header.get("docs", [])
+        self.doc_lengths: List[int] = header.get("doc_lengths", [])
+        self.avgdl: float = header.get("avgdl", 0.0) or 1.0
+        self.min_dl: int = header.get("min_dl", 0)
+        self.terms: Dict[str, List[int]] = header.get("terms", {})
+        self.doc_count: int = sum(1 for d in self.docs if d)
+        self._buf = buf
+        self._base = base
+
+    @classmethod
+    def open(cls, path: Path) -> Optional["PostingsReader"]:
+        """Memory-map an index file. Returns None if missing or invalid."""
+        try:
+            with open(path, "rb") as f:
+                preamble = f.read(_PREAMBLE.size)
+                if len(preamble) < _PREAMBLE.size:
+                    return None
+                magic, version, header_len = _PREAMBLE.unpack(preamble)
+                if magic != MAGIC or version != FORMAT_VERSION:
+                    logger.warning("Unsupported content index format in %s", path)
+                    return None
+                header = json.loads(f.read(header_len).decode("utf-8"))
+                base = _PREAMBLE.size + header_len
+                size = os.fstat(f.fileno()).st_size
+                buf = (
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    if size > base
+                    else b""
+                )
+        except (OSError, ValueError, struct.error) as e:
+            logger.error("Error loading content index: %s", e)
+            return None
+        return cls(header, buf, base)
+
+    @classmethod
+    def from_postings(
+        cls,
+        meta: Dict[str, Any],
+        docs: List[str],
+        doc_lengths: List[int],
+        terms: Dict[str, TermPostings],
+    ) -> "PostingsReader":
+        """Build an in-memory reader (used for freshly built and legacy indexes)."""
+        header, blob = build_header(meta, docs, doc_lengths, terms)
+        return cls(header, blob, 0)
+
+    def close(self) -> None:
+        """Release the memory map."""
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+        self._buf = b""
+
+    def __contains__(self, term: str) -> bool:
+        return term in self.terms
+
+    def doc_freq(self, term: str) -> int:
+        """Number of documents containing term."""
+        entry = self.terms.get(term)
+        return entry[3] if entry else 0
+
+    def max_tf(self, term: str) -> int:
+        """Highest term frequency of term in any document."""
+        entry = self.terms.get(term)
+        return entry[4] if entry else 0
+
+    def postings(self, term: str) -> List[Tuple[int, int]]:
+        """Decode [(doc_id, tf)] for term (positions are not decoded)."""
+        entry = self.terms.get(term)
+        if not entry:
+            return []
+        offset, doc_bytes = self._base + entry[0], entry[1]
+        values = decode_varints(self._buf, offset, offset + doc_bytes)
+        result = []
+        doc_id = 0
+        for i in range(0, len(values), 2):
+            doc_id += values[i]
+            result.append((doc_id, values[i + 1]))
+        return result
+
+    def raw_term(self, term: str) -> Tuple[bytes, bytes, int, int]:
+        """Return (docs_block, positions_block, df, max_tf) without decoding."""
+        offset, doc_bytes, pos_bytes, df, max_tf = self.terms[term]
+        start = self._base + offset
+        return (
+            bytes(self._buf[start : start + doc_bytes]),
+            bytes(self._buf[start + doc_bytes : start + doc_bytes + pos_bytes]),
+            df,
+            max_tf,
+        )
+
+    def positions(self, term: str) -> Dict[int, List[int]]:
+        """Decode {doc_id: [positions]} for term."""
+        entry = self.terms.get(term)
+        if not entry:
+            return {}
+        docs = self.postings(term)
+        start = self._base + entry[0] + entry[1]
+        gaps = decode_varints(self._buf, start, start + entry[2])
+        result: Dict[int, List[int]] = {}
+        i = 0
+        for doc_id, tf in docs:
+            result[doc_id] = list(accumulate(gaps[i : i + tf]))
+            i += tf
+        return result
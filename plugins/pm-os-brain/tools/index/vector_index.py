@@ -7,6 +7,8 @@ sentence-transformers for encoding and ChromaDB for vector storage.
 
 Usage:
     python3 vector_index.py build              # Build/rebuild full index
+    python3 vector_index.py build --workers 8  # Parse files in parallel
+    python3 vector_index.py sync               # Embed only new/changed entities
     python3 vector_index.py query "search text" # Query the index
     python3 vector_index.py stats              # Show index statistics
 """
@@ -14,9 +16,16 @@ Usage:
 import argparse
 import json
 import logging
+import os
+import queue
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Tuple
 
 import yaml
 
@@ -42,6 +51,20 @@ except ImportError:
     except ImportError:
         get_paths = None
 
+try:
+    from ..brain_core.embedding_store import (
+        build_embedding_text,
+        content_hash,
+        get_shared_store,
+    )
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.embedding_store import (
+        build_embedding_text,
+        content_hash,
+        get_shared_store,
+    )
+
 # Optional dependencies — graceful degradation if not installed
 try:
     import chromadb
@@ -61,6 +84,19 @@ except ImportError:
 
 VECTOR_AVAILABLE = HAS_CHROMADB and HAS_SENTENCE_TRANSFORMERS
 
+# Build pipeline: documents per encode() call and batches prepared ahead
+EMBED_BATCH_SIZE = 100
+PIPELINE_DEPTH = 4
+PARSE_CHUNK_SIZE = 64
+# Page size when reading or deleting ids in the collection during sync()
+SYNC_PAGE_SIZE = 5000
+# sync() compacts the embedding store once it holds this many times more
+# vectors than there are live entities
+STORE_COMPACT_RATIO = 2
+
+# (entity_id, document text, metadata)
+PreparedDoc = Tuple[str, str, Dict[str, Any]]
+
 
 def _resolve_brain_dir() -> Path:
     """Resolve brain directory from config/paths, no hardcoded values."""
@@ -82,12 +118,29 @@ def _resolve_brain_dir() -> Path:
     return Path.cwd() / "user" / "brain"
 
 
+def _prepare_files_worker(brain_path: str, paths: List[str]) -> List[Optional[PreparedDoc]]:
+    """Worker process entry point: parse and prepare a chunk of entity files."""
+    index = BrainVectorIndex(Path(brain_path))
+    return [index._prepare_file(Path(p)) for p in paths]
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    """Normalise a --workers value: None/1 serial, 0 = one per CPU."""
+    if workers is None:
+        return 1
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
 class BrainVectorIndex:
     """
     ChromaDB-backed vector index for semantic search across Brain entities.
 
     Embeds entity content (name + body text) using sentence-transformers
     and stores in a persistent ChromaDB collection for fast similarity search.
+    Embeddings come from the shared EmbeddingStore, so text that was already
+    encoded (by an earlier build or by the edge inferrer) is not re-encoded.
     """
 
     DEFAULT_MODEL = "all-MiniLM-L6-v2"
@@ -127,6 +180,7 @@ class BrainVectorIndex:
         self._model = None
         self._client = None
         self._collection = None
+        self.embedding_store = get_shared_store(self.brain_path, model_name)
 
         # Index location
         self.index_path = self.brain_path / self.INDEX_DIR_NAME
@@ -189,7 +243,9 @@ class BrainVectorIndex:
             self._collection = coll
         return self._collection
 
-    def build_index(self) -> Dict[str, Any]:
+    def build_index(
+        self, workers: int = 1, batch_size: int = EMBED_BATCH_SIZE
+    ) -> Dict[str, Any]:
         """
         Build the full vector index from all Brain entities.
 
@@ -197,12 +253,19 @@ class BrainVectorIndex:
         frontmatter metadata and body text, generates embeddings,
         and stores in ChromaDB.
 
+        Document preparation runs in a background thread (fanned out to a
+        process pool when workers > 1) and feeds a bounded queue, so files
+        are read and parsed while the previous batch is being encoded.
+
+        Args:
+            workers: Processes for reading/parsing files (0 = one per CPU)
+            batch_size: Documents per encode/insert batch
+
         Returns:
             Dict with build statistics: entities_indexed, errors, duration
         """
-        entities = self._scan_entities()
-
-        if not entities:
+        files = list(self._iter_entity_files())
+        if not files:
             return {"entities_indexed": 0, "errors": 0, "message": "No entities found"}
 
         # Clear existing collection and recreate
@@ -212,48 +275,239 @@ class BrainVectorIndex:
             pass
         self._collection = None  # Force recreation
 
-        # Prepare data for batch insert
-        ids = []
-        documents = []
-        metadatas = []
+        batches: "queue.Queue" = queue.Queue(maxsize=PIPELINE_DEPTH)
+        scanned: Dict[str, int] = {"entities": 0}
+        producer = threading.Thread(
+            target=self._produce_batches,
+            args=(files, _resolve_workers(workers), batch_size, batches, scanned),
+            daemon=True,
+        )
+        producer.start()
 
-        for entity_id, entity_data in entities.items():
-            doc_text = self._build_document_text(entity_data)
-            if not doc_text.strip():
-                continue
+        # Encode and insert each batch as soon as it is prepared
+        errors = 0
+        batch_num = 0
+        with self._store_writes():
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    break
+                if isinstance(batch, Exception):
+                    producer.join()
+                    raise batch
+                # upsert: an id repeated in a later batch replaces the earlier one
+                if not self._upsert_batch(batch, batch_num):
+                    errors += 1
+                batch_num += 1
+        producer.join()
 
-            ids.append(entity_id)
-            documents.append(doc_text)
-            metadatas.append(self._sanitize_metadata(entity_id, entity_data))
+        return {
+            "entities_indexed": self.collection.count(),
+            "total_scanned": scanned["entities"],
+            "errors": errors,
+        }
 
-        # Batch embed and insert
-        errors = 0
-        batch_size = 100
-        for i in range(0, len(ids), batch_size):
-            batch_ids = ids[i : i + batch_size]
-            batch_docs = documents[i : i + batch_size]
-            batch_meta = metadatas[i : i + batch_size]
+    def sync(self, workers: int = 1, batch_size: int = EMBED_BATCH_SIZE) -> Dict[str, Any]:
+        """
+        Bring the index up to date without re-embedding unchanged entities.
+
+        Each stored document carries the hash of its embedded text, the
+        model that embedded it and a hash of its filter metadata ($status,
+        $confidence, $type, path, name). Entities whose text hash or model
+        differ (or that are new) are embedded and upserted; entities whose
+        metadata alone changed get a metadata update without re-embedding;
+        ids no longer present in the brain are deleted.
+
+        Args:
+            workers: Processes for reading/parsing files (0 = one per CPU)
+            batch_size: Documents per encode/upsert batch
 
+        Returns:
+            Dict with added, updated, metadata_updated, removed, unchanged,
+            errors, elapsed_ms
+        """
+        t0 = time.perf_counter()
+        current: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        for prepared in self._iter_prepared(
+            list(self._iter_entity_files()), _resolve_workers(workers)
+        ):
+            if prepared is None:
+                continue
+            entity_id, doc_text, metadata = prepared
+            if doc_text.strip():
+                current[entity_id] = (doc_text, metadata)
+            else:
+                current.pop(entity_id, None)
+
+        stored = self._stored_hashes()
+        pending = []
+        retagged: List[Tuple[str, Dict[str, Any]]] = []
+        added = updated = 0
+        for entity_id, (doc_text, metadata) in current.items():
+            previous = stored.get(entity_id)
+            if previous is not None and previous[:2] == (
+                metadata["content_hash"], self.model_name
+            ):
+                if previous[2] != metadata["metadata_hash"]:
+                    retagged.append((entity_id, metadata))
+                continue
+            if previous is None:
+                added += 1
+            else:
+                updated += 1
+            pending.append((entity_id, doc_text, metadata))
+        removed = [entity_id for entity_id in stored if entity_id not in current]
+        self._maybe_compact_store(m["content_hash"] for _, m in current.values())
+
+        errors = 0
+        with self._store_writes():
+            for i in range(0, len(pending), batch_size):
+                if not self._upsert_batch(pending[i : i + batch_size], i // batch_size):
+                    errors += 1
+        for i in range(0, len(retagged), SYNC_PAGE_SIZE):
+            page = retagged[i : i + SYNC_PAGE_SIZE]
             try:
-                embeddings = self.model.encode(
-                    batch_docs, normalize_embeddings=True
-                ).tolist()
-
-                self.collection.add(
-                    ids=batch_ids,
-                    documents=batch_docs,
-                    embeddings=embeddings,
-                    metadatas=batch_meta,
+                self.collection.update(
+                    ids=[entity_id for entity_id, _ in page],
+                    metadatas=[dict(m, embedding_model=self.model_name) for _, m in page],
                 )
             except Exception as e:
                 errors += 1
-                logger.error("Error indexing batch %d: %s", i // batch_size, e)
-
-        return {
-            "entities_indexed": self.collection.count(),
-            "total_scanned": len(entities),
+                logger.error("Error updating entity metadata: %s", e)
+        for i in range(0, len(removed), SYNC_PAGE_SIZE):
+            try:
+                self.collection.delete(ids=removed[i : i + SYNC_PAGE_SIZE])
+            except Exception as e:
+                errors += 1
+                logger.error("Error removing stale entities: %s", e)
+
+        stats = {
+            "added": added,
+            "updated": updated,
+            "metadata_updated": len(retagged),
+            "removed": len(removed),
+            "unchanged": len(current) - added - updated - len(retagged),
             "errors": errors,
+            "entities_indexed": self.collection.count(),
+            "elapsed_ms": round((time.perf_counter() - t0) * 1000, 1),
         }
+        logger.info(
+            "Vector index synced: %d added, %d updated, %d re-tagged, %d removed (%.0fms)",
+            added, updated, len(retagged), len(removed), stats["elapsed_ms"],
+        )
+        return stats
+
+    def _stored_hashes(self) -> Dict[str, Tuple[Optional[str], ...]]:
+        """Read {entity_id: (content_hash, embedding_model, metadata_hash)}."""
+        stored: Dict[str, Tuple[Optional[str], ...]] = {}
+        total = self.collection.count()
+        for offset in range(0, total, SYNC_PAGE_SIZE):
+            page = self.collection.get(
+                include=["metadatas"], limit=SYNC_PAGE_SIZE, offset=offset
+            )
+            for entity_id, metadata in zip(page["ids"], page["metadatas"] or []):
+                metadata = metadata or {}
+                stored[entity_id] = (
+                    metadata.get("content_hash"),
+                    metadata.get("embedding_model"),
+                    metadata.get("metadata_hash"),
+                )
+        return stored
+
+    def _upsert_batch(self, batch: List[PreparedDoc], batch_num: int = 0) -> bool:
+        """Embed a batch of prepared documents and upsert it. Returns success."""
+        ids = [b[0] for b in batch]
+        documents = [b[1] for b in batch]
+        metadatas = [dict(b[2], embedding_model=self.model_name) for b in batch]
+        try:
+            embeddings = self._encode(
+                documents, [m["content_hash"] for m in metadatas]
+            ).tolist()
+            self.collection.upsert(
+                ids=ids,
+                documents=documents,
+                embeddings=embeddings,
+                metadatas=metadatas,
+            )
+            return True
+        except Exception as e:
+            logger.error("Error indexing batch %d: %s", batch_num, e)
+            return False
+
+    def _encode(self, documents: List[str], hashes: List[str]) -> Any:
+        """Embed documents through the embedding store (model only on misses)."""
+        def encoder(texts: List[str]) -> Any:
+            return self.model.encode(texts, normalize_embeddings=True)
+
+        if self.embedding_store is None:
+            return encoder(documents)
+        return self.embedding_store.encode(documents, encoder, hashes=hashes)
+
+    def _store_writes(self) -> ContextManager[Any]:
+        """Batch embedding-store table writes for a multi-batch build."""
+        if self.embedding_store is None:
+            return nullcontext()
+        return self.embedding_store.deferred_save()
+
+    def _maybe_compact_store(self, live_hashes: Iterator[str]) -> None:
+        """Drop superseded vectors once they dominate the embedding store."""
+        if self.embedding_store is None:
+            return
+        live = set(live_hashes)
+        if len(self.embedding_store) > STORE_COMPACT_RATIO * max(len(live), 1):
+            removed = self.embedding_store.compact(live)
+            logger.info("Compacted embedding store: %d stale vectors removed", removed)
+
+    def _produce_batches(
+        self,
+        files: List[Path],
+        workers: int,
+        batch_size: int,
+        batches: "queue.Queue",
+        scanned: Dict[str, int],
+    ) -> None:
+        """Prepare documents and queue them in batches; None marks the end."""
+        try:
+            seen = set()
+            pending: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+            for prepared in self._iter_prepared(files, workers):
+                if prepared is None:
+                    continue
+                entity_id, doc_text, metadata = prepared
+                seen.add(entity_id)
+                if not doc_text.strip():
+                    continue
+                pending[entity_id] = (doc_text, metadata)
+                if len(pending) >= batch_size:
+                    batches.put([(e, d, m) for e, (d, m) in pending.items()])
+                    pending = {}
+            if pending:
+                batches.put([(e, d, m) for e, (d, m) in pending.items()])
+            scanned["entities"] = len(seen)
+            batches.put(None)
+        except Exception as e:
+            batches.put(e)
+
+    def _iter_prepared(
+        self, files: List[Path], workers: int
+    ) -> Iterator[Optional[PreparedDoc]]:
+        """Prepare files in order, across a process pool when workers > 1."""
+        if workers > 1 and len(files) > PARSE_CHUNK_SIZE:
+            chunks = [
+                [str(f) for f in files[i : i + PARSE_CHUNK_SIZE]]
+                for i in range(0, len(files), PARSE_CHUNK_SIZE)
+            ]
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    for chunk in pool.map(
+                        _prepare_files_worker, [str(self.brain_path)] * len(chunks), chunks
+                    ):
+                        yield from chunk
+                return
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning("Parallel preparation failed, continuing serially: %s", e)
+        for md_file in files:
+            yield self._prepare_file(md_file)
 
     def query(
         self,
@@ -345,37 +599,13 @@ class BrainVectorIndex:
         Returns:
             True if successfully added/updated
         """
-        try:
-            entity_data = self._parse_entity_file(entity_path)
-            if not entity_data:
-                return False
-
-            entity_id = entity_data.get(
-                "$id", str(entity_path.relative_to(self.brain_path))
-            )
-            doc_text = self._build_document_text(entity_data)
-
-            if not doc_text.strip():
-                return False
-
-            embedding = self.model.encode(
-                [doc_text], normalize_embeddings=True
-            ).tolist()
-
-            metadata = self._sanitize_metadata(entity_id, entity_data)
-            metadata["file_path"] = str(entity_path)
-
-            self.collection.upsert(
-                ids=[entity_id],
-                documents=[doc_text],
-                embeddings=embedding,
-                metadatas=[metadata],
-            )
-            return True
-
-        except Exception as e:
-            logger.error("Error adding entity %s: %s", entity_path, e)
+        prepared = self._prepare_file(entity_path)
+        if prepared is None or not prepared[1].strip():
+            return False
+        if not self._upsert_batch([prepared]):
+            logger.error("Error adding entity %s", entity_path)
             return False
+        return True
 
     def remove_entity(self, entity_id: str) -> bool:
         """
@@ -407,6 +637,11 @@ class BrainVectorIndex:
     # Internal helpers
     # -----------------------------------------------------------------------
 
+    @staticmethod
+    def content_hash(doc_text: str) -> str:
+        """Hash of the exact text that gets embedded."""
+        return content_hash(doc_text)
+
     def _sanitize_metadata(
         self, entity_id: str, entity_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -430,10 +665,8 @@ class BrainVectorIndex:
             "name": name,
         }
 
-    def _scan_entities(self) -> Dict[str, Dict[str, Any]]:
-        """Scan all Brain entity files and parse their metadata."""
-        entities = {}
-
+    def _iter_entity_files(self) -> Iterator[Path]:
+        """Yield indexable markdown files, skipping excluded dirs and files."""
         for md_file in self.brain_path.rglob("*.md"):
             # Skip excluded directories
             if any(excluded in md_file.parts for excluded in self.EXCLUDE_DIRS):
@@ -441,22 +674,28 @@ class BrainVectorIndex:
             # Skip excluded files
             if md_file.name in self.EXCLUDE_FILES:
                 continue
+            yield md_file
 
-            try:
-                entity_data = self._parse_entity_file(md_file)
-                if not entity_data:
-                    continue
-
-                entity_id = entity_data.get(
-                    "$id", str(md_file.relative_to(self.brain_path))
-                )
-                entity_data["_path"] = md_file
-                entities[entity_id] = entity_data
-
-            except Exception:
-                continue
+    def _prepare_file(self, md_file: Path) -> Optional[PreparedDoc]:
+        """Parse one entity file into (entity_id, document text, metadata)."""
+        try:
+            entity_data = self._parse_entity_file(md_file)
+            if not entity_data:
+                return None
 
-        return entities
+            entity_id = entity_data.get(
+                "$id", str(md_file.relative_to(self.brain_path))
+            )
+            entity_data["_path"] = md_file
+            doc_text = self._build_document_text(entity_data)
+            metadata = self._sanitize_metadata(entity_id, entity_data)
+            metadata["metadata_hash"] = self.content_hash(
+                json.dumps(metadata, sort_keys=True)
+            )
+            metadata["content_hash"] = self.content_hash(doc_text)
+            return entity_id, doc_text, metadata
+        except Exception:
+            return None
 
     def _parse_entity_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """Parse a markdown file's YAML frontmatter and body."""
@@ -483,29 +722,7 @@ class BrainVectorIndex:
 
     def _build_document_text(self, entity_data: Dict[str, Any]) -> str:
         """Build the document text for embedding from entity data."""
-        parts = []
-
-        # Entity name (high weight via repetition)
-        name = entity_data.get("name", entity_data.get("_name", ""))
-        if name:
-            parts.append(name)
-
-        # Description
-        desc = entity_data.get("description", "")
-        if desc:
-            parts.append(str(desc))
-
-        # Body content (first 500 chars for efficiency)
-        body = entity_data.get("_body", "")
-        if body:
-            parts.append(body[:500].strip())
-
-        # Tags
-        tags = entity_data.get("$tags", [])
-        if tags and isinstance(tags, list):
-            parts.append(" ".join(str(t) for t in tags))
-
-        return " ".join(parts)
+        return build_embedding_text(entity_data)
 
 
 def main():
@@ -520,7 +737,7 @@ def main():
     )
     parser.add_argument(
         "action",
-        choices=["build", "query", "stats", "rebuild"],
+        choices=["build", "sync", "query", "stats", "rebuild"],
         help="Action to perform",
     )
     parser.add_argument(
@@ -550,6 +767,12 @@ def main():
         type=str,
         help="Filter by entity type",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes for reading/parsing files during build/sync (0 = one per CPU)",
+    )
     parser.add_argument(
         "--output",
         choices=["text", "json"],
@@ -581,7 +804,7 @@ def main():
 
     if args.action in ("build", "rebuild"):
         print(f"Building vector index from {brain_path}...")
-        stats = index.build_index()
+        stats = index.build_index(workers=args.workers)
 
         if args.output == "json":
             print(json.dumps(stats, indent=2))
@@ -591,6 +814,18 @@ def main():
             print(f"Errors: {stats['errors']}")
             print(f"Index location: {index.index_path}")
 
+    elif args.action == "sync":
+        stats = index.sync(workers=args.workers)
+        if args.output == "json":
+            print(json.dumps(stats, indent=2))
+        else:
+            print(
+                f"Added: {stats['added']}  Updated: {stats['updated']}  "
+                f"Removed: {stats['removed']}  Unchanged: {stats['unchanged']}"
+            )
+            print(f"Entities indexed: {stats['entities_indexed']}")
+            print(f"Errors: {stats['errors']}")
+
     elif args.action == "query":
         if not args.query_text:
             print("Error: query action requires query text", file=sys.stderr)
@@ -619,15 +854,24 @@ def main():
 
     elif args.action == "stats":
         count = index.collection.count()
+        store_stats = (
+            index.embedding_store.stats() if index.embedding_store is not None else None
+        )
         if args.output == "json":
             print(
                 json.dumps(
-                    {"entity_count": count, "index_path": str(index.index_path)}
+                    {
+                        "entity_count": count,
+                        "index_path": str(index.index_path),
+                        "embedding_store": store_stats,
+                    }
                 )
             )
         else:
             print(f"Index location: {index.index_path}")
             print(f"Entities in index: {count}")
+            if store_stats is not None:
+                print(f"Stored embeddings: {store_stats['vectors']}")
 
     return 0
 
@@ -9,6 +9,17 @@ Provides tools for searching, retrieving, and querying Brain entities
 so any MCP-compatible client (Cursor, Windsurf, Claude Code, Cowork)
 can access the knowledge graph.
 
+The server keeps one warm engine context (BrainEngines) for its lifetime:
+the embedding model, the open vector collection and the keyword search
+engine (registry aliases + content index) are loaded once, in a background
+warm-up thread at startup, and reloaded only when their files change on
+disk (mtime/size check per call). The read tools (get_entity,
+get_relationships, list_entities) share an EntityIndex over the persistent
+entity cache: an id -> path/metadata map plus precomputed type/status
+orderings served with pagination cursors. get_relationships reads the
+compiled relationship graph (graph_index.bin) unless the entity's file is
+newer than it.
+
 Usage:
     python3 brain_mcp_server.py              # Start MCP server (stdio)
     MCP_TRANSPORT=http python3 brain_mcp_server.py   # Streamable HTTP
@@ -16,11 +27,15 @@ Usage:
 """
 
 import argparse
+import base64
+import bisect
 import json
 import logging
 import os
 import re
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -59,6 +74,16 @@ try:
 except ImportError:
     get_auth = None
 
+# Brain tool packages (index.*) when run as a script
+TOOLS_ROOT = Path(__file__).resolve().parent.parent
+if str(TOOLS_ROOT) not in sys.path:
+    sys.path.insert(0, str(TOOLS_ROOT))
+
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache
+except ImportError:
+    from brain_core.entity_cache import get_shared_cache
+
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -68,6 +93,22 @@ except ImportError:
 MAX_RESPONSE_CHARS = 75000  # ~25k tokens at ~3 chars/token
 MAX_BODY_CHARS = 3000  # Per-entity body truncation
 
+# Set to "0" to skip loading engines in the background at server startup
+WARMUP_ENV = "PM_OS_BRAIN_WARMUP"
+
+# Files whose change invalidates a warm engine (relative to the brain dir)
+KEYWORD_ENGINE_FILES = ("registry.yaml", "content_index.bin", "content_index.json")
+VECTOR_ENGINE_FILES = (".vector_index/chroma.sqlite3",)
+GRAPH_ENGINE_FILES = ("graph_index.bin",)
+
+# Seconds before the entity index re-checks the brain for changed files
+ENTITY_INDEX_TTL = 30.0
+# Minimum seconds between refreshes forced by an unknown entity id
+ENTITY_MISS_REFRESH = 1.0
+# Entities under these directories (or with these names) are not exposed
+EXCLUDE_ENTITY_DIRS = {"Inbox", "Archive", "__pycache__", ".vector_index"}
+EXCLUDE_ENTITY_FILES = {"BRAIN.md", "README.md"}
+
 
 # Initialize FastMCP (stub if mcp package not installed — CLI mode still works)
 if FastMCP:
@@ -161,6 +202,299 @@ def _load_entity_file(file_path: Path) -> Optional[Dict[str, Any]]:
     return fm
 
 
+class BrainEngines:
+    """
+    Warm search engines shared by every tool call.
+
+    Each engine is built on first use (or by warm_up()) and rebuilt when
+    the stat signature of its backing files changes. The embedding model
+    is independent of the index files and survives vector reloads.
+    """
+
+    def __init__(self, brain_path: Path):
+        self.brain_path = brain_path
+        self._keyword_lock = threading.Lock()
+        self._vector_lock = threading.Lock()
+        self._keyword = None
+        self._keyword_sig: Optional[tuple] = None
+        self._vector = None
+        self._vector_sig: Optional[tuple] = None
+        self._graph_lock = threading.Lock()
+        self._graph = None
+        self._graph_sig: Optional[tuple] = None
+        self.graph_mtime_ns = 0
+        self.entities = EntityIndex(brain_path)
+
+        # Legacy location of brain search modules
+        brain_tools = brain_path.parent.parent / "common" / "tools" / "brain"
+        if brain_tools.exists() and str(brain_tools) not in sys.path:
+            sys.path.insert(0, str(brain_tools))
+
+    def _signature(self, names: tuple) -> tuple:
+        """(mtime_ns, size) of each file, None for missing files."""
+        sig = []
+        for name in names:
+            try:
+                st = (self.brain_path / name).stat()
+                sig.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def keyword_search(self):
+        """BrainSearch over the current registry and content index."""
+        from index.brain_search import BrainSearch
+
+        with self._keyword_lock:
+            sig = self._signature(KEYWORD_ENGINE_FILES)
+            if self._keyword is None or sig != self._keyword_sig:
+                started = time.perf_counter()
+                self._keyword = BrainSearch(brain_path=self.brain_path)
+                self._keyword_sig = sig
+                logger.info(
+                    "Keyword engine loaded in %.0fms",
+                    (time.perf_counter() - started) * 1000,
+                )
+            return self._keyword
+
+    def vector_index(self):
+        """BrainVectorIndex with a loaded model and open collection, or None."""
+        from index.vector_index import BrainVectorIndex, VECTOR_AVAILABLE
+
+        if not VECTOR_AVAILABLE:
+            return None
+        with self._vector_lock:
+            sig = self._signature(VECTOR_ENGINE_FILES)
+            if self._vector is None or sig != self._vector_sig:
+                started = time.perf_counter()
+                model = self._vector._model if self._vector is not None else None
+                idx = BrainVectorIndex(self.brain_path)
+                idx._model = model
+                # Load under the lock so concurrent calls wait instead of
+                # loading a second copy of the model
+                idx.model.encode(["warm-up"], normalize_embeddings=True)
+                idx.collection.count()
+                self._vector = idx
+                # Opening the collection may itself have created its files
+                self._vector_sig = self._signature(VECTOR_ENGINE_FILES)
+                logger.info(
+                    "Vector engine loaded in %.0fms",
+                    (time.perf_counter() - started) * 1000,
+                )
+            return self._vector
+
+    def graph(self):
+        """Compiled relationship graph, or None if not compiled yet."""
+        from index.graph_store import GRAPH_FILENAME, CompiledGraph
+
+        with self._graph_lock:
+            sig = self._signature(GRAPH_ENGINE_FILES)
+            if sig != self._graph_sig:
+                self._graph = (
+                    CompiledGraph.open(self.brain_path / GRAPH_FILENAME)
+                    if sig[0] is not None
+                    else None
+                )
+                self._graph_sig = sig
+                self.graph_mtime_ns = sig[0][0] if sig[0] is not None else 0
+            return self._graph
+
+    def warm_up(self) -> None:
+        """Load every engine now so the first tool call is already fast."""
+        started = time.perf_counter()
+        try:
+            self.entities.refresh()
+        except Exception as e:
+            logger.warning("Entity index warm-up failed: %s", e)
+        try:
+            self.keyword_search()
+        except Exception as e:
+            logger.warning("Keyword engine warm-up failed: %s", e)
+        try:
+            self.graph()
+        except Exception as e:
+            logger.warning("Graph warm-up failed: %s", e)
+        try:
+            self.vector_index()
+        except Exception as e:
+            logger.warning("Vector engine warm-up failed: %s", e)
+        logger.info(
+            "Brain engines warm in %.0fms", (time.perf_counter() - started) * 1000
+        )
+
+    def start_warm_up(self) -> threading.Thread:
+        """Run warm_up() in a daemon thread."""
+        thread = threading.Thread(
+            target=self.warm_up, name="brain-engine-warmup", daemon=True
+        )
+        thread.start()
+        return thread
+
+
+class EntityIndex:
+    """
+    id -> path/metadata index for the MCP read tools.
+
+    Built from the shared EntityCache, whose SQLite store makes each
+    refresh incremental (only changed files are re-parsed). Refreshed
+    when older than ENTITY_INDEX_TTL, or sooner when asked for an id it
+    does not know. list_entities orderings are precomputed per
+    (type, status) filter, sorted by ($updated, $id), and paged with
+    opaque cursors.
+    """
+
+    def __init__(self, brain_path: Path):
+        self.brain_path = brain_path
+        self._lock = threading.Lock()
+        self._refreshed_at: Optional[float] = None
+        self._meta: Dict[str, Dict[str, Any]] = {}
+        # (type or "", status or "") -> ascending [(updated, id)]
+        self._orders: Dict[tuple, List[tuple]] = {}
+
+    def refresh(self, force: bool = False) -> None:
+        """Rebuild from the entity cache if stale (or always when forced)."""
+        with self._lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._refreshed_at is not None
+                and now - self._refreshed_at < ENTITY_INDEX_TTL
+            ):
+                return
+            cache = get_shared_cache(self.brain_path)
+            entities = cache.reload().get_all()
+
+            meta: Dict[str, Dict[str, Any]] = {}
+            orders: Dict[tuple, List[tuple]] = {}
+            for entity_id, data in entities.items():
+                path = Path(data.get("_path", ""))
+                if path.name in EXCLUDE_ENTITY_FILES or any(
+                    d in path.parts for d in EXCLUDE_ENTITY_DIRS
+                ):
+                    continue
+                etype = str(data.get("$type", "unknown"))
+                estatus = str(data.get("$status", "unknown"))
+                updated = data.get("$updated")
+                updated = str(updated) if updated is not None else ""
+                meta[entity_id] = {
+                    "id": entity_id,
+                    "name": data.get("name", path.stem.replace("_", " ")),
+                    "type": etype,
+                    "status": estatus,
+                    "confidence": data.get("$confidence", 0.0),
+                    "updated": updated or "N/A",
+                    "path": str(path),
+                }
+                key = (updated, entity_id)
+                for bucket in (("", ""), (etype, ""), ("", estatus), (etype, estatus)):
+                    orders.setdefault(bucket, []).append(key)
+            for keys in orders.values():
+                keys.sort()
+
+            self._meta = meta
+            self._orders = orders
+            self._refreshed_at = time.monotonic()
+
+    def lookup(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """Metadata (including path) for an entity id, or None."""
+        self.refresh()
+        meta = self._meta.get(entity_id)
+        if meta is None and self._stale_for(ENTITY_MISS_REFRESH):
+            self.refresh(force=True)
+            meta = self._meta.get(entity_id)
+        return meta
+
+    def page(
+        self,
+        entity_type: str = "",
+        status: str = "",
+        limit: int = 20,
+        cursor: str = "",
+    ) -> tuple:
+        """
+        One page of entities, newest $updated first.
+
+        Returns:
+            (entries, total matching, cursor for the next page or "")
+        """
+        self.refresh()
+        keys = self._orders.get((entity_type, status), [])
+        end = len(keys)
+        if cursor:
+            end = bisect.bisect_left(keys, self._decode_cursor(cursor))
+        start = max(0, end - max(limit, 0))
+        page_keys = keys[start:end][::-1]
+        entries = [self._meta[entity_id] for _, entity_id in page_keys]
+        next_cursor = self._encode_cursor(page_keys[-1]) if start > 0 and page_keys else ""
+        return entries, len(keys), next_cursor
+
+    def _stale_for(self, seconds: float) -> bool:
+        return (
+            self._refreshed_at is None
+            or time.monotonic() - self._refreshed_at >= seconds
+        )
+
+    @staticmethod
+    def _encode_cursor(key: tuple) -> str:
+        raw = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple:
+        try:
+            updated, entity_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            return (str(updated), str(entity_id))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+_ENGINES: Optional[BrainEngines] = None
+_ENGINES_LOCK = threading.Lock()
+
+
+def _get_engines() -> BrainEngines:
+    """Return the server-wide engine context for the resolved brain path."""
+    global _ENGINES
+    with _ENGINES_LOCK:
+        if _ENGINES is None:
+            _ENGINES = BrainEngines(_get_brain_path())
+        return _ENGINES
+
+
+def _find_entity(entity_id: str) -> Optional[Dict[str, Any]]:
+    """Load an entity by $id via the entity index (one file read)."""
+    entities = _get_engines().entities
+    for attempt in range(2):
+        meta = entities.lookup(entity_id)
+        if meta is None:
+            return None
+        data = _load_entity_file(Path(meta["path"]))
+        if data and data.get("$id") == entity_id:
+            return data
+        # File moved, deleted or re-identified since the last refresh
+        if attempt == 0:
+            entities.refresh(force=True)
+    return None
+
+
+def _compiled_relationships(entity_id: str) -> Optional[List[Dict[str, Any]]]:
+    """Relationships from the compiled graph, or None if it may be stale."""
+    engines = _get_engines()
+    graph = engines.graph()
+    meta = engines.entities.lookup(entity_id)
+    if graph is None or meta is None:
+        return None
+    node = graph.node_ids.get(entity_id)
+    if node is None:
+        return None
+    try:
+        if Path(meta["path"]).stat().st_mtime_ns > engines.graph_mtime_ns:
+            return None
+    except OSError:
+        return None
+    return [graph.edge(e).as_relationship() for e in graph.edge_range(node)]
+
+
 def _truncate_response(text: str, max_chars: int = MAX_RESPONSE_CHARS) -> str:
     """Truncate response to fit within Cowork token limits."""
     if len(text) <= max_chars:
@@ -189,20 +523,13 @@ def search_entities(query: str, entity_type: str = "", limit: int = 10) -> str:
         Formatted list of matching entities with ID, name, type, status, confidence, snippet.
     """
     try:
-        brain_path = _get_brain_path()
-
-        # Add brain tools to path for search modules
-        brain_tools = brain_path.parent.parent / "common" / "tools" / "brain"
-        if brain_tools.exists():
-            sys.path.insert(0, str(brain_tools))
-
+        engines = _get_engines()
         results = []
 
         # Try semantic search first (if available)
         try:
-            from index.vector_index import BrainVectorIndex, VECTOR_AVAILABLE
-            if VECTOR_AVAILABLE:
-                idx = BrainVectorIndex(brain_path)
+            idx = engines.vector_index()
+            if idx is not None:
                 vector_results = idx.query(
                     query,
                     top_k=limit,
@@ -224,8 +551,7 @@ def search_entities(query: str, entity_type: str = "", limit: int = 10) -> str:
         # Fall back to keyword search if no vector results
         if not results:
             try:
-                from index.brain_search import BrainSearch
-                bs = BrainSearch(brain_path=brain_path)
+                bs = engines.keyword_search()
                 keyword_results = bs.search(query, limit=limit)
                 for kr in keyword_results:
                     results.append(
@@ -263,51 +589,35 @@ def get_entity(entity_id: str) -> str:
         Full entity data: frontmatter fields + body content.
     """
     try:
-        brain_path = _get_brain_path()
-
-        # Search for entity file by $id
-        for md_file in brain_path.rglob("*.md"):
-            if md_file.name in ("BRAIN.md", "README.md"):
-                continue
-            if any(
-                d in md_file.parts
-                for d in ("Inbox", "Archive", "__pycache__", ".vector_index")
-            ):
-                continue
-
-            data = _load_entity_file(md_file)
-            if not data:
-                continue
+        data = _find_entity(entity_id)
+        if data is not None:
+            output_parts = [f"Entity: {entity_id}", f"File: {data['_path']}", "=" * 60]
+
+            # Frontmatter fields (excluding internal)
+            output_parts.append("## Frontmatter")
+            for key, value in data.items():
+                if key.startswith("_"):
+                    continue
+                if isinstance(value, (list, dict)):
+                    output_parts.append(
+                        f"{key}: {json.dumps(value, indent=2, default=str)}"
+                    )
+                else:
+                    output_parts.append(f"{key}: {value}")
+
+            # Body
+            body = data.get("_body", "")
+            if body:
+                output_parts.append("")
+                output_parts.append("## Body")
+                output_parts.append(body[:MAX_BODY_CHARS])
+                if len(body) > MAX_BODY_CHARS:
+                    output_parts.append(
+                        f"\n... ({len(body)} chars total, truncated)"
+                    )
 
-            file_id = data.get("$id", "")
-            if file_id == entity_id:
-                output_parts = [f"Entity: {entity_id}", f"File: {md_file}", "=" * 60]
-
-                # Frontmatter fields (excluding internal)
-                output_parts.append("## Frontmatter")
-                for key, value in data.items():
-                    if key.startswith("_"):
-                        continue
-                    if isinstance(value, (list, dict)):
-                        output_parts.append(
-                            f"{key}: {json.dumps(value, indent=2, default=str)}"
-                        )
-                    else:
-                        output_parts.append(f"{key}: {value}")
-
-                # Body
-                body = data.get("_body", "")
-                if body:
-                    output_parts.append("")
-                    output_parts.append("## Body")
-                    output_parts.append(body[:MAX_BODY_CHARS])
-                    if len(body) > MAX_BODY_CHARS:
-                        output_parts.append(
-                            f"\n... ({len(body)} chars total, truncated)"
-                        )
-
-                response = "\n".join(output_parts)
-                return _truncate_response(response)
+            response = "\n".join(output_parts)
+            return _truncate_response(response)
 
         return f"Entity not found: {entity_id}"
 
@@ -330,18 +640,13 @@ def query_knowledge(question: str) -> str:
         Answer with relevant entity references and source paths.
     """
     try:
-        brain_path = _get_brain_path()
-        brain_tools = brain_path.parent.parent / "common" / "tools" / "brain"
-        if brain_tools.exists():
-            sys.path.insert(0, str(brain_tools))
-
+        engines = _get_engines()
         all_findings = []
 
         # Vector search
         try:
-            from index.vector_index import BrainVectorIndex, VECTOR_AVAILABLE
-            if VECTOR_AVAILABLE:
-                idx = BrainVectorIndex(brain_path)
+            idx = engines.vector_index()
+            if idx is not None:
                 vector_results = idx.query(question, top_k=5)
                 for vr in vector_results:
                     all_findings.append({
@@ -358,8 +663,7 @@ def query_knowledge(question: str) -> str:
 
         # Keyword search
         try:
-            from index.brain_search import BrainSearch
-            bs = BrainSearch(brain_path=brain_path)
+            bs = engines.keyword_search()
             keyword_results = bs.search(question, limit=5)
             for kr in keyword_results:
                 # Avoid duplicates
@@ -423,59 +727,46 @@ def get_relationships(entity_id: str) -> str:
         List of relationships with target names, types, and confidence.
     """
     try:
-        brain_path = _get_brain_path()
-
-        for md_file in brain_path.rglob("*.md"):
-            if md_file.name in ("BRAIN.md", "README.md"):
-                continue
-            if any(
-                d in md_file.parts
-                for d in ("Inbox", "Archive", "__pycache__", ".vector_index")
-            ):
-                continue
-
-            data = _load_entity_file(md_file)
-            if not data:
-                continue
-
-            if data.get("$id") != entity_id:
-                continue
-
+        relationships = _compiled_relationships(entity_id)
+        if relationships is None:
+            data = _find_entity(entity_id)
+            if data is None:
+                return f"Entity not found: {entity_id}"
             relationships = data.get("$relationships", [])
-            if not relationships:
-                return f"Entity {entity_id} has no relationships."
+        if not relationships:
+            return f"Entity {entity_id} has no relationships."
 
-            output_parts = [
-                f"Relationships for: {entity_id}",
-                f"Total: {len(relationships)}",
-                "-" * 50,
-            ]
+        output_parts = [
+            f"Relationships for: {entity_id}",
+            f"Total: {len(relationships)}",
+            "-" * 50,
+        ]
 
-            for rel in relationships:
-                if not isinstance(rel, dict):
-                    continue
-                rel_type = rel.get("type", "unknown")
-                target = rel.get("target", "unknown")
-                confidence = rel.get("confidence", 0.0)
-                source = rel.get("source", "unknown")
-                verified = rel.get("last_verified", "N/A")
-
-                output_parts.append(
-                    f"  --[{rel_type}]--> {target}\n"
-                    f"    Confidence: {confidence} | Source: {source} | Verified: {verified}"
-                )
+        for rel in relationships:
+            if not isinstance(rel, dict):
+                continue
+            rel_type = rel.get("type", "unknown")
+            target = rel.get("target", "unknown")
+            confidence = rel.get("confidence", 0.0)
+            source = rel.get("source", "unknown")
+            verified = rel.get("last_verified", "N/A")
 
-            response = "\n".join(output_parts)
-            return _truncate_response(response)
+            output_parts.append(
+                f"  --[{rel_type}]--> {target}\n"
+                f"    Confidence: {confidence} | Source: {source} | Verified: {verified}"
+            )
 
-        return f"Entity not found: {entity_id}"
+        response = "\n".join(output_parts)
+        return _truncate_response(response)
 
     except Exception as e:
         return f"Error fetching relationships for {entity_id}: {str(e)}"
 
 
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": False})
-def list_entities(entity_type: str = "", status: str = "", limit: int = 20) -> str:
+def list_entities(
+    entity_type: str = "", status: str = "", limit: int = 20, cursor: str = ""
+) -> str:
     """
     List Brain entities with optional filters.
 
@@ -483,53 +774,15 @@ def list_entities(entity_type: str = "", status: str = "", limit: int = 20) -> s
         entity_type: Filter by type (e.g., "project", "person", "system")
         status: Filter by status (e.g., "active", "archived")
         limit: Maximum results (default: 20)
+        cursor: Next-page cursor from a previous list_entities response
 
     Returns:
         Paginated list of entities sorted by last update time.
     """
     try:
-        brain_path = _get_brain_path()
-        entities = []
-
-        exclude_dirs = {
-            "Inbox", "Archive", "__pycache__", ".snapshots", ".schema", ".vector_index"
-        }
-        exclude_files = {"BRAIN.md", "README.md", "index.md", "_index.md"}
-
-        for md_file in brain_path.rglob("*.md"):
-            if md_file.name in exclude_files:
-                continue
-            if any(d in md_file.parts for d in exclude_dirs):
-                continue
-
-            data = _load_entity_file(md_file)
-            if not data:
-                continue
-
-            etype = data.get("$type", "unknown")
-            estatus = data.get("$status", "unknown")
-
-            # Apply filters
-            if entity_type and etype != entity_type:
-                continue
-            if status and estatus != status:
-                continue
-
-            entities.append({
-                "id": data.get("$id", str(md_file.relative_to(brain_path))),
-                "name": data.get("name", data.get("_name", md_file.stem)),
-                "type": etype,
-                "status": estatus,
-                "confidence": data.get("$confidence", 0.0),
-                "updated": str(data.get("$updated", "N/A")),
-                "path": str(md_file),
-            })
-
-        # Sort by update time (newest first)
-        entities.sort(key=lambda e: e.get("updated", ""), reverse=True)
-
-        # Apply limit
-        entities = entities[:limit]
+        entities, total, next_cursor = _get_engines().entities.page(
+            entity_type=entity_type, status=status, limit=limit, cursor=cursor
+        )
 
         if not entities:
             filters = []
@@ -541,7 +794,7 @@ def list_entities(entity_type: str = "", status: str = "", limit: int = 20) -> s
             return f"No entities found{filter_str}"
 
         output_parts = [
-            f"Brain entities ({len(entities)} shown):",
+            f"Brain entities ({len(entities)} shown of {total}):",
             "",
         ]
 
@@ -553,6 +806,12 @@ def list_entities(entity_type: str = "", status: str = "", limit: int = 20) -> s
                 f"    Updated: {e['updated']}"
             )
 
+        if next_cursor:
+            output_parts.append("")
+            output_parts.append(
+                f"Next cursor: {next_cursor} (pass with the same filters)"
+            )
+
         response = "\n".join(output_parts)
         return _truncate_response(response)
 
@@ -593,6 +852,7 @@ if __name__ == "__main__":
         p_list.add_argument("--type", default="", help="Entity type filter")
         p_list.add_argument("--status", default="", help="Status filter")
         p_list.add_argument("--limit", type=int, default=20)
+        p_list.add_argument("--cursor", default="", help="Next-page cursor")
 
         args = parser.parse_args()
 
@@ -607,10 +867,16 @@ if __name__ == "__main__":
         elif args.command == "list_entities":
             print(
                 list_entities(
-                    entity_type=args.type, status=args.status, limit=args.limit
+                    entity_type=args.type,
+                    status=args.status,
+                    limit=args.limit,
+                    cursor=args.cursor,
                 )
             )
     else:
+        if os.environ.get(WARMUP_ENV, "1") != "0":
+            _get_engines().start_warm_up()
+
         # Transport selection: stdio (default) or streamable-http (Cowork)
         transport = os.environ.get("MCP_TRANSPORT", "stdio")
         if transport in ("http", "streamable-http"):
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+PM-OS Brain Graph Analytics (v5)
+
+Array-form analytics over the Brain relationship graph, computed in one
+pass from parallel (source, target) node-id arrays:
+
+- In/out degree and degree distribution
+- Weakly connected components
+- PageRank (power iteration, dangling mass redistributed uniformly)
+- Bridge entities (articulation points of the undirected graph)
+- Reciprocal (bidirectional) relationship pairs
+
+Uses NumPy (and scipy.sparse.csgraph for components) when installed and
+falls back to plain Python otherwise; both paths return the same values.
+
+Inputs come from GraphHealthMonitor (entity cache frontmatter) or from
+a CompiledGraph (graph_index.bin), see from_compiled().
+
+Usage:
+    from pm_os_brain.tools.quality.graph_analytics import analyze_edges
+
+    analytics = analyze_edges(node_ids, sources, targets)
+    analytics.top_pagerank(10)   # [(entity_id, score), ...]
+"""
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components as _sp_components
+
+    HAS_SCIPY = HAS_NUMPY
+except ImportError:
+    HAS_SCIPY = False
+
+PAGERANK_DAMPING = 0.85
+PAGERANK_MAX_ITER = 100
+PAGERANK_TOL = 1e-8
+
+# Unresolved edge target in a CompiledGraph (graph_store.NO_NODE)
+UNRESOLVED = 0xFFFFFFFF
+
+
+@dataclass
+class GraphAnalytics:
+    """Per-node analytics arrays (indexed by node id) and graph summaries."""
+
+    node_ids: List[str]
+    in_degree: List[int]
+    out_degree: List[int]
+    component_labels: List[int]
+    component_count: int = 0
+    largest_component: int = 0
+    pagerank: List[float] = field(default_factory=list)
+    bridges: List[int] = field(default_factory=list)
+    reciprocal_pairs: int = 0
+
+    def degree_distribution(self) -> Dict[int, int]:
+        """{total degree: number of nodes}, ascending by degree."""
+        counts = Counter(i + o for i, o in zip(self.in_degree, self.out_degree))
+        return dict(sorted(counts.items()))
+
+    def top_pagerank(self, k: int = 10) -> List[Tuple[str, float]]:
+        """The k most central nodes as (entity_id, pagerank)."""
+        order = sorted(range(len(self.pagerank)), key=lambda i: -self.pagerank[i])
+        return [(self.node_ids[i], round(self.pagerank[i], 6)) for i in order[:k]]
+
+    def bridge_entities(self, k: Optional[int] = None) -> List[str]:
+        """Articulation points, highest-degree first."""
+        ranked = sorted(
+            self.bridges, key=lambda i: -(self.in_degree[i] + self.out_degree[i])
+        )
+        return [self.node_ids[i] for i in ranked[:k]]
+
+    def pagerank_by_id(self) -> Dict[str, float]:
+        """{entity_id: pagerank}."""
+        return dict(zip(self.node_ids, self.pagerank))
+
+
+def analyze_edges(
+    node_ids: List[str],
+    sources: Sequence[int],
+    targets: Sequence[int],
+    with_bridges: bool = True,
+) -> GraphAnalytics:
+    """
+    Compute all analytics for a directed graph.
+
+    Args:
+        node_ids: Entity id per node
+        sources: Source node id per edge
+        targets: Target node id per edge (same length as sources)
+        with_bridges: Also compute articulation points
+
+    Returns:
+        GraphAnalytics
+    """
+    n = len(node_ids)
+    if HAS_NUMPY:
+        src = np.asarray(sources, dtype=np.int64)
+        dst = np.asarray(targets, dtype=np.int64)
+        in_degree = np.bincount(dst, minlength=n)
+        out_degree = np.bincount(src, minlength=n)
+        labels, count = _components_numpy(n, src, dst)
+        pagerank = _pagerank_numpy(n, src, dst, out_degree)
+        reciprocal = _reciprocal_numpy(n, src, dst)
+        result = GraphAnalytics(
+            node_ids=node_ids,
+            in_degree=in_degree.tolist(),
+            out_degree=out_degree.tolist(),
+            component_labels=labels.tolist(),
+            component_count=count,
+            largest_component=int(np.bincount(labels).max()) if n else 0,
+            pagerank=pagerank.tolist(),
+            reciprocal_pairs=reciprocal,
+        )
+    else:
+        src, dst = list(sources), list(targets)
+        in_degree = [0] * n
+        out_degree = [0] * n
+        for s, d in zip(src, dst):
+            out_degree[s] += 1
+            in_degree[d] += 1
+        labels, count = _components_python(n, src, dst)
+        result = GraphAnalytics(
+            node_ids=node_ids,
+            in_degree=in_degree,
+            out_degree=out_degree,
+            component_labels=labels,
+            component_count=count,
+            largest_component=max(Counter(labels).values()) if n else 0,
+            pagerank=_pagerank_python(n, src, dst, out_degree),
+            reciprocal_pairs=_reciprocal_python(src, dst),
+        )
+
+    if with_bridges:
+        result.bridges = _articulation_points(n, src, dst)
+    return result
+
+
+def from_compiled(graph: Any, with_bridges: bool = True) -> GraphAnalytics:
+    """Analytics over a CompiledGraph's resolved edges."""
+    offsets = graph.offsets
+    n = len(graph.nodes)
+    if HAS_NUMPY:
+        offs = np.asarray(offsets, dtype=np.int64)
+        all_targets = np.asarray(graph.targets, dtype=np.int64)
+        all_sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(offs))
+        resolved = all_targets != UNRESOLVED
+        return analyze_edges(
+            graph.nodes, all_sources[resolved], all_targets[resolved], with_bridges
+        )
+    sources, targets = [], []
+    for node in range(n):
+        for e in range(offsets[node], offsets[node + 1]):
+            target = graph.targets[e]
+            if target != UNRESOLVED:
+                sources.append(node)
+                targets.append(target)
+    return analyze_edges(graph.nodes, sources, targets, with_bridges)
+
+
+# ---------------------------------------------------------------------------
+# Components
+# ---------------------------------------------------------------------------
+
+
+def _components_numpy(n: int, src, dst) -> Tuple[Any, int]:
+    if n == 0:
+        return np.zeros(0, dtype=np.int64), 0
+    if HAS_SCIPY:
+        matrix = coo_matrix(
+            (np.ones(len(src), dtype=np.int8), (src, dst)), shape=(n, n)
+        ).tocsr()
+        count, labels = _sp_components(matrix, directed=True, connection="weak")
+        return labels.astype(np.int64), int(count)
+    labels, count = _components_python(n, src.tolist(), dst.tolist())
+    return np.asarray(labels, dtype=np.int64), count
+
+
+def _components_python(n: int, src: List[int], dst: List[int]) -> Tuple[List[int], int]:
+    """Weak components by union-find; labels numbered in node order."""
+    parent = list(range(n))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for s, d in zip(src, dst):
+        rs, rd = find(s), find(d)
+        if rs != rd:
+            parent[max(rs, rd)] = min(rs, rd)
+
+    labels = [0] * n
+    numbering: Dict[int, int] = {}
+    for i in range(n):
+        root = find(i)
+        if root not in numbering:
+            numbering[root] = len(numbering)
+        labels[i] = numbering[root]
+    return labels, len(numbering)
+
+
+# ---------------------------------------------------------------------------
+# PageRank
+# ---------------------------------------------------------------------------
+
+
+def _pagerank_numpy(n: int, src, dst, out_degree):
+    if n == 0:
+        return np.zeros(0)
+    rank = np.full(n, 1.0 / n)
+    dangling = out_degree == 0
+    inv_out = np.where(dangling, 0.0, 1.0 / np.maximum(out_degree, 1))
+    for _ in range(PAGERANK_MAX_ITER):
+        spread = np.bincount(dst, weights=(rank * inv_out)[src], minlength=n)
+        new = (1.0 - PAGERANK_DAMPING) / n + PAGERANK_DAMPING * (
+            spread + rank[dangling].sum() / n
+        )
+        delta = np.abs(new - rank).sum()
+        rank = new
+        if delta < PAGERANK_TOL:
+            break
+    return rank
+
+
+def _pagerank_python(n: int, src: List[int], dst: List[int], out_degree: List[int]) -> List[float]:
+    if n == 0:
+        return []
+    rank = [1.0 / n] * n
+    for _ in range(PAGERANK_MAX_ITER):
+        spread = [0.0] * n
+        for s, d in zip(src, dst):
+            spread[d] += rank[s] / out_degree[s]
+        dangling = sum(r for r, o in zip(rank, out_degree) if o == 0)
+        base = (1.0 - PAGERANK_DAMPING) / n + PAGERANK_DAMPING * dangling / n
+        new = [base + PAGERANK_DAMPING * x for x in spread]
+        delta = sum(abs(a - b) for a, b in zip(new, rank))
+        rank = new
+        if delta < PAGERANK_TOL:
+            break
+    return rank
+
+
+# ---------------------------------------------------------------------------
+# Reciprocity and articulation points
+# ---------------------------------------------------------------------------
+
+
+def _reciprocal_numpy(n: int, src, dst) -> int:
+    """Unordered node pairs linked in both directions."""
+    mask = src != dst
+    forward = np.unique(src[mask] * n + dst[mask])
+    backward = np.unique(dst[mask] * n + src[mask])
+    return int(np.intersect1d(forward, backward, assume_unique=True).size // 2)
+
+
+def _reciprocal_python(src: List[int], dst: List[int]) -> int:
+    pairs = {(s, d) for s, d in zip(src, dst) if s != d}
+    return sum(1 for s, d in pairs if s < d and (d, s) in pairs)
+
+
+def _articulation_points(n: int, src, dst) -> List[int]:
+    """Nodes whose removal splits their (undirected) component."""
+    adjacency: List[List[int]] = [[] for _ in range(n)]
+    for s, d in zip(list(src), list(dst)):
+        if s != d:
+            adjacency[s].append(d)
+            adjacency[d].append(s)
+
+    disc = [-1] * n
+    low = [0] * n
+    points = set()
+    timer = 0
+    for root in range(n):
+        if disc[root] != -1:
+            continue
+        disc[root] = low[root] = timer
+        timer += 1
+        root_children = 0
+        # (node, parent, next neighbor index)
+        stack = [(root, -1, 0)]
+        while stack:
+            node, parent, i = stack[-1]
+            neighbors = adjacency[node]
+            if i < len(neighbors):
+                stack[-1] = (node, parent, i + 1)
+                nxt = neighbors[i]
+                if disc[nxt] == -1:
+                    disc[nxt] = low[nxt] = timer
+                    timer += 1
+                    if node == root:
+                        root_children += 1
+                    stack.append((nxt, node, 0))
+                elif nxt != parent:
+                    low[node] = min(low[node], disc[nxt])
+            else:
+                stack.pop()
+                if parent != -1:
+                    low[parent] = min(low[parent], low[node])
+                    if parent != root and low[node] >= disc[parent]:
+                        points.add(parent)
+        if root_children > 1:
+            points.add(root)
+    return sorted(points)
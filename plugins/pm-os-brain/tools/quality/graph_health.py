@@ -11,18 +11,18 @@ Provides metrics for:
 - Orphan detection (entities with no connections)
 - Type-specific metrics
 - Inferred edge tracking
+- Components, PageRank centrality and bridge entities (graph_analytics)
 
 Version: 5.0.0
 """
 
 import logging
+import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-import yaml
-
 # v5 config-driven imports
 try:
     from pm_os_base.tools.core.path_resolver import get_paths
@@ -40,6 +40,17 @@ except ImportError:
     except ImportError:
         get_config = None
 
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import get_shared_cache
+
+try:
+    from pm_os_brain.tools.quality.graph_analytics import analyze_edges
+except ImportError:
+    from quality.graph_analytics import analyze_edges
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,6 +88,13 @@ class GraphHealthReport:
     inferred_edge_count: int = 0
     inferred_edge_sources: Dict[str, int] = field(default_factory=dict)
 
+    # Structure (weakly connected components, PageRank, articulation points)
+    connected_components: int = 0
+    largest_component: int = 0
+    degree_distribution: Dict[int, int] = field(default_factory=dict)
+    central_entities: List[Tuple[str, float]] = field(default_factory=list)
+    bridge_entities: List[str] = field(default_factory=list)
+
 
 class GraphHealthMonitor:
     """
@@ -107,11 +125,11 @@ class GraphHealthMonitor:
 
         Args:
             brain_path: Path to brain directory
-            cache: Optional EntityCache instance. If provided, avoids
-                   re-scanning the filesystem.
+            cache: Optional EntityCache instance. Defaults to the
+                   process-wide shared cache for brain_path.
         """
         self.brain_path = brain_path
-        self._cache = cache
+        self._cache = cache if cache is not None else get_shared_cache(brain_path)
 
         # Load config-driven values
         self.healthy_relationship_count = dict(self.DEFAULT_HEALTHY_RELATIONSHIP_COUNT)
@@ -135,18 +153,14 @@ class GraphHealthMonitor:
         """
         # Data structures
         entities: Dict[str, Dict[str, Any]] = {}  # id -> frontmatter
-        outgoing: Dict[str, List[str]] = defaultdict(list)  # id -> [targets]
-        incoming: Dict[str, List[str]] = defaultdict(list)  # id -> [sources]
+        outgoing: Dict[str, int] = defaultdict(int)  # id -> relationship count
+        edge_pairs: List[Tuple[str, str]] = []  # (source id, raw target)
         relationship_types: Dict[str, int] = defaultdict(int)
         entity_types: Dict[str, int] = defaultdict(int)
         relationships_by_entity_type: Dict[str, List[int]] = defaultdict(list)
         inferred_sources: Dict[str, int] = defaultdict(int)
 
-        # Load entities -- from cache if available, otherwise scan files
-        if self._cache is not None:
-            cached = self._cache.get_all()
-        else:
-            cached = self._scan_entities()
+        cached = self._cache.get_all()
 
         for entity_id, frontmatter in cached.items():
             entity_type = frontmatter.get("$type", "unknown")
@@ -165,46 +179,53 @@ class GraphHealthMonitor:
                 source = rel.get("source", "manual")
 
                 relationship_types[rel_type] += 1
-                outgoing[entity_id].append(target)
-                incoming[target].append(entity_id)
+                edge_pairs.append((entity_id, target))
                 rel_count += 1
 
                 # Track inferred edges
                 if source in ("auto_embedding", "auto_generated", "inferred"):
                     inferred_sources[source] += 1
 
+            outgoing[entity_id] = rel_count
             relationships_by_entity_type[entity_type].append(rel_count)
 
+        # Array form: targets matching an entity id become edges, the rest
+        # (names, aliases, dangling ids) only count as outgoing
+        node_ids = list(entities)
+        index = {eid: i for i, eid in enumerate(node_ids)}
+        sources: List[int] = []
+        targets: List[int] = []
+        for entity_id, target in edge_pairs:
+            node = index.get(target)
+            if node is not None:
+                sources.append(index[entity_id])
+                targets.append(node)
+        analytics = analyze_edges(node_ids, sources, targets)
+
         # Compute metrics
         total_entities = len(entities)
-        total_relationships = sum(len(rels) for rels in outgoing.values())
+        total_relationships = len(edge_pairs)
 
-        entities_with_outgoing = sum(1 for rels in outgoing.values() if rels)
-        entities_with_incoming = len(
-            [e for e in entities if e in incoming and incoming[e]]
-        )
+        entities_with_outgoing = sum(1 for count in outgoing.values() if count)
+        entities_with_incoming = sum(1 for d in analytics.in_degree if d)
 
         # Orphans: no outgoing AND no incoming
         # An entity is an orphan if it has:
-        #   1. No outgoing relationships (not in outgoing dict)
+        #   1. No outgoing relationships
         #   2. No incoming relationships (not referenced by others)
         #   3. Not marked as standalone (legitimately independent)
-        all_targets = set()
-        for targets in outgoing.values():
-            all_targets.update(targets)
-
         orphans = [
             eid
-            for eid in entities
-            if not outgoing.get(eid)
-            and eid not in all_targets
+            for i, eid in enumerate(node_ids)
+            if not outgoing[eid]
+            and not analytics.in_degree[i]
             and entities[eid].get("$orphan_reason") != "standalone"
         ]
 
         # Connectivity ranking
         connectivity = [
-            (eid, len(outgoing.get(eid, [])) + len(incoming.get(eid, [])))
-            for eid in entities
+            (eid, outgoing[eid] + analytics.in_degree[i])
+            for i, eid in enumerate(node_ids)
         ]
         connectivity.sort(key=lambda x: -x[1])
 
@@ -226,7 +247,7 @@ class GraphHealthMonitor:
             orphan_entities=len(orphans),
             total_relationships=total_relationships,
             unique_relationship_types=len(relationship_types),
-            bidirectional_relationships=0,  # Would need more analysis
+            bidirectional_relationships=analytics.reciprocal_pairs,
             relationship_coverage=round(coverage, 3),
             avg_relationships_per_entity=round(avg_rels, 2),
             density_score=round(density_score, 3),
@@ -238,6 +259,11 @@ class GraphHealthMonitor:
             least_connected=[c for c in connectivity[-10:] if c[1] > 0],
             inferred_edge_count=sum(inferred_sources.values()),
             inferred_edge_sources=dict(inferred_sources),
+            connected_components=analytics.component_count,
+            largest_component=analytics.largest_component,
+            degree_distribution=analytics.degree_distribution(),
+            central_entities=analytics.top_pagerank(10),
+            bridge_entities=analytics.bridge_entities(20),
         )
 
     def get_orphans(self) -> List[Dict[str, Any]]:
@@ -251,68 +277,19 @@ class GraphHealthMonitor:
         orphan_details = []
 
         for orphan_id in report.orphans:
-            # Find the entity file
-            for entity_path in self.brain_path.rglob("*.md"):
-                try:
-                    content = entity_path.read_text(encoding="utf-8")
-                    frontmatter, _ = self._parse_content(content)
-
-                    if frontmatter.get("$id") == orphan_id:
-                        orphan_details.append(
-                            {
-                                "id": orphan_id,
-                                "type": frontmatter.get("$type", "unknown"),
-                                "name": frontmatter.get("name", ""),
-                                "status": frontmatter.get("$status", "unknown"),
-                                "path": str(
-                                    entity_path.relative_to(self.brain_path)
-                                ),
-                            }
-                        )
-                        break
-                except Exception:
-                    continue
+            frontmatter = self._cache.get_by_id(orphan_id)
+            if frontmatter is None:
+                continue
+            orphan_details.append(
+                {
+                    "id": orphan_id,
+                    "type": frontmatter.get("$type", "unknown"),
+                    "name": frontmatter.get("name", ""),
+                    "status": frontmatter.get("$status", "unknown"),
+                    "path": str(
+                        frontmatter["_path"].relative_to(self.brain_path)
+                    ),
+                }
+            )
 
         return orphan_details
-
-    def _scan_entities(self) -> Dict[str, Dict[str, Any]]:
-        """Fallback: scan brain directory when no cache is available."""
-        result = {}
-        entity_files = list(self.brain_path.rglob("*.md"))
-        entity_files = [
-            f
-            for f in entity_files
-            if f.name.lower() not in ("readme.md", "index.md", "_index.md")
-            and ".snapshots" not in str(f)
-            and ".schema" not in str(f)
-        ]
-        for entity_path in entity_files:
-            try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter, body = self._parse_content(content)
-                if not frontmatter:
-                    continue
-                entity_id = frontmatter.get(
-                    "$id", str(entity_path.relative_to(self.brain_path))
-                )
-                frontmatter["_path"] = entity_path
-                frontmatter["_body"] = body
-                result[entity_id] = frontmatter
-            except Exception:
-                continue
-        return result
-
-    def _parse_content(self, content: str) -> Tuple[Dict[str, Any], str]:
-        """Parse YAML frontmatter from content."""
-        if not content.startswith("---"):
-            return {}, content
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}, content
-
-        try:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            return frontmatter, parts[2]
-        except yaml.YAMLError:
-            return {}, content
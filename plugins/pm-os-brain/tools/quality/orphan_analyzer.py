@@ -16,6 +16,7 @@ Version: 5.0.0
 """
 
 import logging
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -57,6 +58,12 @@ except ImportError:
     except ImportError:
         EventHelper = None
 
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache, parse_frontmatter
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import get_shared_cache, parse_frontmatter
+
 logger = logging.getLogger(__name__)
 
 # Default entity types that are legitimately standalone (config-overridable)
@@ -100,9 +107,16 @@ class OrphanAnalyzer:
     - enrichment_failed: Processing failed
     """
 
-    def __init__(self, brain_path: Path):
-        """Initialize the analyzer."""
+    def __init__(self, brain_path: Path, cache=None):
+        """Initialize the analyzer.
+
+        Args:
+            brain_path: Path to brain directory
+            cache: Optional EntityCache instance. Defaults to the
+                   process-wide shared cache for brain_path.
+        """
         self.brain_path = brain_path
+        self._cache = cache if cache is not None else get_shared_cache(brain_path)
 
         # Load config-driven values
         self.standalone_types = list(DEFAULT_STANDALONE_TYPES)
@@ -140,14 +154,8 @@ class OrphanAnalyzer:
         orphans_by_reason: Dict[str, int] = {}
         orphan_details: List[Dict[str, Any]] = []
 
-        for entity_path in self._get_entity_files():
+        for frontmatter in self._cache.get_files():
             try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter, _ = self._parse_content(content)
-
-                if not frontmatter:
-                    continue
-
                 total_entities += 1
                 entity_id = frontmatter.get("$id", "")
                 etype = frontmatter.get("$type", "unknown")
@@ -207,32 +215,19 @@ class OrphanAnalyzer:
         """
         updated = 0
 
-        for entity_path in self._get_entity_files():
+        for frontmatter in self._cache.get_files():
             try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter, body = self._parse_content(content)
-
-                if not frontmatter:
-                    continue
-
                 relationships = frontmatter.get("$relationships", [])
                 orphan_reason = frontmatter.get("$orphan_reason")
 
                 # Only update orphans without a reason
                 if not relationships and not orphan_reason:
-                    frontmatter["$orphan_reason"] = "pending_enrichment"
-
                     if not dry_run:
-                        if EventHelper is not None:
-                            event = EventHelper.create_field_update(
-                                actor="system/orphan_analyzer",
-                                field="$orphan_reason",
-                                new_value="pending_enrichment",
-                                message="Marked orphan as pending enrichment",
-                            )
-                            EventHelper.append_to_frontmatter(frontmatter, event)
-                        new_content = self._format_content(frontmatter, body)
-                        atomic_write(entity_path, new_content)
+                        self._set_orphan_reason(
+                            frontmatter["_path"],
+                            "pending_enrichment",
+                            "Marked orphan as pending enrichment",
+                        )
 
                     updated += 1
 
@@ -264,32 +259,19 @@ class OrphanAnalyzer:
         types_to_mark = entity_types or self.standalone_types
         updated = 0
 
-        for entity_path in self._get_entity_files():
+        for frontmatter in self._cache.get_files():
             try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter, body = self._parse_content(content)
-
-                if not frontmatter:
-                    continue
-
                 etype = frontmatter.get("$type", "unknown")
                 relationships = frontmatter.get("$relationships", [])
 
                 # Mark orphan entities of specified types as standalone
                 if etype in types_to_mark and not relationships:
-                    frontmatter["$orphan_reason"] = "standalone"
-
                     if not dry_run:
-                        if EventHelper is not None:
-                            event = EventHelper.create_field_update(
-                                actor="system/orphan_analyzer",
-                                field="$orphan_reason",
-                                new_value="standalone",
-                                message="Marked entity as standalone orphan",
-                            )
-                            EventHelper.append_to_frontmatter(frontmatter, event)
-                        new_content = self._format_content(frontmatter, body)
-                        atomic_write(entity_path, new_content)
+                        self._set_orphan_reason(
+                            frontmatter["_path"],
+                            "standalone",
+                            "Marked entity as standalone orphan",
+                        )
 
                     updated += 1
 
@@ -321,31 +303,20 @@ class OrphanAnalyzer:
         updated = 0
         ids_set = set(entity_ids)
 
-        for entity_path in self._get_entity_files():
+        for entity_id in ids_set:
+            frontmatter = self._cache.get_by_id(entity_id)
+            if frontmatter is None:
+                continue
             try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter, body = self._parse_content(content)
-
-                if not frontmatter:
-                    continue
-
-                entity_id = frontmatter.get("$id", "")
                 relationships = frontmatter.get("$relationships", [])
 
-                if entity_id in ids_set and not relationships:
-                    frontmatter["$orphan_reason"] = "no_external_data"
-
+                if not relationships:
                     if not dry_run:
-                        if EventHelper is not None:
-                            event = EventHelper.create_field_update(
-                                actor="system/orphan_analyzer",
-                                field="$orphan_reason",
-                                new_value="no_external_data",
-                                message="Enrichers found no external data",
-                            )
-                            EventHelper.append_to_frontmatter(frontmatter, event)
-                        new_content = self._format_content(frontmatter, body)
-                        atomic_write(entity_path, new_content)
+                        self._set_orphan_reason(
+                            frontmatter["_path"],
+                            "no_external_data",
+                            "Enrichers found no external data",
+                        )
 
                     updated += 1
 
@@ -369,33 +340,20 @@ class OrphanAnalyzer:
         """
         updated = 0
 
-        for entity_path in self._get_entity_files():
+        for frontmatter in self._cache.get_files():
             try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter, body = self._parse_content(content)
-
-                if not frontmatter:
-                    continue
-
                 relationships = frontmatter.get("$relationships", [])
                 orphan_reason = frontmatter.get("$orphan_reason")
 
                 # Clear reason if entity now has relationships
                 if relationships and orphan_reason:
-                    del frontmatter["$orphan_reason"]
-
                     if not dry_run:
-                        if EventHelper is not None:
-                            event = EventHelper.create_field_update(
-                                actor="system/orphan_analyzer",
-                                field="$orphan_reason",
-                                new_value=None,
-                                old_value=orphan_reason,
-                                message="Cleared orphan reason (now connected)",
-                            )
-                            EventHelper.append_to_frontmatter(frontmatter, event)
-                        new_content = self._format_content(frontmatter, body)
-                        atomic_write(entity_path, new_content)
+                        self._set_orphan_reason(
+                            frontmatter["_path"],
+                            None,
+                            "Cleared orphan reason (now connected)",
+                            old_value=orphan_reason,
+                        )
 
                     updated += 1
 
@@ -404,31 +362,36 @@ class OrphanAnalyzer:
 
         return updated
 
-    def _get_entity_files(self) -> List[Path]:
-        """Get all entity files in brain."""
-        files = list(self.brain_path.rglob("*.md"))
-        return [
-            f
-            for f in files
-            if f.name.lower() not in ("readme.md", "index.md", "_index.md")
-            and ".snapshots" not in str(f)
-            and ".schema" not in str(f)
-        ]
-
-    def _parse_content(self, content: str) -> Tuple[Dict[str, Any], str]:
-        """Parse YAML frontmatter from content."""
-        if not content.startswith("---"):
-            return {}, content
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}, content
-
-        try:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            return frontmatter, parts[2]
-        except yaml.YAMLError:
-            return {}, content
+    def _set_orphan_reason(
+        self,
+        entity_path: Path,
+        new_value: Optional[str],
+        message: str,
+        old_value: Optional[str] = None,
+    ) -> None:
+        """Rewrite $orphan_reason in an entity file (None clears it)."""
+        content = entity_path.read_text(encoding="utf-8")
+        frontmatter, body = parse_frontmatter(content)
+        if not frontmatter:
+            return
+
+        if new_value is None:
+            frontmatter.pop("$orphan_reason", None)
+        else:
+            frontmatter["$orphan_reason"] = new_value
+
+        if EventHelper is not None:
+            event = EventHelper.create_field_update(
+                actor="system/orphan_analyzer",
+                field="$orphan_reason",
+                new_value=new_value,
+                old_value=old_value,
+                message=message,
+            )
+            EventHelper.append_to_frontmatter(frontmatter, event)
+        new_content = self._format_content(frontmatter, body)
+        atomic_write(entity_path, new_content)
+        self._cache.invalidate_path(entity_path)
 
     def _format_content(self, frontmatter: Dict[str, Any], body: str) -> str:
         """Format frontmatter and body back to markdown."""
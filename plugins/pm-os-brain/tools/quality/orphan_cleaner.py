@@ -15,6 +15,7 @@ Version: 5.0.0
 
 import logging
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -59,6 +60,12 @@ except ImportError:
     except ImportError:
         EventHelper = None
 
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache, parse_frontmatter
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import get_shared_cache, parse_frontmatter
+
 logger = logging.getLogger(__name__)
 
 
@@ -125,20 +132,27 @@ class OrphanCleaner:
         r".*\.inbox\..*$",
     ]
 
-    def __init__(self, brain_path: Path):
+    def __init__(self, brain_path: Path, cache=None):
         """
         Initialize the cleaner.
 
         Args:
             brain_path: Path to the brain directory
+            cache: Optional EntityCache instance. Defaults to the
+                   process-wide shared cache for brain_path.
         """
         self.brain_path = brain_path
+        self._cache = cache if cache is not None else get_shared_cache(brain_path)
+
+        # Batch lookups prefetched by analyze_orphans()
+        self._resolved: Dict[str, Optional[str]] = {}
+        self._similar: Dict[str, List[Tuple[str, float]]] = {}
 
         # Initialize resolver if available
         self.resolver = None
         if CanonicalResolver is not None:
             try:
-                self.resolver = CanonicalResolver(brain_path)
+                self.resolver = CanonicalResolver(brain_path, cache=self._cache)
             except Exception as e:
                 logger.warning("Failed to initialize CanonicalResolver: %s", e)
 
@@ -149,36 +163,33 @@ class OrphanCleaner:
         Returns:
             List of OrphanTarget with categorization
         """
+        entities = self._cache.get_files()
         if self.resolver is not None:
             self.resolver.build_index()
+            self._prefetch(
+                rel.get("target", "")
+                for frontmatter in entities
+                for rel in frontmatter.get("$relationships", [])
+                if isinstance(rel, dict) and rel.get("target")
+            )
 
         orphans = []
-        entity_files = list(self.brain_path.rglob("*.md"))
-        entity_files = [
-            f
-            for f in entity_files
-            if f.name.lower() not in ("readme.md", "index.md", "_index.md")
-            and ".snapshots" not in str(f)
-            and ".schema" not in str(f)
-            and ".events" not in str(f)
-        ]
-
-        for entity_path in entity_files:
-            entity_orphans = self._find_entity_orphans(entity_path)
+        for frontmatter in entities:
+            entity_orphans = self._find_entity_orphans(
+                frontmatter["_path"], frontmatter
+            )
             orphans.extend(entity_orphans)
 
         return orphans
 
-    def _find_entity_orphans(self, entity_path: Path) -> List[OrphanTarget]:
+    def _find_entity_orphans(
+        self,
+        entity_path: Path,
+        frontmatter: Dict[str, Any],
+    ) -> List[OrphanTarget]:
         """Find orphan targets in a single entity."""
         orphans = []
 
-        try:
-            content = entity_path.read_text(encoding="utf-8")
-            frontmatter = self._parse_frontmatter(content)
-        except Exception:
-            return []
-
         canonical_id = frontmatter.get("$id", str(entity_path))
         relationships = frontmatter.get("$relationships", [])
 
@@ -214,8 +225,16 @@ class OrphanCleaner:
 
         return orphans
 
+    def _prefetch(self, targets) -> None:
+        """Resolve all targets, then fuzzy-match the unresolved ones, in batch."""
+        self._resolved = self.resolver.resolve_many(list(targets))
+        unresolved = [t for t, canonical in self._resolved.items() if canonical is None]
+        self._similar = self.resolver.find_similar_many(unresolved, max_results=3)
+
     def _resolve(self, target: str) -> Optional[str]:
         """Resolve a reference using the canonical resolver if available."""
+        if target in self._resolved:
+            return self._resolved[target]
         if self.resolver is not None:
             return self.resolver.resolve(target)
         return None
@@ -224,6 +243,8 @@ class OrphanCleaner:
         self, target: str, max_results: int = 3
     ) -> List[Tuple[str, float]]:
         """Find similar references using the resolver if available."""
+        if target in self._similar:
+            return self._similar[target][:max_results]
         if self.resolver is not None:
             return self.resolver.find_similar(target, max_results=max_results)
         return []
@@ -355,7 +376,7 @@ class OrphanCleaner:
         """Apply cleanup changes to an entity."""
         try:
             content = entity_path.read_text(encoding="utf-8")
-            frontmatter, body = self._parse_content(content)
+            frontmatter, body = parse_frontmatter(content)
         except Exception:
             return
 
@@ -411,6 +432,7 @@ class OrphanCleaner:
         # Write back
         new_content = self._rebuild_content(frontmatter, body)
         entity_path.write_text(new_content, encoding="utf-8")
+        self._cache.invalidate_path(entity_path)
 
     def generate_report(
         self,
@@ -521,35 +543,6 @@ class OrphanCleaner:
 
         return "\n".join(lines)
 
-    def _parse_frontmatter(self, content: str) -> Dict[str, Any]:
-        """Parse YAML frontmatter."""
-        if not content.startswith("---"):
-            return {}
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}
-
-        try:
-            return yaml.safe_load(parts[1]) or {}
-        except yaml.YAMLError:
-            return {}
-
-    def _parse_content(self, content: str) -> Tuple[Dict[str, Any], str]:
-        """Parse frontmatter and body."""
-        if not content.startswith("---"):
-            return {}, content
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}, content
-
-        try:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            return frontmatter, parts[2]
-        except yaml.YAMLError:
-            return {}, content
-
     def _rebuild_content(self, frontmatter: Dict[str, Any], body: str) -> str:
         """Rebuild file content from frontmatter and body."""
         yaml_content = yaml.dump(
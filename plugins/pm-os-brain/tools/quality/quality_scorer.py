@@ -15,13 +15,12 @@ Version: 5.0.0
 """
 
 import logging
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
-
 # v5 config-driven imports
 try:
     from pm_os_base.tools.core.path_resolver import get_paths
@@ -39,6 +38,12 @@ except ImportError:
     except ImportError:
         get_config = None
 
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache, parse_frontmatter
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import get_shared_cache, parse_frontmatter
+
 logger = logging.getLogger(__name__)
 
 
@@ -186,14 +191,17 @@ class QualityScorer:
     THRESHOLD_ACCEPT = 0.4
     THRESHOLD_QUARANTINE = 0.2
 
-    def __init__(self, brain_path: Path):
+    def __init__(self, brain_path: Path, cache=None):
         """
         Initialize the quality scorer.
 
         Args:
             brain_path: Path to the brain directory
+            cache: Optional EntityCache instance. Defaults to the
+                   process-wide shared cache for brain_path.
         """
         self.brain_path = brain_path
+        self._cache = cache if cache is not None else get_shared_cache(brain_path)
 
     def score_entity(self, entity_path: Path) -> QualityScore:
         """
@@ -206,9 +214,15 @@ class QualityScorer:
             QualityScore with breakdown
         """
         content = entity_path.read_text(encoding="utf-8")
-        frontmatter, body = self._parse_content(content)
+        frontmatter, body = parse_frontmatter(content)
 
         entity_id = str(entity_path.relative_to(self.brain_path))
+        return self._score_frontmatter(frontmatter, body, entity_id)
+
+    def _score_frontmatter(
+        self, frontmatter: Dict[str, Any], body: str, entity_id: str
+    ) -> QualityScore:
+        """Calculate quality score from already-parsed frontmatter and body."""
         entity_type = frontmatter.get("$type", "unknown")
 
         # Calculate component scores
@@ -252,33 +266,8 @@ class QualityScorer:
         Returns:
             QualityScore with breakdown
         """
-        frontmatter, body = self._parse_content(content)
-        entity_type = frontmatter.get("$type", "unknown")
-
-        completeness = self._score_completeness(frontmatter, body, entity_type)
-        freshness = self._score_freshness(frontmatter)
-        relationships = self._score_relationships(frontmatter)
-        source_reliability = self._score_source_reliability(frontmatter)
-        kappa = self.compute_kappa(frontmatter, entity_type)
-
-        overall = completeness * 0.40 + source_reliability * 0.40 + freshness * 0.20
-
-        issues, recommendations = self._analyze_issues(
-            frontmatter, body, entity_type, completeness, freshness
-        )
-
-        return QualityScore(
-            entity_id=entity_id,
-            entity_type=entity_type,
-            overall_score=round(overall, 2),
-            completeness_score=round(completeness, 2),
-            freshness_score=round(freshness, 2),
-            relationship_score=round(relationships, 2),
-            source_reliability_score=round(source_reliability, 2),
-            kappa_score=kappa,
-            issues=issues,
-            recommendations=recommendations,
-        )
+        frontmatter, body = parse_frontmatter(content)
+        return self._score_frontmatter(frontmatter, body, entity_id)
 
     def gate_decision(self, score: QualityScore) -> str:
         """
@@ -311,18 +300,12 @@ class QualityScorer:
         """
         scores = []
 
-        entity_files = list(self.brain_path.rglob("*.md"))
-        entity_files = [
-            f
-            for f in entity_files
-            if f.name.lower() not in ("readme.md", "index.md", "_index.md")
-            and ".snapshots" not in str(f)
-            and ".schema" not in str(f)
-        ]
-
-        for entity_path in entity_files:
+        for frontmatter in self._cache.get_files():
             try:
-                score = self.score_entity(entity_path)
+                entity_id = str(frontmatter["_path"].relative_to(self.brain_path))
+                score = self._score_frontmatter(
+                    frontmatter, frontmatter.get("_body", ""), entity_id
+                )
 
                 if entity_type and score.entity_type != entity_type:
                     continue
@@ -575,18 +558,3 @@ class QualityScorer:
             recommendations.append("Enrich from authoritative sources")
 
         return issues, recommendations
-
-    def _parse_content(self, content: str) -> Tuple[Dict[str, Any], str]:
-        """Parse frontmatter and body from content."""
-        if not content.startswith("---"):
-            return {}, content
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}, content
-
-        try:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            return frontmatter, parts[2]
-        except yaml.YAMLError:
-            return {}, content
@@ -283,6 +283,53 @@ class ReferenceValidator:
 
         return (False, None, f"Could not resolve reference '{reference}'")
 
+    def validate_references(
+        self, references: List[str]
+    ) -> Dict[str, Tuple[bool, Optional[str], Optional[str]]]:
+        """
+        Validate a batch of references (see validate_reference).
+
+        Resolution and fuzzy matching run once per distinct reference
+        through the resolver's batch APIs.
+
+        Args:
+            references: References to validate
+
+        Returns:
+            Dict of reference -> (is_valid, canonical_form, error_message)
+        """
+        if self.resolver is None:
+            return {ref: self.validate_reference(ref) for ref in references}
+
+        self.resolver.build_index()
+        resolved = self.resolver.resolve_many(references)
+        similar = self.resolver.find_similar_many(
+            [
+                ref
+                for ref, canonical in resolved.items()
+                if canonical is None and not self.CANONICAL_PATTERN.match(ref)
+            ],
+            max_results=1,
+        )
+
+        results = {}
+        for ref, canonical in resolved.items():
+            if canonical:
+                form = ref if self.CANONICAL_PATTERN.match(ref) else canonical
+                results[ref] = (True, form, None)
+            elif self.CANONICAL_PATTERN.match(ref):
+                results[ref] = (False, None, f"Canonical reference '{ref}' does not exist")
+            elif similar.get(ref):
+                suggestion = similar[ref][0][0]
+                results[ref] = (
+                    False,
+                    suggestion,
+                    f"Could not resolve '{ref}'. Did you mean '{suggestion}'?",
+                )
+            else:
+                results[ref] = (False, None, f"Could not resolve reference '{ref}'")
+        return results
+
     def _resolve(self, reference: str) -> Optional[str]:
         """Resolve a reference using the canonical resolver if available."""
         if self.resolver is not None:
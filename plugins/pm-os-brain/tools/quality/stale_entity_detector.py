@@ -15,13 +15,12 @@ Version: 5.0.0
 """
 
 import logging
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
-
 # v5 config-driven imports
 try:
     from pm_os_base.tools.core.path_resolver import get_paths
@@ -39,6 +38,12 @@ except ImportError:
     except ImportError:
         get_config = None
 
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache, parse_frontmatter
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import get_shared_cache, parse_frontmatter
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,14 +96,17 @@ class StaleEntityDetector:
         "abandoned",
     }
 
-    def __init__(self, brain_path: Path):
+    def __init__(self, brain_path: Path, cache=None):
         """
         Initialize the detector.
 
         Args:
             brain_path: Path to the brain directory
+            cache: Optional EntityCache instance. Defaults to the
+                   process-wide shared cache for brain_path.
         """
         self.brain_path = brain_path
+        self._cache = cache if cache is not None else get_shared_cache(brain_path)
 
         # Load config-driven thresholds
         self.thresholds = dict(self.DEFAULT_THRESHOLDS)
@@ -128,18 +136,11 @@ class StaleEntityDetector:
         """
         stale_entities = []
 
-        entity_files = list(self.brain_path.rglob("*.md"))
-        entity_files = [
-            f
-            for f in entity_files
-            if f.name.lower() not in ("readme.md", "index.md", "_index.md")
-            and ".snapshots" not in str(f)
-            and ".schema" not in str(f)
-        ]
-
-        for entity_path in entity_files:
+        for frontmatter in self._cache.get_files():
             try:
-                stale = self._check_entity(entity_path, threshold_days)
+                stale = self._check_frontmatter(
+                    frontmatter["_path"], frontmatter, threshold_days
+                )
                 if stale:
                     if entity_type and stale.entity_type != entity_type:
                         continue
@@ -197,8 +198,16 @@ class StaleEntityDetector:
     ) -> Optional[StaleEntity]:
         """Check if an entity is stale."""
         content = entity_path.read_text(encoding="utf-8")
-        frontmatter, body = self._parse_content(content)
+        frontmatter, _ = parse_frontmatter(content)
+        return self._check_frontmatter(entity_path, frontmatter, threshold_override)
 
+    def _check_frontmatter(
+        self,
+        entity_path: Path,
+        frontmatter: Dict[str, Any],
+        threshold_override: Optional[int] = None,
+    ) -> Optional[StaleEntity]:
+        """Check if an entity is stale given its parsed frontmatter."""
         entity_id = str(entity_path.relative_to(self.brain_path))
         entity_type = frontmatter.get("$type", "unknown")
 
@@ -334,18 +343,3 @@ class StaleEntityDetector:
                 pass
 
         return False
-
-    def _parse_content(self, content: str) -> Tuple[Dict[str, Any], str]:
-        """Parse frontmatter and body."""
-        if not content.startswith("---"):
-            return {}, content
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}, content
-
-        try:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            return frontmatter, parts[2]
-        except yaml.YAMLError:
-            return {}, content
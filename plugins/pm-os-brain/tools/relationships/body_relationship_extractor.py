@@ -36,6 +36,12 @@ except ImportError:
         def atomic_write(p, c, **kw):
             Path(p).write_text(c, encoding=kw.get("encoding", "utf-8"))
 
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache, parse_frontmatter
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import get_shared_cache, parse_frontmatter
+
 logger = logging.getLogger(__name__)
 
 
@@ -111,9 +117,16 @@ class BodyRelationshipExtractor:
     # Base confidence for body-extracted relationships
     BASE_CONFIDENCE = 0.6
 
-    def __init__(self, brain_path: Path):
-        """Initialize the extractor."""
+    def __init__(self, brain_path: Path, cache=None):
+        """Initialize the extractor.
+
+        Args:
+            brain_path: Path to brain directory
+            cache: Optional EntityCache instance. Defaults to the
+                   process-wide shared cache for brain_path.
+        """
         self.brain_path = brain_path
+        self._cache = cache if cache is not None else get_shared_cache(brain_path)
         self._alias_index: Optional[Dict[str, str]] = None
         self._entity_types: Optional[Dict[str, str]] = None
         self._entity_relationships: Optional[Dict[str, Set[str]]] = None
@@ -147,12 +160,11 @@ class BodyRelationshipExtractor:
         by_source_type: Dict[str, int] = {}
 
         # Scan all entities
-        for entity_path in self._get_entity_files():
+        for frontmatter in self._cache.get_files():
             try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter, body = self._parse_content(content)
+                body = frontmatter.get("_body", "")
 
-                if not frontmatter or not body.strip():
+                if not body.strip():
                     continue
 
                 entity_id = frontmatter.get("$id", "")
@@ -301,14 +313,8 @@ class BodyRelationshipExtractor:
                 pass
 
         # Also scan entity files for names
-        for entity_path in self._get_entity_files():
+        for frontmatter in self._cache.get_all().values():
             try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter, _ = self._parse_content(content)
-
-                if not frontmatter:
-                    continue
-
                 entity_id = frontmatter.get("$id", "")
                 name = frontmatter.get("name", "")
                 aliases = frontmatter.get("$aliases", [])
@@ -330,17 +336,10 @@ class BodyRelationshipExtractor:
 
         self._entity_types = {}
 
-        for entity_path in self._get_entity_files():
-            try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter, _ = self._parse_content(content)
-
-                if frontmatter:
-                    entity_id = frontmatter.get("$id", "")
-                    etype = frontmatter.get("$type", "unknown")
-                    self._entity_types[entity_id] = etype
-            except Exception:
-                continue
+        for frontmatter in self._cache.get_all().values():
+            entity_id = frontmatter.get("$id", "")
+            etype = frontmatter.get("$type", "unknown")
+            self._entity_types[entity_id] = etype
 
     def _build_relationship_index(self) -> None:
         """Build index of existing relationships to avoid duplicates."""
@@ -349,14 +348,8 @@ class BodyRelationshipExtractor:
 
         self._entity_relationships = {}
 
-        for entity_path in self._get_entity_files():
+        for frontmatter in self._cache.get_all().values():
             try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter, _ = self._parse_content(content)
-
-                if not frontmatter:
-                    continue
-
                 entity_id = frontmatter.get("$id", "")
                 relationships = frontmatter.get("$relationships", [])
 
@@ -478,7 +471,7 @@ class BodyRelationshipExtractor:
 
         try:
             content = entity_path.read_text(encoding="utf-8")
-            frontmatter, body = self._parse_content(content)
+            frontmatter, body = parse_frontmatter(content)
 
             if not frontmatter:
                 return False
@@ -522,6 +515,7 @@ class BodyRelationshipExtractor:
 
                 new_content = self._format_content(frontmatter, body)
                 atomic_write(entity_path, new_content)
+                self._cache.invalidate_path(entity_path)
 
             return True
 
@@ -531,41 +525,7 @@ class BodyRelationshipExtractor:
 
     def _find_entity_file(self, entity_id: str) -> Optional[Path]:
         """Find the file path for an entity ID."""
-        for entity_path in self._get_entity_files():
-            try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter, _ = self._parse_content(content)
-                if frontmatter.get("$id") == entity_id:
-                    return entity_path
-            except Exception:
-                continue
-        return None
-
-    def _get_entity_files(self) -> List[Path]:
-        """Get all entity files in brain."""
-        files = list(self.brain_path.rglob("*.md"))
-        return [
-            f
-            for f in files
-            if f.name.lower() not in ("readme.md", "index.md", "_index.md")
-            and ".snapshots" not in str(f)
-            and ".schema" not in str(f)
-        ]
-
-    def _parse_content(self, content: str) -> Tuple[Dict[str, Any], str]:
-        """Parse YAML frontmatter from content."""
-        if not content.startswith("---"):
-            return {}, content
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}, content
-
-        try:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            return frontmatter, parts[2]
-        except yaml.YAMLError:
-            return {}, content
+        return self._cache.get_path(entity_id)
 
     def _format_content(self, frontmatter: Dict[str, Any], body: str) -> str:
         """Format frontmatter and body back to markdown."""
@@ -14,11 +14,13 @@ Usage:
     from pm_os_brain.tools.relationships.canonical_resolver import CanonicalResolver
 """
 
-import json
 import logging
+import json
+import os
 import re
 import sys
-from datetime import datetime
+import tempfile
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -37,11 +39,24 @@ except ImportError:
     except ImportError:
         get_config = None
 
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache, parse_frontmatter
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import get_shared_cache, parse_frontmatter
+
 logger = logging.getLogger(__name__)
 
-# Cache file name
-RESOLVER_CACHE_FILE = "resolver_cache.json"
-CACHE_MAX_AGE_HOURS = 24  # Rebuild cache after 24 hours
+# Cache file: per-file manifest (mtime/size -> refs). JSON, never pickle:
+# it lives in the brain directory, which may be synced or shared.
+RESOLVER_CACHE_FILE = ".resolver-cache.json"
+LEGACY_CACHE_FILES = ("resolver_cache.json", ".resolver-cache.pkl")
+# Bump when the stored entry layout or reference derivation changes
+RESOLVER_CACHE_VERSION = 2
+
+# Fuzzy matching: n-gram size and minimum score kept by find_similar
+NGRAM_SIZE = 3
+SIMILARITY_THRESHOLD = 0.5
 
 
 class CanonicalResolver:
@@ -78,73 +93,86 @@ class CanonicalResolver:
         "reasoning": "reasoning",
     }
 
-    def __init__(self, brain_path: Path):
+    def __init__(self, brain_path: Path, cache=None):
         """
         Initialize the resolver.
 
         Args:
             brain_path: Path to the brain directory
+            cache: Optional EntityCache instance. Defaults to the
+                   process-wide shared cache for brain_path.
         """
         self.brain_path = (
             Path(brain_path) if not isinstance(brain_path, Path) else brain_path
         )
+        self._cache = (
+            cache if cache is not None else get_shared_cache(self.brain_path)
+        )
         self._index: Dict[str, str] = {}  # any_ref -> canonical_id
         self._reverse_index: Dict[str, Set[str]] = {}  # canonical_id -> all_refs
         self._entity_paths: Dict[str, Path] = {}  # canonical_id -> file_path
         self._built = False
         self._cache_file = self.brain_path / RESOLVER_CACHE_FILE
+        # rel_path -> (mtime_ns, size, canonical_id, refs, is_plain)
+        self._files: Dict[str, Tuple[int, int, Optional[str], List[str], bool]] = {}
+        self._cache_stats: Dict[str, Any] = {}
+        self._fuzzy: Optional[Dict[str, Any]] = None  # candidate index, lazy
 
     def _load_cache(self) -> bool:
-        """Load index from cache file if valid."""
-        if not self._cache_file.exists():
-            return False
-
+        """Load the per-file manifest from the cache file if readable."""
+        t0 = time.perf_counter()
         try:
             with open(self._cache_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
-
-            # Check cache age
-            built_at = datetime.fromisoformat(data.get("built_at", "2000-01-01"))
-            age_hours = (datetime.now() - built_at).total_seconds() / 3600
-            if age_hours > CACHE_MAX_AGE_HOURS:
+            if (
+                data.get("version") != RESOLVER_CACHE_VERSION
+                or data.get("brain_path") != str(self.brain_path)
+            ):
                 return False
-
-            # Load data
-            self._index = data.get("index", {})
-            self._reverse_index = {
-                k: set(v) for k, v in data.get("reverse_index", {}).items()
-            }
-            self._entity_paths = {
-                k: Path(v) for k, v in data.get("entity_paths", {}).items()
+            self._files = {
+                rel_path: (int(mtime_ns), int(size), canonical_id, list(refs), bool(is_plain))
+                for rel_path, (mtime_ns, size, canonical_id, refs, is_plain)
+                in data["files"].items()
             }
-            self._built = True
-
-            return True
-
-        except Exception:
+        except FileNotFoundError:
             return False
+        except Exception as e:
+            logger.debug("Resolver cache unreadable, rebuilding: %s", e)
+            return False
+        self._cache_stats["load_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+        return True
 
     def _save_cache(self):
-        """Save index to cache file."""
+        """Save the per-file manifest to the cache file (atomically)."""
+        t0 = time.perf_counter()
+        data = {
+            "version": RESOLVER_CACHE_VERSION,
+            "brain_path": str(self.brain_path),
+            "files": self._files,
+        }
         try:
-            data = {
-                "built_at": datetime.now().isoformat(),
-                "brain_path": str(self.brain_path),
-                "index": self._index,
-                "reverse_index": {k: list(v) for k, v in self._reverse_index.items()},
-                "entity_paths": {k: str(v) for k, v in self._entity_paths.items()},
-            }
-
-            with open(self._cache_file, "w", encoding="utf-8") as f:
-                json.dump(data, f)
-
+            fd, tmp = tempfile.mkstemp(dir=str(self.brain_path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp, self._cache_file)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            for legacy in LEGACY_CACHE_FILES:
+                (self.brain_path / legacy).unlink(missing_ok=True)
         except Exception:
             pass  # Cache save failure is not critical
+        self._cache_stats["save_ms"] = round((time.perf_counter() - t0) * 1000, 2)
 
     def build_index(self, force: bool = False) -> int:
         """
         Build the comprehensive reference index.
 
+        Without force, the cached per-file manifest is loaded and only
+        files added, changed (mtime/size) or removed since it was written
+        are re-indexed. With force, every entity is indexed again.
+
         Args:
             force: Rebuild even if already built
 
@@ -154,42 +182,110 @@ class CanonicalResolver:
         if self._built and not force:
             return len(self._entity_paths)
 
-        # Try to load from cache first (unless force rebuild)
-        if not force and self._load_cache():
-            return len(self._entity_paths)
+        if force or not self._load_cache():
+            self._files = {}
+            self._refresh(full=True)
+        else:
+            self._refresh(full=False)
+        return len(self._entity_paths)
 
-        self._index.clear()
-        self._reverse_index.clear()
-        self._entity_paths.clear()
+    def refresh(self) -> int:
+        """
+        Re-index files added, changed or removed since the last build.
 
-        entity_files = list(self.brain_path.rglob("*.md"))
-        entity_files = [
-            f
-            for f in entity_files
-            if f.name.lower() not in ("readme.md", "index.md", "_index.md")
-            and ".snapshots" not in str(f)
-            and ".schema" not in str(f)
-            and ".events" not in str(f)
-        ]
+        Returns:
+            Number of files re-indexed or removed
+        """
+        if not self._built:
+            self.build_index()
+            return self._cache_stats["reindexed"] + self._cache_stats["removed"]
+        return self._refresh(full=False)
 
-        for entity_path in entity_files:
-            self._index_entity(entity_path)
+    def cache_stats(self) -> Dict[str, Any]:
+        """Timings and hit counts of the last build/refresh."""
+        return dict(self._cache_stats)
 
-        self._built = True
+    def _refresh(self, full: bool) -> int:
+        """
+        Bring the per-file manifest up to date and rebuild the lookup maps.
 
-        # Save to cache for next time
-        self._save_cache()
+        A full pass takes frontmatter from the entity cache where the cached
+        entry was parsed from the file's current mtime/size; files edited
+        since the cache loaded, and every file in an incremental pass, are
+        read directly.
+        """
+        t0 = time.perf_counter()
+        files: Dict[str, Tuple[int, int, Optional[str], List[str], bool]] = {}
+        reused = reindexed = 0
+
+        for entity_path, stat in self._cache.iter_entity_files():
+            rel_path = entity_path.relative_to(self.brain_path).as_posix()
+            entry = self._files.get(rel_path)
+            if (
+                entry is not None
+                and entry[0] == stat.st_mtime_ns
+                and entry[1] == stat.st_size
+            ):
+                files[rel_path] = entry
+                reused += 1
+                continue
 
-        return len(self._entity_paths)
+            frontmatter = self._cache.get_if_current(entity_path, stat) if full else None
+            if frontmatter is None:
+                try:
+                    content = entity_path.read_text(encoding="utf-8")
+                except (OSError, UnicodeDecodeError):
+                    continue
+                frontmatter = parse_frontmatter(content)[0]
+            frontmatter = frontmatter or {}
 
-    def _index_entity(self, entity_path: Path):
-        """Index a single entity with all its reference formats."""
-        try:
-            content = entity_path.read_text(encoding="utf-8")
-            frontmatter = self._parse_frontmatter(content)
-        except Exception:
-            frontmatter = {}
+            canonical_id, refs = self._entity_refs(entity_path, frontmatter)
+            files[rel_path] = (
+                stat.st_mtime_ns, stat.st_size, canonical_id, refs, not frontmatter
+            )
+            reindexed += 1
+
+        removed = len(set(self._files) - set(files))
+        changed = reindexed + removed
+        self._files = files
+
+        if changed or not self._built:
+            self._rebuild_maps()
+        if changed or full:
+            self._save_cache()
+
+        self._built = True
+        self._cache_stats.update(
+            source="rebuild" if full else "cache",
+            reused=reused,
+            reindexed=reindexed,
+            removed=removed,
+            refresh_ms=round((time.perf_counter() - t0) * 1000, 2),
+        )
+        return changed
+
+    def _rebuild_maps(self):
+        """Rebuild lookup maps from the manifest (entities before plain files)."""
+        self._index.clear()
+        self._reverse_index.clear()
+        self._entity_paths.clear()
+        self._fuzzy = None
 
+        entries = sorted(self._files.items(), key=lambda item: item[1][4])
+        for rel_path, (_, _, canonical_id, refs, _) in entries:
+            if not canonical_id:
+                continue
+            self._entity_paths[canonical_id] = self.brain_path / rel_path
+            known = self._reverse_index.setdefault(canonical_id, set())
+            for ref in refs:
+                # Store lowercase for case-insensitive lookup
+                self._index[ref.lower()] = canonical_id
+                known.add(ref)
+
+    def _entity_refs(
+        self, entity_path: Path, frontmatter: Dict[str, Any]
+    ) -> Tuple[Optional[str], List[str]]:
+        """Canonical $id and all reference formats for one entity file."""
         # Determine canonical $id
         canonical_id = frontmatter.get("$id")
 
@@ -198,23 +294,9 @@ class CanonicalResolver:
             canonical_id = self._infer_canonical_id(entity_path)
 
         if not canonical_id:
-            return
+            return None, []
 
-        # Store entity path
-        self._entity_paths[canonical_id] = entity_path
-
-        # Initialize reverse index
-        if canonical_id not in self._reverse_index:
-            self._reverse_index[canonical_id] = set()
-
-        # Index all reference formats
-        refs_to_index = self._get_all_refs(entity_path, frontmatter, canonical_id)
-
-        for ref in refs_to_index:
-            ref_lower = ref.lower()
-            # Store lowercase for case-insensitive lookup
-            self._index[ref_lower] = canonical_id
-            self._reverse_index[canonical_id].add(ref)
+        return canonical_id, self._get_all_refs(entity_path, frontmatter, canonical_id)
 
     def _infer_canonical_id(self, entity_path: Path) -> Optional[str]:
         """Infer canonical $id from file path."""
@@ -348,6 +430,21 @@ class CanonicalResolver:
         is_orphan = canonical is None
         return (canonical, is_orphan)
 
+    def resolve_many(self, references: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Resolve a batch of references, each distinct reference once.
+
+        Args:
+            references: References in any format
+
+        Returns:
+            Dict of reference -> canonical $id (None if not found)
+        """
+        if not self._built:
+            self.build_index()
+
+        return {ref: self.resolve(ref) for ref in dict.fromkeys(references)}
+
     def get_all_references(self, canonical_id: str) -> List[str]:
         """
         Get all known references for an entity.
@@ -409,10 +506,10 @@ class CanonicalResolver:
         ref_lower = reference.lower().strip()
         results = []
 
-        for indexed_ref, canonical_id in self._index.items():
+        for indexed_ref in self._candidates(ref_lower):
             score = self._similarity_score(ref_lower, indexed_ref)
-            if score > 0.5:
-                results.append((canonical_id, score))
+            if score > SIMILARITY_THRESHOLD:
+                results.append((self._index[indexed_ref], score))
 
         # Deduplicate by canonical_id, keep highest score
         best_scores: Dict[str, float] = {}
@@ -424,6 +521,90 @@ class CanonicalResolver:
 
         return sorted_results[:max_results]
 
+    def find_similar_many(
+        self, references: List[str], max_results: int = 5
+    ) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        Fuzzy-match a batch of references against one shared candidate index.
+
+        Args:
+            references: References to match
+            max_results: Maximum results per reference
+
+        Returns:
+            Dict of reference -> [(canonical_id, similarity_score), ...]
+        """
+        return {
+            ref: self.find_similar(ref, max_results=max_results)
+            for ref in dict.fromkeys(references)
+        }
+
+    def _build_fuzzy_index(self) -> Dict[str, Any]:
+        """
+        Build the candidate index over _index keys.
+
+        Every key that _similarity_score can rate above the threshold shares
+        something indexed here with the query: all of the query's n-grams
+        (query inside key), its first 4 characters (common prefix > 3) or a
+        "-"-separated word (word overlap). Keys inside the query are found by
+        substring lookup in _index itself.
+        """
+        keys = list(self._index)
+        ngrams: Dict[str, List[int]] = {}
+        prefixes: Dict[str, List[int]] = {}
+        words: Dict[str, List[int]] = {}
+
+        for pos, key in enumerate(keys):
+            for gram in {key[i:i + NGRAM_SIZE] for i in range(len(key) - NGRAM_SIZE + 1)}:
+                ngrams.setdefault(gram, []).append(pos)
+            if len(key) > 3:
+                prefixes.setdefault(key[:4], []).append(pos)
+            for word in set(key.split("-")):
+                words.setdefault(word, []).append(pos)
+
+        return {
+            "keys": keys,
+            "order": {key: pos for pos, key in enumerate(keys)},
+            "ngrams": ngrams,
+            "prefixes": prefixes,
+            "words": words,
+        }
+
+    def _candidates(self, ref_lower: str) -> List[str]:
+        """Shortlist of _index keys worth scoring, in _index order."""
+        if self._fuzzy is None:
+            self._fuzzy = self._build_fuzzy_index()
+        fuzzy = self._fuzzy
+        keys = fuzzy["keys"]
+
+        if len(ref_lower) < NGRAM_SIZE:
+            return keys
+
+        # Keys containing the query: intersect its n-gram postings
+        grams = {ref_lower[i:i + NGRAM_SIZE] for i in range(len(ref_lower) - NGRAM_SIZE + 1)}
+        postings = sorted((fuzzy["ngrams"].get(g, ()) for g in grams), key=len)
+        found: Set[int] = set(postings[0])
+        for posting in postings[1:]:
+            if not found:
+                break
+            found.intersection_update(posting)
+
+        # Keys sharing a 4-character prefix or a word
+        found.update(fuzzy["prefixes"].get(ref_lower[:4], ()))
+        for word in set(ref_lower.split("-")):
+            found.update(fuzzy["words"].get(word, ()))
+
+        # Keys contained in the query
+        order = fuzzy["order"]
+        n = len(ref_lower)
+        for i in range(n):
+            for j in range(i + 1, n + 1):
+                pos = order.get(ref_lower[i:j])
+                if pos is not None:
+                    found.add(pos)
+
+        return [keys[pos] for pos in sorted(found)]
+
     def _similarity_score(self, s1: str, s2: str) -> float:
         """Calculate simple similarity score between two strings."""
         if s1 == s2:
@@ -673,8 +854,10 @@ class CanonicalResolver:
                         )
                         new_content = f"---\n{fm_str}---{body}"
                         atomic_write(entity_path, new_content)
+                        self._cache.invalidate_path(entity_path)
 
                         # Update index for new aliases
+                        self._fuzzy = None
                         for alias in new_aliases:
                             self._index[alias.lower()] = entity_id
                             if entity_id in self._reverse_index:
@@ -698,11 +881,10 @@ class CanonicalResolver:
         # Build alias -> entity mapping
         alias_map: Dict[str, List[str]] = {}
         for entity_id, entity_path in self._entity_paths.items():
-            if not entity_path.exists():
+            fm = self._cache.get_by_path(entity_path)
+            if fm is None:
                 continue
             try:
-                content = entity_path.read_text(encoding="utf-8")
-                fm = self._parse_frontmatter(content)
                 aliases = fm.get("$aliases", []) or []
                 for alias in aliases:
                     al = alias.lower()
@@ -721,17 +903,7 @@ class CanonicalResolver:
 
     def _parse_frontmatter(self, content: str) -> Dict[str, Any]:
         """Parse YAML frontmatter."""
-        if not content.startswith("---"):
-            return {}
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}
-
-        try:
-            return yaml.safe_load(parts[1]) or {}
-        except yaml.YAMLError:
-            return {}
+        return parse_frontmatter(content)[0]
 
 
 def main():
@@ -809,6 +981,12 @@ def main():
         print(f"Total entities: {stats['total_entities']}")
         print(f"Total references: {stats['total_references']}")
         print(f"Avg refs per entity: {stats['avg_refs_per_entity']}")
+        cache = resolver.cache_stats()
+        print(
+            f"Index source: {cache['source']} ({cache['reused']} reused, "
+            f"{cache['reindexed']} re-indexed, {cache['removed']} removed "
+            f"in {cache['refresh_ms']}ms)"
+        )
 
     elif args.action == "similar":
         if not args.reference:
@@ -5,8 +5,15 @@ PM-OS Brain Embedding-Based Edge Inferrer (v5.0)
 Infers 'similar_to' relationships from embedding similarity
 to increase graph density.
 
+Candidate pairs come from a blocked NumPy matrix multiply with a per-row
+argpartition top-k (see topk_similar_pairs()). ChromaDB HNSW and the
+pairwise Python loop remain available as alternative scan engines.
+
 Usage:
     from pm_os_brain.tools.relationships.embedding_edge_inferrer import EmbeddingEdgeInferrer
+
+    python3 embedding_edge_inferrer.py scan [--engine numpy|chroma|bruteforce]
+    python3 embedding_edge_inferrer.py --benchmark 1000,10000,50000
 """
 
 import argparse
@@ -14,6 +21,7 @@ import json
 import logging
 import os
 import sys
+import time
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
@@ -47,9 +55,25 @@ except ImportError:
     except ImportError:
         _EVENT_SOURCING = False
 
-# Optional: sentence-transformers for embeddings
+# Embedding text and the shared (model, content hash) embedding store
+try:
+    from pm_os_brain.tools.brain_core.embedding_store import (
+        build_embedding_text,
+        get_shared_store,
+    )
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.embedding_store import build_embedding_text, get_shared_store
+
 try:
     import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Optional: sentence-transformers for embeddings
+try:
     from sentence_transformers import SentenceTransformer
 
     EMBEDDINGS_AVAILABLE = True
@@ -65,6 +89,82 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Similarity scan engines; the default can be overridden with
+# PMOS_EDGE_SCAN_ENGINE. "chroma" still honours PMOS_ENRICH_ANN=0.
+SCAN_ENGINES = ("numpy", "chroma", "bruteforce")
+DEFAULT_SCAN_ENGINE = "numpy"
+# Budget for one block of similarity scores in the NumPy engine
+DEFAULT_SCAN_MEMORY_MB = 64
+
+
+def topk_similar_pairs(
+    embeddings: Any,
+    k: int,
+    threshold: float = 0.0,
+    excluded: Optional[Dict[int, List[int]]] = None,
+    memory_mb: float = DEFAULT_SCAN_MEMORY_MB,
+) -> Tuple[Any, Any, Any]:
+    """
+    Find the k most similar pairs (i < j) of normalized embeddings.
+
+    Row blocks of the matrix are multiplied against the rows from the
+    block start onwards, so each pair is scored once and at most
+    memory_mb of scores is held at a time. Each row keeps its k best
+    columns (argpartition) and a running top-k is merged across blocks,
+    which yields exactly the k best pairs of the full matrix.
+
+    Args:
+        embeddings: (n, dim) array of L2-normalized vectors
+        k: Number of pairs to return
+        threshold: Minimum similarity
+        excluded: {row: [col, ...]} pairs (row < col) to skip
+        memory_mb: Budget for one block of similarity scores
+
+    Returns:
+        (rows, cols, similarities) arrays sorted by similarity descending,
+        ties by (row, col)
+    """
+    matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+    n = matrix.shape[0]
+    rows = np.empty(0, dtype=np.int64)
+    cols = np.empty(0, dtype=np.int64)
+    sims = np.empty(0, dtype=np.float32)
+    if n < 2 or k <= 0:
+        return rows, cols, sims
+
+    block = max(1, int(memory_mb * 1024 * 1024) // (4 * n))
+    for start in range(0, n - 1, block):
+        stop = min(start + block, n - 1)
+        scores = matrix[start:stop] @ matrix[start:].T
+        height, width = scores.shape
+
+        # Column c is entity start + c: drop self and earlier pairs
+        scores[np.arange(width)[None, :] <= np.arange(height)[:, None]] = -np.inf
+        if excluded:
+            for row in range(start, stop):
+                masked = excluded.get(row)
+                if masked:
+                    scores[row - start, np.asarray(masked) - start] = -np.inf
+
+        keep = min(k, width)
+        if keep < width:
+            top = np.argpartition(scores, width - keep, axis=1)[:, width - keep:]
+        else:
+            top = np.broadcast_to(np.arange(width), (height, width))
+        values = np.take_along_axis(scores, top, axis=1)
+        hit = np.isfinite(values) & (values >= threshold)
+
+        block_rows = np.broadcast_to(np.arange(start, stop)[:, None], top.shape)[hit]
+        rows = np.concatenate([rows, block_rows])
+        cols = np.concatenate([cols, top[hit] + start])
+        sims = np.concatenate([sims, values[hit]])
+        if len(sims) > k:
+            best = np.argpartition(sims, len(sims) - k)[len(sims) - k:]
+            rows, cols, sims = rows[best], cols[best], sims[best]
+
+    order = np.lexsort((cols, rows, -sims))
+    return rows[order], cols[order], sims[order]
+
 
 @dataclass
 class InferredEdge:
@@ -88,6 +188,7 @@ class EdgeInferenceReport:
     edges_by_type_pair: Dict[str, int] = field(default_factory=dict)
     edges: List[InferredEdge] = field(default_factory=list)
     used_ann: bool = False
+    engine: str = "bruteforce"
 
 
 class EmbeddingEdgeInferrer:
@@ -107,6 +208,7 @@ class EmbeddingEdgeInferrer:
         model_name: str = DEFAULT_MODEL,
         threshold: float = DEFAULT_THRESHOLD,
         cache=None,
+        engine: Optional[str] = None,
     ):
         """
         Initialize the edge inferrer.
@@ -116,10 +218,13 @@ class EmbeddingEdgeInferrer:
             model_name: sentence-transformers model name
             threshold: Similarity threshold for edge creation
             cache: Optional EntityCache instance
+            engine: Scan engine (see SCAN_ENGINES); defaults to
+                    PMOS_EDGE_SCAN_ENGINE or "numpy"
         """
         self.brain_path = brain_path
         self.model_name = model_name
         self.threshold = threshold
+        self.engine = engine
         self._model = None
         self._embeddings_cache: Dict[str, Any] = {}
         self._entity_cache = cache
@@ -139,6 +244,16 @@ class EmbeddingEdgeInferrer:
                 self._model = SentenceTransformer(self.model_name)
         return self._model
 
+    def _encode(self, contents: List[str]) -> Any:
+        """Embed contents, reusing vectors already in the embedding store."""
+        def encoder(texts: List[str]) -> Any:
+            return self._get_model().encode(texts, normalize_embeddings=True)
+
+        store = get_shared_store(self.brain_path, self.model_name)
+        if store is None:
+            return encoder(contents)
+        return store.encode(contents, encoder)
+
     def scan_for_edges(
         self,
         entity_type: Optional[str] = None,
@@ -147,8 +262,10 @@ class EmbeddingEdgeInferrer:
         """
         Scan entities and find potential similar_to edges.
 
-        Uses ANN (ChromaDB) when available and PMOS_ENRICH_ANN != "0",
-        otherwise falls back to brute-force O(n^2) comparison.
+        Embeddings are scanned with the blocked NumPy engine by default;
+        ChromaDB ANN is used when the "chroma" engine is selected and
+        available. Without embeddings, the pairwise loop compares word
+        sets (Jaccard).
 
         Args:
             entity_type: Filter by entity type
@@ -157,12 +274,6 @@ class EmbeddingEdgeInferrer:
         Returns:
             EdgeInferenceReport with potential edges
         """
-        use_ann = (
-            _ANN_AVAILABLE
-            and EMBEDDINGS_AVAILABLE
-            and os.environ.get("PMOS_ENRICH_ANN", "1") != "0"
-        )
-
         # Load entities
         entities = self._load_entities(entity_type)
 
@@ -179,18 +290,20 @@ class EmbeddingEdgeInferrer:
         contents = [self._get_entity_content(entities[eid]) for eid in entity_ids]
 
         if EMBEDDINGS_AVAILABLE:
-            model = self._get_model()
-            embeddings = model.encode(contents, normalize_embeddings=True)
+            embeddings = self._encode(contents)
         else:
             embeddings = None
 
         # Choose scan strategy
-        used_ann = False
-        if use_ann and embeddings is not None and len(entity_ids) >= 20:
+        engine = self._select_engine(len(entity_ids), embeddings)
+        if engine == "chroma":
             inferred_edges, edges_by_type_pair, similarity_sum = (
                 self._ann_scan(entities, entity_ids, embeddings, limit)
             )
-            used_ann = True
+        elif engine == "numpy":
+            inferred_edges, edges_by_type_pair, similarity_sum = (
+                self._numpy_scan(entities, entity_ids, embeddings, limit)
+            )
         else:
             inferred_edges, edges_by_type_pair, similarity_sum = (
                 self._bruteforce_scan(
@@ -210,9 +323,95 @@ class EmbeddingEdgeInferrer:
             avg_similarity=round(avg_sim, 4),
             edges_by_type_pair=edges_by_type_pair,
             edges=inferred_edges,
-            used_ann=used_ann,
+            used_ann=engine == "chroma",
+            engine=engine,
+        )
+
+    def _select_engine(self, count: int, embeddings: Any) -> str:
+        """Pick the scan engine for this run."""
+        if embeddings is None or not HAS_NUMPY:
+            return "bruteforce"
+        requested = (
+            self.engine or os.environ.get("PMOS_EDGE_SCAN_ENGINE", DEFAULT_SCAN_ENGINE)
+        ).lower()
+        if requested == "bruteforce":
+            return "bruteforce"
+        if (
+            requested == "chroma"
+            and _ANN_AVAILABLE
+            and os.environ.get("PMOS_ENRICH_ANN", "1") != "0"
+            and count >= 20
+        ):
+            return "chroma"
+        return "numpy"
+
+    def _related_pairs(
+        self,
+        entities: Dict[str, Dict[str, Any]],
+        entity_ids: List[str],
+    ) -> Dict[int, List[int]]:
+        """Already-related pairs as {lower index: [higher index, ...]}."""
+        position = {eid: i for i, eid in enumerate(entity_ids)}
+        pairs: Dict[int, set] = {}
+        for i, eid in enumerate(entity_ids):
+            for rel in entities[eid].get("$relationships") or []:
+                if not isinstance(rel, dict):
+                    continue
+                j = position.get(rel.get("target"))
+                if j is not None and j != i:
+                    pairs.setdefault(min(i, j), set()).add(max(i, j))
+        return {row: sorted(cols) for row, cols in pairs.items()}
+
+    def _numpy_scan(
+        self,
+        entities: Dict[str, Dict[str, Any]],
+        entity_ids: List[str],
+        embeddings: Any,
+        limit: int,
+    ) -> Tuple[List[InferredEdge], Dict[str, int], float]:
+        """Exact top-N scan with blocked matrix products (topk_similar_pairs)."""
+        rows, cols, sims = topk_similar_pairs(
+            embeddings,
+            limit,
+            threshold=self.threshold,
+            excluded=self._related_pairs(entities, entity_ids),
         )
 
+        all_edges: List[InferredEdge] = []
+        for i, j, sim in zip(rows.tolist(), cols.tolist(), sims.tolist()):
+            eid_i = entity_ids[i]
+            eid_j = entity_ids[j]
+            all_edges.append(InferredEdge(
+                source_id=eid_i,
+                target_id=eid_j,
+                similarity=round(sim, 4),
+                source_type=entities[eid_i].get("$type", "unknown"),
+                target_type=entities[eid_j].get("$type", "unknown"),
+            ))
+
+        return self._summarize(all_edges, limit)
+
+    @staticmethod
+    def _summarize(
+        all_edges: List[InferredEdge], limit: int
+    ) -> Tuple[List[InferredEdge], Dict[str, int], float]:
+        """Top-N edges by similarity with per-type-pair counts and similarity sum."""
+        # Sort by similarity descending, take top-N
+        all_edges.sort(key=lambda e: -e.similarity)
+        inferred_edges = all_edges[:limit]
+
+        # Build summary stats from the returned edges
+        edges_by_type_pair: Dict[str, int] = {}
+        similarity_sum = 0.0
+        for edge in inferred_edges:
+            similarity_sum += edge.similarity
+            type_pair = f"{edge.source_type}-{edge.target_type}"
+            edges_by_type_pair[type_pair] = (
+                edges_by_type_pair.get(type_pair, 0) + 1
+            )
+
+        return inferred_edges, edges_by_type_pair, similarity_sum
+
     def _ann_scan(
         self,
         entities: Dict[str, Dict[str, Any]],
@@ -291,21 +490,7 @@ class EmbeddingEdgeInferrer:
         except Exception:
             pass
 
-        # Sort by similarity descending, take top-N
-        all_edges.sort(key=lambda e: -e.similarity)
-        inferred_edges = all_edges[:limit]
-
-        # Build summary stats from the returned edges
-        edges_by_type_pair: Dict[str, int] = {}
-        similarity_sum = 0.0
-        for edge in inferred_edges:
-            similarity_sum += edge.similarity
-            type_pair = f"{edge.source_type}-{edge.target_type}"
-            edges_by_type_pair[type_pair] = (
-                edges_by_type_pair.get(type_pair, 0) + 1
-            )
-
-        return inferred_edges, edges_by_type_pair, similarity_sum
+        return self._summarize(all_edges, limit)
 
     def _bruteforce_scan(
         self,
@@ -352,21 +537,7 @@ class EmbeddingEdgeInferrer:
                         target_type=type_j,
                     ))
 
-        # Sort by similarity descending, take top-N
-        all_edges.sort(key=lambda e: -e.similarity)
-        inferred_edges = all_edges[:limit]
-
-        # Build summary stats from the returned edges
-        edges_by_type_pair: Dict[str, int] = {}
-        similarity_sum = 0.0
-        for edge in inferred_edges:
-            similarity_sum += edge.similarity
-            type_pair = f"{edge.source_type}-{edge.target_type}"
-            edges_by_type_pair[type_pair] = (
-                edges_by_type_pair.get(type_pair, 0) + 1
-            )
-
-        return inferred_edges, edges_by_type_pair, similarity_sum
+        return self._summarize(all_edges, limit)
 
     def apply_edges(
         self,
@@ -496,31 +667,8 @@ class EmbeddingEdgeInferrer:
         return entities
 
     def _get_entity_content(self, entity: Dict[str, Any]) -> str:
-        """Extract content string for embedding."""
-        parts = []
-
-        # Name/title
-        name = entity.get("name")
-        if name:
-            parts.append(str(name))
-
-        # Description
-        description = entity.get("description")
-        if description:
-            parts.append(str(description))
-
-        # Body content
-        body = entity.get("_body", "")
-        if body:
-            # Take first 500 chars of body
-            parts.append(body[:500].strip())
-
-        # Tags
-        tags = entity.get("$tags")
-        if tags:
-            parts.append(" ".join(str(t) for t in tags))
-
-        return " ".join(parts)
+        """Extract content string for embedding (same text as the vector index)."""
+        return build_embedding_text(entity)
 
     def _already_related(
         self,
@@ -588,6 +736,66 @@ class EmbeddingEdgeInferrer:
         return f"---\n{yaml_str}---{body}"
 
 
+def _synthetic_embeddings(count: int, dim: int = 384, seed: int = 7) -> Any:
+    """Clustered, normalized random embeddings (about 50 per cluster)."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(1, count // 50), dim)).astype(np.float32)
+    noise = rng.standard_normal((count, dim)).astype(np.float32)
+    vectors = centers[rng.integers(0, len(centers), count)] + 0.35 * noise
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def _benchmark(
+    sizes: List[int], limit: int = 100, loop_max: int = 5000
+) -> List[Dict[str, Any]]:
+    """Compare the NumPy, ChromaDB and pairwise-loop scan engines."""
+    results = []
+    for count in sizes:
+        embeddings = _synthetic_embeddings(count)
+        entity_ids = [f"entity/synthetic/e{i}" for i in range(count)]
+        entities = {
+            eid: {"$type": "synthetic", "$relationships": []} for eid in entity_ids
+        }
+        # Pre-relate a few neighbours so masking is exercised
+        for i in range(0, count - 1, 10):
+            entities[entity_ids[i]]["$relationships"].append(
+                {"type": "related_to", "target": entity_ids[i + 1]}
+            )
+        inferrer = EmbeddingEdgeInferrer(Path("."))
+        row: Dict[str, Any] = {"entities": count, "limit": limit}
+
+        t0 = time.perf_counter()
+        fast, _, _ = inferrer._numpy_scan(entities, entity_ids, embeddings, limit)
+        row["numpy_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+
+        if count <= loop_max:
+            t0 = time.perf_counter()
+            slow, _, _ = inferrer._bruteforce_scan(
+                entities, entity_ids, [], embeddings, limit
+            )
+            row["bruteforce_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+            # Pairs may differ only among near-ties (float32 summation order)
+            row["bruteforce_max_similarity_diff"] = round(
+                max((abs(a.similarity - b.similarity) for a, b in zip(fast, slow)), default=0.0),
+                4,
+            )
+        else:
+            row["bruteforce_ms"] = None
+
+        if _ANN_AVAILABLE:
+            t0 = time.perf_counter()
+            ann, _, _ = inferrer._ann_scan(entities, entity_ids, embeddings, limit)
+            row["chroma_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+            exact = {tuple(sorted((e.source_id, e.target_id))) for e in fast}
+            found = {tuple(sorted((e.source_id, e.target_id))) for e in ann}
+            row["chroma_recall"] = round(len(found & exact) / max(1, len(exact)), 3)
+        else:
+            row["chroma_ms"] = None
+        results.append(row)
+    return results
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -639,9 +847,28 @@ def main():
         default="text",
         help="Output format",
     )
+    parser.add_argument(
+        "--engine",
+        choices=SCAN_ENGINES,
+        help="Similarity scan engine (default: numpy)",
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=str,
+        metavar="N[,N...]",
+        help="Benchmark scan engines on N synthetic entities (pairwise loop up to 5000)",
+    )
 
     args = parser.parse_args()
 
+    if args.benchmark:
+        if not HAS_NUMPY:
+            print("numpy is required for --benchmark")
+            return 1
+        sizes = [int(n) for n in args.benchmark.split(",") if n.strip()]
+        print(json.dumps(_benchmark(sizes, limit=args.limit), indent=2))
+        return 0
+
     if not EMBEDDINGS_AVAILABLE:
         logger.warning(
             "sentence-transformers not installed. Using fallback similarity. "
@@ -660,6 +887,7 @@ def main():
         args.brain_path,
         model_name=args.model,
         threshold=args.threshold,
+        engine=args.engine,
     )
 
     if args.action == "scan":
@@ -674,6 +902,7 @@ def main():
                 "edges_inferred": report.edges_inferred,
                 "avg_similarity": report.avg_similarity,
                 "threshold": args.threshold,
+                "engine": report.engine,
                 "edges_by_type_pair": report.edges_by_type_pair,
                 "edges": [
                     {
@@ -690,6 +919,7 @@ def main():
             print("=" * 60)
             print(f"Model: {args.model}")
             print(f"Threshold: {args.threshold}")
+            print(f"Scan engine: {report.engine}")
             print(f"Entities processed: {report.entities_processed}")
             print(f"Edges inferred: {report.edges_inferred}")
             print(f"Avg similarity: {report.avg_similarity:.4f}")
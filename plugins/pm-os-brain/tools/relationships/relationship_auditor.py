@@ -27,6 +27,12 @@ try:
 except ImportError:
     from relationships.canonical_resolver import CanonicalResolver
 
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache, parse_frontmatter
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import get_shared_cache, parse_frontmatter
+
 logger = logging.getLogger(__name__)
 
 
@@ -109,17 +115,20 @@ class RelationshipAuditor:
         "preceded_by",
     }
 
-    def __init__(self, brain_path: Path):
+    def __init__(self, brain_path: Path, cache=None):
         """
         Initialize the auditor.
 
         Args:
             brain_path: Path to the brain directory
+            cache: Optional EntityCache instance. Defaults to the
+                   process-wide shared cache for brain_path.
         """
         self.brain_path = brain_path
+        self._cache = cache if cache is not None else get_shared_cache(brain_path)
         self.entity_index: Dict[str, Path] = {}
         self.relationships: Dict[str, List[Dict]] = {}
-        self.resolver = CanonicalResolver(brain_path)
+        self.resolver = CanonicalResolver(brain_path, cache=self._cache)
 
     def audit(self) -> AuditResult:
         """
@@ -189,16 +198,12 @@ class RelationshipAuditor:
         """Build index of all entities."""
         self.entity_index.clear()
 
-        entity_files = list(self.brain_path.rglob("*.md"))
-        entity_files = [
-            f
-            for f in entity_files
-            if f.name.lower() not in ("readme.md", "index.md", "_index.md")
-            and ".snapshots" not in str(f)
-            and ".schema" not in str(f)
+        entities = [
+            (fm["_path"], fm) for fm in self._cache.get_files()
         ]
+        entities.extend((p, {}) for p in self._cache.get_plain_paths())
 
-        for entity_path in entity_files:
+        for entity_path, frontmatter in entities:
             # Create multiple index keys
             relative_path = str(entity_path.relative_to(self.brain_path))
             slug = entity_path.stem.lower().replace(" ", "-").replace("_", "-")
@@ -207,31 +212,21 @@ class RelationshipAuditor:
             self.entity_index[slug] = entity_path
 
             # Also index by $id if present
-            try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter = self._parse_frontmatter(content)
-                if "$id" in frontmatter:
-                    self.entity_index[frontmatter["$id"]] = entity_path
-            except Exception:
-                pass
+            if "$id" in frontmatter:
+                self.entity_index[frontmatter["$id"]] = entity_path
 
     def _load_relationships(self):
         """Load all relationships from entities."""
         self.relationships.clear()
 
         for entity_id, entity_path in self.entity_index.items():
-            if not entity_path.exists():
+            frontmatter = self._cache.get_by_path(entity_path)
+            if frontmatter is None:
                 continue
 
-            try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter = self._parse_frontmatter(content)
-                relationships = frontmatter.get("$relationships", [])
-
-                if relationships and entity_id not in self.relationships:
-                    self.relationships[entity_id] = relationships
-            except Exception:
-                pass
+            relationships = frontmatter.get("$relationships", [])
+            if relationships and entity_id not in self.relationships:
+                self.relationships[entity_id] = relationships
 
     def _find_orphan_targets(self) -> List[RelationshipIssue]:
         """Find relationships pointing to non-existent entities."""
@@ -444,7 +439,7 @@ class RelationshipAuditor:
 
         try:
             content = target_path.read_text(encoding="utf-8")
-            frontmatter, body = self._parse_content(content)
+            frontmatter, body = parse_frontmatter(content)
 
             if "$relationships" not in frontmatter:
                 frontmatter["$relationships"] = []
@@ -469,6 +464,7 @@ class RelationshipAuditor:
             )
 
             target_path.write_text(new_content, encoding="utf-8")
+            self._cache.invalidate_path(target_path)
             return True
 
         except Exception:
@@ -491,7 +487,7 @@ class RelationshipAuditor:
 
         try:
             content = source_path.read_text(encoding="utf-8")
-            frontmatter, body = self._parse_content(content)
+            frontmatter, body = parse_frontmatter(content)
 
             relationships = frontmatter.get("$relationships", [])
             frontmatter["$relationships"] = [
@@ -516,40 +512,12 @@ class RelationshipAuditor:
             )
 
             source_path.write_text(new_content, encoding="utf-8")
+            self._cache.invalidate_path(source_path)
             return True
 
         except Exception:
             return False
 
-    def _parse_frontmatter(self, content: str) -> Dict[str, Any]:
-        """Parse YAML frontmatter."""
-        if not content.startswith("---"):
-            return {}
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}
-
-        try:
-            return yaml.safe_load(parts[1]) or {}
-        except yaml.YAMLError:
-            return {}
-
-    def _parse_content(self, content: str) -> Tuple[Dict[str, Any], str]:
-        """Parse frontmatter and body."""
-        if not content.startswith("---"):
-            return {}, content
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}, content
-
-        try:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            return frontmatter, parts[2]
-        except yaml.YAMLError:
-            return {}, content
-
 
 def main():
     """CLI entry point."""
@@ -27,6 +27,12 @@ try:
 except ImportError:
     from relationships.canonical_resolver import CanonicalResolver
 
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache, parse_frontmatter
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import get_shared_cache, parse_frontmatter
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,20 +78,24 @@ class RelationshipNormalizer:
     - Generate detailed normalization report
     """
 
-    def __init__(self, brain_path: Path):
+    def __init__(self, brain_path: Path, cache=None):
         """
         Initialize the normalizer.
 
         Args:
             brain_path: Path to the brain directory
+            cache: Optional EntityCache instance. Defaults to the
+                   process-wide shared cache for brain_path.
         """
         self.brain_path = brain_path
-        self.resolver = CanonicalResolver(brain_path)
+        self._cache = cache if cache is not None else get_shared_cache(brain_path)
+        self.resolver = CanonicalResolver(brain_path, cache=self._cache)
 
     def normalize_entity(
         self,
         entity_path: Path,
         dry_run: bool = True,
+        frontmatter: Optional[Dict[str, Any]] = None,
     ) -> NormalizationResult:
         """
         Normalize relationships in a single entity.
@@ -93,13 +103,16 @@ class RelationshipNormalizer:
         Args:
             entity_path: Path to entity file
             dry_run: If True, don't write changes
+            frontmatter: Already-parsed frontmatter (e.g. from the entity
+                         cache). The file is only read when changes are written.
 
         Returns:
             NormalizationResult with details
         """
         try:
-            content = entity_path.read_text(encoding="utf-8")
-            frontmatter, body = self._parse_content(content)
+            if frontmatter is None:
+                content = entity_path.read_text(encoding="utf-8")
+                frontmatter, _ = parse_frontmatter(content)
         except Exception as e:
             return NormalizationResult(
                 entity_path=entity_path,
@@ -185,30 +198,39 @@ class RelationshipNormalizer:
 
         # Write if changes and not dry_run
         if changes and not dry_run:
-            frontmatter["$relationships"] = deduplicated
-            frontmatter["$updated"] = datetime.now(timezone.utc).isoformat()
-
-            # Add normalization event
-            if "$events" not in frontmatter:
-                frontmatter["$events"] = []
-
-            frontmatter["$events"].append(
-                {
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "type": "normalization",
-                    "actor": "system/relationship_normalizer",
-                    "changes": [
-                        {
-                            "field": "$relationships",
-                            "operation": "normalize",
-                            "count": len(changes),
-                        }
-                    ],
-                }
-            )
-
-            new_content = self._rebuild_content(frontmatter, body)
-            entity_path.write_text(new_content, encoding="utf-8")
+            try:
+                content = entity_path.read_text(encoding="utf-8")
+                frontmatter, body = parse_frontmatter(content)
+                if not frontmatter:
+                    raise ValueError("frontmatter is no longer parseable")
+                frontmatter["$relationships"] = deduplicated
+                frontmatter["$updated"] = datetime.now(timezone.utc).isoformat()
+
+                # Add normalization event
+                if "$events" not in frontmatter:
+                    frontmatter["$events"] = []
+
+                frontmatter["$events"].append(
+                    {
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "type": "normalization",
+                        "actor": "system/relationship_normalizer",
+                        "changes": [
+                            {
+                                "field": "$relationships",
+                                "operation": "normalize",
+                                "count": len(changes),
+                            }
+                        ],
+                    }
+                )
+
+                new_content = self._rebuild_content(frontmatter, body)
+                entity_path.write_text(new_content, encoding="utf-8")
+                self._cache.invalidate_path(entity_path)
+            except Exception as e:
+                result.success = False
+                result.error = str(e)
 
         return result
 
@@ -230,18 +252,10 @@ class RelationshipNormalizer:
         # Build resolver index first
         self.resolver.build_index()
 
-        entity_files = list(self.brain_path.rglob("*.md"))
-        entity_files = [
-            f
-            for f in entity_files
-            if f.name.lower() not in ("readme.md", "index.md", "_index.md")
-            and ".snapshots" not in str(f)
-            and ".schema" not in str(f)
-            and ".events" not in str(f)
-        ]
+        entities = self._cache.get_files()
 
         result = BatchNormalizationResult(
-            total_entities=len(entity_files),
+            total_entities=len(entities),
             entities_processed=0,
             entities_modified=0,
             relationships_normalized=0,
@@ -249,8 +263,11 @@ class RelationshipNormalizer:
             orphans_found=0,
         )
 
-        for i, entity_path in enumerate(entity_files):
-            entity_result = self.normalize_entity(entity_path, dry_run)
+        for cached in entities:
+            entity_path = cached["_path"]
+            entity_result = self.normalize_entity(
+                entity_path, dry_run, frontmatter=cached
+            )
 
             result.entities_processed += 1
 
@@ -355,21 +372,6 @@ class RelationshipNormalizer:
 
         return "\n".join(lines)
 
-    def _parse_content(self, content: str) -> Tuple[Dict[str, Any], str]:
-        """Parse frontmatter and body."""
-        if not content.startswith("---"):
-            return {}, content
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}, content
-
-        try:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            return frontmatter, parts[2]
-        except yaml.YAMLError:
-            return {}, content
-
     def _rebuild_content(self, frontmatter: Dict[str, Any], body: str) -> str:
         """Rebuild file content from frontmatter and body."""
         yaml_content = yaml.dump(
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+PM-OS Brain Checkpoint Index (v5.0)
+
+Per-entity checkpoints derived from content-addressed entity snapshots
+(see snapshot_manager.py). A row is written only when an entity's snapshot
+object changes, or with a NULL hash when the entity disappears, so
+"nearest checkpoint at or before X" is one indexed query for a single
+entity or for the whole brain.
+
+The index (.snapshots/checkpoints.db) is derived data: sync() folds in
+snapshots newer than the last indexed one and rebuilds from the manifests
+when indexed snapshots were removed by cleanup.
+
+Usage:
+    from temporal.checkpoint_index import CheckpointIndex
+
+    index = CheckpointIndex(snapshot_manager)
+    index.sync()
+    states = index.states_at(point_in_time)  # {path: (ts_us, object_hash)}
+"""
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from pm_os_brain.tools.temporal.event_index import to_micros
+except ImportError:
+    from temporal.event_index import to_micros
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_INDEX_FILENAME = "checkpoints.db"
+# Bump when the stored row layout changes
+CHECKPOINT_INDEX_SCHEMA_VERSION = 1
+
+Checkpoint = Tuple[int, Optional[str]]
+
+
+class CheckpointIndex:
+    """SQLite index of per-entity snapshot checkpoints."""
+
+    def __init__(self, snapshots):
+        """
+        Initialize the index.
+
+        Args:
+            snapshots: SnapshotManager whose entity snapshots are indexed
+        """
+        self.snapshots = snapshots
+        self.db_path = Path(snapshots.snapshots_dir) / CHECKPOINT_INDEX_FILENAME
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index, (re)creating tables if the schema changed."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path))
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != CHECKPOINT_INDEX_SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS checkpoints")
+            conn.execute("DROP TABLE IF EXISTS snapshots")
+            conn.execute(f"PRAGMA user_version = {CHECKPOINT_INDEX_SCHEMA_VERSION}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "path TEXT, ts_us INTEGER, object_hash TEXT, PRIMARY KEY (path, ts_us))"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_checkpoints_ts ON checkpoints (ts_us)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            "ts_us INTEGER PRIMARY KEY, path TEXT, has_entities INTEGER)"
+        )
+        return conn
+
+    def _fetch(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        if not self.db_path.exists():
+            return []
+        with self._lock:
+            conn = self._connect()
+            try:
+                return conn.execute(sql, params).fetchall()
+            finally:
+                conn.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def sync(self) -> int:
+        """
+        Index entity snapshots not seen yet.
+
+        Returns:
+            Number of entity snapshots indexed
+        """
+        available = [
+            (to_micros(datetime.fromisoformat(info["timestamp"])), info["path"])
+            for info in self.snapshots.list_snapshots()
+        ]
+        on_disk = dict(available)
+
+        indexed_count = 0
+        with self._lock:
+            conn = self._connect()
+            try:
+                indexed = dict(conn.execute("SELECT ts_us, path FROM snapshots"))
+                pending = [(ts, p) for ts, p in available if ts not in indexed]
+                stale = any(on_disk.get(ts) != p for ts, p in indexed.items())
+                if indexed and pending and min(ts for ts, _ in pending) < max(indexed):
+                    stale = True
+                if stale:
+                    # Snapshots removed or filed out of order: rebuild
+                    with conn:
+                        conn.execute("DELETE FROM checkpoints")
+                        conn.execute("DELETE FROM snapshots")
+                    pending = available
+
+                manifest = {
+                    path: digest
+                    for path, _, digest in conn.execute(
+                        "SELECT path, MAX(ts_us), object_hash FROM checkpoints GROUP BY path"
+                    )
+                    if digest is not None
+                }
+                for ts, snapshot_path in pending:
+                    snapshot = self.snapshots._load_snapshot(Path(snapshot_path))
+                    rows: List[Tuple[str, int, Optional[str]]] = []
+                    has_entities = bool(snapshot) and "entity_manifest" in snapshot
+                    if has_entities:
+                        current = {
+                            path: entry[0]
+                            for path, entry in snapshot["entity_manifest"].items()
+                        }
+                        rows = [
+                            (path, ts, digest)
+                            for path, digest in current.items()
+                            if manifest.get(path) != digest
+                        ]
+                        rows += [(path, ts, None) for path in manifest if path not in current]
+                        manifest = current
+                        indexed_count += 1
+                    with conn:
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)", rows
+                        )
+                        conn.execute(
+                            "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?)",
+                            (ts, snapshot_path, int(has_entities)),
+                        )
+            finally:
+                conn.close()
+        return indexed_count
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def latest_checkpoint(self) -> Optional[int]:
+        """Timestamp (UTC microseconds) of the newest indexed entity snapshot."""
+        rows = self._fetch("SELECT MAX(ts_us) FROM snapshots WHERE has_entities = 1")
+        return rows[0][0] if rows else None
+
+    def get(self, rel_path: str, point_in_time: datetime) -> Optional[Checkpoint]:
+        """Nearest (ts_us, object_hash) for one entity at or before a time."""
+        rows = self._fetch(
+            "SELECT ts_us, object_hash FROM checkpoints "
+            "WHERE path = ? AND ts_us <= ? ORDER BY ts_us DESC LIMIT 1",
+            (rel_path, to_micros(point_in_time)),
+        )
+        return (rows[0][0], rows[0][1]) if rows else None
+
+    def states_at(self, point_in_time: datetime) -> Dict[str, Checkpoint]:
+        """Nearest (ts_us, object_hash) per entity at or before a time."""
+        # SQLite returns the bare column from the row holding MAX()
+        rows = self._fetch(
+            "SELECT path, MAX(ts_us), object_hash FROM checkpoints "
+            "WHERE ts_us <= ? GROUP BY path",
+            (to_micros(point_in_time),),
+        )
+        return {path: (ts, digest) for path, ts, digest in rows}
+
+    def changed_between(self, start: datetime, end: datetime) -> List[str]:
+        """Entities with a checkpoint row in (start, end]."""
+        rows = self._fetch(
+            "SELECT DISTINCT path FROM checkpoints WHERE ts_us > ? AND ts_us <= ?",
+            (to_micros(start), to_micros(end)),
+        )
+        return [path for (path,) in rows]
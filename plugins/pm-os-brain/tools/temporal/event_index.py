@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+PM-OS Brain Event Index (v5.0)
+
+Append-only SQLite log of entity events (.events/events.db under the
+brain), indexed on timestamp, entity, type, actor and correlation id so
+that time-range and correlation queries do not read entity files.
+
+The log is fed two ways:
+- EventStore.append_event() records each event as it is written
+- sync() mirrors $events from entity files whose content hash changed
+  since the last sync (via the shared EntityCache), which covers every
+  writer that goes through EventHelper.append_to_frontmatter()
+
+Events are keyed by (path, event_id), so history that
+EventHelper.compact_events() folds out of the frontmatter stays queryable.
+Rows are only deleted once their entity file no longer exists. Events
+that repeat an event_id within one file (older second-resolution ids)
+are kept apart by their position.
+
+Usage:
+    from temporal.event_index import EventIndex
+
+    index = EventIndex(brain_path)
+    index.sync()
+    rows = index.query(since=since, correlation_id="corr-1")
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import get_shared_cache
+
+logger = logging.getLogger(__name__)
+
+EVENTS_DIR = ".events"
+EVENT_INDEX_FILENAME = "events.db"
+# Bump when the stored row layout changes
+EVENT_INDEX_SCHEMA_VERSION = 1
+
+GROUP_COLUMNS = {
+    "type": "type",
+    "actor": "actor",
+    "entity_id": "entity_id",
+    "path": "path",
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_micros(timestamp: datetime) -> int:
+    """UTC microseconds since the epoch (naive datetimes are taken as UTC)."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    delta = timestamp - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def event_key(data: Dict[str, Any]) -> str:
+    """Stable per-entity key: event_id, else a hash of the event content."""
+    if data.get("event_id"):
+        return str(data["event_id"])
+    raw = json.dumps(data, sort_keys=True, default=str)
+    return "sha-" + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+class EventIndex:
+    """SQLite-backed, append-only event log for one brain directory."""
+
+    def __init__(self, brain_path: Path, cache=None):
+        """
+        Initialize the index.
+
+        Args:
+            brain_path: Path to the brain directory
+            cache: Optional EntityCache used by sync(). Defaults to the
+                   process-wide shared cache for brain_path.
+        """
+        self.brain_path = Path(brain_path)
+        self.db_path = self.brain_path / EVENTS_DIR / EVENT_INDEX_FILENAME
+        self._cache = cache
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the log, (re)creating tables if the schema changed."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path))
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != EVENT_INDEX_SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS events")
+            conn.execute("DROP TABLE IF EXISTS files")
+            conn.execute(f"PRAGMA user_version = {EVENT_INDEX_SCHEMA_VERSION}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            "path TEXT, event_key TEXT, ts_us INTEGER, type TEXT, actor TEXT, "
+            "entity_id TEXT, correlation_id TEXT, data TEXT, "
+            "PRIMARY KEY (path, event_key))"
+        )
+        for column in ("ts_us", "entity_id", "type", "actor", "correlation_id"):
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_events_{column} ON events ({column})"
+            )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, content_hash TEXT)"
+        )
+        return conn
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record(self, rel_path: str, events: Iterable[Any]) -> int:
+        """
+        Append events for one entity file (already-known keys are ignored).
+
+        Args:
+            rel_path: Entity path relative to the brain directory
+            events: Event objects (temporal.event_store.Event)
+
+        Returns:
+            Number of rows offered to the log
+        """
+        rows = [self._row(rel_path, event) for event in events]
+        if not rows:
+            return 0
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+            finally:
+                conn.close()
+        return len(rows)
+
+    def sync(self) -> Dict[str, int]:
+        """
+        Mirror $events from entity files changed since the last sync.
+
+        Returns:
+            Counts of files checked, files read, events offered and
+            deleted files whose events were dropped
+        """
+        # Late import: event_store imports this module
+        try:
+            from pm_os_brain.tools.temporal.event_store import Event
+        except ImportError:
+            from temporal.event_store import Event
+
+        cache = self._cache if self._cache is not None else get_shared_cache(self.brain_path)
+        cache.reload()
+        entities = list(cache.get_all().values())
+
+        stats = {"files": len(entities), "changed": 0, "events": 0}
+        with self._lock:
+            conn = self._connect()
+            try:
+                known = dict(conn.execute("SELECT path, content_hash FROM files"))
+                scanned: set = set()
+                rows: List[Tuple[Any, ...]] = []
+                hashes: List[Tuple[str, str]] = []
+                for frontmatter in entities:
+                    rel_path = str(frontmatter["_path"].relative_to(self.brain_path))
+                    content_hash = frontmatter.get("_content_hash", "")
+                    scanned.add(rel_path)
+                    if known.get(rel_path) == content_hash:
+                        continue
+                    stats["changed"] += 1
+                    hashes.append((rel_path, content_hash))
+                    seen_keys: Dict[str, int] = {}
+                    for raw in frontmatter.get("$events") or []:
+                        if not isinstance(raw, dict):
+                            continue
+                        try:
+                            event = Event.from_dict(raw, rel_path)
+                        except (TypeError, ValueError):
+                            continue
+                        key = event_key(raw)
+                        repeat = seen_keys.get(key, 0)
+                        seen_keys[key] = repeat + 1
+                        if repeat:
+                            key = f"{key}#{repeat}"
+                        rows.append(self._row(rel_path, event, key))
+                # Drop the rows of entity files that were deleted
+                logged = {path for (path,) in conn.execute("SELECT DISTINCT path FROM events")}
+                removed = [
+                    (path,)
+                    for path in (logged | set(known)) - scanned
+                    if not (self.brain_path / path).exists()
+                ]
+                with conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO files VALUES (?, ?)", hashes
+                    )
+                    conn.executemany("DELETE FROM events WHERE path = ?", removed)
+                    conn.executemany("DELETE FROM files WHERE path = ?", removed)
+                stats["events"] = len(rows)
+                stats["removed"] = len(removed)
+            finally:
+                conn.close()
+        return stats
+
+    @staticmethod
+    def _row(rel_path: str, event: Any, key: Optional[str] = None) -> Tuple[Any, ...]:
+        data = event.to_dict()
+        data["timestamp"] = event.timestamp.isoformat()
+        return (
+            rel_path,
+            key or event_key(data),
+            to_micros(event.timestamp),
+            event.event_type,
+            event.actor,
+            event.entity_id,
+            event.correlation_id,
+            json.dumps(data, default=str),
+        )
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _where(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        event_types: Optional[List[str]] = None,
+        actors: Optional[List[str]] = None,
+        entity_ids: Optional[List[str]] = None,
+        correlation_id: Optional[str] = None,
+        paths: Optional[List[str]] = None,
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if since is not None:
+            clauses.append("ts_us >= ?")
+            params.append(to_micros(since))
+        if until is not None:
+            clauses.append("ts_us <= ?")
+            params.append(to_micros(until))
+        for column, values in (
+            ("type", event_types),
+            ("actor", actors),
+            ("entity_id", entity_ids),
+            ("path", paths),
+        ):
+            if values:
+                clauses.append(f"{column} IN ({','.join('?' * len(values))})")
+                params.extend(values)
+        if correlation_id is not None:
+            clauses.append("correlation_id = ?")
+            params.append(correlation_id)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        event_types: Optional[List[str]] = None,
+        actors: Optional[List[str]] = None,
+        entity_ids: Optional[List[str]] = None,
+        correlation_id: Optional[str] = None,
+        limit: Optional[int] = 100,
+        newest_first: bool = True,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Query the log.
+
+        Returns:
+            List of (rel_path, event dict) ordered by timestamp
+        """
+        where, params = self._where(
+            since, until, event_types, actors, entity_ids, correlation_id
+        )
+        sql = f"SELECT path, data FROM events{where} ORDER BY ts_us"
+        sql += " DESC" if newest_first else ""
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        if not self.db_path.exists():
+            return []
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(sql, params).fetchall()
+            finally:
+                conn.close()
+        return [(path, json.loads(data)) for path, data in rows]
+
+    def count(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        group_by: str = "type",
+        paths: Optional[List[str]] = None,
+    ) -> Dict[str, int]:
+        """Count events grouped by type, actor, entity_id or path."""
+        if not self.db_path.exists():
+            return {}
+        column = GROUP_COLUMNS.get(group_by)
+        where, params = self._where(since, until, paths=paths)
+        select = column if column else "'unknown'"
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    f"SELECT {select}, COUNT(*) FROM events{where} GROUP BY 1", params
+                ).fetchall()
+            finally:
+                conn.close()
+        return {key: count for key, count in rows}
+
+    def path_stats(self, until: datetime) -> Dict[str, Tuple[int, int]]:
+        """Per entity path: (latest event ts_us, number of events at or before until)."""
+        if not self.db_path.exists():
+            return {}
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT path, MAX(ts_us), SUM(ts_us <= ?) FROM events GROUP BY path",
+                    (to_micros(until),),
+                ).fetchall()
+            finally:
+                conn.close()
+        return {path: (latest, count) for path, latest, count in rows}
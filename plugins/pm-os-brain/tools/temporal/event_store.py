@@ -5,6 +5,11 @@ PM-OS Brain Event Store (v5.0)
 Manages event persistence and querying for Brain entities.
 Supports both embedded events (in entity files) and separate event logs.
 
+Cross-entity queries (query_events, get_events_by_correlation,
+count_events) are served from the indexed event log in
+.events/events.db (see event_index.py), which is synced from entity
+files once per EventStore and appended to by append_event().
+
 Usage:
     from pm_os_base.tools.core.path_resolver import get_paths
     paths = get_paths()
@@ -17,9 +22,15 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional
+from uuid import uuid4
 
 import yaml
 
+try:
+    from pm_os_brain.tools.temporal.event_index import EventIndex
+except ImportError:
+    from temporal.event_index import EventIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,6 +110,18 @@ class EventStore:
         """
         self.brain_path = brain_path
         self.events_cache: Dict[str, List[Event]] = {}
+        self.index = EventIndex(brain_path)
+        self._index_synced = False
+
+    def sync_index(self, force: bool = False) -> None:
+        """Mirror entity-file events into the event log (once unless forced)."""
+        if self._index_synced and not force:
+            return
+        try:
+            self.index.sync()
+        except Exception as exc:
+            logger.warning("Event index sync failed: %s", exc)
+        self._index_synced = True
 
     def get_entity_events(
         self,
@@ -156,8 +179,8 @@ class EventStore:
         """
         now = datetime.now(timezone.utc)
 
-        # Generate event ID
-        event_id = f"evt-{now.strftime('%Y%m%d-%H%M%S')}"
+        # Unique even for events written in the same second
+        event_id = f"evt-{uuid4().hex[:12]}"
 
         # Determine entity ID from path
         try:
@@ -176,7 +199,11 @@ class EventStore:
             correlation_id=correlation_id,
         )
 
-        self._write_event_to_entity(entity_path, event)
+        if self._write_event_to_entity(entity_path, event):
+            try:
+                self.index.record(entity_id, [event])
+            except Exception as exc:
+                logger.debug("Failed to record event in index: %s", exc)
         return event
 
     def query_events(
@@ -202,30 +229,27 @@ class EventStore:
         Returns:
             List of matching events
         """
-        all_events = []
+        self.sync_index()
 
-        # Find entity files
+        paths = None
         if entity_pattern:
-            entity_files = list(self.brain_path.glob(entity_pattern))
-        else:
-            entity_files = list(self.brain_path.rglob("*.md"))
-            entity_files = [
-                f
-                for f in entity_files
-                if f.name.lower() not in ("readme.md", "index.md", "_index.md")
-            ]
-
-        for entity_path in entity_files:
-            events = self.get_entity_events(entity_path, since, until, event_types)
-
-            if actors:
-                events = [e for e in events if e.actor in actors]
+            paths = {
+                str(f.relative_to(self.brain_path))
+                for f in self.brain_path.glob(entity_pattern)
+            }
 
-            all_events.extend(events)
+        rows = self.index.query(
+            since=since,
+            until=until,
+            event_types=event_types,
+            actors=actors,
+            limit=None if paths is not None else limit,
+        )
+        if paths is not None:
+            rows = [row for row in rows if row[0] in paths][:limit]
 
-        # Sort by timestamp descending and limit
-        all_events.sort(key=lambda e: e.timestamp, reverse=True)
-        return all_events[:limit]
+        # Newest first
+        return [Event.from_dict(data) for _, data in rows]
 
     def get_events_by_correlation(self, correlation_id: str) -> List[Event]:
         """
@@ -237,8 +261,9 @@ class EventStore:
         Returns:
             List of events with matching correlation ID
         """
-        events = self.query_events(limit=10000)
-        return [e for e in events if e.correlation_id == correlation_id]
+        self.sync_index()
+        rows = self.index.query(correlation_id=correlation_id, limit=None)
+        return [Event.from_dict(data) for _, data in rows]
 
     def get_entity_timeline(
         self,
@@ -289,22 +314,8 @@ class EventStore:
         Returns:
             Dictionary of counts by group
         """
-        events = self.query_events(since=since, until=until, limit=10000)
-        counts: Dict[str, int] = {}
-
-        for event in events:
-            if group_by == "type":
-                key = event.event_type
-            elif group_by == "actor":
-                key = event.actor
-            elif group_by == "entity_id":
-                key = event.entity_id
-            else:
-                key = "unknown"
-
-            counts[key] = counts.get(key, 0) + 1
-
-        return counts
+        self.sync_index()
+        return self.index.count(since=since, until=until, group_by=group_by)
 
     def _load_entity_events(self, entity_path: Path) -> List[Event]:
         """Load events from an entity file."""
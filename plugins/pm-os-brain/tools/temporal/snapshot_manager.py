@@ -4,6 +4,13 @@ PM-OS Brain Snapshot Manager (v5.0)
 
 Creates and manages point-in-time snapshots of the Brain registry and entities.
 
+Entity snapshots are content-addressed: each entity's frontmatter and body
+is stored once as a gzip JSON object under .snapshots/objects/, keyed by
+the SHA-256 of its canonical JSON, and a snapshot is just a manifest of
+{path: object hash}. Entities whose file content hash is unchanged since
+the previous snapshot reuse its object without being serialized again,
+and cleanup removes objects no remaining snapshot references.
+
 Usage:
     python3 snapshot_manager.py create [--include-entities] [--brain-path PATH]
     python3 snapshot_manager.py list
@@ -13,18 +20,30 @@ Usage:
 
 import argparse
 import gzip
+import hashlib
 import json
 import logging
+import os
 import shutil
 import sys
+import tempfile
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from pm_os_brain.tools.brain_core.entity_cache import get_shared_cache, strip_meta
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import get_shared_cache, strip_meta
+
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_VERSION = "2.0"
+OBJECTS_DIR = "objects"
+
 
 def json_serial(obj):
     """JSON serializer for objects not serializable by default json code."""
@@ -33,6 +52,17 @@ def json_serial(obj):
     raise TypeError(f"Type {type(obj)} not serializable")
 
 
+def object_hash(data: bytes) -> str:
+    """Content address of a serialized snapshot object."""
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def _canonical_json(value: Any) -> bytes:
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), default=json_serial
+    ).encode("utf-8")
+
+
 class SnapshotManager:
     """
     Manages Brain snapshots for point-in-time queries.
@@ -44,16 +74,21 @@ class SnapshotManager:
     - Fast point-in-time lookups
     """
 
-    def __init__(self, brain_path: Path):
+    def __init__(self, brain_path: Path, cache=None):
         """
         Initialize the snapshot manager.
 
         Args:
             brain_path: Path to the brain directory
+            cache: Optional EntityCache instance. Defaults to the
+                   process-wide shared cache for brain_path.
         """
         self.brain_path = brain_path
+        self._cache = cache if cache is not None else get_shared_cache(brain_path)
         self.snapshots_dir = brain_path / ".snapshots"
+        self.objects_dir = self.snapshots_dir / OBJECTS_DIR
         self.registry_path = brain_path / "registry.yaml"
+        self.last_stats: Dict[str, int] = {}
 
     def create_snapshot(
         self,
@@ -65,7 +100,8 @@ class SnapshotManager:
         Create a snapshot of the current Brain state.
 
         Args:
-            include_entities: Include full entity snapshots (larger)
+            include_entities: Include an entity manifest (entity objects
+                              are written only for entities not stored yet)
             compress: Compress the snapshot
             metadata: Additional metadata to include
 
@@ -82,7 +118,7 @@ class SnapshotManager:
 
         # Create snapshot data
         snapshot = {
-            "$snapshot_version": "1.0",
+            "$snapshot_version": SNAPSHOT_VERSION,
             "$created": timestamp.isoformat() + "Z",
             "$type": "full" if include_entities else "registry",
             "metadata": metadata or {},
@@ -96,7 +132,7 @@ class SnapshotManager:
 
         # Optionally snapshot entities
         if include_entities:
-            snapshot["entities"] = self._snapshot_entities()
+            snapshot["entity_manifest"] = self._snapshot_entities()
 
         # Save snapshot
         snapshot_name = f"snapshot-{time_str}"
@@ -146,8 +182,14 @@ class SnapshotManager:
 
         if not target_dir.exists():
             # Find closest earlier snapshot
+            if not self.snapshots_dir.exists():
+                return None
             available_dates = sorted(
-                [d.name for d in self.snapshots_dir.iterdir() if d.is_dir()],
+                [
+                    d.name
+                    for d in self.snapshots_dir.iterdir()
+                    if d.is_dir() and d.name != OBJECTS_DIR
+                ],
                 reverse=True,
             )
             for d in available_dates:
@@ -179,6 +221,125 @@ class SnapshotManager:
             return snapshot.get("registry")
         return None
 
+    def find_snapshot(self, point_in_time: datetime) -> Optional[Path]:
+        """Path of the latest snapshot taken at or before point_in_time."""
+        if point_in_time.tzinfo is not None:
+            point_in_time = point_in_time.astimezone(timezone.utc).replace(tzinfo=None)
+        best = None
+        for info in self.list_snapshots(until=point_in_time):
+            if datetime.fromisoformat(info["timestamp"]) <= point_in_time:
+                best = info["path"]
+        return Path(best) if best else None
+
+    def get_entity_at(
+        self, rel_path: str, point_in_time: datetime
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Entity state from the latest entity snapshot at or before a time.
+
+        Reads the snapshot manifest and a single entity object.
+
+        Args:
+            rel_path: Entity path relative to the brain directory
+            point_in_time: The target datetime
+
+        Returns:
+            {"frontmatter": ..., "body": ..., "snapshot": path} or None
+        """
+        path = self.find_snapshot(point_in_time)
+        while path is not None:
+            snapshot = self._load_snapshot(path)
+            if snapshot and ("entity_manifest" in snapshot or "entities" in snapshot):
+                state = self.get_snapshot_entity(snapshot, rel_path)
+                if state is not None:
+                    state["snapshot"] = str(path)
+                return state
+            # Registry-only snapshot: look further back
+            path = self._previous_snapshot(path)
+        return None
+
+    def get_snapshot_entity(
+        self, snapshot: Dict[str, Any], rel_path: str
+    ) -> Optional[Dict[str, Any]]:
+        """One entity's {"frontmatter", "body"} from a loaded snapshot."""
+        if "entities" in snapshot:  # v1: inline frontmatter only
+            frontmatter = snapshot["entities"].get(rel_path)
+            return {"frontmatter": frontmatter, "body": ""} if frontmatter else None
+        entry = snapshot.get("entity_manifest", {}).get(rel_path)
+        return self.read_object(entry[0]) if entry else None
+
+    def load_entities(self, snapshot: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """All entity frontmatter of a snapshot as {rel_path: frontmatter}."""
+        if "entities" in snapshot:
+            return snapshot["entities"]
+        entities = {}
+        for rel_path, (digest, _) in snapshot.get("entity_manifest", {}).items():
+            obj = self.read_object(digest)
+            if obj is not None:
+                entities[rel_path] = obj["frontmatter"]
+        return entities
+
+    def read_object(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Load one content-addressed object."""
+        try:
+            with gzip.open(self._object_path(digest), "rb") as f:
+                return json.loads(f.read().decode("utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.debug("Failed to read snapshot object %s: %s", digest, exc)
+            return None
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.json.gz"
+
+    def _write_object(self, data: bytes) -> Tuple[str, bool]:
+        """Store serialized data under its hash. Returns (hash, written)."""
+        digest = object_hash(data)
+        path = self._object_path(digest)
+        if path.exists():
+            return digest, False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(data, mtime=0))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return digest, True
+
+    def _previous_snapshot(self, path: Path) -> Optional[Path]:
+        paths = [Path(info["path"]) for info in self.list_snapshots()]
+        if path not in paths:
+            return None
+        index = paths.index(path)
+        return paths[index - 1] if index > 0 else None
+
+    def _latest_manifest(self) -> Dict[str, List[str]]:
+        """Entity manifest of the most recent snapshot that has one."""
+        for info in reversed(self.list_snapshots()):
+            snapshot = self._load_snapshot(Path(info["path"]))
+            if snapshot and "entity_manifest" in snapshot:
+                return snapshot["entity_manifest"]
+        return {}
+
+    def gc_objects(self, dry_run: bool = False) -> int:
+        """Remove objects that no remaining snapshot references."""
+        if not self.objects_dir.exists():
+            return 0
+        live = set()
+        for info in self.list_snapshots():
+            snapshot = self._load_snapshot(Path(info["path"]))
+            if snapshot:
+                live.update(e[0] for e in snapshot.get("entity_manifest", {}).values())
+        removed = 0
+        for path in self.objects_dir.glob("*/*.json.gz"):
+            if path.name[: -len(".json.gz")] not in live:
+                if not dry_run:
+                    path.unlink()
+                removed += 1
+        return removed
+
     def list_snapshots(
         self,
         since: Optional[datetime] = None,
@@ -255,7 +416,10 @@ class SnapshotManager:
             List of removed snapshot paths
         """
         removed = []
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        # Snapshot directory dates are naive UTC
+        cutoff_date = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            days=retention_days
+        )
 
         if not self.snapshots_dir.exists():
             return removed
@@ -286,31 +450,43 @@ class SnapshotManager:
                     shutil.rmtree(date_dir)
                 removed.append(str(date_dir))
 
-        return removed
+        if removed and not dry_run:
+            self.gc_objects()
 
-    def _snapshot_entities(self) -> Dict[str, Dict[str, Any]]:
-        """Create snapshot of all entities."""
-        entities = {}
+        return removed
 
-        entity_files = list(self.brain_path.rglob("*.md"))
-        entity_files = [
-            f
-            for f in entity_files
-            if f.name.lower() not in ("readme.md", "index.md", "_index.md")
-            and ".snapshots" not in str(f)
-        ]
+    def _snapshot_entities(self) -> Dict[str, List[str]]:
+        """
+        Store changed entities and return the manifest.
 
-        for entity_path in entity_files:
-            try:
-                content = entity_path.read_text(encoding="utf-8")
-                frontmatter = self._parse_frontmatter(content)
-                if frontmatter:
-                    entity_id = str(entity_path.relative_to(self.brain_path))
-                    entities[entity_id] = frontmatter
-            except Exception:
+        Returns:
+            {rel_path: [object_hash, file_content_hash]}
+        """
+        previous = self._latest_manifest()
+        manifest: Dict[str, List[str]] = {}
+        stats = {"entities": 0, "reused": 0, "serialized": 0, "written": 0}
+
+        for frontmatter in self._cache.get_files():
+            entity_id = str(frontmatter["_path"].relative_to(self.brain_path))
+            content_hash = frontmatter.get("_content_hash", "")
+            stats["entities"] += 1
+
+            entry = previous.get(entity_id)
+            if entry and entry[1] == content_hash and self._object_path(entry[0]).exists():
+                manifest[entity_id] = entry
+                stats["reused"] += 1
                 continue
 
-        return entities
+            data = _canonical_json(
+                {"frontmatter": strip_meta(frontmatter), "body": frontmatter.get("_body", "")}
+            )
+            digest, written = self._write_object(data)
+            manifest[entity_id] = [digest, content_hash]
+            stats["serialized"] += 1
+            stats["written"] += int(written)
+
+        self.last_stats = stats
+        return manifest
 
     def _load_snapshot(self, path: Path) -> Optional[Dict[str, Any]]:
         """Load snapshot from file."""
@@ -329,20 +505,6 @@ class SnapshotManager:
             logger.debug("Failed to load snapshot %s: %s", path, exc)
             return None
 
-    def _parse_frontmatter(self, content: str) -> Dict[str, Any]:
-        """Parse YAML frontmatter from content."""
-        if not content.startswith("---"):
-            return {}
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}
-
-        try:
-            return yaml.safe_load(parts[1]) or {}
-        except yaml.YAMLError:
-            return {}
-
 
 def create_daily_snapshot(brain_path: Optional[Path] = None) -> Path:
     """
@@ -422,6 +584,12 @@ def main():
             compress=True,
         )
         print(f"Created snapshot: {path}")
+        if manager.last_stats:
+            stats = manager.last_stats
+            print(
+                f"Entities: {stats['entities']} "
+                f"({stats['reused']} unchanged, {stats['written']} new objects)"
+            )
 
     elif args.action == "list":
         snapshots = manager.list_snapshots()
@@ -4,6 +4,14 @@ PM-OS Brain Temporal Query System (v5.0)
 
 Enables point-in-time reconstruction and temporal queries on Brain entities.
 
+Historical state comes from per-entity checkpoints (content-addressed
+entity snapshots, indexed by checkpoint_index.py) plus the event log
+(event_index.py): an entity is read from its nearest checkpoint at or
+before the requested time, then events logged after that checkpoint are
+replayed where they carry exact values. Entities unchanged since the
+requested time are served from the current entity cache, so whole-brain
+queries never re-parse files or replay full histories.
+
 Usage:
     from pm_os_base.tools.core.path_resolver import get_paths
     paths = get_paths()
@@ -12,20 +20,44 @@ Usage:
 
 import copy
 import logging
+import sys
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import yaml
 
 try:
-    from temporal.event_store import Event, EventStore
+    from pm_os_brain.tools.brain_core.entity_cache import strip_meta
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from brain_core.entity_cache import strip_meta
+
+try:
+    from pm_os_brain.tools.temporal.event_store import Event, EventStore
 except ImportError:
     from temporal.event_store import Event, EventStore
 
+try:
+    from pm_os_brain.tools.temporal.snapshot_manager import SnapshotManager
+except ImportError:
+    from temporal.snapshot_manager import SnapshotManager
+
+try:
+    from pm_os_brain.tools.temporal.checkpoint_index import CheckpointIndex
+    from pm_os_brain.tools.temporal.event_index import to_micros
+except ImportError:
+    from temporal.checkpoint_index import CheckpointIndex
+    from temporal.event_index import to_micros
+
 logger = logging.getLogger(__name__)
 
+# Minimum age of the newest checkpoint before checkpoint() takes another
+DEFAULT_CHECKPOINT_INTERVAL = timedelta(days=1)
+
+NON_ENTITY_FILES = ("readme.md", "index.md", "_index.md")
+
 
 @dataclass
 class EntitySnapshot:
@@ -58,7 +90,44 @@ class TemporalQuery:
         """
         self.brain_path = brain_path
         self.event_store = EventStore(brain_path)
+        self.snapshots = SnapshotManager(brain_path)
+        self.checkpoints = CheckpointIndex(self.snapshots)
         self.snapshot_cache: Dict[str, Dict[str, EntitySnapshot]] = {}
+        self._checkpoints_synced = False
+
+    def sync_checkpoints(self, force: bool = False) -> None:
+        """Index entity snapshots as checkpoints (once unless forced)."""
+        if self._checkpoints_synced and not force:
+            return
+        try:
+            self.checkpoints.sync()
+        except Exception as exc:
+            logger.warning("Checkpoint index sync failed: %s", exc)
+        self._checkpoints_synced = True
+
+    def checkpoint(
+        self, min_interval: timedelta = DEFAULT_CHECKPOINT_INTERVAL
+    ) -> Optional[Path]:
+        """
+        Take an entity snapshot if the newest checkpoint is too old.
+
+        Intended to run periodically (e.g. from the daily snapshot job);
+        only entities whose content changed get new snapshot objects.
+
+        Args:
+            min_interval: Minimum age of the newest checkpoint
+
+        Returns:
+            Path of the new snapshot, or None if a recent one exists
+        """
+        self.sync_checkpoints(force=True)
+        latest = self.checkpoints.latest_checkpoint()
+        now = to_micros(datetime.now(timezone.utc))
+        if latest is not None and now - latest < min_interval // timedelta(microseconds=1):
+            return None
+        path = self.snapshots.create_snapshot(include_entities=True)
+        self.sync_checkpoints(force=True)
+        return path
 
     def get_entity_at(
         self,
@@ -69,8 +138,11 @@ class TemporalQuery:
         Reconstruct entity state at a specific point in time.
 
         Works by:
-        1. Getting all events up to point_in_time
-        2. Applying events in order to reconstruct state
+        1. Using the current file if it has not changed since point_in_time
+        2. Otherwise reading the entity's nearest checkpoint at or before
+           point_in_time (also for deleted entities) and replaying the
+           events logged after it
+        3. Falling back to the event history when there is no checkpoint
 
         Args:
             entity_path: Path to entity file
@@ -79,24 +151,93 @@ class TemporalQuery:
         Returns:
             EntitySnapshot if reconstruction possible, None otherwise
         """
-        if not entity_path.exists():
-            return None
-
-        # Get current state as base
-        content = entity_path.read_text(encoding="utf-8")
-        frontmatter, body = self._parse_content(content)
-
         entity_id = str(entity_path.relative_to(self.brain_path))
+        point_in_time = self._as_utc(point_in_time)
+        until_us = to_micros(point_in_time)
+        self.sync_checkpoints()
+
+        current = None
+        events: List[Event] = []
+        if entity_path.exists():
+            content = entity_path.read_text(encoding="utf-8")
+            current = self._parse_content(content)
+            events = self.event_store.get_entity_events(entity_path)
+
+        def delta(since_us: int) -> List[Event]:
+            if current is None:
+                return self._logged_events(since_us, point_in_time).get(entity_id, [])
+            return [e for e in events if since_us < to_micros(e.timestamp) <= until_us]
+
+        return self._resolve(
+            entity_id,
+            point_in_time,
+            current,
+            self._last_change(current[0], events) if current else None,
+            len(events),
+            sum(1 for e in events if e.timestamp <= point_in_time),
+            self.checkpoints.get(entity_id, point_in_time),
+            delta,
+        )
 
-        # Get all events for this entity
-        all_events = self.event_store.get_entity_events(entity_path)
+    def _resolve(
+        self,
+        entity_id: str,
+        point_in_time: datetime,
+        current: Optional[Tuple[Dict[str, Any], str]],
+        last_change: Optional[datetime],
+        event_count: int,
+        events_until: int,
+        checkpoint: Optional[Tuple[int, Optional[str]]],
+        delta: Callable[[int], List[Event]],
+    ) -> Optional[EntitySnapshot]:
+        """
+        State of one entity at point_in_time.
+
+        Args:
+            entity_id: Entity path relative to the brain
+            point_in_time: UTC point in time
+            current: (frontmatter, body) of the file today, None if deleted
+            last_change: Latest of $updated and the newest event
+            event_count: Number of events for the entity
+            events_until: Number of those at or before point_in_time
+            checkpoint: Nearest (ts_us, object_hash) at or before point_in_time
+            delta: Returns the entity's events after a checkpoint timestamp
+        """
+        changed_since = last_change is not None and last_change > point_in_time
+        if checkpoint is not None and (current is None or changed_since):
+            ts_us, digest = checkpoint
+            if digest is None:
+                return None  # Removed as of this checkpoint
+            state = self.snapshots.read_object(digest)
+            if state and state.get("frontmatter"):
+                frontmatter = self._apply_events(state["frontmatter"], delta(ts_us))
+                return EntitySnapshot(
+                    entity_id=entity_id,
+                    timestamp=point_in_time,
+                    frontmatter=frontmatter,
+                    body=state.get("body", ""),
+                    version=frontmatter.get("$version", 1),
+                )
 
-        if not all_events:
-            # No events, return current state if created before point_in_time
+        if current is None:
+            return None
+        frontmatter, body = current
+
+        if not event_count:
+            # No events, return current state if checkpointed or created
+            # before point_in_time
+            if checkpoint is not None:
+                return EntitySnapshot(
+                    entity_id=entity_id,
+                    timestamp=point_in_time,
+                    frontmatter=frontmatter,
+                    body=body,
+                    version=frontmatter.get("$version", 1),
+                )
             created = frontmatter.get("$created", "")
             if created:
                 created_dt = self._parse_datetime(created)
-                if created_dt and created_dt <= point_in_time:
+                if created_dt and self._as_utc(created_dt) <= point_in_time:
                     return EntitySnapshot(
                         entity_id=entity_id,
                         timestamp=point_in_time,
@@ -106,25 +247,160 @@ class TemporalQuery:
                     )
             return None
 
-        # Filter events up to point_in_time
-        relevant_events = [e for e in all_events if e.timestamp <= point_in_time]
-
-        if not relevant_events:
+        if not events_until:
             return None
 
-        # Reconstruct state by replaying events
-        reconstructed = self._reconstruct_from_events(
-            frontmatter, body, relevant_events
-        )
-
         return EntitySnapshot(
             entity_id=entity_id,
             timestamp=point_in_time,
-            frontmatter=reconstructed["frontmatter"],
-            body=reconstructed["body"],
-            version=len(relevant_events),
+            frontmatter=copy.deepcopy(frontmatter),
+            body=body,
+            version=events_until,
+        )
+
+    def _resolver(
+        self,
+        point_in_time: datetime,
+        paths: Optional[Iterable[str]] = None,
+    ) -> Tuple[List[str], Callable[[str], Optional[EntitySnapshot]]]:
+        """
+        Prepare bulk point-in-time reads.
+
+        Loads the per-entity aggregates once (current entities from the
+        entity cache, event counts from the event log, nearest checkpoints)
+        and the delta events for entities that need a checkpoint.
+
+        Args:
+            point_in_time: UTC point in time
+            paths: Entity paths to resolve (default: every known entity)
+
+        Returns:
+            (candidate paths, function resolving one path)
+        """
+        self.event_store.sync_index()
+        self.sync_checkpoints()
+
+        current: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        for cached in self.snapshots._cache.get_all().values():
+            path = cached["_path"]
+            if path.name.lower() in NON_ENTITY_FILES:
+                continue
+            rel_path = str(path.relative_to(self.brain_path))
+            current[rel_path] = (strip_meta(cached), cached.get("_body", ""))
+
+        stats = self.event_store.index.path_stats(point_in_time)
+        checkpoints = self.checkpoints.states_at(point_in_time)
+
+        if paths is None:
+            candidates = set(current)
+            candidates.update(p for p, (_, digest) in checkpoints.items() if digest)
+        else:
+            candidates = set(paths)
+
+        def last_change(rel_path: str) -> Optional[datetime]:
+            latest = stats.get(rel_path, (None, 0))[0]
+            times = [] if latest is None else [_from_micros(latest)]
+            updated = self._parse_datetime(current[rel_path][0].get("$updated", ""))
+            if updated:
+                times.append(self._as_utc(updated))
+            return max(times) if times else None
+
+        changes = {p: last_change(p) for p in candidates if p in current}
+        needs_delta = [
+            checkpoints[p][0]
+            for p in candidates
+            if p in checkpoints
+            and (p not in current or (changes[p] and changes[p] > point_in_time))
+        ]
+        logged = (
+            self._logged_events(min(needs_delta), point_in_time) if needs_delta else {}
         )
 
+        def resolve(rel_path: str) -> Optional[EntitySnapshot]:
+            latest, events_until = stats.get(rel_path, (None, 0))
+            return self._resolve(
+                rel_path,
+                point_in_time,
+                current.get(rel_path),
+                changes.get(rel_path),
+                0 if latest is None else 1,
+                events_until or 0,
+                checkpoints.get(rel_path),
+                lambda since_us: [
+                    e for e in logged.get(rel_path, []) if to_micros(e.timestamp) > since_us
+                ],
+            )
+
+        return sorted(candidates), resolve
+
+    def _logged_events(
+        self, since_us: int, until: datetime
+    ) -> Dict[str, List[Event]]:
+        """Events from the log after since_us up to until, grouped by path."""
+        grouped: Dict[str, List[Event]] = {}
+        rows = self.event_store.index.query(
+            since=_from_micros(since_us), until=until, limit=None, newest_first=False
+        )
+        for rel_path, data in rows:
+            event = Event.from_dict(data, rel_path)
+            if to_micros(event.timestamp) > since_us:
+                grouped.setdefault(rel_path, []).append(event)
+        return grouped
+
+    @staticmethod
+    def _apply_events(
+        base_frontmatter: Dict[str, Any], events: List[Event]
+    ) -> Dict[str, Any]:
+        """
+        Replay events that carry exact values onto checkpoint frontmatter.
+
+        Only "set" changes whose old_value matches the replayed state and
+        relationship append/remove changes are applied; enrichment events
+        record truncated values and other changes only summaries.
+        """
+        frontmatter = copy.deepcopy(base_frontmatter)
+        for event in sorted(events, key=lambda e: e.timestamp):
+            for change in event.changes:
+                field = change.get("field")
+                operation = change.get("operation")
+                value = change.get("value")
+                if operation == "set" and "old_value" in change:
+                    if field and frontmatter.get(field) == change["old_value"]:
+                        frontmatter[field] = value
+                elif field == "$relationships" and isinstance(value, dict):
+                    relationships = frontmatter.get("$relationships")
+                    if not isinstance(relationships, list):
+                        relationships = frontmatter["$relationships"] = []
+                    entry = {"type": value.get("type"), "target": value.get("target")}
+                    matches = [
+                        r
+                        for r in relationships
+                        if isinstance(r, dict)
+                        and r.get("type") == entry["type"]
+                        and r.get("target") == entry["target"]
+                    ]
+                    if operation == "append" and not matches:
+                        relationships.append(entry)
+                    elif operation == "remove":
+                        for match in matches:
+                            relationships.remove(match)
+        return frontmatter
+
+    def _last_change(
+        self, frontmatter: Dict[str, Any], events: List[Event]
+    ) -> Optional[datetime]:
+        """Latest of $updated and the newest event timestamp."""
+        candidates = [e.timestamp for e in events]
+        updated = self._parse_datetime(frontmatter.get("$updated", ""))
+        if updated:
+            candidates.append(self._as_utc(updated))
+        return max(candidates) if candidates else None
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        """Treat naive datetimes as UTC."""
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
     def compare_states(
         self,
         entity_path: Path,
@@ -216,18 +492,11 @@ class TemporalQuery:
         Returns:
             List of entity snapshots matching criteria
         """
+        paths, resolve = self._resolver(self._as_utc(point_in_time))
         snapshots = []
 
-        # Find all entity files
-        entity_files = list(self.brain_path.rglob("*.md"))
-        entity_files = [
-            f
-            for f in entity_files
-            if f.name.lower() not in ("readme.md", "index.md", "_index.md")
-        ]
-
-        for entity_path in entity_files:
-            snapshot = self.get_entity_at(entity_path, point_in_time)
+        for rel_path in paths:
+            snapshot = resolve(rel_path)
             if not snapshot:
                 continue
 
@@ -260,62 +529,92 @@ class TemporalQuery:
         Returns:
             Summary of changes
         """
-        events = self.event_store.query_events(since=start, until=end, limit=10000)
+        self.event_store.sync_index()
+        index = self.event_store.index
+
+        paths = None
+        if entity_type:
+            paths = [
+                str(fm["_path"].relative_to(self.brain_path))
+                for fm in self.snapshots._cache.get_by_type(entity_type).values()
+            ]
 
         summary = {
             "period_start": start.isoformat(),
             "period_end": end.isoformat(),
-            "total_events": len(events),
-            "entities_changed": len(set(e.entity_id for e in events)),
+            "total_events": 0,
+            "entities_changed": 0,
             "by_type": {},
             "by_actor": {},
             "by_entity": {},
         }
+        if paths == []:
+            return summary
 
-        for event in events:
-            # Count by event type
-            event_type = event.event_type
-            summary["by_type"][event_type] = summary["by_type"].get(event_type, 0) + 1
-
-            # Count by actor
-            actor = event.actor
-            summary["by_actor"][actor] = summary["by_actor"].get(actor, 0) + 1
-
-            # Count by entity
-            entity_id = event.entity_id
-            summary["by_entity"][entity_id] = summary["by_entity"].get(entity_id, 0) + 1
+        # Aggregated in the event log, not by loading events
+        summary["by_type"] = index.count(start, end, "type", paths)
+        summary["by_actor"] = index.count(start, end, "actor", paths)
+        summary["by_entity"] = index.count(start, end, "entity_id", paths)
+        summary["total_events"] = sum(summary["by_type"].values())
+        summary["entities_changed"] = len(summary["by_entity"])
 
         return summary
 
-    def _reconstruct_from_events(
+    def iter_changes(
         self,
-        base_frontmatter: Dict[str, Any],
-        base_body: str,
-        events: List[Event],
-    ) -> Dict[str, Any]:
+        start: datetime,
+        end: datetime,
+        entity_type: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Reconstruct state by replaying events.
+        Stream per-entity state diffs between two points in time.
 
-        Note: This is a simplified reconstruction that tracks field updates.
-        Full reconstruction would require storing complete snapshots.
-        """
-        frontmatter = copy.deepcopy(base_frontmatter)
+        Only entities with logged events or new checkpoints in the period
+        (or $updated inside it) are reconstructed, each once per end point.
 
-        # For now, we can't fully reconstruct past states without snapshots
-        # We can only confirm which fields changed
-        changed_fields = set()
+        Args:
+            start: Start of period
+            end: End of period
+            entity_type: Filter by entity type (at either end of the period)
 
-        for event in events:
-            for change in event.changes:
-                field = change.get("field", "")
-                if field:
-                    changed_fields.add(field)
-
-        return {
-            "frontmatter": frontmatter,
-            "body": base_body,
-            "changed_fields": list(changed_fields),
-        }
+        Yields:
+            Dicts with entity_id, exists_at_start, exists_at_end and
+            field_changes, for entities whose state differs
+        """
+        start, end = self._as_utc(start), self._as_utc(end)
+        self.event_store.sync_index()
+        self.sync_checkpoints()
+
+        touched = set(self.event_store.index.count(start, end, "path"))
+        touched.update(self.checkpoints.changed_between(start, end))
+        for cached in self.snapshots._cache.get_all().values():
+            updated = self._parse_datetime(cached.get("$updated", ""))
+            if updated and start < self._as_utc(updated) <= end:
+                touched.add(str(cached["_path"].relative_to(self.brain_path)))
+
+        _, before = self._resolver(start, touched)
+        paths, after = self._resolver(end, touched)
+        for rel_path in paths:
+            state_a, state_b = before(rel_path), after(rel_path)
+            if state_a is None and state_b is None:
+                continue
+            if entity_type and entity_type not in {
+                s.frontmatter.get("$type") for s in (state_a, state_b) if s
+            }:
+                continue
+            field_changes = []
+            if state_a and state_b:
+                field_changes = self._diff_frontmatter(
+                    state_a.frontmatter, state_b.frontmatter
+                )
+                if not field_changes and state_a.body == state_b.body:
+                    continue
+            yield {
+                "entity_id": rel_path,
+                "exists_at_start": state_a is not None,
+                "exists_at_end": state_b is not None,
+                "field_changes": field_changes,
+            }
 
     def _diff_frontmatter(
         self,
@@ -363,6 +662,8 @@ class TemporalQuery:
         """Parse datetime from string."""
         if not date_str:
             return None
+        if isinstance(date_str, datetime):
+            return date_str
 
         try:
             return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
@@ -370,6 +671,11 @@ class TemporalQuery:
             return None
 
 
+def _from_micros(value: int) -> datetime:
+    """UTC datetime from microseconds since the epoch."""
+    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(microseconds=value)
+
+
 def create_temporal_query(brain_path: Optional[Path] = None) -> TemporalQuery:
     """
     Factory function to create a TemporalQuery.
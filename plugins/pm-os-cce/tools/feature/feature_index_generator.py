@@ -37,6 +37,10 @@ except ImportError:
         get_root_path = None
 
 
+# main(argv) can be called repeatedly in one process (pipeline/tool_runner.py)
+REENTRANT = True
+
+
 def _get_root_path() -> Path:
     """Resolve PM-OS root path."""
     if get_root_path:
@@ -257,13 +261,13 @@ def generate_features_json(products: List[Dict[str, Any]], generated_at: str) ->
     return json.dumps(output, indent=2)
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(description="Generate FEATURES.md index")
     parser.add_argument("--output", type=str, help="Output file path")
     parser.add_argument("--products-path", type=str, help="Products directory path")
     parser.add_argument("--format", type=str, choices=["md", "json"], default="md",
                         help="Output format: md (default) or json")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     root = _get_root_path()
     products_path = Path(args.products_path) if args.products_path else root / "user" / "products"
@@ -89,6 +89,42 @@ class TestParticipantContext:
         assert "testcorp.com" in resolver.internal_domains
         assert "testcorp.de" in resolver.internal_domains
 
+    def test_resolve_participant_via_alias_matcher(self):
+        from meeting.participant_context import (
+            get_alias_matcher,
+            resolve_participant_to_brain,
+        )
+
+        if get_alias_matcher is None:
+            pytest.skip("pm-os-brain not available")
+        alias_index = {
+            "alice smith": ("entities", "alice-smith", "Entities/People/alice.md"),
+            "platform": ("entities", "platform", "Entities/Teams/platform.md"),
+        }
+        matcher = get_alias_matcher(alias_index.keys())
+        match = resolve_participant_to_brain(
+            "Alice Smith (Platform)", "", alias_index, matcher
+        )
+        assert match["entity_id"] == "alice-smith"
+        assert resolve_participant_to_brain("Alice Smith (Platform)", "", alias_index) is None
+
+    def test_alias_matcher_never_resolves_to_a_team(self):
+        from meeting.participant_context import (
+            get_alias_matcher,
+            resolve_participant_to_brain,
+        )
+
+        if get_alias_matcher is None:
+            pytest.skip("pm-os-brain not available")
+        alias_index = {
+            "alice smith": ("entities", "alice-smith", "Entities/People/alice.md"),
+            "platform": ("entities", "platform", "Entities/Teams/platform.md"),
+        }
+        matcher = get_alias_matcher(alias_index.keys())
+        assert resolve_participant_to_brain(
+            "Bob Jones (Platform)", "", alias_index, matcher
+        ) is None
+
 
 class TestAgendaGenerator:
     """Test agenda generation."""
@@ -59,6 +59,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# main(argv) can be called repeatedly in one process (pipeline/tool_runner.py)
+REENTRANT = True
+
 # LLM settings
 SYNTHESIS_MODEL = "claude-3-5-haiku-20241022"
 MAX_INPUT_CHARS = 50000
@@ -862,7 +865,7 @@ def generate_context_file_rulebased(
 # =============================================================================
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entry point for context synthesis."""
     parser = argparse.ArgumentParser(description="Synthesize context from raw data")
     parser.add_argument("--input", type=str, help="Input raw data file (default: stdin)")
@@ -871,7 +874,7 @@ def main():
     parser.add_argument("--no-ai", action="store_true", help="Skip AI synthesis, rule-based only")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable debug logging")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Configure logging
     log_level = logging.DEBUG if args.verbose else logging.INFO
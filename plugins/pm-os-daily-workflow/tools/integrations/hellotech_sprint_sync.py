@@ -78,12 +78,14 @@ def _sanitize_filename(name: str) -> str:
 try:
     from google.oauth2.credentials import Credentials
     from googleapiclient.discovery import build
+    HAS_GOOGLE_API = True
 except ImportError:
-    print("Error: Google API libraries not installed")
-    print("Run: pip install google-auth google-auth-oauthlib google-api-python-client")
-    sys.exit(1)
+    HAS_GOOGLE_API = False
 
 
+# main(argv) can be called repeatedly in one process (pipeline/tool_runner.py)
+REENTRANT = True
+
 # Default spreadsheet ID (can be overridden in config)
 DEFAULT_SPREADSHEET_ID = os.environ.get("HELLOTECH_SPREADSHEET_ID", "YOUR_SPREADSHEET_ID_HERE")
 
@@ -472,7 +474,7 @@ class HelloTechSprintSync:
         return None
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(
         description="Sync HelloTech Sprint Reports to Brain"
     )
@@ -481,7 +483,13 @@ def main():
     parser.add_argument("--tribe", type=str, help="Filter by tribe")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--spreadsheet-id", type=str, help="Override spreadsheet ID")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    # Checked here rather than at import so loading the module has no side effects
+    if not HAS_GOOGLE_API:
+        print("Error: Google API libraries not installed")
+        print("Run: pip install google-auth google-auth-oauthlib google-api-python-client")
+        sys.exit(1)
 
     try:
         syncer = HelloTechSprintSync(spreadsheet_id=args.spreadsheet_id)
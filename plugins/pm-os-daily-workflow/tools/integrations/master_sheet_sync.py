@@ -26,6 +26,9 @@ from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# main(argv) can be called repeatedly in one process (pipeline/tool_runner.py)
+REENTRANT = True
+
 # v5 imports: shared utils from pm_os_base
 try:
     from pm_os_base.tools.core.config_loader import get_config
@@ -773,7 +776,7 @@ def run_sync() -> Dict[str, Any]:
         return {"status": "error", "message": str(e)}
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """CLI entry point."""
     parser = argparse.ArgumentParser(description="PM-OS Master Sheet Sync")
     parser.add_argument("--status", action="store_true", help="Show current sync status")
@@ -785,7 +788,7 @@ def main():
     parser.add_argument("--post-slack", action="store_true", help="Post weekly summary to Slack")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
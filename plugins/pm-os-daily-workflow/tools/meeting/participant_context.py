@@ -18,6 +18,7 @@ Usage:
 import logging
 import os
 import re
+import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -48,6 +49,17 @@ except ImportError:
         def check_plugin(name: str) -> bool:
             return False
 
+try:
+    from pm_os_brain.tools.brain_core.alias_matcher import get_alias_matcher
+except ImportError:
+    _BRAIN_TOOLS = Path(__file__).resolve().parents[3] / "pm-os-brain" / "tools"
+    if _BRAIN_TOOLS.is_dir() and str(_BRAIN_TOOLS) not in sys.path:
+        sys.path.append(str(_BRAIN_TOOLS))
+    try:
+        from brain_core.alias_matcher import get_alias_matcher
+    except ImportError:
+        get_alias_matcher = None
+
 try:
     import yaml
     HAS_YAML = True
@@ -107,10 +119,22 @@ def build_alias_index(registry: Dict) -> Dict[str, Tuple[str, str, str]]:
     return index
 
 
+def _is_person(file_path: str) -> bool:
+    """Whether an alias index entry points at a Brain person entity."""
+    return "People" in Path(file_path).parts
+
+
 def resolve_participant_to_brain(
-    name: str, email: str, alias_index: Dict
+    name: str, email: str, alias_index: Dict, matcher: Any = None
 ) -> Optional[Dict]:
-    """Resolve a participant name/email to a Brain entity."""
+    """
+    Resolve a participant name/email to a Brain entity.
+
+    Tries the full name, first name and email prefix as exact aliases.
+    If a shared Brain alias matcher is given, falls back to the longest
+    person alias mentioned in the display name (e.g. "Alice Smith
+    (Platform)"); teams and projects in a display name are never matched.
+    """
     name_lower = name.lower()
     if name_lower in alias_index:
         cat, eid, path = alias_index[name_lower]
@@ -123,6 +147,15 @@ def resolve_participant_to_brain(
     if email_prefix and email_prefix in alias_index:
         cat, eid, path = alias_index[email_prefix]
         return {"entity_id": eid, "category": cat, "file_path": path}
+    if matcher is not None and name_lower:
+        found = [
+            alias for alias in matcher.count_words(name_lower)
+            if alias in alias_index and _is_person(alias_index[alias][2])
+        ]
+        if found:
+            alias = max(found, key=len)
+            cat, eid, path = alias_index[alias]
+            return {"entity_id": eid, "category": cat, "file_path": path}
     return None
 
 
@@ -164,6 +197,7 @@ class ParticipantContextResolver:
         )
         self._internal_domains: Optional[List[str]] = None
         self._alias_index: Optional[Dict] = None
+        self._alias_matcher: Any = None
         self._registry: Optional[Dict] = None
 
     # -- Lazy properties -----------------------------------------------------
@@ -193,6 +227,15 @@ class ParticipantContextResolver:
             self._alias_index = build_alias_index(self.registry)
         return self._alias_index
 
+    @property
+    def alias_matcher(self) -> Any:
+        """Shared Brain automaton over person aliases (None if pm-os-brain is unavailable)."""
+        if self._alias_matcher is None and get_alias_matcher is not None:
+            people = [a for a, (_, _, path) in self.alias_index.items() if _is_person(path)]
+            if people:
+                self._alias_matcher = get_alias_matcher(people, cache_dir=self.brain_dir)
+        return self._alias_matcher
+
     # -- Public API ----------------------------------------------------------
 
     def is_internal(self, email: str) -> bool:
@@ -254,7 +297,7 @@ class ParticipantContextResolver:
         enriched: List[Dict] = []
         for p in participants:
             match = resolve_participant_to_brain(
-                p["name"], p["email"], self.alias_index
+                p["name"], p["email"], self.alias_index, self.alias_matcher
             )
             if not match:
                 continue
@@ -287,7 +330,9 @@ class ParticipantContextResolver:
         seen_projects: set = set()
 
         for name in participant_names:
-            entity_match = resolve_participant_to_brain(name, "", self.alias_index)
+            entity_match = resolve_participant_to_brain(
+                name, "", self.alias_index, self.alias_matcher
+            )
             if not entity_match:
                 continue
 
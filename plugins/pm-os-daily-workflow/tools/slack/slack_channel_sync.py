@@ -20,10 +20,13 @@ import logging
 import os
 import sys
 import time
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# main(argv) can be called repeatedly in one process (pipeline/tool_runner.py)
+REENTRANT = True
+
 # v5 shared utils
 try:
     from pm_os_base.tools.core.connector_bridge import get_auth
@@ -242,7 +245,7 @@ def get_all_channel_ids(config_path: str = None) -> List[Dict[str, str]]:
     return result
 
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """CLI entry point."""
     default_path = _default_config_path()
 
@@ -252,7 +255,7 @@ def main() -> None:
         "--config", default=default_path,
         help="Config file path (default: %s)" % default_path,
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
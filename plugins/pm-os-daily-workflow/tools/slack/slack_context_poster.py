@@ -21,9 +21,13 @@ import os
 import re
 import sys
 from datetime import datetime
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# main(argv) can be called repeatedly in one process (pipeline/tool_runner.py)
+REENTRANT = True
+
 # v5 shared utils
 try:
     from pm_os_base.tools.core.config_loader import get_config
@@ -282,7 +286,7 @@ def post_to_slack(client, channel: str, blocks: list, fallback_text: str) -> dic
         return {"success": False, "error": e.response["error"]}
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """CLI entry point."""
     parser = argparse.ArgumentParser(description="Post context highlights to Slack")
     parser.add_argument("context_file", nargs="?", help="Path to context markdown file")
@@ -298,7 +302,7 @@ def main() -> int:
     parser.add_argument(
         "--dry-run", action="store_true", help="Parse and format but do not post"
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
@@ -30,6 +30,9 @@ from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# main(argv) can be called repeatedly in one process (pipeline/tool_runner.py)
+REENTRANT = True
+
 # v5 shared utils
 try:
     from pm_os_base.tools.core.config_loader import get_config
@@ -896,7 +899,7 @@ def print_mention_status(state: Dict[str, Any]) -> None:
 # CLI
 # ============================================================================
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """CLI entry point."""
     parser = argparse.ArgumentParser(description="Slack Mention Handler")
     parser.add_argument(
@@ -918,7 +921,7 @@ def main() -> None:
         help="Use LLM to formalize tasks (requires AWS Bedrock)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
     state = load_state()